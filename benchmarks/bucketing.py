@@ -0,0 +1,139 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: bucketing of data sizes
+==================================
+
+Simulates an online job which fits a logistic regression with NUTS and with SVI
+on a new dataset of a random size at each run, either on the data as is, which
+compiles the inference for each new size, or on the data padded by
+:class:`~numpyro.handlers.bucket` to a power of two, with `jit_model_args=True`,
+which reuses the inference compiled for each bucket size.
+
+For each inference, the number of distinct data sizes and buckets, and the total
+and median time of a run are printed.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.handlers import bucket
+from numpyro.infer import MCMC, NUTS, SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+
+
+def model(X, y=None):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event())
+    with numpyro.plate("N", X.shape[0]):
+        numpyro.sample("obs", dist.Bernoulli(logits=X @ coefs), obs=y)
+
+
+def run_mcmc(model, args, jit_model_args):
+    mcmc = MCMC(
+        NUTS(model),
+        num_warmup=args.num_warmup,
+        num_samples=args.num_samples,
+        jit_model_args=jit_model_args,
+        progress_bar=False,
+    )
+
+    def run(*args_, **kwargs):
+        mcmc.run(random.PRNGKey(1), *args_, **kwargs)
+        return mcmc.get_samples()["coefs"]
+
+    return run
+
+
+def run_svi(model, args, jit_model_args):
+    # the guide receives the same padded arguments as the model
+    guide = AutoNormal(model)
+    if isinstance(model, bucket):
+        guide = bucket(guide, model.plate)
+    svi = SVI(
+        model,
+        guide,
+        numpyro.optim.Adam(0.01),
+        Trace_ELBO(),
+        jit_model_args=jit_model_args,
+    )
+
+    def run(*args_, **kwargs):
+        result = svi.run(
+            random.PRNGKey(1), args.num_steps, *args_, progress_bar=False, **kwargs
+        )
+        return result.losses
+
+    return run
+
+
+def benchmark(make_run, datasets, args):
+    for name, bucketed in [("none", False), ("bucket", True)]:
+        model_ = bucket(model, "N") if bucketed else model
+        run = make_run(model_, args, bucketed)
+        elapsed = []
+        buckets = set()
+        for X, y in datasets:
+            if bucketed:
+                args_, kwargs = model_.pad(X, y=y)
+            else:
+                args_, kwargs = (X,), {"y": y}
+            buckets.add(args_[0].shape[0])
+            start = time.time()
+            jax.block_until_ready(run(*args_, **kwargs))
+            elapsed.append(time.time() - start)
+        print(
+            "{:<8} {:<8} {:>8} {:>8} {:>12.2f} {:>12.1f}".format(
+                make_run.__name__[4:],
+                name,
+                len({X.shape[0] for X, _ in datasets}),
+                len(buckets),
+                sum(elapsed),
+                1000 * np.median(elapsed),
+            )
+        )
+
+
+def main(args):
+    D = args.num_features
+    rng = np.random.RandomState(0)
+    sizes = rng.randint(args.min_size, args.max_size + 1, args.num_runs)
+    datasets = []
+    for n in sizes:
+        X = rng.randn(n, D).astype(np.float32)
+        y = (X @ np.linspace(-1, 1, D) > 0).astype(np.float32)
+        datasets.append((X, y))
+    print(
+        "{:<8} {:<8} {:>8} {:>8} {:>12} {:>12}".format(
+            "run", "padding", "sizes", "buckets", "total (s)", "median (ms)"
+        )
+    )
+    benchmark(run_mcmc, datasets, args)
+    benchmark(run_svi, datasets, args)
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Bucketing of data sizes")
+    parser.add_argument("--num-runs", nargs="?", default=20, type=int)
+    parser.add_argument("--min-size", nargs="?", default=100, type=int)
+    parser.add_argument("--max-size", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=10, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=500, type=int)
+    parser.add_argument("--num-warmup", nargs="?", default=500, type=int)
+    parser.add_argument("--num-steps", nargs="?", default=2000, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
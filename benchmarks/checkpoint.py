@@ -0,0 +1,154 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: checkpointing of MCMC and SVI runs
+=============================================
+
+Runs NUTS on a logistic regression, and SVI with
+:class:`~numpyro.infer.autoguide.AutoNormal` on the same model, without
+checkpointing and with a :class:`~numpyro.util.Checkpoint` snapshot every `k`
+steps, then resumes each checkpointed run from its snapshot after half of its
+steps.
+
+For each run, the total time (including compilation), the size of the snapshot
+directory and the time to resume and finish the run are printed, with the largest
+difference from the samples or losses of the run without checkpointing.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import MCMC, NUTS, SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+import numpyro.util
+from numpyro.util import Checkpoint
+
+
+def model(X, y):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event())
+    with numpyro.plate("N", X.shape[0]):
+        numpyro.sample("obs", dist.Bernoulli(logits=X @ coefs), obs=y)
+
+
+def run_mcmc(X, y, args, checkpoint=None, resume=False):
+    mcmc = MCMC(
+        NUTS(model),
+        num_warmup=args.num_warmup,
+        num_samples=args.num_samples,
+        progress_bar=False,
+    )
+    mcmc.run(random.PRNGKey(1), X, y, checkpoint=checkpoint, resume=resume)
+    return np.asarray(mcmc.get_samples()["coefs"])
+
+
+def run_svi(X, y, args, checkpoint=None, resume=False):
+    svi = SVI(model, AutoNormal(model), numpyro.optim.Adam(0.01), Trace_ELBO())
+    svi_result = svi.run(
+        random.PRNGKey(1),
+        args.num_steps,
+        X,
+        y,
+        progress_bar=False,
+        checkpoint=checkpoint,
+        resume=resume,
+    )
+    return np.asarray(svi_result.losses)
+
+
+def interrupt_after(num_saves):
+    # stop the run as if it was killed after `num_saves` files are written
+    save_checkpoint = numpyro.util._save_checkpoint
+    saves = []
+
+    def interrupted_save(*args):
+        if len(saves) == num_saves:
+            raise KeyboardInterrupt
+        saves.append(args[1])
+        save_checkpoint(*args)
+
+    numpyro.util._save_checkpoint = interrupted_save
+    return save_checkpoint
+
+
+def benchmark(run_fn, num_steps, X, y, args):
+    start = time.time()
+    expected = run_fn(X, y, args)
+    print(
+        "{:<8} {:>8} {:>10.2f}".format(run_fn.__name__[4:], "none", time.time() - start)
+    )
+    for every in args.every:
+        directory = tempfile.mkdtemp()
+        checkpoint = Checkpoint(directory, every)
+        start = time.time()
+        run_fn(X, y, args, checkpoint)
+        elapsed = time.time() - start
+        size = sum(
+            os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)
+        )
+
+        num_segments = -(-num_steps // every)
+        # each segment writes a chunk and a state file
+        save_checkpoint = interrupt_after(num_segments // 2 * 2)
+        shutil.rmtree(directory)
+        os.makedirs(directory)
+        try:
+            run_fn(X, y, args, checkpoint)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            numpyro.util._save_checkpoint = save_checkpoint
+        start = time.time()
+        result = run_fn(X, y, args, checkpoint, resume=True)
+        resume_elapsed = time.time() - start
+        shutil.rmtree(directory)
+        print(
+            "{:<8} {:>8} {:>10.2f} {:>12.1f} {:>12.2f} {:>12.2e}".format(
+                run_fn.__name__[4:],
+                every,
+                elapsed,
+                size / 2**10,
+                resume_elapsed,
+                np.abs(result - expected).max(),
+            )
+        )
+
+
+def main(args):
+    N, D = args.num_data, args.num_features
+    X = random.normal(random.PRNGKey(0), (N, D))
+    y = (X @ jnp.linspace(-1, 1, D) > 0).astype(X.dtype)
+    print(
+        "{:<8} {:>8} {:>10} {:>12} {:>12} {:>12}".format(
+            "run", "every", "time (s)", "size (KiB)", "resume (s)", "max diff"
+        )
+    )
+    benchmark(run_mcmc, args.num_warmup + args.num_samples, X, y, args)
+    benchmark(run_svi, args.num_steps, X, y, args)
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Checkpointing of MCMC and SVI")
+    parser.add_argument("-n", "--num-data", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=10, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-warmup", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-steps", nargs="?", default=10_000, type=int)
+    parser.add_argument("--every", nargs="+", default=[100, 500], type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+
+    main(args)
@@ -0,0 +1,118 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: serving predictions with CompiledPredictive
+======================================================
+
+Scores a stream of requests of random sizes with a trained Bayesian neural network
+regression and an amortized guide of a per data point latent variable, either with
+a jitted :class:`~numpyro.infer.util.Predictive`, which is compiled for each new
+request size, or with :class:`~numpyro.infer.util.CompiledPredictive`, which pads
+the requests to a few bucket sizes compiled ahead of serving.
+
+For each predictive, the number of distinct request sizes, the warmup time and the
+median and maximum latency of a request are printed.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer.util import CompiledPredictive, Predictive
+
+
+def model(x, y=None):
+    hidden_dim = 32
+    w1 = numpyro.sample("w1", dist.Normal(0, 1).expand([x.shape[1], hidden_dim]))
+    w2 = numpyro.sample("w2", dist.Normal(0, 1).expand([hidden_dim]))
+    with numpyro.plate("N", x.shape[0]):
+        z = numpyro.sample("z", dist.Normal(0, 1))
+        mean = jnp.tanh(x @ w1) @ w2 + z
+        numpyro.sample("y", dist.Normal(mean, 0.1), obs=y)
+
+
+def guide(x, y=None):
+    hidden_dim = 32
+    numpyro.sample(
+        "w1",
+        dist.Normal(numpyro.param("w1_loc", jnp.zeros((x.shape[1], hidden_dim))), 0.1),
+    )
+    numpyro.sample(
+        "w2", dist.Normal(numpyro.param("w2_loc", jnp.zeros(hidden_dim)), 0.1)
+    )
+    # the encoder of the local latent variables
+    encoder = numpyro.param("encoder", jnp.zeros(x.shape[1]))
+    with numpyro.plate("N", x.shape[0]):
+        numpyro.sample("z", dist.Normal(x @ encoder, 0.1))
+
+
+def serve(predict, requests):
+    latencies = []
+    for i, x in enumerate(requests):
+        start = time.time()
+        jax.block_until_ready(predict(random.PRNGKey(i), x))
+        latencies.append(time.time() - start)
+    return np.array(latencies)
+
+
+def main(args):
+    D = args.num_features
+    params = {
+        "w1_loc": random.normal(random.PRNGKey(0), (D, 32)),
+        "w2_loc": random.normal(random.PRNGKey(1), (32,)),
+        "encoder": random.normal(random.PRNGKey(2), (D,)),
+    }
+    sizes = np.random.RandomState(0).randint(1, args.max_size + 1, args.num_requests)
+    requests = [np.random.RandomState(i).randn(n, D) for i, n in enumerate(sizes)]
+    kwargs = dict(guide=guide, params=params, num_samples=args.num_samples)
+
+    jitted = jax.jit(Predictive(model, **kwargs))
+    batch_sizes = [2**k for k in range(int(np.log2(args.max_size - 1)) + 2)]
+    compiled = CompiledPredictive(model, batch_sizes=batch_sizes, **kwargs)
+    start = time.time()
+    compiled.warmup(random.PRNGKey(0), requests[0])
+    warmup = time.time() - start
+
+    print(
+        "{:<20} {:>8} {:>12} {:>14} {:>12}".format(
+            "predictive", "sizes", "warmup (s)", "median (ms)", "max (ms)"
+        )
+    )
+    for name, predict, warmup_time in [
+        ("jit(Predictive)", jitted, 0.0),
+        ("CompiledPredictive", compiled, warmup),
+    ]:
+        latencies = serve(predict, requests)
+        print(
+            "{:<20} {:>8} {:>12.2f} {:>14.2f} {:>12.2f}".format(
+                name,
+                len(set(sizes)),
+                warmup_time,
+                1000 * np.median(latencies),
+                1000 * latencies.max(),
+            )
+        )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Serving with CompiledPredictive")
+    parser.add_argument("--num-requests", nargs="?", default=200, type=int)
+    parser.add_argument("--max-size", nargs="?", default=256, type=int)
+    parser.add_argument("--num-features", nargs="?", default=16, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=100, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,126 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: mixed precision
+==========================
+
+Runs a logistic regression on a large dataset with 64 bit parameters, either fully
+in ``float64`` or with the likelihood computed in a lower precision by
+:class:`~numpyro.handlers.mixed_precision`, with the data stored in that precision.
+
+For each precision, the size of the data, the time of a compiled evaluation of the
+potential energy and its gradient, and the acceptance probability, the number of
+divergences and the posterior mean of a short NUTS run are printed.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.handlers import mixed_precision
+from numpyro.infer import MCMC, NUTS
+from numpyro.infer.util import initialize_model
+
+
+def model(X, y):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event())
+    with numpyro.plate("N", X.shape[0]):
+        numpyro.sample("obs", dist.Bernoulli(logits=X @ coefs), obs=y)
+
+
+def benchmark(model, X, y, args):
+    model_info = initialize_model(random.PRNGKey(2), model, model_args=(X, y))
+    step = jax.jit(jax.value_and_grad(model_info.potential_fn))
+    z = model_info.param_info.z
+    # compile the step before timing
+    jax.block_until_ready(step(z))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(step(z))
+        elapsed = min(elapsed, time.time() - start)
+
+    mcmc = MCMC(
+        NUTS(model),
+        num_warmup=args.num_warmup,
+        num_samples=args.num_samples,
+        progress_bar=False,
+    )
+    mcmc.run(random.PRNGKey(3), X, y, extra_fields=("accept_prob", "diverging"))
+    extra_fields = mcmc.get_extra_fields()
+    coefs = mcmc.get_samples()["coefs"]
+    return (
+        elapsed,
+        float(extra_fields["accept_prob"].mean()),
+        int(extra_fields["diverging"].sum()),
+        coefs.dtype,
+        np.asarray(coefs.mean(0)),
+    )
+
+
+def main(args):
+    N, D = args.num_data, args.num_features
+    X = random.normal(random.PRNGKey(0), (N, D))
+    logits = X @ jnp.linspace(-1, 1, D)
+    y = random.bernoulli(random.PRNGKey(1), jax.nn.sigmoid(logits)).astype(X.dtype)
+
+    models = {
+        "float64": (model, jnp.float64),
+        "float32 compute": (mixed_precision(model, compute_dtype=jnp.float32), None),
+        "bfloat16 compute": (mixed_precision(model, compute_dtype=jnp.bfloat16), None),
+    }
+    print(
+        "{:<18} {:>10} {:>10} {:>12} {:>10} {:>12} {:>10}".format(
+            "likelihood",
+            "data (MiB)",
+            "grad (ms)",
+            "accept prob",
+            "diverging",
+            "mean error",
+            "z dtype",
+        )
+    )
+    reference = None
+    for name, (model_, data_dtype) in models.items():
+        data_dtype = data_dtype or model_.compute_dtype
+        X_, y_ = X.astype(data_dtype), y.astype(data_dtype)
+        elapsed, accept_prob, diverging, dtype, mean = benchmark(model_, X_, y_, args)
+        reference = mean if reference is None else reference
+        print(
+            "{:<18} {:>10.1f} {:>10.2f} {:>12.3f} {:>10} {:>12.2e} {:>10}".format(
+                name,
+                (X_.nbytes + y_.nbytes) / 2**20,
+                1000 * elapsed,
+                accept_prob,
+                diverging,
+                np.abs(mean - reference).max(),
+                str(dtype),
+            )
+        )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Mixed precision")
+    parser.add_argument("-n", "--num-data", nargs="?", default=10_000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=20, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=100, type=int)
+    parser.add_argument("--num-warmup", nargs="?", default=100, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=10, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    numpyro.enable_x64()
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
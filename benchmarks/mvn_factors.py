@@ -0,0 +1,92 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: MultivariateNormal factorizations
+============================================
+
+Measures the time of a gradient evaluation of the log density of a Gaussian process
+with a fixed kernel matrix, as done at each step of HMC or SVI, for three ways of
+building :class:`~numpyro.distributions.MultivariateNormal`:
+
+- from the covariance matrix, with a latent observation noise, which requires a
+  Cholesky decomposition at each evaluation;
+- from a precomputed :class:`~numpyro.distributions.util.CholeskyFactor`, which
+  requires the observation noise to be fixed;
+- from a precomputed :class:`~numpyro.distributions.util.EighFactor` of the kernel
+  matrix, updated with a latent observation noise at each evaluation.
+
+Compilation time is excluded: each gradient is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.distributions.util import CholeskyFactor, EighFactor
+
+
+def get_problems(kernel, args):
+    eye = jnp.eye(args.num_data)
+    cholesky = CholeskyFactor.from_covariance(kernel + args.noise * eye)
+    eigh = EighFactor.from_covariance(kernel)
+    return {
+        "covariance_matrix": lambda loc, noise: dist.MultivariateNormal(
+            loc, kernel + noise * eye
+        ),
+        "CholeskyFactor (fixed noise)": lambda loc, noise: dist.MultivariateNormal(
+            loc, factor=cholesky
+        ),
+        "EighFactor": lambda loc, noise: dist.MultivariateNormal(
+            loc, factor=eigh.add_diag(noise)
+        ),
+    }
+
+
+def benchmark(make_dist, y, args):
+    grad = jax.jit(
+        jax.grad(lambda *params: make_dist(*params).log_prob(y).sum(), argnums=(0, 1))
+    )
+    params = (jnp.zeros(args.num_data), jnp.array(args.noise))
+    # compile the gradient before timing
+    jax.block_until_ready(grad(*params))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(grad(*params))
+        elapsed = min(elapsed, time.time() - start)
+    return elapsed
+
+
+def main(args):
+    x = jnp.linspace(0, 1, args.num_data)
+    kernel = jnp.exp(-0.5 * (x[:, None] - x) ** 2 / 0.1**2)
+    y = random.normal(random.PRNGKey(0), (args.num_samples, args.num_data))
+    print("{:<30} {:>12}".format("parameterization", "time (ms)"))
+    for name, make_dist in get_problems(kernel, args).items():
+        elapsed = benchmark(make_dist, y, args)
+        print("{:<30} {:>12.3f}".format(name, 1000 * elapsed))
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="MultivariateNormal factorizations")
+    parser.add_argument("-n", "--num-data", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=1, type=int)
+    parser.add_argument("--noise", nargs="?", default=0.1, type=float)
+    parser.add_argument("--num-repeats", nargs="?", default=10, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
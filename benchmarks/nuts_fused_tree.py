@@ -0,0 +1,128 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: NUTS tree building
+=============================
+
+Compares the throughput, measured in gradient evaluations per second, of the
+default NUTS tree building (:func:`~numpyro.infer.hmc_util.build_tree`) and the
+fused tree building on flat arrays (:func:`~numpyro.infer.hmc_util.fused_build_tree`)
+for small and medium sized models, where the non-gradient overhead of each
+leapfrog step is most noticeable.
+
+Compilation time is excluded: warmup is run first, then a compiled sampling loop
+is timed from the post-warmup state.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import lax, random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import MCMC, NUTS
+
+
+def logistic_regression(X, y=None):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]))
+    intercept = numpyro.sample("intercept", dist.Normal(0, 10))
+    numpyro.sample("y", dist.Bernoulli(logits=X @ coefs + intercept), obs=y)
+
+
+def hierarchical(group, y=None, num_groups=None):
+    mu = numpyro.sample("mu", dist.Normal(0, 5))
+    tau = numpyro.sample("tau", dist.HalfCauchy(5))
+    with numpyro.plate("groups", num_groups):
+        theta = numpyro.sample("theta", dist.Normal(mu, tau))
+    sigma = numpyro.sample("sigma", dist.HalfNormal(1))
+    numpyro.sample("y", dist.Normal(theta[group], sigma), obs=y)
+
+
+def get_problems(args):
+    rng_key_x, rng_key_y, rng_key_g = random.split(random.PRNGKey(0), 3)
+    problems = {}
+    for dim in args.dims:
+        X = random.normal(rng_key_x, (args.num_data, dim))
+        y = dist.Bernoulli(logits=X.sum(-1)).sample(rng_key_y)
+        problems[f"logistic_regression(d={dim})"] = (logistic_regression, (X, y), {})
+    for num_groups in args.dims:
+        group = random.randint(rng_key_g, (args.num_data,), 0, num_groups)
+        y = random.normal(rng_key_y, (args.num_data,)) + group / num_groups
+        problems[f"hierarchical(groups={num_groups})"] = (
+            hierarchical,
+            (group, y),
+            {"num_groups": num_groups},
+        )
+    return problems
+
+
+def benchmark(model, model_args, model_kwargs, fused, args):
+    kernel = NUTS(model, fused_tree_building=fused)
+    mcmc = MCMC(
+        kernel,
+        num_warmup=args.num_warmup,
+        num_samples=args.num_samples,
+        num_chains=args.num_chains,
+        chain_method="vectorized",
+        progress_bar=False,
+    )
+    mcmc.warmup(random.PRNGKey(1), *model_args, **model_kwargs)
+
+    @jax.jit
+    def sample(state):
+        def body_fn(state, _):
+            state = kernel.sample(state, model_args, model_kwargs)
+            return state, state.num_steps
+
+        return lax.scan(body_fn, state, length=args.num_samples)
+
+    # compile the sampling loop before timing
+    jax.block_until_ready(sample(mcmc.last_state))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        _, num_steps = jax.block_until_ready(sample(mcmc.last_state))
+        elapsed = min(elapsed, time.time() - start)
+    return int(np.sum(num_steps)), elapsed
+
+
+def main(args):
+    print(
+        "{:<32} {:>16} {:>16} {:>10}".format("model", "build_tree", "fused", "speedup")
+    )
+    for name, (model, model_args, model_kwargs) in get_problems(args).items():
+        throughputs = []
+        for fused in [False, True]:
+            num_grads, elapsed = benchmark(model, model_args, model_kwargs, fused, args)
+            throughputs.append(num_grads / elapsed)
+        print(
+            "{:<32} {:>16.0f} {:>16.0f} {:>9.2f}x".format(
+                name, *throughputs, throughputs[1] / throughputs[0]
+            )
+        )
+    print("(throughput is in gradient evaluations per second)")
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="NUTS tree building benchmark")
+    parser.add_argument("-n", "--num-samples", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-warmup", nargs="?", default=500, type=int)
+    parser.add_argument("--num-chains", nargs="?", default=1, type=int)
+    parser.add_argument("--num-data", nargs="?", default=100, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=3, type=int)
+    parser.add_argument("--dims", nargs="+", default=[2, 10, 50], type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,99 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: Poisson samplers
+===========================
+
+Compares the throughput, measured in draws per second, of the samplers of
+:class:`~numpyro.distributions.Poisson` and
+:class:`~numpyro.distributions.GammaPoisson`: the default samplers, which rely on
+:func:`jax.random.poisson` and :func:`jax.random.gamma`, the vectorized rejection
+samplers ('ptrs') and the normal approximation of large rates ('normal').
+
+Compilation time is excluded: each sampler is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+
+SAMPLERS = [None, "ptrs", "normal"]
+
+
+def get_problems(args):
+    rng_key = random.PRNGKey(0)
+    shape = (args.num_draws,)
+    mixed = random.uniform(rng_key, shape, maxval=2 * args.large_rate)
+    problems = {}
+    for name, rate in [
+        (f"rate={args.small_rate:g}", jnp.full(shape, args.small_rate)),
+        (f"rate={args.large_rate:g}", jnp.full(shape, args.large_rate)),
+        (f"rate~U(0, {2 * args.large_rate:g})", mixed),
+    ]:
+        problems[f"Poisson({name})"] = lambda sampler, rate=rate: dist.Poisson(
+            rate, sampler=sampler, normal_threshold=args.normal_threshold
+        )
+    for concentration in [0.5, 10.0]:
+        mean = jnp.full(shape, args.large_rate)
+        problems[f"NegativeBinomial2(conc={concentration:g})"] = (
+            lambda sampler, mean=mean, concentration=concentration: (
+                dist.NegativeBinomial2(
+                    mean,
+                    concentration,
+                    sampler=sampler,
+                    normal_threshold=args.normal_threshold,
+                )
+            )
+        )
+    return problems
+
+
+def benchmark(d, args):
+    sample = jax.jit(lambda d, key: d.sample(key))
+    # compile the sampler before timing
+    jax.block_until_ready(sample(d, random.PRNGKey(1)))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for i in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(sample(d, random.PRNGKey(i)))
+        elapsed = min(elapsed, time.time() - start)
+    return args.num_draws / elapsed
+
+
+def main(args):
+    print(
+        "{:<36} {:>12} {:>12} {:>12}".format(
+            "distribution", *(str(sampler) for sampler in SAMPLERS)
+        )
+    )
+    for name, make_dist in get_problems(args).items():
+        throughputs = [benchmark(make_dist(sampler), args) for sampler in SAMPLERS]
+        print("{:<36} {:>12.3g} {:>12.3g} {:>12.3g}".format(name, *throughputs))
+    print("(throughput is in draws per second)")
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Poisson samplers benchmark")
+    parser.add_argument("-n", "--num-draws", nargs="?", default=1000000, type=int)
+    parser.add_argument("--small-rate", nargs="?", default=3.0, type=float)
+    parser.add_argument("--large-rate", nargs="?", default=1000.0, type=float)
+    parser.add_argument("--normal-threshold", nargs="?", default=100.0, type=float)
+    parser.add_argument("--num-repeats", nargs="?", default=3, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,97 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: rematerialization of scans
+=====================================
+
+Compares the gradient of the potential energy of a recurrent neural network
+model of a long time series, written with
+:func:`~numpyro.contrib.control_flow.scan`, without rematerialization, with
+rematerialization of each step (``remat=True``) and with rematerialization of
+chunks of `k` steps (``remat=k``). The same option can be set for all the scans
+of a model with the `remat` argument of :class:`~numpyro.infer.hmc.NUTS`,
+:class:`~numpyro.infer.hmc.HMC` or :class:`~numpyro.infer.svi.SVI`.
+
+For each option, the temporary memory reported by XLA for the compiled gradient
+and the time of a gradient evaluation are printed. Compilation time is excluded:
+each gradient is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+from numpyro.contrib.control_flow import scan
+import numpyro.distributions as dist
+from numpyro.infer.util import potential_energy
+
+
+def model(y, hidden_dim, remat=None):
+    w = numpyro.sample("w", dist.Normal(0, 0.1).expand([hidden_dim, hidden_dim]))
+    v = numpyro.sample("v", dist.Normal(0, 0.1).expand([hidden_dim]))
+    sigma = numpyro.sample("sigma", dist.HalfNormal(1))
+
+    def transition(h, y_t):
+        h = jnp.tanh(h @ w.T + y_t)
+        numpyro.sample("y", dist.Normal(h @ v, sigma), obs=y_t)
+        return h, None
+
+    scan(transition, jnp.zeros(hidden_dim), y, remat=remat)
+
+
+def benchmark(remat, y, args):
+    params = {
+        "w": jnp.zeros((args.hidden_dim, args.hidden_dim)),
+        "v": jnp.zeros(args.hidden_dim),
+        "sigma": jnp.zeros(()),
+    }
+    step = jax.jit(
+        jax.value_and_grad(
+            lambda params: potential_energy(
+                model, (y, args.hidden_dim), {"remat": remat}, params
+            )
+        )
+    )
+    memory = step.lower(params).compile().memory_analysis()
+    memory = None if memory is None else memory.temp_size_in_bytes / 2**20
+    # compile the step before timing
+    jax.block_until_ready(step(params))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(step(params))
+        elapsed = min(elapsed, time.time() - start)
+    return memory, elapsed
+
+
+def main(args):
+    y = random.normal(random.PRNGKey(0), (args.num_steps,))
+    print("{:<16} {:>12} {:>12}".format("remat", "temp (MiB)", "time (ms)"))
+    for remat in [None, True] + args.chunk_sizes:
+        memory, elapsed = benchmark(remat, y, args)
+        memory = "n/a" if memory is None else "{:.1f}".format(memory)
+        print("{:<16} {:>12} {:>12.2f}".format(str(remat), memory, 1000 * elapsed))
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Rematerialization of scans")
+    parser.add_argument("-t", "--num-steps", nargs="?", default=10_000, type=int)
+    parser.add_argument("--hidden-dim", nargs="?", default=128, type=int)
+    parser.add_argument("--chunk-sizes", nargs="+", default=[10, 100, 1000], type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=5, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
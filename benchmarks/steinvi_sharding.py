@@ -0,0 +1,111 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: SteinVI particle sharding
+====================================
+
+Measures the throughput of :class:`~numpyro.contrib.einstein.SVGD`, in particle
+updates per second, when the Stein particles are sharded across an increasing
+number of devices (see the `devices` argument of
+:class:`~numpyro.contrib.einstein.SteinVI`). On CPU, the devices are created with
+:func:`~numpyro.util.set_host_device_count`, so each device corresponds to one core.
+
+Compilation time is excluded: a compiled loop of SVGD steps is run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import lax, random
+import jax.numpy as jnp
+
+import numpyro
+from numpyro.contrib.einstein import SVGD, RBFKernel
+import numpyro.distributions as dist
+from numpyro.optim import Adagrad
+
+
+def logistic_regression(X, y=None):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event(1))
+    intercept = numpyro.sample("intercept", dist.Normal(0, 10))
+    with numpyro.plate("data", X.shape[0]):
+        numpyro.sample("y", dist.Bernoulli(logits=X @ coefs + intercept), obs=y)
+
+
+def benchmark(devices, X, y, args):
+    kernel = RBFKernel(approximation=args.approximation)
+    svgd = SVGD(
+        logistic_regression,
+        Adagrad(0.05),
+        kernel,
+        num_stein_particles=args.num_particles,
+        num_force_particles=args.num_force_particles,
+        devices=devices,
+    )
+    state = svgd.init(random.PRNGKey(0), X, y)
+
+    @jax.jit
+    def run(state):
+        return lax.fori_loop(
+            0, args.num_steps, lambda i, state: svgd.update(state, X, y)[0], state
+        )
+
+    # compile the loop before timing
+    jax.block_until_ready(run(state))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(run(state))
+        elapsed = min(elapsed, time.time() - start)
+    return args.num_particles * args.num_steps / elapsed
+
+
+def main(args):
+    rng_key_x, rng_key_y = random.split(random.PRNGKey(1))
+    X = random.normal(rng_key_x, (args.num_data, args.dim))
+    y = dist.Bernoulli(logits=X.sum(-1)).sample(rng_key_y)
+
+    devices = jax.local_devices()
+    print("{:>8} {:>20} {:>10}".format("devices", "particles/sec", "speedup"))
+    baseline = None
+    num_devices = 1
+    while num_devices <= len(devices):
+        throughput = benchmark(devices[:num_devices], X, y, args)
+        baseline = throughput if baseline is None else baseline
+        print(
+            "{:>8} {:>20.0f} {:>9.2f}x".format(
+                num_devices, throughput, throughput / baseline
+            )
+        )
+        num_devices *= 2
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="SteinVI sharding benchmark")
+    parser.add_argument("--num-devices", nargs="?", default=4, type=int)
+    parser.add_argument("--num-particles", nargs="?", default=256, type=int)
+    parser.add_argument("--num-force-particles", nargs="?", default=None, type=int)
+    parser.add_argument(
+        "--approximation",
+        default=None,
+        choices=["random_features", "nystrom"],
+        help="kernel approximation, see RBFKernel",
+    )
+    parser.add_argument("--num-steps", nargs="?", default=20, type=int)
+    parser.add_argument("--num-data", nargs="?", default=1000, type=int)
+    parser.add_argument("--dim", nargs="?", default=20, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=3, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    numpyro.set_host_device_count(args.num_devices)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,108 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: structured multivariate normal distributions
+=======================================================
+
+Measures the time of a gradient evaluation of the log density, with respect to the
+covariance parameters, of :class:`~numpyro.distributions.KroneckerMultivariateNormal`,
+:class:`~numpyro.distributions.ToeplitzMultivariateNormal` and
+:class:`~numpyro.distributions.BlockDiagonalMultivariateNormal`. Each is compared
+with a dense :class:`~numpyro.distributions.MultivariateNormal` that has the same
+covariance matrix.
+
+Compilation time is excluded: each gradient is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+
+
+def squared_exponential(n, length_scale):
+    x = jnp.arange(n) / n
+    return jnp.exp(-0.5 * (x[:, None] - x) ** 2 / length_scale**2) + 1e-3 * jnp.eye(n)
+
+
+def get_problems(args):
+    T, S = args.num_times, args.num_sites
+    n = T * S
+    block_size = n // args.num_blocks
+    return {
+        f"Kronecker ({T} x {S})": (
+            jnp.array([0.1, 0.2]),
+            lambda ls: dist.KroneckerMultivariateNormal(
+                0.0, squared_exponential(T, ls[0]), squared_exponential(S, ls[1])
+            ),
+        ),
+        f"Toeplitz ({n})": (
+            jnp.array(0.1),
+            lambda ls: dist.ToeplitzMultivariateNormal(
+                0.0, squared_exponential(n, ls)[0]
+            ),
+        ),
+        f"BlockDiagonal ({args.num_blocks} x {block_size})": (
+            jnp.full((args.num_blocks, 1, 1), 0.1),
+            lambda ls: dist.BlockDiagonalMultivariateNormal(
+                0.0, jax.vmap(squared_exponential, (None, 0))(block_size, ls[:, 0, 0])
+            ),
+        ),
+    }
+
+
+def benchmark(make_dist, params, y, args):
+    grad = jax.jit(jax.grad(lambda params: make_dist(params).log_prob(y).sum()))
+    # compile the gradient before timing
+    jax.block_until_ready(grad(params))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(grad(params))
+        elapsed = min(elapsed, time.time() - start)
+    return elapsed
+
+
+def main(args):
+    n = args.num_times * args.num_sites
+    y = random.normal(random.PRNGKey(0), (args.num_samples, n))
+    print("{:<28} {:>14} {:>14}".format("covariance", "dense (ms)", "structured (ms)"))
+    for name, (params, make_dist) in get_problems(args).items():
+        structured = benchmark(make_dist, params, y, args)
+        dense = benchmark(
+            lambda params: dist.MultivariateNormal(
+                0.0, make_dist(params).covariance_matrix
+            ),
+            params,
+            y,
+            args,
+        )
+        print(
+            "{:<28} {:>14.2f} {:>14.2f}".format(name, 1000 * dense, 1000 * structured)
+        )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Structured MVN benchmark")
+    parser.add_argument("--num-times", nargs="?", default=50, type=int)
+    parser.add_argument("--num-sites", nargs="?", default=40, type=int)
+    parser.add_argument("--num-blocks", nargs="?", default=20, type=int)
+    parser.add_argument("--num-samples", nargs="?", default=1, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=5, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,71 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: batched SVI
+======================
+
+Measures the time to fit the same local level model to many independent series,
+either with a Python loop of :meth:`~numpyro.infer.svi.SVI.run` or with a single
+call of :meth:`~numpyro.infer.svi.SVI.run_batched`.
+
+The loop includes the dispatch and compilation of each run, as in a service that
+fits a new series at each call; the batched run includes its single compilation.
+"""
+
+import argparse
+import time
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+
+
+def model(y):
+    level = numpyro.sample("level", dist.Normal(0, 10))
+    scale = numpyro.sample("scale", dist.HalfNormal(1))
+    with numpyro.plate("time", y.shape[-1]):
+        numpyro.sample("obs", dist.Normal(level, scale), obs=y)
+
+
+def main(args):
+    y = jnp.arange(args.num_series)[:, None] + random.normal(
+        random.PRNGKey(0), (args.num_series, args.num_times)
+    )
+    rng_keys = random.split(random.PRNGKey(1), args.num_series)
+    svi = SVI(model, AutoNormal(model), numpyro.optim.Adam(0.05), Trace_ELBO())
+
+    start = time.time()
+    for i in range(args.num_series):
+        svi_result = svi.run(rng_keys[i], args.num_steps, y[i], progress_bar=False)
+        jax.block_until_ready(svi_result.losses)
+    loop = time.time() - start
+
+    start = time.time()
+    svi_result = svi.run_batched(rng_keys, args.num_steps, y, in_axes=0)
+    jax.block_until_ready(svi_result.losses)
+    batched = time.time() - start
+
+    print("{:<24} {:>10}".format("method", "time (s)"))
+    print("{:<24} {:>10.2f}".format("loop of SVI.run", loop))
+    print("{:<24} {:>10.2f}".format("SVI.run_batched", batched))
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Batched SVI benchmark")
+    parser.add_argument("--num-series", nargs="?", default=100, type=int)
+    parser.add_argument("--num-times", nargs="?", default=50, type=int)
+    parser.add_argument("--num-steps", nargs="?", default=1000, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,121 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: SVI with conjugate sites
+===================================
+
+Fits a hierarchical Gamma-Poisson model, where the Poisson rates of many groups share
+a Gamma prior with an unknown concentration, either with
+:class:`~numpyro.infer.autoguide.AutoNormal` over all the latent sites, or with
+the rates as `conjugate_sites` of :class:`~numpyro.infer.svi.SVI`, which are updated
+with closed-form natural gradient steps, and `AutoNormal` over the concentration.
+
+For each fit, :meth:`~numpyro.infer.svi.SVI.run` is compiled and run once before
+timing, and the number of steps until the smoothed loss is within `tol` of the
+final loss of the best fit is printed with the time of the run and the time taken
+by these steps.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.handlers import block
+from numpyro.infer import SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+
+
+def model(counts):
+    concentration = numpyro.sample("concentration", dist.LogNormal(0, 1))
+    with numpyro.plate("groups", counts.shape[-1]):
+        rate = numpyro.sample("rate", dist.Gamma(concentration, 0.1))
+        with numpyro.plate("N", counts.shape[0], dim=-2):
+            numpyro.sample("obs", dist.Poisson(rate), obs=counts)
+
+
+def fit(svi, args, counts):
+    # initialize the guide outside of the compiled run
+    svi_state = svi.init(random.PRNGKey(2), counts)
+    run = jax.jit(
+        lambda svi_state: svi.run(
+            None, args.num_steps, counts, progress_bar=False, init_state=svi_state
+        )
+    )
+    # compile the run before timing
+    jax.block_until_ready(run(svi_state).losses)
+    start = time.time()
+    losses = jax.block_until_ready(run(svi_state).losses)
+    return np.asarray(losses), time.time() - start
+
+
+def steps_to_converge(losses, target, tol, window=20):
+    smoothed = np.convolve(losses, np.ones(window) / window, mode="valid")
+    converged = np.nonzero(smoothed < target + tol)[0]
+    return converged[0] + window if converged.size else None
+
+
+def main(args):
+    rates = random.gamma(random.PRNGKey(0), 2.0, (args.num_groups,)) * 10
+    counts = random.poisson(random.PRNGKey(1), rates, (args.num_data, args.num_groups))
+    counts = counts.astype(jnp.float32)
+
+    svis = {
+        "AutoNormal": SVI(
+            model, AutoNormal(model), numpyro.optim.Adam(args.step_size), Trace_ELBO()
+        ),
+        "AutoNormal + conjugate": SVI(
+            model,
+            AutoNormal(block(model, hide=["rate"])),
+            numpyro.optim.Adam(args.step_size),
+            Trace_ELBO(),
+            conjugate_sites=["rate"],
+            conjugate_step_size=args.conjugate_step_size,
+        ),
+    }
+    results = {name: fit(svi, args, counts) for name, svi in svis.items()}
+    final = {name: np.mean(losses[-100:]) for name, (losses, _) in results.items()}
+    target = min(final.values())
+    print(
+        "{:<24} {:>12} {:>8} {:>10} {:>22}".format(
+            "guide", "final loss", "steps", "time (s)", "time to converge (s)"
+        )
+    )
+    for name, (losses, elapsed) in results.items():
+        steps = steps_to_converge(losses, target, args.tol)
+        print(
+            "{:<24} {:>12.2f} {:>8} {:>10.2f} {:>22}".format(
+                name,
+                final[name],
+                "n/a" if steps is None else steps,
+                elapsed,
+                "n/a"
+                if steps is None
+                else "{:.3f}".format(elapsed * steps / args.num_steps),
+            )
+        )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="SVI with conjugate sites")
+    parser.add_argument("--num-groups", nargs="?", default=500, type=int)
+    parser.add_argument("-n", "--num-data", nargs="?", default=20, type=int)
+    parser.add_argument("--num-steps", nargs="?", default=5000, type=int)
+    parser.add_argument("--step-size", nargs="?", default=0.05, type=float)
+    parser.add_argument("--conjugate-step-size", nargs="?", default=0.5, type=float)
+    parser.add_argument("--tol", nargs="?", default=10.0, type=float)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,80 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: SVI early stopping
+=============================
+
+Measures the time of :meth:`~numpyro.infer.svi.SVI.run` on a Bayesian linear
+regression with a budget of `num_steps` steps:
+
+- without early stopping, in a compiled scan over all the steps;
+- with early stopping and a progress bar, where the steps are dispatched from Python
+  and the criterion is checked on the host;
+- with early stopping and no progress bar, where the criterion is checked on device
+  in a while loop over compiled scans.
+
+Compilation time is included, as in a job which runs a single fit.
+"""
+
+import argparse
+import time
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+from numpyro.infer.svi import EarlyStopping
+
+
+def model(X, y):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event())
+    with numpyro.plate("N", X.shape[0]):
+        numpyro.sample("obs", dist.Normal(X @ coefs, 1), obs=y)
+
+
+def main(args):
+    X = random.normal(random.PRNGKey(0), (args.num_data, args.num_features))
+    y = X @ jnp.ones(args.num_features) + random.normal(
+        random.PRNGKey(1), (args.num_data,)
+    )
+    svi = SVI(model, AutoNormal(model), numpyro.optim.Adam(0.01), Trace_ELBO())
+    early_stopping = EarlyStopping(window=args.window, rtol=args.rtol)
+    print("{:<36} {:>8} {:>10}".format("method", "steps", "time (s)"))
+    for name, kwargs in [
+        ("scan", dict(progress_bar=False)),
+        ("early stopping, host", dict(early_stopping=early_stopping)),
+        (
+            "early stopping, on device",
+            dict(progress_bar=False, early_stopping=early_stopping),
+        ),
+    ]:
+        start = time.time()
+        svi_result = svi.run(random.PRNGKey(2), args.num_steps, X, y, **kwargs)
+        jax.block_until_ready(svi_result.losses)
+        elapsed = time.time() - start
+        num_steps = (
+            args.num_steps if svi_result.num_steps is None else svi_result.num_steps
+        )
+        print("{:<36} {:>8} {:>10.2f}".format(name, int(num_steps), elapsed))
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="SVI early stopping benchmark")
+    parser.add_argument("--num-data", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=20, type=int)
+    parser.add_argument("-n", "--num-steps", nargs="?", default=50_000, type=int)
+    parser.add_argument("--window", nargs="?", default=500, type=int)
+    parser.add_argument("--rtol", nargs="?", default=1e-4, type=float)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
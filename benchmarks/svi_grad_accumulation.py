@@ -0,0 +1,96 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: SVI gradient accumulation
+====================================
+
+Compares an SVI step on a full dataset of a one hidden layer Bayesian neural network
+with :meth:`~numpyro.infer.svi.SVI.accumulated_update` over the same dataset split
+into `K` minibatches, with and without rematerialization. For each, the temporary
+memory reported by XLA for the compiled step and the time of a step are printed.
+
+Compilation time is excluded: each step is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoNormal
+
+
+def model(X, y, num_data):
+    D, H = X.shape[-1], 64
+    w1 = numpyro.sample("w1", dist.Normal(0, 1).expand([D, H]).to_event())
+    w2 = numpyro.sample("w2", dist.Normal(0, 1).expand([H]).to_event())
+    # the likelihood of a minibatch is scaled to the full dataset
+    with numpyro.plate("N", num_data, subsample_size=X.shape[0]):
+        logits = jnp.tanh(X @ w1) @ w2
+        numpyro.sample("obs", dist.Bernoulli(logits=logits), obs=y)
+
+
+def benchmark(step_fn, svi_state, args):
+    step = jax.jit(step_fn)
+    memory = step.lower(svi_state).compile().memory_analysis()
+    memory = None if memory is None else memory.temp_size_in_bytes / 2**20
+    # compile the step before timing
+    jax.block_until_ready(step(svi_state))
+    # report the best of a few repeats to reduce timing noise
+    elapsed = np.inf
+    for _ in range(args.num_repeats):
+        start = time.time()
+        jax.block_until_ready(step(svi_state))
+        elapsed = min(elapsed, time.time() - start)
+    return memory, elapsed
+
+
+def main(args):
+    N, K = args.num_data, args.num_batches
+    X = random.normal(random.PRNGKey(0), (N, args.num_features))
+    y = random.bernoulli(random.PRNGKey(1), 0.5, (N,)).astype(jnp.float32)
+    X_batches = X.reshape((K, N // K, -1))
+    y_batches = y.reshape((K, N // K))
+
+    svi = SVI(
+        model, AutoNormal(model), numpyro.optim.Adam(0.01), Trace_ELBO(), num_data=N
+    )
+    svi_state = svi.init(random.PRNGKey(2), X, y)
+    steps = {
+        "full batch": lambda state: svi.update(state, X, y),
+        f"{K} minibatches": lambda state: svi.accumulated_update(
+            state, X_batches, y_batches
+        ),
+        f"{K} minibatches, remat": lambda state: svi.accumulated_update(
+            state, X_batches, y_batches, remat=True
+        ),
+    }
+    print("{:<28} {:>12} {:>12}".format("update", "temp (MiB)", "time (ms)"))
+    for name, step_fn in steps.items():
+        memory, elapsed = benchmark(step_fn, svi_state, args)
+        memory = "n/a" if memory is None else "{:.1f}".format(memory)
+        print("{:<28} {:>12} {:>12.2f}".format(name, memory, 1000 * elapsed))
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="SVI gradient accumulation")
+    parser.add_argument("-n", "--num-data", nargs="?", default=100_000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=50, type=int)
+    parser.add_argument("-k", "--num-batches", nargs="?", default=10, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=5, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
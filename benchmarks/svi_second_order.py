@@ -0,0 +1,132 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: second order SVI optimizers
+======================================
+
+Compares first order :class:`~numpyro.optim.Adam` with
+:class:`~numpyro.optim.LBFGS` on a MAP fit of a logistic regression with
+:class:`~numpyro.infer.autoguide.AutoDelta`, and with
+:class:`~numpyro.optim.NaturalGradient`, wrapping SGD with gradient clipping, on a
+variational fit of the same model with
+:class:`~numpyro.infer.autoguide.AutoMultivariateNormal`.
+
+For each optimizer, :meth:`~numpyro.infer.svi.SVI.run` is compiled and run once
+before timing, and the number of steps until the smoothed loss is within `tol` of
+the final loss of the best optimizer is printed with the time of the run.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import jax
+from jax import random
+import jax.numpy as jnp
+import optax
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import SVI, Trace_ELBO
+from numpyro.infer.autoguide import AutoDelta, AutoMultivariateNormal
+from numpyro.optim import LBFGS, Adam, NaturalGradient
+
+
+def model(X, y):
+    coefs = numpyro.sample("coefs", dist.Normal(0, 1).expand([X.shape[1]]).to_event())
+    with numpyro.plate("N", X.shape[0]):
+        numpyro.sample("obs", dist.Bernoulli(logits=X @ coefs), obs=y)
+
+
+def fit(guide, optim, args, X, y, num_particles):
+    svi = SVI(model, guide, optim, Trace_ELBO(num_particles))
+    # initialize the guide outside of the compiled run
+    svi_state = svi.init(random.PRNGKey(2), X, y)
+    run = jax.jit(
+        lambda svi_state: svi.run(
+            None, args.num_steps, X, y, progress_bar=False, init_state=svi_state
+        )
+    )
+    # compile the run before timing
+    jax.block_until_ready(run(svi_state).losses)
+    start = time.time()
+    losses = jax.block_until_ready(run(svi_state).losses)
+    return np.asarray(losses), time.time() - start
+
+
+def steps_to_converge(losses, target, tol, window=20):
+    smoothed = np.convolve(losses, np.ones(window) / window, mode="valid")
+    converged = np.nonzero(smoothed < target + tol)[0]
+    return converged[0] + window if converged.size else None
+
+
+def main(args):
+    N, D = args.num_data, args.num_features
+    # correlated features make the posterior ill-conditioned
+    latent = random.normal(random.PRNGKey(0), (N, 1))
+    X = latent + 0.3 * random.normal(random.PRNGKey(1), (N, D))
+    logits = X @ jnp.linspace(-1, 1, D) / 4
+    y = random.bernoulli(random.PRNGKey(3), jax.nn.sigmoid(logits)).astype(jnp.float32)
+
+    map_guide = AutoDelta(model)
+    vi_guide = AutoMultivariateNormal(model)
+    natural_gradient = NaturalGradient(
+        vi_guide,
+        optax.chain(optax.clip_by_global_norm(1.0), optax.sgd(args.ng_step_size)),
+    )
+    experiments = {
+        "MAP (AutoDelta)": (
+            map_guide,
+            1,
+            {"Adam": Adam(args.step_size), "LBFGS": LBFGS()},
+        ),
+        "VI (AutoMultivariateNormal)": (
+            vi_guide,
+            args.num_particles,
+            {"Adam": Adam(args.step_size), "NaturalGradient": natural_gradient},
+        ),
+    }
+    print(
+        "{:<28} {:<22} {:>12} {:>12} {:>10}".format(
+            "fit", "optimizer", "final loss", "steps", "time (s)"
+        )
+    )
+    for fit_name, (guide, num_particles, optims) in experiments.items():
+        results = {
+            name: fit(guide, optim, args, X, y, num_particles)
+            for name, optim in optims.items()
+        }
+        final = {name: np.mean(losses[-100:]) for name, (losses, _) in results.items()}
+        target = min(final.values())
+        for name, (losses, elapsed) in results.items():
+            steps = steps_to_converge(losses, target, args.tol)
+            print(
+                "{:<28} {:<22} {:>12.2f} {:>12} {:>10.2f}".format(
+                    fit_name,
+                    name,
+                    final[name],
+                    "n/a" if steps is None else steps,
+                    elapsed,
+                )
+            )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="Second order SVI optimizers")
+    parser.add_argument("-n", "--num-data", nargs="?", default=1000, type=int)
+    parser.add_argument("--num-features", nargs="?", default=20, type=int)
+    parser.add_argument("--num-steps", nargs="?", default=5000, type=int)
+    parser.add_argument("--num-particles", nargs="?", default=4, type=int)
+    parser.add_argument("--step-size", nargs="?", default=0.01, type=float)
+    parser.add_argument("--ng-step-size", nargs="?", default=0.3, type=float)
+    parser.add_argument("--tol", nargs="?", default=1.0, type=float)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -0,0 +1,127 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: TruncatedNormal in the tails
+=======================================
+
+Compares :class:`~numpyro.distributions.TruncatedNormal` with a plain inverse-CDF
+sampler, which mixes the base cdf at the truncation points in linear space, across
+truncation regimes ranging from the bulk of the distribution to its far tails.
+For each regime, reports the sampling throughput, the fraction of invalid samples
+(non-finite or outside of the support), the error of the sample mean, and the
+throughput and maximum error of :meth:`log_prob` over a batch of censored
+observations. The references are computed with :data:`scipy.stats.truncnorm`.
+
+Compilation time is excluded: each function is compiled and run once before timing.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy import stats
+
+import jax
+from jax import random
+import jax.numpy as jnp
+from jax.scipy.special import ndtr, ndtri
+
+import numpyro
+import numpyro.distributions as dist
+
+REGIMES = {
+    "bulk [-1, 1]": (-1.0, 1.0),
+    "tail [3, inf)": (3.0, np.inf),
+    "far tail [15, inf)": (15.0, np.inf),
+    "far tail [40, 41]": (40.0, 41.0),
+    "narrow [8, 8.01]": (8.0, 8.01),
+    "lower tail (-inf, -20]": (-np.inf, -20.0),
+}
+
+
+def inverse_cdf_sample(key, low, high, num_samples):
+    u = random.uniform(key, (num_samples,))
+    return ndtri(ndtr(low) + u * (ndtr(high) - ndtr(low)))
+
+
+def timeit(fn, *args, num_repeats):
+    # compile before timing, then report the best of a few repeats
+    out = jax.block_until_ready(fn(*args))
+    elapsed = np.inf
+    for _ in range(num_repeats):
+        start = time.time()
+        jax.block_until_ready(fn(*args))
+        elapsed = min(elapsed, time.time() - start)
+    return out, elapsed
+
+
+def summarize(samples, low, high, expected_mean):
+    samples = np.asarray(samples, dtype=np.float64)
+    valid = np.isfinite(samples) & (samples >= low) & (samples <= high)
+    error = abs(samples[valid].mean() - expected_mean) if valid.any() else np.nan
+    return 1 - valid.mean(), error
+
+
+def main(args):
+    key = random.PRNGKey(0)
+    print(
+        "{:<24} {:>14} {:>10} {:>10} {:>14} {:>10} {:>10} {:>14} {:>10}".format(
+            "regime",
+            "icdf draws/s",
+            "invalid",
+            "mean err",
+            "draws/s",
+            "invalid",
+            "mean err",
+            "log_prob /s",
+            "max err",
+        )
+    )
+    for name, (low, high) in REGIMES.items():
+        reference = stats.truncnorm(low, high)
+        d = dist.TruncatedNormal(
+            low=None if np.isinf(low) else low, high=None if np.isinf(high) else high
+        )
+
+        baseline_fn = jax.jit(
+            lambda key: inverse_cdf_sample(key, low, high, args.num_samples)
+        )
+        samples, elapsed = timeit(baseline_fn, key, num_repeats=args.num_repeats)
+        baseline = (args.num_samples / elapsed,) + summarize(
+            samples, low, high, reference.mean()
+        )
+
+        sample_fn = jax.jit(lambda key: d.sample(key, (args.num_samples,)))
+        samples, elapsed = timeit(sample_fn, key, num_repeats=args.num_repeats)
+        result = (args.num_samples / elapsed,) + summarize(
+            samples, low, high, reference.mean()
+        )
+
+        value = reference.ppf(np.linspace(0.001, 0.999, args.num_samples))
+        log_prob, elapsed = timeit(
+            jax.jit(d.log_prob), jnp.asarray(value), num_repeats=args.num_repeats
+        )
+        error = np.max(np.abs(np.asarray(log_prob) - reference.logpdf(value)))
+        print(
+            "{:<24} {:>14.3g} {:>10.3g} {:>10.3g} {:>14.3g} {:>10.3g} {:>10.3g}"
+            " {:>14.3g} {:>10.3g}".format(
+                name, *baseline, *result, args.num_samples / elapsed, error
+            )
+        )
+
+
+if __name__ == "__main__":
+    assert numpyro.__version__.startswith("0.18.0")
+    parser = argparse.ArgumentParser(description="TruncatedNormal benchmark")
+    parser.add_argument("-n", "--num-samples", nargs="?", default=1000000, type=int)
+    parser.add_argument("--num-repeats", nargs="?", default=3, type=int)
+    parser.add_argument("--device", default="cpu", type=str, help='use "cpu" or "gpu".')
+    parser.add_argument("--x64", action="store_true", help="use double precision")
+    args = parser.parse_args()
+
+    numpyro.set_platform(args.device)
+    numpyro.enable_x64(args.x64)
+    jnp.zeros(())  # initialize the backend before timing
+
+    main(args)
@@ -3,7 +3,7 @@
 
 from collections import OrderedDict
 from functools import partial
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 import jax
 from jax import lax, random
@@ -119,6 +119,50 @@ def _promote_scanned_value_shapes(value, fn):
         return value
 
 
+def _checkpoint_scan(f, init, xs, length, reverse=False, remat=None):
+    # a helper function to run `lax.scan` where the intermediate values of `f`
+    # are rematerialized in the backward pass:
+    #   + remat=True: the carry of each step is saved, and each step is
+    #     recomputed in the backward pass
+    #   + remat=k: the carry of every k steps is saved, and the backward pass of
+    #     each chunk of k steps recomputes the intermediate values of that chunk
+    if not remat:
+        return lax.scan(f, init, xs, length=length, reverse=reverse)
+    k = 1 if remat is True else int(remat)
+    if k <= 1 or length <= k:
+        return lax.scan(jax.checkpoint(f), init, xs, length=length, reverse=reverse)
+
+    num_chunks = length // k
+    split = num_chunks * k
+    head = jax.tree.map(lambda x: x[:split].reshape((num_chunks, k) + x.shape[1:]), xs)
+    tail = jax.tree.map(lambda x: x[split:], xs)
+
+    @jax.checkpoint
+    def chunk_fn(carry, x):
+        return lax.scan(f, carry, x, length=k, reverse=reverse)
+
+    def scan_head(carry):
+        carry, ys = lax.scan(chunk_fn, carry, head, length=num_chunks, reverse=reverse)
+        return carry, jax.tree.map(lambda y: y.reshape((split,) + y.shape[2:]), ys)
+
+    def scan_tail(carry):
+        return lax.scan(
+            jax.checkpoint(f), carry, tail, length=length - split, reverse=reverse
+        )
+
+    if split == length:
+        return scan_head(init)
+    # in reverse mode, the tail is scanned before the head
+    if reverse:
+        carry, tail_ys = scan_tail(init)
+        carry, head_ys = scan_head(carry)
+    else:
+        carry, head_ys = scan_head(init)
+        carry, tail_ys = scan_tail(carry)
+    ys = jax.tree.map(lambda a, b: jnp.concatenate([a, b]), head_ys, tail_ys)
+    return carry, ys
+
+
 def scan_enum(
     f,
     init,
@@ -129,6 +173,7 @@ def scan_enum(
     substitute_stack=None,
     history=1,
     first_available_dim=None,
+    remat=None,
 ):
     from numpyro.contrib.funsor import (
         config_enumerate,
@@ -230,8 +275,8 @@ def scan_enum(
                 # return early if length = unroll_steps
                 if length == unroll_steps:
                     return wrapped_carry, (PytreeTrace({}), y0s)
-                wrapped_carry, (pytree_trace, ys) = lax.scan(
-                    body_fn, wrapped_carry, xs_, length - unroll_steps, reverse
+                wrapped_carry, (pytree_trace, ys) = _checkpoint_scan(
+                    body_fn, wrapped_carry, xs_, length - unroll_steps, reverse, remat
                 )
 
     first_var = None
@@ -285,6 +330,7 @@ def scan_wrapper(
     enum=False,
     history=1,
     first_available_dim=None,
+    remat=None,
 ):
     if length is None:
         length = jnp.shape(jax.tree.flatten(xs)[0][0])[0]
@@ -303,6 +349,7 @@ def scan_wrapper(
             substitute_stack,
             history,
             first_available_dim,
+            remat,
         )
 
     def body_fn(wrapped_carry, x):
@@ -333,8 +380,8 @@ def scan_wrapper(
         return (i + 1, rng_key, carry), (PytreeTrace(trace), y)
 
     wrapped_carry = (jnp.asarray(0), rng_key, init)
-    last_carry, (pytree_trace, ys) = lax.scan(
-        body_fn, wrapped_carry, xs, length=length, reverse=reverse
+    last_carry, (pytree_trace, ys) = _checkpoint_scan(
+        body_fn, wrapped_carry, xs, length, reverse, remat
     )
     for name, site in pytree_trace.trace.items():
         if site["type"] != "sample":
@@ -352,6 +399,7 @@ def scan(
     length: Optional[int] = None,
     reverse: bool = False,
     history: int = 1,
+    remat: Optional[Union[bool, int]] = None,
 ):
     """
     This primitive scans a function over the leading array axes of
@@ -452,6 +500,16 @@ def scan(
         forward (the default) or in reverse
     :param int history: The number of previous contexts visible from the current context.
         Defaults to 1. If zero, this is similar to :class:`numpyro.plate`.
+    :param bool | int | None remat: whether to rematerialize the intermediate values of `f` in the
+        backward pass with :func:`jax.checkpoint`, which trades computation for
+        memory when differentiating through a long scan. If True, only the carry
+        of each step is kept for the backward pass. If an integer `k`, only the
+        carry of every `k` steps is kept, and the intermediate values of each chunk
+        of `k` steps are recomputed at once, e.g. `k` close to `sqrt(length)`
+        keeps `O(sqrt(length))` carries and steps in memory. Defaults to
+        None, which does not rematerialize unless the default is set by the
+        inference algorithm, e.g. by the `remat` argument of
+        :class:`~numpyro.infer.hmc.HMC` or :class:`~numpyro.infer.svi.SVI`.
     :return: output of scan, quoted from :func:`jax.lax.scan` docs:
         "pair of type (c, [b]) where the first element represents the final loop
         carry value and the second element represents the stacked outputs of the
@@ -460,7 +518,7 @@ def scan(
     # if there are no active Messengers, we just run and return it as expected:
     if not _PYRO_STACK:
         (length, rng_key, carry), (pytree_trace, ys) = scan_wrapper(
-            f, init, xs, length=length, reverse=reverse
+            f, init, xs, length=length, reverse=reverse, remat=remat
         )
         return carry, ys
     else:
@@ -469,7 +527,12 @@ def scan(
             "type": "control_flow",
             "fn": scan_wrapper,
             "args": (f, init, xs, length, reverse),
-            "kwargs": {"rng_key": None, "substitute_stack": [], "history": history},
+            "kwargs": {
+                "rng_key": None,
+                "substitute_stack": [],
+                "history": history,
+                "remat": remat,
+            },
             "value": None,
         }
 
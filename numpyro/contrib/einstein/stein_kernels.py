@@ -45,6 +45,42 @@ class SteinKernel(ABC):
         """
         raise NotImplementedError
 
+    def compute_grad(
+        self,
+        rng_key,
+        particles: jnp.ndarray,
+        particle_info: dict[str, tuple[int, int]],
+        loss_fn: Callable[[jnp.ndarray], float],
+    ):
+        r"""Computes the gradient of the kernel function with respect to its first
+        argument in closed form. The arguments are the same as in :meth:`compute`.
+
+        :return: The function to compute the kernel gradient for a pair of particles
+            `(d,) (d,) -> (d,)`, or `None` (default) if the kernel does not provide
+            one, in which case the gradient is computed by automatic
+            differentiation. For a matrix-valued kernel `K`, the output is the
+            divergence :math:`\sum_b \partial K_{ab} / \partial x_b`.
+        """
+        return None
+
+    def compute_features(
+        self,
+        rng_key,
+        particles: jnp.ndarray,
+        particle_info: dict[str, tuple[int, int]],
+        loss_fn: Callable[[jnp.ndarray], float],
+    ):
+        r"""Computes a finite dimensional feature map :math:`\phi` of the kernel,
+        such that :math:`k(x,y) = \phi(x)^T \phi(y)`. The arguments are the same as
+        in :meth:`compute`. A feature map with `D` features allows
+        :class:`~numpyro.contrib.einstein.SteinVI` to compute the Stein forces in
+        :math:`O(m D d)` rather than :math:`O(m^2 d)` time for `m` particles.
+
+        :return: The feature map `(d,) -> (D,)`, or `None` (default) if the kernel
+            does not have a finite dimensional feature map.
+        """
+        return None
+
     def init(self, rng_key, particles_shape):
         """
         Initializes the kernel
@@ -54,6 +90,54 @@ class SteinKernel(ABC):
         pass
 
 
+def _random_fourier_features(rng_key, dim, num_features, scale, weights_scale):
+    r"""
+    Random Fourier features :math:`\phi(x) = scale \sqrt{2/D} \cos(W x + b)` of a
+    stationary kernel, where the rows of :math:`W` are standard normal draws
+    multiplied by `weights_scale`.
+    """
+    rng_weight, rng_bias = random.split(rng_key)
+    weights = random.normal(rng_weight, (num_features, dim))
+    weights = weights * jnp.reshape(weights_scale, (-1, 1))
+    biases = random.uniform(rng_bias, (num_features,), maxval=2 * np.pi)
+
+    def features(x):
+        return scale * jnp.sqrt(2 / num_features) * jnp.cos(weights @ x + biases)
+
+    return features
+
+
+def _nystrom_features(rng_key, particles, num_features, kernel):
+    r"""
+    Nyström features :math:`\phi(x) = K_{LL}^{-1/2} k(L, x)` of a kernel, where the
+    landmarks :math:`L` are a random subset of the particles.
+    """
+    num_landmarks = min(num_features, particles.shape[0])
+    landmarks = stop_gradient(
+        particles[
+            random.choice(rng_key, particles.shape[0], (num_landmarks,), replace=False)
+        ]
+    )
+    gram = vmap(lambda x: vmap(lambda y: kernel(x, y))(landmarks))(landmarks)
+    eigvals, eigvecs = jnp.linalg.eigh(gram)
+    # pseudo-inverse square root: directions with negligible eigenvalues are dropped
+    tol = jnp.finfo(gram.dtype).eps * num_landmarks * eigvals[-1]
+    inv_sqrt = jnp.where(eigvals > tol, 1 / jnp.sqrt(jnp.abs(eigvals)), 0.0)
+    inv_sqrt_gram = (eigvecs * inv_sqrt) @ eigvecs.T
+
+    def features(x):
+        return inv_sqrt_gram @ vmap(lambda y: kernel(x, y))(landmarks)
+
+    return features
+
+
+def _features_kernel(features):
+    def kernel(x, y):
+        return features(x) @ features(y)
+
+    return kernel
+
+
 class RBFKernel(SteinKernel):
     """Calculates the Gaussian RBF kernel function used in [1]. The kernel is given by
 
@@ -65,6 +149,11 @@ class RBFKernel(SteinKernel):
 
     In the above :math:`m` is the number of particles.
 
+    For a large number of particles, the kernel can be approximated by random Fourier
+    features [2] or by the Nyström method [3], which allows
+    :class:`~numpyro.contrib.einstein.SteinVI` to compute the Stein forces in linear
+    time in the number of particles.
+
     :param str mode: Either 'norm' (default) specifying to take the norm of each
         particle, 'vector' to return a component-wise kernel or 'matrix' to return a
         matrix-valued kernel
@@ -72,11 +161,24 @@ class RBFKernel(SteinKernel):
         norm kernel or 'vector_diag' for diagonal of vector-valued kernel
     :param bandwidth_factor: A multiplier to the bandwidth based on data size n
         (default 1/log(n))
+    :param str approximation: Either `None` (default) for the exact kernel,
+        'random_features' for random Fourier features or 'nystrom' for Nyström
+        features with landmarks drawn from the particles. Only supported for 'norm'
+        mode.
+    :param int num_features: Number of random features or Nyström landmarks.
+        Default is 100.
+    :param int bandwidth_subset: Number of randomly selected particles used to
+        compute the median heuristic, which otherwise costs quadratic memory in the
+        number of particles. Default is None, meaning all particles.
 
     **References:**
 
     1. Liu, Qiang, and Dilin Wang. "Stein Variational Gradient Descent: A General Purpose Bayesian Inference Algorithm."
         Advances in neural information processing systems 29 (2016).
+    2. Rahimi, Ali, and Benjamin Recht. "Random Features for Large-Scale Kernel Machines."
+        Advances in neural information processing systems 20 (2007).
+    3. Williams, Christopher, and Matthias Seeger. "Using the Nyström Method to Speed Up Kernel Machines."
+        Advances in neural information processing systems 13 (2000).
     """
 
     def __init__(
@@ -84,24 +186,52 @@ class RBFKernel(SteinKernel):
         mode="norm",
         matrix_mode="norm_diag",
         bandwidth_factor: Callable[[float], float] = lambda n: 1 / jnp.log(n),
+        approximation=None,
+        num_features=100,
+        bandwidth_subset=None,
     ):
         assert mode == "norm" or mode == "vector" or mode == "matrix"
         assert matrix_mode == "norm_diag" or matrix_mode == "vector_diag"
+        assert approximation in (None, "random_features", "nystrom")
+        assert approximation is None or mode == "norm"
+        assert bandwidth_subset is None or bandwidth_subset > 0
         self._mode = mode
         self.matrix_mode = matrix_mode
         self.bandwidth_factor = bandwidth_factor
+        self.approximation = approximation
+        self.num_features = num_features
+        self.bandwidth_subset = bandwidth_subset
 
     def _normed(self):
         return self._mode == "norm" or (
             self.mode == "matrix" and self.matrix_mode == "norm_diag"
         )
 
-    def compute(self, rng_key, particles, particle_info, loss_fn):
-        bandwidth = median_bandwidth(particles, self.bandwidth_factor)
+    def _bandwidth(self, rng_key, particles):
+        if self.bandwidth_subset is not None:
+            num_particles = particles.shape[0]
+            subset_size = min(self.bandwidth_subset, num_particles)
+            particles = particles[
+                random.choice(rng_key, num_particles, (subset_size,), replace=False)
+            ]
+        return stop_gradient(median_bandwidth(particles, self.bandwidth_factor))
 
+    def _exact_kernel(self, bandwidth):
         def kernel(x, y):
             reduce = jnp.sum if self._normed() else lambda x: x
-            kernel_res = jnp.exp(-reduce((x - y) ** 2) / stop_gradient(bandwidth))
+            return jnp.exp(-reduce((x - y) ** 2) / bandwidth)
+
+        return kernel
+
+    def compute(self, rng_key, particles, particle_info, loss_fn):
+        features = self.compute_features(rng_key, particles, particle_info, loss_fn)
+        if features is not None:
+            return _features_kernel(features)
+        bandwidth = self._bandwidth(rng_key, particles)
+        exact_kernel = self._exact_kernel(bandwidth)
+
+        def kernel(x, y):
+            kernel_res = exact_kernel(x, y)
             if self._mode == "matrix":
                 if self.matrix_mode == "norm_diag":
                     return kernel_res * jnp.identity(x.shape[0])
@@ -112,6 +242,37 @@ class RBFKernel(SteinKernel):
 
         return kernel
 
+    def compute_grad(self, rng_key, particles, particle_info, loss_fn):
+        if self.approximation is not None:
+            return None
+        bandwidth = self._bandwidth(rng_key, particles)
+        exact_kernel = self._exact_kernel(bandwidth)
+
+        def kernel_grad(x, y):
+            # for the matrix modes, the kernel is diagonal and its divergence
+            # reduces to the gradient of the norm or vector kernels
+            return -2 * (x - y) / bandwidth * exact_kernel(x, y)
+
+        return kernel_grad
+
+    def compute_features(self, rng_key, particles, particle_info, loss_fn):
+        if self.approximation is None:
+            return None
+        bandwidth = self._bandwidth(rng_key, particles)
+        feature_key = random.fold_in(rng_key, 1)
+        if self.approximation == "random_features":
+            # the spectral density of the kernel is Normal(0, 2 / bandwidth)
+            return _random_fourier_features(
+                feature_key,
+                particles.shape[1],
+                self.num_features,
+                1.0,
+                jnp.sqrt(2 / bandwidth),
+            )
+        return _nystrom_features(
+            feature_key, particles, self.num_features, self._exact_kernel(bandwidth)
+        )
+
     @property
     def mode(self):
         return self._mode
@@ -124,25 +285,45 @@ class IMQKernel(SteinKernel):
 
     where :math:`c\\in \\mathcal\\{R\\}` and :math:`\\beta \\in (-1,0)`.
 
+    The kernel is a scale mixture of Gaussian kernels, with inverse squared length
+    scales distributed as :math:`\\text{Gamma}(-\\beta, c^2)`, so it can be
+    approximated by random Fourier features [2] drawn from this mixture. It can also
+    be approximated by the Nyström method [3].
 
     :param str mode: Either 'norm' (default) specifying to take the norm
         of each particle, or 'vector' to return a component-wise kernel
     :param float const: Positive multi-quadratic constant (c)
     :param float expon: Inverse exponent (beta) between (-1, 0)
+    :param str approximation: Either `None` (default) for the exact kernel,
+        'random_features' for random Fourier features or 'nystrom' for Nyström
+        features with landmarks drawn from the particles. Only supported for 'norm'
+        mode.
+    :param int num_features: Number of random features or Nyström landmarks.
+        Default is 100.
 
     **References:**
 
     1. Gorham, Jackson, and Lester Mackey. "Measuring Sample Quality with Kernels."
         International Conference on Machine Learning. PMLR, 2017.
+    2. Rahimi, Ali, and Benjamin Recht. "Random Features for Large-Scale Kernel Machines."
+        Advances in neural information processing systems 20 (2007).
+    3. Williams, Christopher, and Matthias Seeger. "Using the Nyström Method to Speed Up Kernel Machines."
+        Advances in neural information processing systems 13 (2000).
     """
 
-    def __init__(self, mode="norm", const=1.0, expon=-0.5):
+    def __init__(
+        self, mode="norm", const=1.0, expon=-0.5, approximation=None, num_features=100
+    ):
         assert mode == "norm" or mode == "vector"
         assert 0.0 < const
         assert -1.0 < expon < 0.0
+        assert approximation in (None, "random_features", "nystrom")
+        assert approximation is None or mode == "norm"
         self._mode = mode
         self.const = const
         self.expon = expon
+        self.approximation = approximation
+        self.num_features = num_features
 
     @property
     def mode(self):
@@ -151,12 +332,46 @@ class IMQKernel(SteinKernel):
     def _normed(self):
         return self._mode == "norm"
 
+    def _exact_kernel(self, x, y):
+        reduce = jnp.sum if self._normed() else lambda x: x
+        return (self.const**2 + reduce((x - y) ** 2)) ** self.expon
+
     def compute(self, rng_key, particles, particle_info, loss_fn):
-        def kernel(x, y):
-            reduce = jnp.sum if self._normed() else lambda x: x
-            return (self.const**2 + reduce((x - y) ** 2)) ** self.expon
+        features = self.compute_features(rng_key, particles, particle_info, loss_fn)
+        if features is not None:
+            return _features_kernel(features)
+        return self._exact_kernel
 
-        return kernel
+    def compute_grad(self, rng_key, particles, particle_info, loss_fn):
+        if self.approximation is not None:
+            return None
+
+        def kernel_grad(x, y):
+            reduce = jnp.sum if self._normed() else lambda x: x
+            base = self.const**2 + reduce((x - y) ** 2)
+            return 2 * self.expon * (x - y) * base ** (self.expon - 1)
+
+        return kernel_grad
+
+    def compute_features(self, rng_key, particles, particle_info, loss_fn):
+        if self.approximation is None:
+            return None
+        if self.approximation == "random_features":
+            rng_key, rng_scale = random.split(rng_key)
+            inv_sq_scales = (
+                random.gamma(rng_scale, -self.expon, (self.num_features,))
+                / self.const**2
+            )
+            return _random_fourier_features(
+                rng_key,
+                particles.shape[1],
+                self.num_features,
+                self.const**self.expon,
+                jnp.sqrt(2 * inv_sq_scales),
+            )
+        return _nystrom_features(
+            rng_key, particles, self.num_features, self._exact_kernel
+        )
 
 
 class LinearKernel(SteinKernel):
@@ -322,6 +537,37 @@ class MixtureKernel(SteinKernel):
 
         return kernel
 
+    def compute_grad(self, rng_key, particles, particle_info, loss_fn):
+        kernel_grads = [
+            kf.compute_grad(rng_key, particles, particle_info, loss_fn)
+            for kf in self.kernel_fns
+        ]
+        if any(kernel_grad is None for kernel_grad in kernel_grads):
+            return None
+
+        def kernel_grad(x, y):
+            res = self.ws[0] * kernel_grads[0](x, y)
+            for w, kg in zip(self.ws[1:], kernel_grads[1:]):
+                res = res + w * kg(x, y)
+            return res
+
+        return kernel_grad
+
+    def compute_features(self, rng_key, particles, particle_info, loss_fn):
+        features = [
+            kf.compute_features(rng_key, particles, particle_info, loss_fn)
+            for kf in self.kernel_fns
+        ]
+        if any(feature is None for feature in features):
+            return None
+
+        def feature(x):
+            return jnp.concatenate(
+                [jnp.sqrt(w) * f(x) for w, f in zip(self.ws, features)]
+            )
+
+        return feature
+
     def init(self, rng_key, particles_shape):
         for kf in self.kernel_fns:
             rng_key, krng_key = random.split(rng_key)
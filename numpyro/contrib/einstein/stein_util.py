@@ -43,6 +43,31 @@ def median_bandwidth(particles, factor_fn):
     return bandwidth
 
 
+def chunked_vmap(fn, xs, chunk_size=None):
+    """Map `fn` over the leading axis of the pytree `xs`, vectorizing over chunks of
+    `chunk_size` elements at a time to bound the memory of intermediate values.
+
+    :param fn: a function of a single element of `xs`.
+    :param xs: a pytree of arrays with a common leading dimension.
+    :param chunk_size: number of elements processed at once. Default is None, meaning
+        all elements are processed at once, i.e. the same as :func:`jax.vmap`.
+    :return: the stacked outputs of `fn`.
+    """
+    size = jax.tree.leaves(xs)[0].shape[0]
+    if chunk_size is None or chunk_size >= size:
+        return vmap(fn)(xs)
+    num_chunks = -(-size // chunk_size)
+    pad = num_chunks * chunk_size - size
+    chunks = jax.tree.map(
+        lambda x: jnp.pad(x, [(0, pad)] + [(0, 0)] * (x.ndim - 1)).reshape(
+            (num_chunks, chunk_size) + x.shape[1:]
+        ),
+        xs,
+    )
+    out = jax.lax.map(vmap(fn), chunks)
+    return jax.tree.map(lambda x: x.reshape((-1,) + x.shape[2:])[:size], out)
+
+
 def get_parameter_transform(site):
     constraint = site["kwargs"].get("constraint", real)
     transform = site["kwargs"].get("particle_transform", IdentityTransform())
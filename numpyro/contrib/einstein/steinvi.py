@@ -8,14 +8,19 @@ from functools import partial
 from itertools import chain
 import operator
 
+import numpy as np
+
+import jax
 from jax import grad, numpy as jnp, random, tree, vmap
 from jax.flatten_util import ravel_pytree
 from jax.lax import scan
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
 
 from numpyro import handlers
 from numpyro.contrib.einstein.stein_loss import SteinLoss
 from numpyro.contrib.einstein.stein_util import (
     batch_ravel_pytree,
+    chunked_vmap,
     get_parameter_transform,
 )
 from numpyro.distributions import Distribution
@@ -95,9 +100,29 @@ class SteinVI:
     :param Callable non_mixture_guide_param_fn: Predicate on names of parameters in the guide which should be optimized
         using one particle. This could be parameters for large normal networks or other transformation.
         Default excludes all parameters from this option.
+    :param int num_force_particles: Number of randomly selected particles used to estimate
+        the attractive and repulsive forces on each particle in every step. This reduces the
+        number of ELBO gradients per step from :math:`m^2` to `num_force_particles` for `m`
+        Stein particles. Default is `None`, which uses all particles and computes the forces
+        exactly.
+    :param int chunk_size: Maximum number of particles for which the pairwise interactions are
+        evaluated at once, which caps the memory of the force computation. Default is `None`,
+        meaning all particles at once.
+    :param devices: Sequence of devices, e.g. :func:`jax.local_devices`, over which the Stein
+        particles are sharded. The ELBO gradients of the particles are computed on the device
+        holding them, and the pairwise interactions gather the particles from the other devices.
+        The number of Stein particles must be divisible by the number of devices. On CPU, multiple
+        devices can be made available with :func:`~numpyro.util.set_host_device_count`. Default is
+        `None`, meaning no sharding.
     :param static_kwargs: Static keyword arguments for the model and guide. These arguments cannot change
         during inference.
 
+    .. note:: If any of `num_force_particles` or `chunk_size` is set, or if the kernel has a finite
+        dimensional feature map (see :meth:`~numpyro.contrib.einstein.stein_kernels.SteinKernel.compute_features`),
+        the ELBO gradient of each selected particle is computed once per step and shared by all
+        particles it acts on. With a feature map, the forces are computed in linear time in the number
+        of particles.
+
     **References:**
 
     1. Rønning, Ola, et al. "ELBOing Stein: Variational Bayes with Stein Mixture Inference."
@@ -119,8 +144,18 @@ class SteinVI:
         loss_temperature=1.0,
         repulsion_temperature=1.0,
         non_mixture_guide_params_fn=lambda name: False,
+        num_force_particles=None,
+        chunk_size=None,
+        devices=None,
         **static_kwargs,
     ):
+        assert num_force_particles is None or num_force_particles > 0
+        assert chunk_size is None or chunk_size > 0
+        if devices is not None and num_stein_particles % len(devices) != 0:
+            raise ValueError(
+                f"The number of Stein particles ({num_stein_particles}) must be"
+                f" divisible by the number of devices ({len(devices)})."
+            )
         if isinstance(guide, AutoGuide):
             not_comptaible_guides = [
                 "AutoIAFNormal",
@@ -168,12 +203,28 @@ class SteinVI:
         self.loss_temperature = loss_temperature
         self.repulsion_temperature = repulsion_temperature
         self.non_mixture_params_fn = non_mixture_guide_params_fn
+        self.num_force_particles = num_force_particles
+        self.chunk_size = chunk_size
+        self.particle_sharding = (
+            None
+            if devices is None
+            else NamedSharding(
+                Mesh(np.asarray(devices), ("particles",)), PartitionSpec("particles")
+            )
+        )
         self.guide_sites = None
         self.constrain_fn = None
         self.uconstrain_fn = None
         self.particle_transform_fn = None
         self.particle_transforms = None
 
+    def _shard_particles(self, x):
+        if self.particle_sharding is None or x.shape[0] % len(
+            self.particle_sharding.device_set
+        ):
+            return x
+        return jax.lax.with_sharding_constraint(x, self.particle_sharding)
+
     def _apply_kernel(self, kernel, x, y, v):
         if self.kernel_fn.mode == "norm" or self.kernel_fn.mode == "vector":
             return kernel(x, y) * v
@@ -196,6 +247,112 @@ class SteinVI:
                 )
             )(jnp.arange(x.shape[0]))
 
+    def _exact_stein_forces(
+        self, rng_key, particles, loss_fn, kernel, kernel_grad, repulsion_temperature
+    ):
+        """Computes the attractive and repulsive forces from all pairs of particles."""
+
+        # Second term of eq. 9 from https://arxiv.org/pdf/2410.22948.
+        def body(attr_force, state, y):
+            key, x, i = state
+            x_grad = grad(loss_fn, argnums=1)(key, x, i)
+            attr_force = attr_force + self._apply_kernel(kernel, x, y, x_grad)
+            return attr_force, None
+
+        particle_keys = random.split(rng_key, self.stein_loss.stein_num_particles)
+        init = jnp.zeros_like(particles[0])
+        idxs = jnp.arange(self.num_stein_particles)
+
+        attractive_force, _ = vmap(
+            lambda y, key: scan(
+                partial(body, y=y),
+                init,
+                (random.split(key, self.num_stein_particles), particles, idxs),
+            )
+        )(particles, self._shard_particles(particle_keys))
+
+        # Third term of eq. 9 from https://arxiv.org/pdf/2410.22948.
+        repulsive_force = vmap(
+            lambda y: jnp.mean(
+                vmap(lambda x: repulsion_temperature * kernel_grad(x, y))(particles),
+                axis=0,
+            )
+        )(particles)
+        return attractive_force, repulsive_force
+
+    def _sampled_stein_forces(
+        self,
+        rng_key,
+        particles,
+        loss_fn,
+        kernel,
+        kernel_grad,
+        features,
+        repulsion_temperature,
+    ):
+        """Estimates the attractive and repulsive forces using a random subset of the
+        particles as sources, with one ELBO gradient per source particle."""
+        num_particles, dim = particles.shape
+        subset_key, grad_key = random.split(rng_key)
+        if (
+            self.num_force_particles is None
+            or self.num_force_particles >= num_particles
+        ):
+            idxs = jnp.arange(num_particles)
+        else:
+            idxs = random.choice(
+                subset_key, num_particles, (self.num_force_particles,), replace=False
+            )
+        num_sources = idxs.shape[0]
+        sources = self._shard_particles(particles[idxs])
+        # the ELBO gradients are computed on the devices holding the sources
+        source_grads = self._shard_particles(
+            chunked_vmap(
+                lambda args: grad(loss_fn, argnums=1)(*args),
+                (random.split(grad_key, num_sources), sources, idxs),
+                self.chunk_size,
+            )
+        )
+        # the attractive force is a sum rather than a mean over the particles
+        attr_scale = num_particles / num_sources
+
+        if features is not None:
+            # With k(x, y) = phi(x)^T phi(y), both forces are linear in phi(y).
+            source_features = chunked_vmap(features, sources, self.chunk_size)
+            attr_weights = attr_scale * source_features.T @ source_grads
+
+            # sum of the feature jacobians over the sources, i.e. the jacobian of the
+            # summed features w.r.t. a common shift of all sources
+            def summed_features(shift):
+                return jnp.sum(
+                    chunked_vmap(
+                        lambda x: features(x + shift), sources, self.chunk_size
+                    ),
+                    axis=0,
+                )
+
+            jacobian = jax.jacfwd if dim <= source_features.shape[1] else jax.jacrev
+            repulsion_weights = jacobian(summed_features)(jnp.zeros(dim)) / num_sources
+
+            target_features = chunked_vmap(features, particles, self.chunk_size)
+            attractive_force = target_features @ attr_weights
+            repulsive_force = (
+                repulsion_temperature * target_features @ repulsion_weights
+            )
+            return attractive_force, repulsive_force
+
+        def forces(y):
+            attr_force = jnp.sum(
+                vmap(lambda x, g: self._apply_kernel(kernel, x, y, g))(
+                    sources, source_grads
+                ),
+                axis=0,
+            )
+            rep_force = jnp.mean(vmap(lambda x: kernel_grad(x, y))(sources), axis=0)
+            return attr_scale * attr_force, repulsion_temperature * rep_force
+
+        return chunked_vmap(forces, particles, self.chunk_size)
+
     def _param_size(self, param):
         if isinstance(param, tuple) or isinstance(param, list):
             return sum(map(self._param_size, param))
@@ -260,6 +417,7 @@ class SteinVI:
         stein_particles, unravel_pytree, unravel_pytree_batched = batch_ravel_pytree(
             stein_uparams, nbatch_dims=1
         )
+        stein_particles = self._shard_particles(stein_particles)
 
         # Kernel behavior varies based on particle site locations. The particle_info dictionary
         # maps site names to their corresponding dimensional ranges as (start, end) tuples.
@@ -294,54 +452,60 @@ class SteinVI:
         kernel = self.kernel_fn.compute(
             rng_key, stein_particles, particle_info, stein_loss_fn
         )
+        kernel_grad = self.kernel_fn.compute_grad(
+            rng_key, stein_particles, particle_info, stein_loss_fn
+        )
+        if kernel_grad is None:
+            kernel_grad = partial(self._kernel_grad, kernel)
+        features = (
+            self.kernel_fn.compute_features(
+                rng_key, stein_particles, particle_info, stein_loss_fn
+            )
+            if self.kernel_fn.mode == "norm"
+            else None
+        )
         attractive_key, classic_key = random.split(rng_key)
 
-        def compute_attr_force(rng_key, particles):
-            # Second term of eq. 9 from https://arxiv.org/pdf/2410.22948.
-            def body(attr_force, state, y):
-                key, x, i = state
-                x_grad = grad(stein_loss_fn, argnums=1)(key, x, i)
-                attr_force = attr_force + self._apply_kernel(kernel, x, y, x_grad)
-                return attr_force, None
-
-            particle_keys = random.split(rng_key, self.stein_loss.stein_num_particles)
-            init = jnp.zeros_like(particles[0])
-            idxs = jnp.arange(self.num_stein_particles)
-
-            attr_force, _ = vmap(
-                lambda y, key: scan(
-                    partial(body, y=y),
-                    init,
-                    (random.split(key, self.num_stein_particles), particles, idxs),
-                )
-            )(particles, particle_keys)
-
-            return attr_force
-
-        attractive_force = compute_attr_force(attractive_key, stein_particles)
-
-        # Third term of eq. 9 from https://arxiv.org/pdf/2410.22948.
-        repulsive_force = vmap(
-            lambda y: jnp.mean(
-                vmap(lambda x: repulsion_temperature * self._kernel_grad(kernel, x, y))(
-                    stein_particles
-                ),
-                axis=0,
+        if (
+            features is not None
+            or self.num_force_particles is not None
+            or self.chunk_size is not None
+        ):
+            attractive_force, repulsive_force = self._sampled_stein_forces(
+                attractive_key,
+                stein_particles,
+                stein_loss_fn,
+                kernel,
+                kernel_grad,
+                features,
+                repulsion_temperature,
+            )
+        else:
+            attractive_force, repulsive_force = self._exact_stein_forces(
+                attractive_key,
+                stein_particles,
+                stein_loss_fn,
+                kernel,
+                kernel_grad,
+                repulsion_temperature,
             )
-        )(stein_particles)
 
-        particle_grads = attractive_force + repulsive_force
+        particle_grads = self._shard_particles(attractive_force + repulsive_force)
 
         # Compute non-mixture parameter gradients.
         nonmix_uparam_grads = grad(
-            lambda cps: -self.stein_loss.loss(
-                classic_key,
-                self.constrain_fn(cps),
-                model,
-                self.guide,
-                unravel_pytree_batched(vmap(particle_transform_fn)(stein_particles)),
-                *args,
-                **kwargs,
+            lambda cps: (
+                -self.stein_loss.loss(
+                    classic_key,
+                    self.constrain_fn(cps),
+                    model,
+                    self.guide,
+                    unravel_pytree_batched(
+                        vmap(particle_transform_fn)(stein_particles)
+                    ),
+                    *args,
+                    **kwargs,
+                )
             )
         )(nonmix_uparams)
 
@@ -412,6 +576,14 @@ class SteinVI:
                 else:
                     pval = site["value"]
                 params[site["name"]] = transform.inv(pval)
+                if (
+                    self.particle_sharding is not None
+                    and site["name"] in guide_init_params
+                    and not self.non_mixture_params_fn(site["name"])
+                ):
+                    params[site["name"]] = jax.device_put(
+                        params[site["name"]], self.particle_sharding
+                    )
                 if site["name"] in guide_trace:
                     guide_param_names.add(site["name"])
 
@@ -617,6 +789,12 @@ class SVGD(SteinVI):
             k = RBFKernel()
             svgd = SVGD(model, opt, k, guide_kwargs={'init_loc_fn': partial(init_to_uniform, radius=0.1)})
 
+    :param int num_force_particles: Number of randomly selected particles used to estimate the
+        Stein forces in every step, see :class:`SteinVI`. Default is `None`, meaning all particles.
+    :param int chunk_size: Maximum number of particles for which the pairwise interactions are
+        evaluated at once, see :class:`SteinVI`. Default is `None`, meaning all particles at once.
+    :param devices: Sequence of devices over which the particles are sharded, see :class:`SteinVI`.
+        Default is `None`, meaning no sharding.
     :param Dict static_kwargs: Static keyword arguments for the model and guide. These arguments cannot
         change during inference.
 
@@ -633,6 +811,9 @@ class SVGD(SteinVI):
         kernel_fn,
         num_stein_particles=10,
         guide_kwargs={},
+        num_force_particles=None,
+        chunk_size=None,
+        devices=None,
         **static_kwargs,
     ):
         super().__init__(
@@ -649,6 +830,9 @@ class SVGD(SteinVI):
             # target posterior so we keep it fixed at 1.
             repulsion_temperature=1.0,
             non_mixture_guide_params_fn=lambda name: False,
+            num_force_particles=num_force_particles,
+            chunk_size=chunk_size,
+            devices=devices,
             **static_kwargs,
         )
 
@@ -716,6 +900,12 @@ class ASVGD(SVGD):
             k = RBFKernel()
             asvgd = ASVGD(model, opt, k, guide_kwargs={'init_loc_fn': partial(init_to_uniform, radius=0.1)})
 
+    :param int num_force_particles: Number of randomly selected particles used to estimate the
+        Stein forces in every step, see :class:`SteinVI`. Default is `None`, meaning all particles.
+    :param int chunk_size: Maximum number of particles for which the pairwise interactions are
+        evaluated at once, see :class:`SteinVI`. Default is `None`, meaning all particles at once.
+    :param devices: Sequence of devices over which the particles are sharded, see :class:`SteinVI`.
+        Default is `None`, meaning no sharding.
     :param Dict static_kwargs: Static keyword arguments for the model and guide. These arguments cannot
         change during inference.
 
@@ -734,6 +924,9 @@ class ASVGD(SVGD):
         num_cycles=10,
         transition_speed=10,
         guide_kwargs={},
+        num_force_particles=None,
+        chunk_size=None,
+        devices=None,
         **static_kwargs,
     ):
         assert num_cycles > 0, f"The number of cycles must be >0. Got {num_cycles}."
@@ -750,6 +943,9 @@ class ASVGD(SVGD):
             kernel_fn,
             num_stein_particles,
             guide_kwargs,
+            num_force_particles=num_force_particles,
+            chunk_size=chunk_size,
+            devices=devices,
             **static_kwargs,
         )
 
@@ -3,8 +3,11 @@
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, OrderedDict as OrderedDictType, Union
 
+import numpy as np
+
 import jax
 from jax import random
 import jax.numpy as jnp
@@ -53,12 +56,23 @@ class StochasticSupportInference(ABC):
         straight-line programs (SLPs).
     :param int max_slps: Maximum number of SLPs to discover. DCC will not run inference
         on more than `max_slps`.
+    :param int num_workers: Number of threads used to run inference in different SLPs
+        concurrently. Defaults to 1, i.e. SLPs are processed one after another.
     """
 
-    def __init__(self, model: Callable, num_slp_samples: int, max_slps: int) -> None:
+    def __init__(
+        self,
+        model: Callable,
+        num_slp_samples: int,
+        max_slps: int,
+        num_workers: int = 1,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be positive, but got {num_workers}.")
         self.model: Callable = model
         self.num_slp_samples: int = num_slp_samples
         self.max_slps: int = max_slps
+        self.num_workers: int = num_workers
 
     def _find_slps(
         self, rng_key: ArrayLike, *args: Any, **kwargs: Any
@@ -67,7 +81,20 @@ class StochasticSupportInference(ABC):
         Discover the straight-line programs (SLPs) in the model by sampling from the prior.
         This implementation assumes that all branching is done via discrete sampling sites
         that are annotated with `infer={"branching": True}`.
+
+        Prior samples are first drawn in a vectorized way. This fails if the control flow
+        of the model depends on the values of the branching sites, in which case the
+        model is run once per prior sample instead.
         """
+        try:
+            return self._find_slps_vectorized(rng_key, *args, **kwargs)
+        except (
+            jax.errors.ConcretizationTypeError,
+            jax.errors.TracerIntegerConversionError,
+            jax.errors.TracerArrayConversionError,
+        ):
+            pass
+
         branching_traces = {}
         for _ in range(self.num_slp_samples):
             rng_key, subkey = random.split(rng_key)
@@ -81,11 +108,43 @@ class StochasticSupportInference(ABC):
 
         return branching_traces
 
-    def _get_branching_trace(self, tr: dict[str, Any]) -> OrderedDictType:
+    def _find_slps_vectorized(
+        self, rng_key: ArrayLike, *args: Any, **kwargs: Any
+    ) -> dict[str, OrderedDictType]:
+        """
+        Discover the SLPs by tracing the model under :func:`jax.vmap` over the seeds.
+        """
+        names = []
+
+        def get_branching_values(rng_key):
+            tr = trace(seed(self.model, rng_key)).get_trace(*args, **kwargs)
+            sites = self._get_branching_sites(tr)
+            names[:] = [site["name"] for site in sites]
+            return [site["value"] for site in sites]
+
+        rng_keys = random.split(rng_key, self.num_slp_samples)
+        values = jax.vmap(get_branching_values)(rng_keys)
+        values = np.stack(
+            [np.asarray(v) for v in values] or [np.zeros(self.num_slp_samples)],
+            axis=-1,
+        )[:, : len(names)]
+
+        branching_traces = {}
+        for row in values:
+            btr = OrderedDict((name, int(v)) for name, v in zip(names, row))
+            btr_str = ",".join(str(x) for x in btr.values())
+            if btr_str not in branching_traces:
+                branching_traces[btr_str] = btr
+                if len(branching_traces) >= self.max_slps:
+                    break
+
+        return branching_traces
+
+    def _get_branching_sites(self, tr: dict[str, Any]) -> list[dict[str, Any]]:
         """
         Extract the sites from the trace that are annotated with `infer={"branching": True}`.
         """
-        branching_trace = OrderedDict()
+        branching_sites = []
         for site in tr.values():
             if (
                 site["type"] == "sample"
@@ -99,11 +158,21 @@ class StochasticSupportInference(ABC):
                     raise RuntimeError(
                         "Branching is only supported for discrete sampling sites."
                     )
-                # It is essential that we convert the value to a Python int. If it remains
-                # a JAX Array, then during JIT compilation it will be treated as an AbstractArray
-                # which means branching will raise in an error.
-                # Reference: (https://jax.readthedocs.io/en/latest/notebooks/Common_Gotchas_in_JAX.html#python-control-flow-jit)
-                branching_trace[site["name"]] = int(site["value"])
+                branching_sites.append(site)
+        return branching_sites
+
+    def _get_branching_trace(self, tr: dict[str, Any]) -> OrderedDictType:
+        """
+        Extract the values of the sites from the trace that are annotated with
+        `infer={"branching": True}`.
+        """
+        branching_trace = OrderedDict()
+        for site in self._get_branching_sites(tr):
+            # It is essential that we convert the value to a Python int. If it remains
+            # a JAX Array, then during JIT compilation it will be treated as an AbstractArray
+            # which means branching will raise in an error.
+            # Reference: (https://jax.readthedocs.io/en/latest/notebooks/Common_Gotchas_in_JAX.html#python-control-flow-jit)
+            branching_trace[site["name"]] = int(site["value"])
         return branching_trace
 
     @abstractmethod
@@ -140,10 +209,26 @@ class StochasticSupportInference(ABC):
         rng_key, subkey = random.split(rng_key)
         branching_traces = self._find_slps(subkey, *args, **kwargs)
 
-        inferences = dict()
-        for key, bt in branching_traces.items():
-            rng_key, subkey = random.split(rng_key)
-            inferences[key] = self._run_inference(subkey, bt, *args, **kwargs)
+        rng_keys = dict()
+        for key in branching_traces:
+            rng_key, rng_keys[key] = random.split(rng_key)
+
+        if self.num_workers > 1 and len(branching_traces) > 1:
+            # JAX releases the GIL while running compiled computations, so the
+            # inferences in different SLPs can run concurrently in threads.
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                futures = {
+                    key: executor.submit(
+                        self._run_inference, rng_keys[key], bt, *args, **kwargs
+                    )
+                    for key, bt in branching_traces.items()
+                }
+                inferences = {key: future.result() for key, future in futures.items()}
+        else:
+            inferences = {
+                key: self._run_inference(rng_keys[key], bt, *args, **kwargs)
+                for key, bt in branching_traces.items()
+            }
 
         rng_key, subkey = random.split(rng_key)
         return self._combine_inferences(
@@ -189,6 +274,8 @@ class DCC(StochasticSupportInference):
         on more than `max_slps`.
     :param float proposal_scale: Scale parameter for the proposal distribution for
         estimating the normalization constant of an SLP.
+    :param int num_workers: Number of threads used to run MCMC in different SLPs
+        concurrently. Defaults to 1, i.e. SLPs are processed one after another.
     """
 
     def __init__(
@@ -199,13 +286,14 @@ class DCC(StochasticSupportInference):
         num_slp_samples: int = 1_000,
         max_slps: int = 124,
         proposal_scale: float = 1.0,
+        num_workers: int = 1,
     ) -> None:
         self.kernel_cls = kernel_cls
         self.mcmc_kwargs = mcmc_kwargs
 
         self.proposal_scale = proposal_scale
 
-        super().__init__(model, num_slp_samples, max_slps)
+        super().__init__(model, num_slp_samples, max_slps, num_workers=num_workers)
 
     def _run_inference(
         self,
@@ -69,6 +69,8 @@ class SDVI(StochasticSupportInference):
         straight-line programs (SLPs).
     :param int max_slps: Maximum number of SLPs to discover. DCC will not run inference
         on more than `max_slps`.
+    :param int num_workers: Number of threads used to run SVI in different SLPs
+        concurrently. Defaults to 1, i.e. SLPs are processed one after another.
     """
 
     def __init__(
@@ -82,6 +84,7 @@ class SDVI(StochasticSupportInference):
         svi_progress_bar: bool = False,
         num_slp_samples: int = 1_000,
         max_slps: int = 124,
+        num_workers: int = 1,
     ) -> None:
         self.guide_init = guide_init
         self.optimizer = optimizer
@@ -94,7 +97,7 @@ class SDVI(StochasticSupportInference):
         self.loss = loss
         self.combine_elbo_particles = combine_elbo_particles
 
-        super().__init__(model, num_slp_samples, max_slps)
+        super().__init__(model, num_slp_samples, max_slps, num_workers=num_workers)
 
     def _run_inference(
         self,
@@ -17,6 +17,7 @@ from numpyro.distributions.continuous import (
     AsymmetricLaplaceQuantile,
     Beta,
     BetaProportion,
+    BlockDiagonalMultivariateNormal,
     Cauchy,
     Chi2,
     CirculantNormal,
@@ -31,6 +32,7 @@ from numpyro.distributions.continuous import (
     HalfCauchy,
     HalfNormal,
     InverseGamma,
+    KroneckerMultivariateNormal,
     Kumaraswamy,
     Laplace,
     Levy,
@@ -48,6 +50,7 @@ from numpyro.distributions.continuous import (
     RelaxedBernoulliLogits,
     SoftLaplace,
     StudentT,
+    ToeplitzMultivariateNormal,
     Uniform,
     Weibull,
     Wishart,
@@ -125,6 +128,7 @@ __all__ = [
     "BetaBinomial",
     "BetaProportion",
     "Binomial",
+    "BlockDiagonalMultivariateNormal",
     "BinomialLogits",
     "BinomialProbs",
     "CAR",
@@ -160,6 +164,7 @@ __all__ = [
     "ImproperUniform",
     "Independent",
     "InverseGamma",
+    "KroneckerMultivariateNormal",
     "Kumaraswamy",
     "Laplace",
     "LeftTruncatedDistribution",
@@ -196,6 +201,7 @@ __all__ = [
     "SineSkewed",
     "SoftLaplace",
     "StudentT",
+    "ToeplitzMultivariateNormal",
     "TransformedDistribution",
     "TruncatedCauchy",
     "TruncatedDistribution",
@@ -24,11 +24,13 @@ from numpyro.distributions.continuous import (
     AsymmetricLaplaceQuantile,
     Beta,
     BetaProportion,
+    BlockDiagonalMultivariateNormal,
     Chi2,
     Gamma,
     HalfCauchy,
     HalfNormal,
     InverseGamma,
+    KroneckerMultivariateNormal,
     Kumaraswamy,
     LKJCholesky,
     LogNormal,
@@ -38,6 +40,7 @@ from numpyro.distributions.continuous import (
     Pareto,
     RelaxedBernoulliLogits,
     StudentT,
+    ToeplitzMultivariateNormal,
     Uniform,
 )
 from numpyro.distributions.copula import GaussianCopula, GaussianCopulaBeta
@@ -342,6 +345,54 @@ def _vmap_over_low_rank_multivariate_normal(
     return dist_axes
 
 
+@vmap_over.register
+def _vmap_over_kronecker_multivariate_normal(
+    dist: KroneckerMultivariateNormal,
+    loc=None,
+    left_covariance_matrix=None,
+    right_covariance_matrix=None,
+    left_scale_tril=None,
+    right_scale_tril=None,
+):
+    return _default_vmap_over(
+        dist,
+        loc=loc,
+        left_scale_tril=(
+            left_scale_tril if left_scale_tril is not None else left_covariance_matrix
+        ),
+        right_scale_tril=(
+            right_scale_tril
+            if right_scale_tril is not None
+            else right_covariance_matrix
+        ),
+    )
+
+
+@vmap_over.register
+def _vmap_over_toeplitz_multivariate_normal(
+    dist: ToeplitzMultivariateNormal, loc=None, covariance_row=None
+):
+    return _default_vmap_over(dist, loc=loc, covariance_row=covariance_row)
+
+
+@vmap_over.register
+def _vmap_over_block_diagonal_multivariate_normal(
+    dist: BlockDiagonalMultivariateNormal,
+    loc=None,
+    block_covariance_matrix=None,
+    block_scale_tril=None,
+):
+    return _default_vmap_over(
+        dist,
+        loc=loc,
+        block_scale_tril=(
+            block_scale_tril
+            if block_scale_tril is not None
+            else block_covariance_matrix
+        ),
+    )
+
+
 @vmap_over.register
 def _vmap_over_pareto(dist: Pareto, scale=None, alpha=None):
     dist_axes = _default_vmap_over(dist, scale=scale, alpha=alpha)
@@ -14,7 +14,7 @@ from numpyro.distributions.discrete import (
     ZeroInflatedDistribution,
 )
 from numpyro.distributions.distribution import Distribution
-from numpyro.distributions.util import promote_shapes, validate_sample
+from numpyro.distributions.util import gamma_poisson, promote_shapes, validate_sample
 from numpyro.util import is_prng_key
 
 
@@ -183,6 +183,16 @@ class GammaPoisson(Distribution):
 
     :param numpy.ndarray concentration: shape parameter (alpha) of the Gamma distribution.
     :param numpy.ndarray rate: rate parameter (beta) for the Gamma distribution.
+    :param str sampler: the sampling method. By default, a
+        :class:`~numpyro.distributions.Gamma` sample is drawn first and then a
+        :class:`~numpyro.distributions.Poisson` sample. 'ptrs' fuses both steps into
+        vectorized rejection samplers (see
+        :func:`~numpyro.distributions.util.gamma_poisson`), which is faster for large
+        batches, and 'normal' additionally draws the Poisson samples whose rate is
+        at least `normal_threshold` from a normal approximation.
+    :param float normal_threshold: the smallest Poisson rate drawn from the normal
+        approximation by the 'normal' sampler, see
+        :class:`~numpyro.distributions.Poisson`.
     """
 
     arg_constraints = {
@@ -191,9 +201,26 @@ class GammaPoisson(Distribution):
     }
     support = constraints.nonnegative_integer
     pytree_data_fields = ("concentration", "rate", "_gamma")
+    pytree_aux_fields = ("sampler", "normal_threshold")
 
-    def __init__(self, concentration, rate=1.0, *, validate_args=None):
+    def __init__(
+        self,
+        concentration,
+        rate=1.0,
+        *,
+        sampler=None,
+        normal_threshold=None,
+        validate_args=None,
+    ):
+        if sampler not in (None, "ptrs", "normal"):
+            raise ValueError(
+                f"Unknown sampler {sampler}. Use None, 'ptrs' or 'normal' instead."
+            )
+        if sampler == "normal" and normal_threshold is None:
+            normal_threshold = 1000.0
         self.concentration, self.rate = promote_shapes(concentration, rate)
+        self.sampler = sampler
+        self.normal_threshold = normal_threshold
         self._gamma = Gamma(concentration, rate)
         super(GammaPoisson, self).__init__(
             self._gamma.batch_shape, validate_args=validate_args
@@ -201,6 +228,16 @@ class GammaPoisson(Distribution):
 
     def sample(self, key, sample_shape=()):
         assert is_prng_key(key)
+        if self.sampler is not None:
+            return gamma_poisson(
+                key,
+                self.concentration,
+                self.rate,
+                shape=sample_shape + self.batch_shape,
+                normal_threshold=(
+                    self.normal_threshold if self.sampler == "normal" else None
+                ),
+            )
         key_gamma, key_poisson = random.split(key)
         rate = self._gamma.sample(key_gamma, sample_shape)
         return Poisson(rate).sample(key_poisson)
@@ -228,11 +265,24 @@ class GammaPoisson(Distribution):
         return bt
 
 
-def NegativeBinomial(total_count, probs=None, logits=None, *, validate_args=None):
+def NegativeBinomial(
+    total_count,
+    probs=None,
+    logits=None,
+    *,
+    sampler=None,
+    normal_threshold=None,
+    validate_args=None,
+):
+    kwargs = {
+        "sampler": sampler,
+        "normal_threshold": normal_threshold,
+        "validate_args": validate_args,
+    }
     if probs is not None:
-        return NegativeBinomialProbs(total_count, probs, validate_args=validate_args)
+        return NegativeBinomialProbs(total_count, probs, **kwargs)
     elif logits is not None:
-        return NegativeBinomialLogits(total_count, logits, validate_args=validate_args)
+        return NegativeBinomialLogits(total_count, logits, **kwargs)
     else:
         raise ValueError("One of `probs` or `logits` must be specified.")
 
@@ -244,11 +294,25 @@ class NegativeBinomialProbs(GammaPoisson):
     }
     support = constraints.nonnegative_integer
 
-    def __init__(self, total_count, probs, *, validate_args=None):
+    def __init__(
+        self,
+        total_count,
+        probs,
+        *,
+        sampler=None,
+        normal_threshold=None,
+        validate_args=None,
+    ):
         self.total_count, self.probs = promote_shapes(total_count, probs)
         concentration = total_count
         rate = 1.0 / probs - 1.0
-        super().__init__(concentration, rate, validate_args=validate_args)
+        super().__init__(
+            concentration,
+            rate,
+            sampler=sampler,
+            normal_threshold=normal_threshold,
+            validate_args=validate_args,
+        )
 
 
 class NegativeBinomialLogits(GammaPoisson):
@@ -258,11 +322,25 @@ class NegativeBinomialLogits(GammaPoisson):
     }
     support = constraints.nonnegative_integer
 
-    def __init__(self, total_count, logits, *, validate_args=None):
+    def __init__(
+        self,
+        total_count,
+        logits,
+        *,
+        sampler=None,
+        normal_threshold=None,
+        validate_args=None,
+    ):
         self.total_count, self.logits = promote_shapes(total_count, logits)
         concentration = total_count
         rate = jnp.exp(-logits)
-        super().__init__(concentration, rate, validate_args=validate_args)
+        super().__init__(
+            concentration,
+            rate,
+            sampler=sampler,
+            normal_threshold=normal_threshold,
+            validate_args=validate_args,
+        )
 
     @validate_sample
     def log_prob(self, value):
@@ -285,9 +363,23 @@ class NegativeBinomial2(GammaPoisson):
     support = constraints.nonnegative_integer
     pytree_data_fields = ("concentration",)
 
-    def __init__(self, mean, concentration, *, validate_args=None):
+    def __init__(
+        self,
+        mean,
+        concentration,
+        *,
+        sampler=None,
+        normal_threshold=None,
+        validate_args=None,
+    ):
         rate = concentration / mean
-        super().__init__(concentration, rate, validate_args=validate_args)
+        super().__init__(
+            concentration,
+            rate,
+            sampler=sampler,
+            normal_threshold=normal_threshold,
+            validate_args=validate_args,
+        )
 
 
 def ZeroInflatedNegativeBinomial2(
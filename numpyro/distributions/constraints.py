@@ -48,6 +48,7 @@ __all__ = [
     "positive",
     "positive_definite",
     "positive_definite_circulant_vector",
+    "positive_definite_toeplitz_vector",
     "positive_semidefinite",
     "positive_integer",
     "real",
@@ -656,6 +657,20 @@ class _PositiveDefiniteCirculantVector(_SingletonConstraint):
         return jnp.zeros_like(prototype).at[..., 0].set(1.0)
 
 
+class _PositiveDefiniteToeplitzVector(_SingletonConstraint):
+    event_dim = 1
+
+    def __call__(self, x):
+        jnp = np if isinstance(x, (np.ndarray, np.generic)) else jax.numpy
+        # check for the smallest eigenvalue of the Toeplitz matrix is positive
+        n = x.shape[-1]
+        idx = jnp.abs(jnp.arange(n)[:, None] - jnp.arange(n))
+        return jnp.linalg.eigh(x[..., idx])[0][..., 0] > 0
+
+    def feasible_like(self, prototype):
+        return jnp.zeros_like(prototype).at[..., 0].set(1.0)
+
+
 class _PositiveSemiDefinite(_SingletonConstraint):
     event_dim = 2
 
@@ -807,6 +822,7 @@ ordered_vector = _OrderedVector()
 positive = _Positive()
 positive_definite = _PositiveDefinite()
 positive_definite_circulant_vector = _PositiveDefiniteCirculantVector()
+positive_definite_toeplitz_vector = _PositiveDefiniteToeplitzVector()
 positive_semidefinite = _PositiveSemiDefinite()
 positive_integer = _IntegerPositive()
 positive_ordered_vector = _PositiveOrderedVector()
@@ -1571,7 +1571,36 @@ def _batch_mahalanobis(bL, bx):
     return jnp.reshape(M, out_shape)
 
 
+def _batch_whitened_mahalanobis(bW, bx):
+    r"""
+    Computes the squared Mahalanobis distance :math:`\|W x\|^2` given a whitening
+    matrix :math:`W`, i.e. :math:`W^T W` is the precision matrix.
+    """
+    if jnp.ndim(bW) == 2:
+        # a single matrix product for all batch and sample dimensions
+        white = jnp.matmul(bx, bW.T)
+    else:
+        white = jnp.squeeze(jnp.matmul(bW, bx[..., None]), -1)
+    return jnp.sum(jnp.square(white), -1)
+
+
 class MultivariateNormal(Distribution):
+    r"""
+    Multivariate normal distribution parameterized by exactly one of a covariance
+    matrix, a precision matrix, a lower Cholesky factor of the covariance matrix or
+    a precomputed factorization of the covariance matrix.
+
+    :param numpy.ndarray loc: mean of the distribution.
+    :param numpy.ndarray covariance_matrix: positive definite covariance matrix.
+    :param numpy.ndarray precision_matrix: positive definite precision matrix.
+    :param numpy.ndarray scale_tril: lower Cholesky factor of the covariance matrix.
+    :param factor: a :class:`~numpyro.distributions.util.CholeskyFactor` or a
+        :class:`~numpyro.distributions.util.EighFactor` of the covariance matrix. When
+        the covariance matrix is fixed, building the factorization once outside of the
+        model avoids repeating the decomposition and the triangular solves at each
+        evaluation of the density.
+    """
+
     arg_constraints = {
         "loc": constraints.real_vector,
         "covariance_matrix": constraints.positive_definite,
@@ -1585,6 +1614,8 @@ class MultivariateNormal(Distribution):
         "precision_matrix",
         "scale_tril",
     ]
+    pytree_data_fields = ("loc", "scale_tril", "_factor")
+    _factor = None
 
     def __init__(
         self,
@@ -1593,11 +1624,14 @@ class MultivariateNormal(Distribution):
         precision_matrix=None,
         scale_tril=None,
         validate_args=None,
+        *,
+        factor=None,
     ):
         assert_one_of(
             covariance_matrix=covariance_matrix,
             precision_matrix=precision_matrix,
             scale_tril=scale_tril,
+            factor=factor,
         )
         if jnp.ndim(loc) == 0:
             (loc,) = promote_shapes(loc, shape=(1,))
@@ -1611,10 +1645,16 @@ class MultivariateNormal(Distribution):
             self.scale_tril = cholesky_of_inverse(self.precision_matrix)
         elif scale_tril is not None:
             loc, self.scale_tril = promote_shapes(loc, scale_tril)
-        batch_shape = lax.broadcast_shapes(
-            jnp.shape(loc)[:-2], jnp.shape(self.scale_tril)[:-2]
-        )
-        event_shape = jnp.shape(self.scale_tril)[-1:]
+        else:
+            # the factorization is kept as is, `scale_tril` is only computed on demand
+            factor_shape = jnp.shape(factor.scale)
+            (loc,) = promote_shapes(loc, shape=factor_shape)
+            self._factor = factor
+        matrix_shape = jnp.shape(
+            self.scale_tril if self._factor is None else self._factor.scale
+        )
+        batch_shape = lax.broadcast_shapes(jnp.shape(loc)[:-2], matrix_shape[:-2])
+        event_shape = matrix_shape[-1:]
         self.loc = loc[..., 0]
         super(MultivariateNormal, self).__init__(
             batch_shape=batch_shape,
@@ -1628,21 +1668,39 @@ class MultivariateNormal(Distribution):
             key, shape=sample_shape + self.batch_shape + self.event_shape
         )
         return self.loc + jnp.squeeze(
-            jnp.matmul(self.scale_tril, eps[..., jnp.newaxis]), axis=-1
+            jnp.matmul(self._scale, eps[..., jnp.newaxis]), axis=-1
         )
 
     @validate_sample
     def log_prob(self, value):
-        M = _batch_mahalanobis(self.scale_tril, value - self.loc)
-        half_log_det = tri_logabsdet(self.scale_tril)
-        normalize_term = half_log_det + 0.5 * self.scale_tril.shape[-1] * jnp.log(
+        if self._factor is None:
+            M = _batch_mahalanobis(self.scale_tril, value - self.loc)
+        else:
+            M = _batch_whitened_mahalanobis(self._factor.whitening, value - self.loc)
+        normalize_term = self._half_log_det + 0.5 * self.event_shape[0] * jnp.log(
             2 * jnp.pi
         )
         return -0.5 * M - normalize_term
 
+    @property
+    def _scale(self):
+        # any square root of the covariance matrix
+        return self.scale_tril if self._factor is None else self._factor.scale
+
+    @property
+    def _half_log_det(self):
+        if self._factor is None:
+            return tri_logabsdet(self.scale_tril)
+        return self._factor.half_log_det
+
+    @lazy_property
+    def scale_tril(self):
+        # only reached when the distribution is constructed from a `factor`
+        return jnp.linalg.cholesky(self.covariance_matrix)
+
     @lazy_property
     def covariance_matrix(self):
-        return jnp.matmul(self.scale_tril, jnp.swapaxes(self.scale_tril, -1, -2))
+        return jnp.matmul(self._scale, jnp.swapaxes(self._scale, -1, -2))
 
     @lazy_property
     def precision_matrix(self):
@@ -1658,7 +1716,7 @@ class MultivariateNormal(Distribution):
     @property
     def variance(self):
         return jnp.broadcast_to(
-            jnp.sum(self.scale_tril**2, axis=-1), self.batch_shape + self.event_shape
+            jnp.sum(self._scale**2, axis=-1), self.batch_shape + self.event_shape
         )
 
     @staticmethod
@@ -1679,8 +1737,7 @@ class MultivariateNormal(Distribution):
 
     def entropy(self):
         (n,) = self.event_shape
-        half_log_det = tri_logabsdet(self.scale_tril)
-        return n * (jnp.log(2 * np.pi) + 1) / 2 + half_log_det
+        return n * (jnp.log(2 * np.pi) + 1) / 2 + self._half_log_det
 
 
 def _is_sparse(A):
@@ -2048,6 +2105,17 @@ def _batch_lowrank_mahalanobis(W, D, x, capacitance_tril):
 
 
 class LowRankMultivariateNormal(Distribution):
+    r"""
+    Multivariate normal distribution with a low-rank plus diagonal covariance matrix
+    `cov_factor @ cov_factor.T + diag(cov_diag)`.
+
+    :param numpy.ndarray loc: mean of the distribution.
+    :param numpy.ndarray cov_factor: the low-rank factor with shape `n x m`.
+    :param numpy.ndarray cov_diag: the diagonal with shape `n`.
+    :param factor: a precomputed :class:`~numpyro.distributions.util.LowRankFactor`,
+        to be specified instead of `cov_factor` and `cov_diag`.
+    """
+
     arg_constraints = {
         "loc": constraints.real_vector,
         "cov_factor": constraints.independent(constraints.real, 2),
@@ -2057,7 +2125,20 @@ class LowRankMultivariateNormal(Distribution):
     reparametrized_params = ["loc", "cov_factor", "cov_diag"]
     pytree_data_fields = ("loc", "cov_factor", "cov_diag", "_capacitance_tril")
 
-    def __init__(self, loc, cov_factor, cov_diag, *, validate_args=None):
+    def __init__(
+        self, loc, cov_factor=None, cov_diag=None, *, factor=None, validate_args=None
+    ):
+        capacitance_tril = None
+        if factor is not None:
+            if cov_factor is not None or cov_diag is not None:
+                raise ValueError(
+                    "`cov_factor` and `cov_diag` cannot be specified with `factor`."
+                )
+            cov_factor, cov_diag, capacitance_tril = factor
+        elif cov_factor is None or cov_diag is None:
+            raise ValueError(
+                "Either `cov_factor` and `cov_diag`, or `factor` must be specified."
+            )
         if jnp.ndim(loc) < 1:
             raise ValueError("`loc` must be at least one-dimensional.")
         event_shape = jnp.shape(loc)[-1:]
@@ -2089,7 +2170,9 @@ class LowRankMultivariateNormal(Distribution):
         self.cov_factor = cov_factor
         cov_diag = cov_diag[..., 0]
         self.cov_diag = cov_diag
-        self._capacitance_tril = _batch_capacitance_tril(cov_factor, cov_diag)
+        if capacitance_tril is None:
+            capacitance_tril = _batch_capacitance_tril(cov_factor, cov_diag)
+        self._capacitance_tril = capacitance_tril
         super(LowRankMultivariateNormal, self).__init__(
             batch_shape=batch_shape,
             event_shape=event_shape,
@@ -3212,3 +3295,466 @@ class CirculantNormal(TransformedDistribution):
         (n,) = self.event_shape
         log_abs_det_jacobian = 2 * jnp.log(2) * ((n - 1) // 2) - jnp.log(n) * n
         return self.base_dist.entropy() + log_abs_det_jacobian / 2
+
+
+def _kron(A, B):
+    # batched Kronecker product of two (batches of) square matrices
+    m, n = A.shape[-1], B.shape[-1]
+    K = A[..., :, None, :, None] * B[..., None, :, None, :]
+    return jnp.reshape(K, K.shape[:-4] + (m * n, m * n))
+
+
+def _batch_kronecker_mahalanobis(L_left, L_right, diff):
+    r"""
+    Computes the squared Mahalanobis distance :math:`x^T (A \otimes B)^{-1} x` where
+    :math:`A = L_{left} L_{left}^T` and :math:`B = L_{right} L_{right}^T`, using the
+    identity :math:`(A \otimes B)^{-1} \mathrm{vec}(X) = \mathrm{vec}(A^{-1} X B^{-1})`
+    for the row-major vectorization of :math:`X`.
+    """
+    m, n = L_left.shape[-1], L_right.shape[-1]
+    X = jnp.reshape(diff, jnp.shape(diff)[:-1] + (m, n))
+    X = _batch_solve_triangular(L_left, X)
+    X = _batch_solve_triangular(L_right, jnp.swapaxes(X, -1, -2))
+    return _batch_trace_from_cholesky(X)
+
+
+class KroneckerMultivariateNormal(Distribution):
+    r"""
+    Multivariate normal distribution whose covariance matrix is the Kronecker product
+    :math:`\mathbf{A} \otimes \mathbf{B}` of an :math:`m \times m` matrix
+    :math:`\mathbf{A}` and an :math:`n \times n` matrix :math:`\mathbf{B}`, e.g. a
+    temporal and a spatial covariance matrix in panel models. Equivalently, a sample
+    :math:`\mathbf{x}` reshaped to :math:`m \times n` is matrix normal with row
+    covariance :math:`\mathbf{A}` and column covariance :math:`\mathbf{B}`.
+
+    The log density and the samples are computed from the Cholesky factors of
+    :math:`\mathbf{A}` and :math:`\mathbf{B}`, which costs
+    :math:`O(m^3 + n^3 + m n (m + n))` instead of :math:`O(m^3 n^3)` for a dense
+    :class:`MultivariateNormal`.
+
+    :param numpy.ndarray loc: mean of the distribution, with size :math:`m n`.
+    :param numpy.ndarray left_covariance_matrix: the covariance matrix
+        :math:`\mathbf{A}`.
+    :param numpy.ndarray right_covariance_matrix: the covariance matrix
+        :math:`\mathbf{B}`.
+    :param numpy.ndarray left_scale_tril: lower Cholesky factor of :math:`\mathbf{A}`,
+        to be specified instead of `left_covariance_matrix`.
+    :param numpy.ndarray right_scale_tril: lower Cholesky factor of
+        :math:`\mathbf{B}`, to be specified instead of `right_covariance_matrix`.
+    """
+
+    arg_constraints = {
+        "loc": constraints.real_vector,
+        "left_covariance_matrix": constraints.positive_definite,
+        "right_covariance_matrix": constraints.positive_definite,
+        "left_scale_tril": constraints.lower_cholesky,
+        "right_scale_tril": constraints.lower_cholesky,
+    }
+    support = constraints.real_vector
+    reparametrized_params = [
+        "loc",
+        "left_covariance_matrix",
+        "right_covariance_matrix",
+        "left_scale_tril",
+        "right_scale_tril",
+    ]
+
+    def __init__(
+        self,
+        loc=0.0,
+        left_covariance_matrix=None,
+        right_covariance_matrix=None,
+        left_scale_tril=None,
+        right_scale_tril=None,
+        *,
+        validate_args=None,
+    ):
+        assert_one_of(
+            left_covariance_matrix=left_covariance_matrix,
+            left_scale_tril=left_scale_tril,
+        )
+        assert_one_of(
+            right_covariance_matrix=right_covariance_matrix,
+            right_scale_tril=right_scale_tril,
+        )
+        if left_scale_tril is None:
+            left_scale_tril = jnp.linalg.cholesky(left_covariance_matrix)
+        if right_scale_tril is None:
+            right_scale_tril = jnp.linalg.cholesky(right_covariance_matrix)
+        event_shape = (left_scale_tril.shape[-1] * right_scale_tril.shape[-1],)
+        if jnp.ndim(loc) == 0:
+            (loc,) = promote_shapes(loc, shape=event_shape)
+        batch_shape = lax.broadcast_shapes(
+            jnp.shape(loc)[:-1],
+            jnp.shape(left_scale_tril)[:-2],
+            jnp.shape(right_scale_tril)[:-2],
+        )
+        (self.loc,) = promote_shapes(loc, shape=batch_shape + jnp.shape(loc)[-1:])
+        (self.left_scale_tril,) = promote_shapes(
+            left_scale_tril, shape=batch_shape + left_scale_tril.shape[-2:]
+        )
+        (self.right_scale_tril,) = promote_shapes(
+            right_scale_tril, shape=batch_shape + right_scale_tril.shape[-2:]
+        )
+        super(KroneckerMultivariateNormal, self).__init__(
+            batch_shape=batch_shape,
+            event_shape=event_shape,
+            validate_args=validate_args,
+        )
+
+    def sample(self, key, sample_shape=()):
+        assert is_prng_key(key)
+        m, n = self.left_scale_tril.shape[-1], self.right_scale_tril.shape[-1]
+        eps = random.normal(key, shape=sample_shape + self.batch_shape + (m, n))
+        X = self.left_scale_tril @ eps @ jnp.swapaxes(self.right_scale_tril, -1, -2)
+        return self.loc + jnp.reshape(X, X.shape[:-2] + self.event_shape)
+
+    @validate_sample
+    def log_prob(self, value):
+        M = _batch_kronecker_mahalanobis(
+            self.left_scale_tril, self.right_scale_tril, value - self.loc
+        )
+        normalize_term = self._half_log_det + 0.5 * self.event_shape[0] * jnp.log(
+            2 * jnp.pi
+        )
+        return -0.5 * M - normalize_term
+
+    @property
+    def _half_log_det(self):
+        m, n = self.left_scale_tril.shape[-1], self.right_scale_tril.shape[-1]
+        return n * tri_logabsdet(self.left_scale_tril) + m * tri_logabsdet(
+            self.right_scale_tril
+        )
+
+    @lazy_property
+    def left_covariance_matrix(self):
+        return jnp.matmul(
+            self.left_scale_tril, jnp.swapaxes(self.left_scale_tril, -1, -2)
+        )
+
+    @lazy_property
+    def right_covariance_matrix(self):
+        return jnp.matmul(
+            self.right_scale_tril, jnp.swapaxes(self.right_scale_tril, -1, -2)
+        )
+
+    @lazy_property
+    def covariance_matrix(self):
+        return _kron(self.left_covariance_matrix, self.right_covariance_matrix)
+
+    @lazy_property
+    def scale_tril(self):
+        # the Cholesky factor of a Kronecker product is the product of the factors
+        return _kron(self.left_scale_tril, self.right_scale_tril)
+
+    @property
+    def mean(self):
+        return jnp.broadcast_to(self.loc, self.shape())
+
+    @property
+    def variance(self):
+        left = jnp.sum(self.left_scale_tril**2, axis=-1)
+        right = jnp.sum(self.right_scale_tril**2, axis=-1)
+        variance = left[..., :, None] * right[..., None, :]
+        return jnp.broadcast_to(
+            jnp.reshape(variance, variance.shape[:-2] + self.event_shape), self.shape()
+        )
+
+    @staticmethod
+    def infer_shapes(
+        loc=(),
+        left_covariance_matrix=None,
+        right_covariance_matrix=None,
+        left_scale_tril=None,
+        right_scale_tril=None,
+    ):
+        left = left_covariance_matrix or left_scale_tril
+        right = right_covariance_matrix or right_scale_tril
+        batch_shape = lax.broadcast_shapes(loc[:-1], left[:-2], right[:-2])
+        event_shape = (left[-1] * right[-1],)
+        return batch_shape, event_shape
+
+    def entropy(self):
+        (n,) = self.event_shape
+        return n * (jnp.log(2 * np.pi) + 1) / 2 + self._half_log_det
+
+
+def _levinson_durbin(covariance_row, value, inverse=False):
+    r"""
+    Runs the Levinson-Durbin recursion on the first row :math:`r` of a symmetric
+    positive definite Toeplitz matrix :math:`T`. At step :math:`k`, the recursion
+    gives the coefficients of the best linear predictor :math:`\hat{x}_k` of
+    :math:`x_k` given :math:`x_0, \dots, x_{k-1}` and the variance :math:`v_k` of the
+    prediction error. The innovations :math:`(x_k - \hat{x}_k) / \sqrt{v_k}` of a
+    sample :math:`x \sim \mathcal{N}(0, T)` are independent standard normal
+    variables, which costs :math:`O(n^2)` instead of :math:`O(n^3)` for a Cholesky
+    decomposition of :math:`T`.
+
+    :param covariance_row: the first row :math:`r`, with shape `batch_shape + (n,)`.
+    :param value: an array with shape `sample_shape + batch_shape + (n,)`.
+    :param bool inverse: if False, `value` is :math:`x` and the innovations are
+        returned; if True, `value` are the innovations and :math:`x` is returned.
+    :return: a tuple of the transformed `value` and of :math:`\log v`.
+    """
+    covariance_row = jnp.asarray(covariance_row)
+    value = jnp.asarray(value)
+    n = jnp.shape(covariance_row)[-1]
+    idx = jnp.arange(n)
+
+    def reverse_pad(x):
+        # slicing n elements of the result from position n - k gives
+        # x[k - 1], ..., x[0] followed by zeros
+        return jnp.concatenate([x[..., ::-1], jnp.zeros_like(x)], axis=-1)
+
+    def lagged(x_rev, k):
+        return lax.dynamic_slice_in_dim(x_rev, n - k, n, axis=-1)
+
+    row_rev = reverse_pad(covariance_row)
+    value_rev = None if inverse else reverse_pad(value)
+
+    def step(carry, xs):
+        a, v, y_rev = carry
+        k, value_k = xs
+        # update the coefficients of the predictor of order k - 1, i.e. the
+        # prediction of x_{k-1} is sum_i a[i] x_{k-2-i}, to order k
+        r_k = lax.dynamic_index_in_dim(covariance_row, k, -1, keepdims=False)
+        kappa = (r_k - jnp.sum(a * lagged(row_rev, k), -1)) / v
+        a_flip = lagged(reverse_pad(a), k - 1)
+        a = a + kappa[..., None] * (jnp.where(idx == k - 1, 1.0, 0.0) - a_flip)
+        v = jnp.where(k == 0, v, v * (1 - kappa**2))
+        # the previous x are `value` when whitening and `y` when coloring
+        prediction = jnp.sum(a * lagged(y_rev if inverse else value_rev, k), -1)
+        if inverse:
+            y_k = prediction + jnp.sqrt(v) * value_k
+            y_rev = y_rev.at[..., n - 1 - k].set(y_k)
+        else:
+            y_k = (value_k - prediction) / jnp.sqrt(v)
+        return (a, v, y_rev), (y_k, jnp.log(v))
+
+    a = jnp.zeros(jnp.shape(covariance_row))
+    y_rev = None
+    if inverse:
+        y_shape = jnp.broadcast_shapes(jnp.shape(value), jnp.shape(covariance_row))
+        y_rev = jnp.zeros(y_shape[:-1] + (2 * n,))
+    _, (y, log_v) = scan(
+        step,
+        (a, covariance_row[..., 0], y_rev),
+        (idx, jnp.moveaxis(value, -1, 0)),
+    )
+    return jnp.moveaxis(y, 0, -1), jnp.moveaxis(log_v, 0, -1)
+
+
+class ToeplitzMultivariateNormal(Distribution):
+    r"""
+    Multivariate normal distribution with a symmetric positive definite Toeplitz
+    covariance matrix :math:`\mathbf{T}`, i.e. :math:`T_{ij} = r_{|i - j|}`, which is
+    the covariance matrix of a stationary process observed on a regular grid.
+    Unlike :class:`CirculantNormal`, there is no periodic boundary condition.
+
+    The log density is evaluated with the Levinson-Durbin recursion [1], which
+    costs :math:`O(n^2)` for :math:`n` observations instead of :math:`O(n^3)` for a
+    dense :class:`MultivariateNormal`. Samples are drawn by running the same
+    recursion backwards, i.e. as a sample of the autoregressive process of order
+    :math:`n - 1` with covariance matrix :math:`\mathbf{T}`.
+
+    :param numpy.ndarray loc: mean of the distribution.
+    :param numpy.ndarray covariance_row: first row :math:`\mathbf{r}` of the
+        covariance matrix :math:`\mathbf{T}`, see :func:`jax.scipy.linalg.toeplitz`.
+
+    **References:**
+
+    1. Durbin, J. (1960). The Fitting of Time-Series Models. *Revue de l'Institut
+       International de Statistique*, 28(3), 233--244.
+    """
+
+    arg_constraints = {
+        "loc": constraints.real_vector,
+        "covariance_row": constraints.positive_definite_toeplitz_vector,
+    }
+    support = constraints.real_vector
+    reparametrized_params = ["loc", "covariance_row"]
+
+    def __init__(self, loc, covariance_row, *, validate_args=None):
+        event_shape = jnp.shape(covariance_row)[-1:]
+        if jnp.ndim(loc) == 0:
+            (loc,) = promote_shapes(loc, shape=event_shape)
+        batch_shape = lax.broadcast_shapes(
+            jnp.shape(loc)[:-1], jnp.shape(covariance_row)[:-1]
+        )
+        (self.loc,) = promote_shapes(loc, shape=batch_shape + jnp.shape(loc)[-1:])
+        (self.covariance_row,) = promote_shapes(
+            covariance_row, shape=batch_shape + event_shape
+        )
+        super(ToeplitzMultivariateNormal, self).__init__(
+            batch_shape=batch_shape,
+            event_shape=event_shape,
+            validate_args=validate_args,
+        )
+
+    def sample(self, key, sample_shape=()):
+        assert is_prng_key(key)
+        eps = random.normal(
+            key, shape=sample_shape + self.batch_shape + self.event_shape
+        )
+        x, _ = _levinson_durbin(self.covariance_row, eps, inverse=True)
+        return self.loc + x
+
+    @validate_sample
+    def log_prob(self, value):
+        white, log_v = _levinson_durbin(self.covariance_row, value - self.loc)
+        M = jnp.sum(white**2, -1)
+        normalize_term = 0.5 * jnp.sum(log_v, -1) + 0.5 * self.event_shape[0] * jnp.log(
+            2 * jnp.pi
+        )
+        return -0.5 * M - normalize_term
+
+    @lazy_property
+    def covariance_matrix(self):
+        n = self.event_shape[0]
+        idx = jnp.abs(jnp.arange(n)[:, None] - jnp.arange(n))
+        return self.covariance_row[..., idx]
+
+    @property
+    def mean(self):
+        return jnp.broadcast_to(self.loc, self.shape())
+
+    @property
+    def variance(self):
+        return jnp.broadcast_to(self.covariance_row[..., :1], self.shape())
+
+    @staticmethod
+    def infer_shapes(loc, covariance_row):
+        batch_shape = lax.broadcast_shapes(loc[:-1], covariance_row[:-1])
+        event_shape = covariance_row[-1:]
+        return batch_shape, event_shape
+
+    def entropy(self):
+        (n,) = self.event_shape
+        _, log_v = _levinson_durbin(self.covariance_row, jnp.zeros(self.event_shape))
+        return n * (jnp.log(2 * np.pi) + 1) / 2 + 0.5 * jnp.sum(log_v, -1)
+
+
+class BlockDiagonalMultivariateNormal(Distribution):
+    r"""
+    Multivariate normal distribution with a block-diagonal covariance matrix made of
+    :math:`k` blocks of size :math:`b \times b`. The log density and the samples cost
+    :math:`O(k b^3)` instead of :math:`O(k^3 b^3)` for a dense
+    :class:`MultivariateNormal`.
+
+    :param numpy.ndarray loc: mean of the distribution, with size :math:`k b`.
+    :param numpy.ndarray block_covariance_matrix: the blocks of the covariance matrix,
+        with shape `batch_shape + (k, b, b)`.
+    :param numpy.ndarray block_scale_tril: the lower Cholesky factors of the blocks,
+        with shape `batch_shape + (k, b, b)`, to be specified instead of
+        `block_covariance_matrix`.
+    """
+
+    arg_constraints = {
+        "loc": constraints.real_vector,
+        "block_covariance_matrix": constraints.independent(
+            constraints.positive_definite, 1
+        ),
+        "block_scale_tril": constraints.independent(constraints.lower_cholesky, 1),
+    }
+    support = constraints.real_vector
+    reparametrized_params = ["loc", "block_covariance_matrix", "block_scale_tril"]
+
+    def __init__(
+        self,
+        loc=0.0,
+        block_covariance_matrix=None,
+        block_scale_tril=None,
+        *,
+        validate_args=None,
+    ):
+        assert_one_of(
+            block_covariance_matrix=block_covariance_matrix,
+            block_scale_tril=block_scale_tril,
+        )
+        if block_scale_tril is None:
+            block_scale_tril = jnp.linalg.cholesky(block_covariance_matrix)
+        if jnp.ndim(block_scale_tril) < 3:
+            raise ValueError(
+                "The blocks must have shape `batch_shape + (num_blocks, b, b)`."
+            )
+        event_shape = (block_scale_tril.shape[-3] * block_scale_tril.shape[-1],)
+        if jnp.ndim(loc) == 0:
+            (loc,) = promote_shapes(loc, shape=event_shape)
+        batch_shape = lax.broadcast_shapes(
+            jnp.shape(loc)[:-1], jnp.shape(block_scale_tril)[:-3]
+        )
+        (self.loc,) = promote_shapes(loc, shape=batch_shape + jnp.shape(loc)[-1:])
+        (self.block_scale_tril,) = promote_shapes(
+            block_scale_tril, shape=batch_shape + block_scale_tril.shape[-3:]
+        )
+        super(BlockDiagonalMultivariateNormal, self).__init__(
+            batch_shape=batch_shape,
+            event_shape=event_shape,
+            validate_args=validate_args,
+        )
+
+    def _split(self, x):
+        # reshape the trailing dimension into (num_blocks, block_size)
+        return jnp.reshape(x, jnp.shape(x)[:-1] + self.block_scale_tril.shape[-3:-1])
+
+    def sample(self, key, sample_shape=()):
+        assert is_prng_key(key)
+        eps = random.normal(
+            key,
+            shape=sample_shape + self.batch_shape + self.block_scale_tril.shape[-3:-1],
+        )
+        x = _batch_mv(self.block_scale_tril, eps)
+        return self.loc + jnp.reshape(x, x.shape[:-2] + self.event_shape)
+
+    @validate_sample
+    def log_prob(self, value):
+        diff = value - self.loc
+        diff = jnp.broadcast_to(diff, lax.broadcast_shapes(diff.shape, self.shape()))
+        M = _batch_mahalanobis(self.block_scale_tril, self._split(diff))
+        normalize_term = self._half_log_det + 0.5 * self.event_shape[0] * jnp.log(
+            2 * jnp.pi
+        )
+        return -0.5 * M.sum(-1) - normalize_term
+
+    @property
+    def _half_log_det(self):
+        return tri_logabsdet(self.block_scale_tril).sum(-1)
+
+    @lazy_property
+    def block_covariance_matrix(self):
+        return jnp.matmul(
+            self.block_scale_tril, jnp.swapaxes(self.block_scale_tril, -1, -2)
+        )
+
+    @lazy_property
+    def covariance_matrix(self):
+        blocks = self.block_covariance_matrix
+        k, b = blocks.shape[-3], blocks.shape[-1]
+        dense = jnp.eye(k)[:, None, :, None] * blocks[..., :, :, None, :]
+        return jnp.reshape(dense, dense.shape[:-4] + (k * b, k * b))
+
+    @property
+    def mean(self):
+        return jnp.broadcast_to(self.loc, self.shape())
+
+    @property
+    def variance(self):
+        variance = jnp.sum(self.block_scale_tril**2, axis=-1)
+        return jnp.broadcast_to(
+            jnp.reshape(variance, variance.shape[:-2] + self.event_shape), self.shape()
+        )
+
+    @staticmethod
+    def infer_shapes(loc=(), block_covariance_matrix=None, block_scale_tril=None):
+        assert_one_of(
+            block_covariance_matrix=block_covariance_matrix,
+            block_scale_tril=block_scale_tril,
+        )
+        blocks = block_covariance_matrix or block_scale_tril
+        batch_shape = lax.broadcast_shapes(loc[:-1], blocks[:-3])
+        event_shape = (blocks[-3] * blocks[-1],)
+        return batch_shape, event_shape
+
+    def entropy(self):
+        (n,) = self.event_shape
+        return n * (jnp.log(2 * np.pi) + 1) / 2 + self._half_log_det
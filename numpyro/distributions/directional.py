@@ -18,6 +18,8 @@ from numpyro.distributions.distribution import Distribution
 from numpyro.distributions.util import (
     assert_one_of,
     lazy_property,
+    log_bessel_iv,
+    log_bessel_iv_range,
     promote_shapes,
     safe_normalize,
     validate_sample,
@@ -32,49 +34,18 @@ def _numel(shape):
 
 def log_I1(orders: int, value, terms=250):
     r"""Compute first n log modified bessel function of first kind
-    .. math ::
-        \log(I_v(z)) = v*\log(z/2) + \log(\sum_{k=0}^\inf \exp\left[2*k*\log(z/2) - \sum_kk^k log(kk)
-        - \lgamma(v + k + 1)\right])
+    :math:`\log(I_v(z))` for :math:`v = 0, \dots,` `orders`, see
+    :func:`~numpyro.distributions.util.log_bessel_iv_range`.
+
     :param orders: orders of the log modified bessel function.
     :param value: values to compute modified bessel function for
-    :param terms: truncation of summation
+    :param terms: unused, kept for backward compatibility.
     :return: 0 to orders modified bessel function
     """
-    orders = orders + 1
+    value = jnp.asarray(value)
     if value.ndim == 0:
-        vshape = jnp.shape([1])
-    else:
-        vshape = value.shape
-    value = value.reshape(-1, 1)
-    flat_vshape = _numel(vshape)
-
-    k = jnp.arange(terms)
-    lgammas_all = special.gammaln(jnp.arange(1.0, terms + orders + 1))
-    assert lgammas_all.shape == (orders + terms,)  # lgamma(0) = inf => start from 1
-
-    lvalues = jnp.log(value / 2) * k.reshape(1, -1)
-    assert lvalues.shape == (flat_vshape, terms)
-
-    lfactorials = lgammas_all[:terms]
-    assert lfactorials.shape == (terms,)
-
-    lgammas = jnp.tile(lgammas_all, orders).reshape((orders, -1))
-    assert lgammas.shape == (orders, terms + orders)  # lgamma(0) = inf => start from 1
-
-    indices = k[:orders].reshape(-1, 1) + k.reshape(1, -1)
-    assert indices.shape == (orders, terms)
-
-    seqs = logsumexp(
-        2 * lvalues[None, :, :]
-        - lfactorials[None, None, :]
-        - jnp.take_along_axis(lgammas, indices, axis=1)[:, None, :],
-        -1,
-    )
-    assert seqs.shape == (orders, flat_vshape)
-
-    i1s = lvalues[..., :orders].T + seqs
-    assert i1s.shape == (orders, flat_vshape)
-    return i1s.reshape(-1, *vshape)
+        value = value.reshape((1,))
+    return log_bessel_iv_range(orders, value)
 
 
 class VonMises(Distribution):
@@ -409,8 +380,7 @@ class SineBivariateVonMises(Distribution):
             jnp.log(jnp.clip(corr**2, jnp.finfo(jnp.result_type(float)).tiny))
             - jnp.log(4 * jnp.prod(conc, axis=-1))
         )
-        num_I1terms = 10_001
-        fs += log_I1(49, conc, terms=num_I1terms).sum(-1)
+        fs += log_bessel_iv_range(49, conc).sum(-1)
         norm_const = 2 * jnp.log(jnp.array(2 * pi)) + logsumexp(fs, 0)
         return norm_const.reshape(jnp.shape(self.phi_loc))
 
@@ -445,7 +415,7 @@ class SineBivariateVonMises(Distribution):
         b0 = self._bfind(eig)
 
         total = _numel(sample_shape)
-        phi_den = log_I1(0, conc[1]).squeeze(0)
+        phi_den = log_bessel_iv(0, conc[1])
         batch_size = _numel(self.batch_shape)
         phi_shape = (total, 2, batch_size)
         phi_state = SineBivariateVonMises._phi_marginal(
@@ -493,7 +463,7 @@ class SineBivariateVonMises(Distribution):
             lf = (
                 conc[0] * (x[:, 0] - 1)
                 + eigmin
-                + log_I1(0, jnp.sqrt(conc[1] ** 2 + (corr * x[:, 1]) ** 2)).squeeze(0)
+                + log_bessel_iv(0, jnp.sqrt(conc[1] ** 2 + (corr * x[:, 1]) ** 2))
                 - phi_den
             )
 
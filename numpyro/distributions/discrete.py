@@ -37,13 +37,20 @@ from jax.scipy.special import expit, gammaincc, gammaln, logsumexp, xlog1py, xlo
 from numpyro.distributions import constraints, transforms
 from numpyro.distributions.distribution import Distribution
 from numpyro.distributions.util import (
+    alias_table,
     assert_one_of,
     binary_cross_entropy_with_logits,
     binomial,
     categorical,
+    categorical_alias,
+    categorical_icdf,
     clamp_probs,
     lazy_property,
     multinomial,
+    multinomial_alias,
+    multinomial_binomial,
+    multinomial_icdf,
+    poisson,
     promote_shapes,
     validate_sample,
 )
@@ -304,20 +311,50 @@ def Binomial(total_count=1, probs=None, logits=None, *, validate_args=None):
 
 
 class CategoricalProbs(Distribution):
+    """
+    Categorical distribution parameterized by event probabilities.
+
+    :param probs: event probabilities, with the categories in the rightmost dimension.
+    :param str sampler: the sampling method. By default, each draw costs O(K) for `K`
+        categories. For many draws from fixed probabilities, 'alias' precomputes an
+        alias table once per instance (see :func:`~numpyro.distributions.util.alias_table`)
+        so that each draw costs O(1), and 'icdf' precomputes the cumulative
+        probabilities so that each draw costs O(log K).
+    """
+
     arg_constraints = {"probs": constraints.simplex}
     has_enumerate_support = True
+    pytree_aux_fields = ("sampler",)
 
-    def __init__(self, probs, *, validate_args=None):
+    def __init__(self, probs, *, sampler=None, validate_args=None):
         if jnp.ndim(probs) < 1:
             raise ValueError("`probs` parameter must be at least one-dimensional.")
+        if sampler not in (None, "alias", "icdf"):
+            raise ValueError(
+                f"Unknown sampler {sampler}. Use None, 'alias' or 'icdf' instead."
+            )
         self.probs = probs
+        self.sampler = sampler
         super(CategoricalProbs, self).__init__(
             batch_shape=jnp.shape(self.probs)[:-1], validate_args=validate_args
         )
 
     def sample(self, key, sample_shape=()):
         assert is_prng_key(key)
-        return categorical(key, self.probs, shape=sample_shape + self.batch_shape)
+        shape = sample_shape + self.batch_shape
+        if self.sampler == "alias":
+            return categorical_alias(key, *self._alias_table, shape=shape)
+        elif self.sampler == "icdf":
+            return categorical_icdf(key, self._cdf, shape=shape)
+        return categorical(key, self.probs, shape=shape)
+
+    @lazy_property
+    def _alias_table(self):
+        return alias_table(self.probs)
+
+    @lazy_property
+    def _cdf(self):
+        return jnp.cumsum(self.probs, axis=-1)
 
     @validate_sample
     def log_prob(self, value):
@@ -412,10 +449,12 @@ class CategoricalLogits(Distribution):
         return -(probs * self.logits).sum(axis=-1) + logsumexp(self.logits, axis=-1)
 
 
-def Categorical(probs=None, logits=None, *, validate_args=None):
+def Categorical(probs=None, logits=None, *, sampler=None, validate_args=None):
     assert_one_of(probs=probs, logits=logits)
     if probs is not None:
-        return CategoricalProbs(probs, validate_args=validate_args)
+        return CategoricalProbs(probs, sampler=sampler, validate_args=validate_args)
+    elif sampler is not None:
+        raise ValueError("`sampler` is only supported with `probs`.")
     elif logits is not None:
         return CategoricalLogits(logits, validate_args=validate_args)
 
@@ -526,18 +565,47 @@ class OrderedLogistic(CategoricalProbs):
 
 
 class MultinomialProbs(Distribution):
+    """
+    Multinomial distribution parameterized by event probabilities.
+
+    :param probs: event probabilities, with the categories in the rightmost dimension.
+    :param total_count: number of trials. If this is a JAX array,
+        it is required to specify `total_count_max`, except for the 'binomial' sampler.
+    :param int total_count_max: the maximum number of trials,
+        i.e. `max(total_count)`
+    :param str sampler: the sampling method. By default, the counts are accumulated
+        from `total_count` categorical draws of O(K) cost each for `K` categories.
+        'alias' and 'icdf' draw the categories from an alias table or from the
+        cumulative probabilities, precomputed once per instance, in O(1) or O(log K)
+        time each (see :class:`CategoricalProbs`). 'binomial' draws the count of each
+        category from a binomial distribution given the previous counts, which costs
+        O(K) regardless of `total_count` and is preferable for large total counts.
+    """
+
     arg_constraints = {
         "probs": constraints.simplex,
         "total_count": constraints.nonnegative_integer,
     }
     pytree_data_fields = ("probs",)
-    pytree_aux_fields = ("total_count", "total_count_max")
+    pytree_aux_fields = ("total_count", "total_count_max", "sampler")
 
     def __init__(
-        self, probs, total_count=1, *, total_count_max=None, validate_args=None
+        self,
+        probs,
+        total_count=1,
+        *,
+        total_count_max=None,
+        sampler=None,
+        validate_args=None,
     ):
         if jnp.ndim(probs) < 1:
             raise ValueError("`probs` parameter must be at least one-dimensional.")
+        if sampler not in (None, "alias", "icdf", "binomial"):
+            raise ValueError(
+                f"Unknown sampler {sampler}. Use None, 'alias', 'icdf' or 'binomial'"
+                " instead."
+            )
+        self.sampler = sampler
         batch_shape, event_shape = self.infer_shapes(
             jnp.shape(probs), jnp.shape(total_count)
         )
@@ -552,11 +620,30 @@ class MultinomialProbs(Distribution):
 
     def sample(self, key, sample_shape=()):
         assert is_prng_key(key)
+        shape = sample_shape + self.batch_shape
+        if self.sampler == "binomial":
+            return multinomial_binomial(key, self.probs, self.total_count, shape=shape)
+        elif self.sampler == "alias":
+            return multinomial_alias(
+                key,
+                *self._alias_table,
+                self.total_count,
+                shape=shape,
+                total_count_max=self.total_count_max,
+            )
+        elif self.sampler == "icdf":
+            return multinomial_icdf(
+                key,
+                self._cdf,
+                self.total_count,
+                shape=shape,
+                total_count_max=self.total_count_max,
+            )
         return multinomial(
             key,
             self.probs,
             self.total_count,
-            shape=sample_shape + self.batch_shape,
+            shape=shape,
             total_count_max=self.total_count_max,
         )
 
@@ -571,6 +658,14 @@ class MultinomialProbs(Distribution):
     def logits(self):
         return _to_logits_multinom(self.probs)
 
+    @lazy_property
+    def _alias_table(self):
+        return alias_table(self.probs)
+
+    @lazy_property
+    def _cdf(self):
+        return jnp.cumsum(self.probs, axis=-1)
+
     @property
     def mean(self):
         return self.probs * jnp.expand_dims(self.total_count, -1)
@@ -662,7 +757,13 @@ class MultinomialLogits(Distribution):
 
 
 def Multinomial(
-    total_count=1, probs=None, logits=None, *, total_count_max=None, validate_args=None
+    total_count=1,
+    probs=None,
+    logits=None,
+    *,
+    total_count_max=None,
+    sampler=None,
+    validate_args=None,
 ):
     """Multinomial distribution.
 
@@ -672,6 +773,8 @@ def Multinomial(
     :param logits: event log probabilities
     :param int total_count_max: the maximum number of trials,
         i.e. `max(total_count)`
+    :param str sampler: the sampling method, only supported with `probs`, see
+        :class:`MultinomialProbs`.
     """
     assert_one_of(probs=probs, logits=logits)
     if probs is not None:
@@ -679,8 +782,11 @@ def Multinomial(
             probs,
             total_count,
             total_count_max=total_count_max,
+            sampler=sampler,
             validate_args=validate_args,
         )
+    elif sampler is not None:
+        raise ValueError("`sampler` is only supported with `probs`.")
     elif logits is not None:
         return MultinomialLogits(
             logits,
@@ -702,20 +808,47 @@ class Poisson(Distribution):
     :param numpy.ndarray rate: The rate parameter
     :param bool is_sparse: Whether to assume value is mostly zero when computing
         :meth:`log_prob`, which can speed up computation when data is sparse.
+    :param str sampler: the sampling method. By default, :func:`jax.random.poisson`
+        is used. 'ptrs' uses :func:`~numpyro.distributions.util.poisson`, which is
+        faster for large batches, and 'normal' additionally draws the samples whose
+        rate is at least `normal_threshold` from a normal approximation.
+    :param float normal_threshold: the smallest rate drawn from the normal
+        approximation by the 'normal' sampler, 1000 by default. The total variation
+        error of the approximation is about `0.13 / sqrt(rate)`.
     """
 
     arg_constraints = {"rate": constraints.positive}
     support = constraints.nonnegative_integer
-    pytree_aux_fields = ("is_sparse",)
+    pytree_aux_fields = ("is_sparse", "sampler", "normal_threshold")
 
-    def __init__(self, rate, *, is_sparse=False, validate_args=None):
+    def __init__(
+        self,
+        rate,
+        *,
+        is_sparse=False,
+        sampler=None,
+        normal_threshold=None,
+        validate_args=None,
+    ):
+        if sampler not in (None, "ptrs", "normal"):
+            raise ValueError(
+                f"Unknown sampler {sampler}. Use None, 'ptrs' or 'normal' instead."
+            )
+        if sampler == "normal" and normal_threshold is None:
+            normal_threshold = 1000.0
         self.rate = rate
         self.is_sparse = is_sparse
+        self.sampler = sampler
+        self.normal_threshold = normal_threshold
         super(Poisson, self).__init__(jnp.shape(rate), validate_args=validate_args)
 
     def sample(self, key, sample_shape=()):
         assert is_prng_key(key)
-        return random.poisson(key, self.rate, shape=sample_shape + self.batch_shape)
+        shape = sample_shape + self.batch_shape
+        if self.sampler is None:
+            return random.poisson(key, self.rate, shape=shape)
+        normal_threshold = self.normal_threshold if self.sampler == "normal" else None
+        return poisson(key, self.rate, shape=shape, normal_threshold=normal_threshold)
 
     @validate_sample
     def log_prob(self, value):
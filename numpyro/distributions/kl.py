@@ -33,15 +33,20 @@ from jax.scipy.special import betaln, digamma, gammaln
 
 from numpyro.distributions.continuous import (
     Beta,
+    BlockDiagonalMultivariateNormal,
     CirculantNormal,
     Dirichlet,
     Gamma,
+    KroneckerMultivariateNormal,
     Kumaraswamy,
     MultivariateNormal,
     Normal,
+    ToeplitzMultivariateNormal,
     Weibull,
+    _batch_kronecker_mahalanobis,
     _batch_solve_triangular,
     _batch_trace_from_cholesky,
+    _levinson_durbin,
 )
 from numpyro.distributions.discrete import CategoricalProbs
 from numpyro.distributions.distribution import (
@@ -184,6 +189,69 @@ def kl_divergence(p: MultivariateNormal, q: MultivariateNormal):
     return 0.5 * (tr + t1 - D - log_det_ratio)
 
 
+@dispatch(KroneckerMultivariateNormal, KroneckerMultivariateNormal)
+def kl_divergence(p: KroneckerMultivariateNormal, q: KroneckerMultivariateNormal):
+    m, n = p.left_scale_tril.shape[-1], p.right_scale_tril.shape[-1]
+    if (q.left_scale_tril.shape[-1], q.right_scale_tril.shape[-1]) != (m, n):
+        raise ValueError(
+            "Distributions must have Kronecker factors of the same sizes, but have"
+            f" {(m, n)} and"
+            f" {(q.left_scale_tril.shape[-1], q.right_scale_tril.shape[-1])}"
+            " for p and q, respectively."
+        )
+    # tr(inv(A_q kron B_q) @ (A_p kron B_p)) = tr(inv(A_q) @ A_p) * tr(inv(B_q) @ B_p)
+    tr_left = _batch_trace_from_cholesky(
+        _batch_solve_triangular(q.left_scale_tril, p.left_scale_tril)
+    )
+    tr_right = _batch_trace_from_cholesky(
+        _batch_solve_triangular(q.right_scale_tril, p.right_scale_tril)
+    )
+    t1 = _batch_kronecker_mahalanobis(
+        q.left_scale_tril, q.right_scale_tril, p.loc - q.loc
+    )
+    log_det_ratio = 2 * (p._half_log_det - q._half_log_det)
+    return 0.5 * (tr_left * tr_right + t1 - m * n - log_det_ratio)
+
+
+@dispatch(ToeplitzMultivariateNormal, ToeplitzMultivariateNormal)
+def kl_divergence(p: ToeplitzMultivariateNormal, q: ToeplitzMultivariateNormal):
+    if p.event_shape != q.event_shape:
+        raise ValueError(
+            "Distributions must have the same event shape, but are"
+            f" {p.event_shape} and {q.event_shape} for p and q, respectively."
+        )
+    (n,) = p.event_shape
+    # The Levinson-Durbin recursion of q applies the whitening matrix W, which
+    # satisfies inv(T_q) = W.T @ W, to the rows of a matrix. Because T_p is
+    # symmetric, applying it twice gives (W @ T_p @ W.T).T, whose trace is the trace
+    # of inv(T_q) @ T_p.
+    q_row = q.covariance_row[..., None, :]
+    white, _ = _levinson_durbin(q_row, p.covariance_matrix)
+    white, _ = _levinson_durbin(q_row, jnp.swapaxes(white, -1, -2))
+    tr = jnp.trace(white, axis1=-2, axis2=-1)
+    white_diff, q_log_v = _levinson_durbin(q.covariance_row, p.loc - q.loc)
+    t1 = jnp.sum(white_diff**2, -1)
+    _, p_log_v = _levinson_durbin(p.covariance_row, jnp.zeros(n))
+    log_det_ratio = jnp.sum(p_log_v, -1) - jnp.sum(q_log_v, -1)
+    return 0.5 * (tr + t1 - n - log_det_ratio)
+
+
+@dispatch(BlockDiagonalMultivariateNormal, BlockDiagonalMultivariateNormal)
+def kl_divergence(
+    p: BlockDiagonalMultivariateNormal, q: BlockDiagonalMultivariateNormal
+):
+    p_shape, q_shape = p.block_scale_tril.shape[-3:], q.block_scale_tril.shape[-3:]
+    if p_shape != q_shape:
+        raise ValueError(
+            "Distributions must have blocks of the same shape, but have"
+            f" {p_shape} and {q_shape} for p and q, respectively."
+        )
+    # the KL divergence is the sum of the divergences between the blocks
+    p_blocks = MultivariateNormal(p._split(p.loc), scale_tril=p.block_scale_tril)
+    q_blocks = MultivariateNormal(q._split(q.loc), scale_tril=q.block_scale_tril)
+    return kl_divergence(p_blocks, q_blocks).sum(-1)
+
+
 @dispatch(Independent, CirculantNormal)
 def kl_divergence(p: Independent, q: CirculantNormal):
     # We can only calculate the KL divergence if the base distribution is normal.
@@ -29,6 +29,7 @@ __all__ = [
     "biject_to",
     "AbsTransform",
     "AffineTransform",
+    "BlockLowerCholeskyAffine",
     "CholeskyTransform",
     "ComplexTransform",
     "ComposeTransform",
@@ -40,6 +41,7 @@ __all__ = [
     "LowerCholeskyTransform",
     "ScaledUnitLowerCholeskyTransform",
     "LowerCholeskyAffine",
+    "LowRankUpdateAffine",
     "PackRealFastFourierCoefficientsTransform",
     "PermuteTransform",
     "PowerTransform",
@@ -776,6 +778,186 @@ class LowerCholeskyAffine(Transform):
         )
 
 
+class BlockLowerCholeskyAffine(Transform):
+    r"""
+    Transform via the mapping :math:`y = loc + scale\_tril\ @\ x`, where
+    :math:`scale\_tril` is a block diagonal matrix whose diagonal blocks are the
+    lower triangular matrices `scale_trils`. Only the blocks are stored, so the
+    memory cost is the sum of the squared block sizes.
+
+    :param loc: a real vector.
+    :param tuple scale_trils: a tuple of lower triangular matrices with positive
+        diagonals. The sum of their sizes must be equal to the size of `loc`.
+
+    **Example**
+
+    .. doctest::
+
+       >>> import jax.numpy as jnp
+       >>> from numpyro.distributions.transforms import BlockLowerCholeskyAffine
+       >>> base = jnp.ones(3)
+       >>> loc = jnp.zeros(3)
+       >>> scale_trils = (jnp.array([[2.0]]), jnp.array([[0.3, 0.0], [1.0, 0.5]]))
+       >>> affine = BlockLowerCholeskyAffine(loc=loc, scale_trils=scale_trils)
+       >>> affine(base)
+       Array([2. , 0.3, 1.5], dtype=float32)
+    """
+
+    domain = constraints.real_vector
+    codomain = constraints.real_vector
+
+    def __init__(self, loc, scale_trils):
+        scale_trils = tuple(scale_trils)
+        if any(jnp.ndim(scale_tril) != 2 for scale_tril in scale_trils):
+            raise ValueError("Only support 2-dimensional scale_tril matrices.")
+        self.loc = loc
+        self.scale_trils = scale_trils
+
+    def _split(self, x):
+        sizes = [scale_tril.shape[-1] for scale_tril in self.scale_trils]
+        return jnp.split(x, np.cumsum(sizes)[:-1], axis=-1)
+
+    def __call__(self, x):
+        blocks = [
+            jnp.squeeze(jnp.matmul(scale_tril, x_block[..., jnp.newaxis]), axis=-1)
+            for scale_tril, x_block in zip(self.scale_trils, self._split(x))
+        ]
+        return self.loc + jnp.concatenate(blocks, axis=-1)
+
+    def _inverse(self, y):
+        y = y - self.loc
+        blocks = []
+        for scale_tril, y_block in zip(self.scale_trils, self._split(y)):
+            block_shape = jnp.shape(y_block)
+            yt = jnp.reshape(y_block, (-1, block_shape[-1])).T
+            xt = solve_triangular(scale_tril, yt, lower=True)
+            blocks.append(jnp.reshape(xt.T, block_shape))
+        return jnp.concatenate(blocks, axis=-1)
+
+    def log_abs_det_jacobian(self, x, y, intermediates=None):
+        return jnp.broadcast_to(
+            sum(
+                jnp.log(jnp.diagonal(scale_tril)).sum()
+                for scale_tril in self.scale_trils
+            ),
+            jnp.shape(x)[:-1],
+        )
+
+    def forward_shape(self, shape):
+        if len(shape) < 1:
+            raise ValueError("Too few dimensions on input")
+        return lax.broadcast_shapes(shape, self.loc.shape)
+
+    def inverse_shape(self, shape):
+        if len(shape) < 1:
+            raise ValueError("Too few dimensions on input")
+        return lax.broadcast_shapes(shape, self.loc.shape)
+
+    def tree_flatten(self):
+        return (self.loc, self.scale_trils), (("loc", "scale_trils"), dict())
+
+    def __eq__(self, other):
+        if not isinstance(other, BlockLowerCholeskyAffine):
+            return False
+        if len(self.scale_trils) != len(other.scale_trils):
+            return False
+        result = jnp.array_equal(self.loc, other.loc)
+        for scale_tril, other_scale_tril in zip(self.scale_trils, other.scale_trils):
+            result = result & jnp.array_equal(scale_tril, other_scale_tril)
+        return result
+
+
+class LowRankUpdateAffine(Transform):
+    r"""
+    Transform via the mapping
+
+    .. math::
+
+        y = loc + scale \odot \left(x + basis\ @\ ((basis\_scale - 1) \odot
+        (basis^T\ @\ x))\right),
+
+    where the columns of `basis` are orthonormal. This is the matrix square root of
+    the covariance matrix :math:`D^{-1/2} (I + U \Lambda U^T)^{-1} D^{-1/2}` with
+    :math:`D = diag(scale)^{-2}`, :math:`U = basis` and
+    :math:`\Lambda = basis\_scale^{-2} - 1`, i.e. the inverse of a diagonal plus
+    low rank precision matrix. Both the forward and the inverse mappings cost
+    :math:`O(d k)` time and memory for a `basis` with shape `(d, k)`.
+
+    :param loc: a real vector.
+    :param scale: a positive vector.
+    :param basis: a matrix with orthonormal columns.
+    :param basis_scale: a positive vector which scales the components of `x` in the
+        directions of the columns of `basis`.
+
+    **Example**
+
+    .. doctest::
+
+       >>> import jax.numpy as jnp
+       >>> from numpyro.distributions.transforms import LowRankUpdateAffine
+       >>> base = jnp.ones(2)
+       >>> loc = jnp.zeros(2)
+       >>> scale = jnp.array([1.0, 2.0])
+       >>> basis = jnp.array([[1.0], [0.0]])
+       >>> affine = LowRankUpdateAffine(loc, scale, basis, jnp.array([0.5]))
+       >>> affine(base)
+       Array([0.5, 2. ], dtype=float32)
+    """
+
+    domain = constraints.real_vector
+    codomain = constraints.real_vector
+
+    def __init__(self, loc, scale, basis, basis_scale):
+        if jnp.ndim(basis) != 2:
+            raise ValueError("Only support 2-dimensional basis matrix.")
+        self.loc = loc
+        self.scale = scale
+        self.basis = basis
+        self.basis_scale = basis_scale
+
+    def _update(self, x, basis_scale):
+        coef = jnp.matmul(x, self.basis) * (basis_scale - 1)
+        return x + jnp.matmul(coef, self.basis.T)
+
+    def __call__(self, x):
+        return self.loc + self.scale * self._update(x, self.basis_scale)
+
+    def _inverse(self, y):
+        return self._update((y - self.loc) / self.scale, 1 / self.basis_scale)
+
+    def log_abs_det_jacobian(self, x, y, intermediates=None):
+        return jnp.broadcast_to(
+            jnp.log(self.scale).sum(-1) + jnp.log(self.basis_scale).sum(-1),
+            jnp.shape(x)[:-1],
+        )
+
+    def forward_shape(self, shape):
+        if len(shape) < 1:
+            raise ValueError("Too few dimensions on input")
+        return lax.broadcast_shapes(shape, self.loc.shape, self.scale.shape)
+
+    def inverse_shape(self, shape):
+        if len(shape) < 1:
+            raise ValueError("Too few dimensions on input")
+        return lax.broadcast_shapes(shape, self.loc.shape, self.scale.shape)
+
+    def tree_flatten(self):
+        return (self.loc, self.scale, self.basis, self.basis_scale), (
+            ("loc", "scale", "basis", "basis_scale"),
+            dict(),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, LowRankUpdateAffine):
+            return False
+        return (
+            jnp.array_equal(self.loc, other.loc)
+            & jnp.array_equal(self.scale, other.scale)
+            & jnp.array_equal(self.basis, other.basis)
+            & jnp.array_equal(self.basis_scale, other.basis_scale)
+        )
+
+
 class LowerCholeskyTransform(ParameterFreeTransform):
     """
     Transform a real vector to a lower triangular cholesky
@@ -20,12 +20,20 @@ from numpyro.distributions.distribution import Distribution
 from numpyro.distributions.util import (
     clamp_probs,
     lazy_property,
+    log_ndtr_inv,
+    logdiffexp,
     promote_shapes,
     validate_sample,
 )
 from numpyro.util import is_prng_key
 
 
+def _normal_tail_icdf(base_dist, sign, log_q):
+    # icdf of the Normal base distribution at exp(log_q), reflected around loc
+    # if sign is -1
+    return base_dist.loc + sign * base_dist.scale * log_ndtr_inv(log_q)
+
+
 class LeftTruncatedDistribution(Distribution):
     arg_constraints = {"low": constraints.real}
     reparametrized_params = ["low"]
@@ -61,6 +69,12 @@ class LeftTruncatedDistribution(Distribution):
         # if low < loc, returns cdf(high) = 1; otherwise returns 1 - cdf(high) = 0
         return jnp.where(self.low <= self.base_dist.loc, 1.0, 0.0)
 
+    @lazy_property
+    def _log_tail_prob_at_low(self):
+        loc = self.base_dist.loc
+        sign = jnp.where(loc >= self.low, 1.0, -1.0)
+        return self.base_dist.log_cdf(loc - sign * (loc - self.low))
+
     def sample(self, key, sample_shape=()):
         assert is_prng_key(key)
         dtype = jnp.result_type(float)
@@ -72,13 +86,27 @@ class LeftTruncatedDistribution(Distribution):
     def icdf(self, q):
         loc = self.base_dist.loc
         sign = jnp.where(loc >= self.low, 1.0, -1.0)
-        ppf = (1 - sign) * loc + sign * self.base_dist.icdf(
-            (1 - q) * self._tail_prob_at_low + q * self._tail_prob_at_high
-        )
+        if isinstance(self.base_dist, Normal):
+            log_q = jnp.logaddexp(
+                jnp.log1p(-q) + self._log_tail_prob_at_low,
+                jnp.log(q) + jnp.log(self._tail_prob_at_high),
+            )
+            ppf = _normal_tail_icdf(self.base_dist, sign, log_q)
+            ppf = jnp.clip(ppf, self.low)
+        else:
+            ppf = (1 - sign) * loc + sign * self.base_dist.icdf(
+                (1 - q) * self._tail_prob_at_low + q * self._tail_prob_at_high
+            )
         return jnp.where(q < 0, jnp.nan, ppf)
 
     @validate_sample
     def log_prob(self, value):
+        log_cdf = getattr(self.base_dist, "log_cdf", None)
+        if callable(log_cdf):
+            # 1 - cdf(low) = cdf(2 * loc - low) for a symmetric base distribution
+            return self.base_dist.log_prob(value) - log_cdf(
+                2 * self.base_dist.loc - self.low
+            )
         sign = jnp.where(self.base_dist.loc >= self.low, 1.0, -1.0)
         return self.base_dist.log_prob(value) - jnp.log(
             sign * (self._tail_prob_at_high - self._tail_prob_at_low)
@@ -145,11 +173,20 @@ class RightTruncatedDistribution(Distribution):
         return self.icdf(u)
 
     def icdf(self, q):
-        ppf = self.base_dist.icdf(q * self._cdf_at_high)
+        if isinstance(self.base_dist, Normal):
+            log_q = jnp.log(q) + self.base_dist.log_cdf(self.high)
+            ppf = jnp.clip(
+                _normal_tail_icdf(self.base_dist, 1.0, log_q), None, self.high
+            )
+        else:
+            ppf = self.base_dist.icdf(q * self._cdf_at_high)
         return jnp.where(q > 1, jnp.nan, ppf)
 
     @validate_sample
     def log_prob(self, value):
+        log_cdf = getattr(self.base_dist, "log_cdf", None)
+        if callable(log_cdf):
+            return self.base_dist.log_prob(value) - log_cdf(self.high)
         return self.base_dist.log_prob(value) - jnp.log(self._cdf_at_high)
 
     @property
@@ -220,16 +257,29 @@ class TwoSidedTruncatedDistribution(Distribution):
         sign = jnp.where(loc >= self.low, 1.0, -1.0)
         return self.base_dist.cdf(loc - sign * (loc - self.high))
 
+    @lazy_property
+    def _log_tail_prob_at_low(self):
+        loc = self.base_dist.loc
+        sign = jnp.where(loc >= self.low, 1.0, -1.0)
+        return self.base_dist.log_cdf(loc - sign * (loc - self.low))
+
+    @lazy_property
+    def _log_tail_prob_at_high(self):
+        loc = self.base_dist.loc
+        sign = jnp.where(loc >= self.low, 1.0, -1.0)
+        return self.base_dist.log_cdf(loc - sign * (loc - self.high))
+
     @lazy_property
     def _log_diff_tail_probs(self):
         # use log_cdf method, if available, to avoid inf's in log_prob
         # fall back to cdf, if log_cdf not available
         log_cdf = getattr(self.base_dist, "log_cdf", None)
         if callable(log_cdf):
-            return logsumexp(
-                a=jnp.stack([log_cdf(self.high), log_cdf(self.low)], axis=-1),
-                axis=-1,
-                b=jnp.array([1, -1]),  # subtract low from high
+            # the tail probabilities are log cdfs of the points reflected below loc,
+            # whose difference does not cancel out in the upper tail
+            return logdiffexp(
+                jnp.maximum(self._log_tail_prob_at_low, self._log_tail_prob_at_high),
+                jnp.minimum(self._log_tail_prob_at_low, self._log_tail_prob_at_high),
             )
 
         else:
@@ -255,9 +305,21 @@ class TwoSidedTruncatedDistribution(Distribution):
         #   A = 2 * loc - icdf[(1 - q) * cdf(2*loc-low)) + q * cdf(2*loc - high)]
         loc = self.base_dist.loc
         sign = jnp.where(loc >= self.low, 1.0, -1.0)
-        ppf = (1 - sign) * loc + sign * self.base_dist.icdf(
-            clamp_probs((1 - q) * self._tail_prob_at_low + q * self._tail_prob_at_high)
-        )
+        if isinstance(self.base_dist, Normal):
+            # mix the tail probabilities in log space, which does not underflow
+            # in the far tails
+            log_q = jnp.logaddexp(
+                jnp.log1p(-q) + self._log_tail_prob_at_low,
+                jnp.log(q) + self._log_tail_prob_at_high,
+            )
+            ppf = _normal_tail_icdf(self.base_dist, sign, log_q)
+            ppf = jnp.clip(ppf, self.low, self.high)
+        else:
+            ppf = (1 - sign) * loc + sign * self.base_dist.icdf(
+                clamp_probs(
+                    (1 - q) * self._tail_prob_at_low + q * self._tail_prob_at_high
+                )
+            )
         return jnp.where(jnp.logical_or(q < 0, q > 1), jnp.nan, ppf)
 
     @validate_sample
@@ -378,6 +440,12 @@ class TruncatedPolyaGamma(Distribution):
         return jnp.log(sum_even - sum_odd) - 0.5 * jnp.log(2.0 * jnp.pi)
 
 
+def _log_abs_pow_diff(exponent, log_x, log_y):
+    # log|x^exponent - y^exponent|, which does not overflow for large exponents
+    a, b = exponent * log_x, exponent * log_y
+    return logdiffexp(jnp.maximum(a, b), jnp.minimum(a, b))
+
+
 class DoublyTruncatedPowerLaw(Distribution):
     r"""Power law distribution with :math:`\alpha` index, and lower and upper bounds.
     We can define the power law distribution as,
@@ -443,10 +511,10 @@ class DoublyTruncatedPowerLaw(Distribution):
 
             def neq_neg1_fn():
                 one_more_alpha = 1.0 + neq_neg1_alpha
-                return jnp.log(
-                    jnp.power(x, neq_neg1_alpha)
-                    * (one_more_alpha)
-                    / (jnp.power(high, one_more_alpha) - jnp.power(low, one_more_alpha))
+                return (
+                    neq_neg1_alpha * jnp.log(x)
+                    + jnp.log(jnp.abs(one_more_alpha))
+                    - _log_abs_pow_diff(one_more_alpha, jnp.log(high), jnp.log(low))
                 )
 
             def eq_neg1_fn():
@@ -558,15 +626,18 @@ class DoublyTruncatedPowerLaw(Distribution):
             neq_neg1_mask = jnp.not_equal(alpha, -1.0)
             neq_neg1_alpha = jnp.where(neq_neg1_mask, alpha, 0.0)
 
+            x = jnp.clip(x, low, high)
+            log_x, log_low = jnp.log(x), jnp.log(low)
+
             def cdf_when_alpha_neq_neg1():
                 one_more_alpha = 1.0 + neq_neg1_alpha
-                low_pow_one_more_alpha = jnp.power(low, one_more_alpha)
-                return (jnp.power(x, one_more_alpha) - low_pow_one_more_alpha) / (
-                    jnp.power(high, one_more_alpha) - low_pow_one_more_alpha
+                return jnp.exp(
+                    _log_abs_pow_diff(one_more_alpha, log_x, log_low)
+                    - _log_abs_pow_diff(one_more_alpha, jnp.log(high), log_low)
                 )
 
             def cdf_when_alpha_eq_neg1():
-                return jnp.log(x / low) / jnp.log(high / low)
+                return (log_x - log_low) / (jnp.log(high) - log_low)
 
             cdf_val = jnp.where(
                 neq_neg1_mask,
@@ -694,14 +765,13 @@ class DoublyTruncatedPowerLaw(Distribution):
             neq_neg1_alpha = jnp.where(neq_neg1_mask, alpha, 0.0)
 
             def icdf_alpha_neq_neg1():
+                # (1 - q) * low^(1 + alpha) + q * high^(1 + alpha), in log space
                 one_more_alpha = 1.0 + neq_neg1_alpha
-                low_pow_one_more_alpha = jnp.power(low, one_more_alpha)
-                high_pow_one_more_alpha = jnp.power(high, one_more_alpha)
-                return jnp.power(
-                    low_pow_one_more_alpha
-                    + q * (high_pow_one_more_alpha - low_pow_one_more_alpha),
-                    jnp.reciprocal(one_more_alpha),
+                log_mix = jnp.logaddexp(
+                    jnp.log1p(-q) + one_more_alpha * jnp.log(low),
+                    jnp.log(q) + one_more_alpha * jnp.log(high),
                 )
+                return jnp.exp(log_mix / one_more_alpha)
 
             def icdf_alpha_eq_neg1():
                 return jnp.power(high / low, q) * low
@@ -891,7 +961,7 @@ class LowerTruncatedPowerLaw(Distribution):
         cdf_val = jnp.where(
             jnp.less_equal(value, self.low),
             jnp.zeros_like(value),
-            1.0 - jnp.power(value / self.low, 1.0 + self.alpha),
+            -jnp.expm1((1.0 + self.alpha) * jnp.log(value / self.low)),
         )
         return cdf_val
 
@@ -901,7 +971,7 @@ class LowerTruncatedPowerLaw(Distribution):
         return jnp.where(
             nan_mask,
             jnp.nan,
-            self.low * jnp.power(1.0 - q, jnp.reciprocal(1.0 + self.alpha)),
+            self.low * jnp.exp(jnp.log1p(-q) / (1.0 + self.alpha)),
         )
 
     def sample(self, key, sample_shape=()):
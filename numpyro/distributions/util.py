@@ -4,6 +4,7 @@
 from collections import namedtuple
 from functools import partial, update_wrapper
 import math
+from numbers import Number
 import warnings
 
 import numpy as np
@@ -12,7 +13,7 @@ import jax
 from jax import jit, lax, random, vmap
 import jax.numpy as jnp
 from jax.scipy.linalg import solve_triangular
-from jax.scipy.special import digamma
+from jax.scipy.special import digamma, gammaln, i0e, i1e, log_ndtr, ndtri, xlogy
 from jax.typing import ArrayLike
 
 from numpyro.util import not_jax_tracer
@@ -217,6 +218,137 @@ def categorical(key, p, shape=()):
     return _categorical(key, p, shape)
 
 
+def _alias_table_1d(p):
+    # Vose's alias method: pair each underfull bucket with an overfull one.
+    num_categories = p.shape[-1]
+    q = p / jnp.sum(p) * num_categories
+    # underfull buckets first, then overfull buckets
+    order = jnp.argsort(q >= 1)
+    num_small = jnp.sum(q < 1)
+
+    def body_fn(i, state):
+        q, alias, done, small_ptr, large_ptr, pending = state
+        # a bucket which became underfull is processed before the remaining ones
+        use_pending = pending >= 0
+        small = jnp.where(
+            use_pending, pending, order[jnp.minimum(small_ptr, num_categories - 1)]
+        )
+        large = order[jnp.minimum(large_ptr, num_categories - 1)]
+        valid = (use_pending | (small_ptr < num_small)) & (large_ptr < num_categories)
+        small_ptr = small_ptr + (valid & ~use_pending)
+        new_q_large = q[large] - (1 - q[small])
+        alias = alias.at[small].set(jnp.where(valid, large, alias[small]))
+        done = done.at[small].set(done[small] | valid)
+        q = q.at[large].set(jnp.where(valid, new_q_large, q[large]))
+        becomes_small = valid & (new_q_large < 1)
+        large_ptr = large_ptr + becomes_small
+        pending = jnp.where(becomes_small, large, jnp.where(valid, -1, pending))
+        return q, alias, done, small_ptr, large_ptr, pending
+
+    alias = jnp.arange(num_categories)
+    init = (q, alias, jnp.zeros(num_categories, bool), 0, num_small, -1)
+    q, alias, done, *_ = lax.fori_loop(0, num_categories, body_fn, init)
+    # buckets which were never underfull are full up to rounding errors
+    return jnp.where(done, jnp.clip(q, 0, 1), 1.0), alias
+
+
+def alias_table(p):
+    """
+    Computes the alias table of Walker's alias method [1] for categorical
+    distributions with probabilities `p`, using Vose's O(K) construction [2] for
+    `K` categories. Given the table, :func:`categorical_alias` draws samples in O(1)
+    time each.
+
+    **References:**
+
+    1. Walker, Alastair J. "An Efficient Method for Generating Discrete Random
+       Variables with General Distributions." ACM Transactions on Mathematical
+       Software 3.3 (1977): 253-256.
+    2. Vose, Michael D. "A Linear Algorithm for Generating Random Numbers with a
+       Given Distribution." IEEE Transactions on Software Engineering 17.9 (1991):
+       972-975.
+
+    :param p: probabilities, with the categories in the rightmost dimension.
+    :return: a tuple `(prob, alias)` of arrays with the same shape as `p`.
+    """
+    p = jnp.asarray(p)
+    prob, alias = vmap(_alias_table_1d)(p.reshape((-1, p.shape[-1])))
+    return prob.reshape(p.shape), alias.reshape(p.shape)
+
+
+def _gather_categories(table, indices):
+    # table has shape batch_shape + (K,), indices has shape sample_shape + batch_shape
+    batch_shape = table.shape[:-1]
+    flat_indices = jnp.reshape(indices, (-1, math.prod(batch_shape)))
+    values = vmap(lambda t, i: t[i], in_axes=(0, 1), out_axes=1)(
+        table.reshape((-1, table.shape[-1])), flat_indices
+    )
+    return values.reshape(indices.shape)
+
+
+def _broadcast_table(table, shape):
+    batch_shape = lax.broadcast_shapes(
+        table.shape[:-1], shape[len(shape) - len(table.shape[:-1]) :]
+    )
+    return jnp.broadcast_to(table, batch_shape + table.shape[-1:])
+
+
+@partial(jit, static_argnums=(3,))
+def _categorical_alias(key, prob, alias, shape):
+    shape = shape or prob.shape[:-1]
+    prob = _broadcast_table(prob, shape)
+    alias = _broadcast_table(alias, shape)
+    key_bucket, key_coin = random.split(key)
+    bucket = random.randint(key_bucket, shape, 0, prob.shape[-1])
+    coin = random.uniform(key_coin, shape)
+    keep = coin < _gather_categories(prob, bucket)
+    return jnp.where(keep, bucket, _gather_categories(alias, bucket))
+
+
+def categorical_alias(key, prob, alias, shape=()):
+    """
+    Draws categorical samples in O(1) time each from an alias table computed by
+    :func:`alias_table`.
+
+    :param jax.random.PRNGKey key: random key.
+    :param prob: the acceptance probabilities of the alias table.
+    :param alias: the aliases of the alias table.
+    :param tuple shape: the shape of the samples, which must end with the batch shape
+        of the table, i.e. `prob.shape[:-1]`. Defaults to the batch shape.
+    :return: the sampled categories.
+    """
+    return _categorical_alias(key, prob, alias, shape)
+
+
+@partial(jit, static_argnums=(2,))
+def _categorical_icdf(key, cdf, shape):
+    shape = shape or cdf.shape[:-1]
+    cdf = _broadcast_table(cdf, shape)
+    batch_shape = cdf.shape[:-1]
+    u = random.uniform(key, shape) * cdf[..., -1]
+    flat_u = u.reshape((-1, math.prod(batch_shape)))
+    indices = vmap(
+        lambda c, u: jnp.searchsorted(c, u, side="right"), in_axes=(0, 1), out_axes=1
+    )(cdf.reshape((-1, cdf.shape[-1])), flat_u)
+    # guard against rounding errors at the end of the cdf
+    return jnp.minimum(indices, cdf.shape[-1] - 1).reshape(shape)
+
+
+def categorical_icdf(key, cdf, shape=()):
+    """
+    Draws categorical samples by inverting the cumulative distribution function,
+    using a binary search in O(log K) time each for `K` categories.
+
+    :param jax.random.PRNGKey key: random key.
+    :param cdf: cumulative sums of the (possibly unnormalized) probabilities, with
+        the categories in the rightmost dimension.
+    :param tuple shape: the shape of the samples, which must end with the batch shape
+        of `cdf`, i.e. `cdf.shape[:-1]`. Defaults to the batch shape.
+    :return: the sampled categories.
+    """
+    return _categorical_icdf(key, cdf, shape)
+
+
 def _scatter_add_one(operand, indices, updates):
     return lax.scatter_add(
         operand,
@@ -230,17 +362,7 @@ def _scatter_add_one(operand, indices, updates):
     )
 
 
-@partial(jit, static_argnums=(3, 4))
-def _multinomial(key, p, n, n_max, shape=()):
-    if jnp.shape(n) != jnp.shape(p)[:-1]:
-        broadcast_shape = lax.broadcast_shapes(jnp.shape(n), jnp.shape(p)[:-1])
-        n = jnp.broadcast_to(n, broadcast_shape)
-        p = jnp.broadcast_to(p, broadcast_shape + jnp.shape(p)[-1:])
-    shape = shape or p.shape[:-1]
-    if n_max == 0:
-        return jnp.zeros(shape + p.shape[-1:], dtype=jnp.result_type(int))
-    # get indices from categorical distribution then gather the result
-    indices = categorical(key, p, (n_max,) + shape)
+def _count_categories(indices, n, n_max, num_categories, shape):
     # mask out values when counts is heterogeneous
     if jnp.ndim(n) > 0:
         mask = promote_shapes(
@@ -250,7 +372,7 @@ def _multinomial(key, p, n, n_max, shape=()):
         excess = jnp.concatenate(
             [
                 jnp.expand_dims(n_max - n, -1),
-                jnp.zeros(jnp.shape(n) + (p.shape[-1] - 1,)),
+                jnp.zeros(jnp.shape(n) + (num_categories - 1,)),
             ],
             -1,
         )
@@ -260,25 +382,354 @@ def _multinomial(key, p, n, n_max, shape=()):
     # NB: we transpose to move batch shape to the front
     indices_2D = (jnp.reshape(indices * mask, (n_max, -1))).T
     samples_2D = vmap(_scatter_add_one, (0, 0, 0))(
-        jnp.zeros((indices_2D.shape[0], p.shape[-1]), dtype=indices.dtype),
+        jnp.zeros((indices_2D.shape[0], num_categories), dtype=indices.dtype),
         jnp.expand_dims(indices_2D, axis=-1),
         jnp.ones(indices_2D.shape, dtype=indices.dtype),
     )
-    return jnp.reshape(samples_2D, shape + p.shape[-1:]) - excess
+    return jnp.reshape(samples_2D, shape + (num_categories,)) - excess
 
 
-def multinomial(key, p, n, shape=(), total_count_max=None):
+def _broadcast_total_count(p, n):
+    if jnp.shape(n) != jnp.shape(p)[:-1]:
+        broadcast_shape = lax.broadcast_shapes(jnp.shape(n), jnp.shape(p)[:-1])
+        n = jnp.broadcast_to(n, broadcast_shape)
+        p = jnp.broadcast_to(p, broadcast_shape + jnp.shape(p)[-1:])
+    return p, n
+
+
+@partial(jit, static_argnums=(3, 4))
+def _multinomial(key, p, n, n_max, shape=()):
+    p, n = _broadcast_total_count(p, n)
+    shape = shape or p.shape[:-1]
+    if n_max == 0:
+        return jnp.zeros(shape + p.shape[-1:], dtype=jnp.result_type(int))
+    # get indices from categorical distribution then gather the result
+    indices = categorical(key, p, (n_max,) + shape)
+    return _count_categories(indices, n, n_max, p.shape[-1], shape)
+
+
+def _get_total_count_max(n, total_count_max):
     if total_count_max is None:
         if isinstance(n, jax.core.Tracer):
             raise ValueError(
                 "Please specify total_count_max in Multinomial distribution."
             )
-        n_max = int(np.max(jax.device_get(n)))
-    else:
-        n_max = total_count_max
+        return int(np.max(jax.device_get(n)))
+    return total_count_max
+
+
+def multinomial(key, p, n, shape=(), total_count_max=None):
+    n_max = _get_total_count_max(n, total_count_max)
     return _multinomial(key, p, n, n_max, shape)
 
 
+@partial(jit, static_argnums=(4, 5))
+def _multinomial_alias(key, prob, alias, n, n_max, shape=()):
+    prob, n = _broadcast_total_count(prob, n)
+    alias = jnp.broadcast_to(alias, prob.shape)
+    shape = shape or prob.shape[:-1]
+    if n_max == 0:
+        return jnp.zeros(shape + prob.shape[-1:], dtype=jnp.result_type(int))
+    indices = categorical_alias(key, prob, alias, (n_max,) + shape)
+    return _count_categories(indices, n, n_max, prob.shape[-1], shape)
+
+
+def multinomial_alias(key, prob, alias, n, shape=(), total_count_max=None):
+    """
+    Draws multinomial samples from an alias table computed by :func:`alias_table`,
+    in O(`n`) time each.
+
+    :param jax.random.PRNGKey key: random key.
+    :param prob: the acceptance probabilities of the alias table.
+    :param alias: the aliases of the alias table.
+    :param n: the total counts.
+    :param tuple shape: the shape of the samples, excluding the rightmost categories
+        dimension.
+    :param int total_count_max: the maximum of `n`, required if `n` is traced.
+    :return: the sampled counts.
+    """
+    n_max = _get_total_count_max(n, total_count_max)
+    return _multinomial_alias(key, prob, alias, n, n_max, shape)
+
+
+@partial(jit, static_argnums=(3, 4))
+def _multinomial_icdf(key, cdf, n, n_max, shape=()):
+    cdf, n = _broadcast_total_count(cdf, n)
+    shape = shape or cdf.shape[:-1]
+    if n_max == 0:
+        return jnp.zeros(shape + cdf.shape[-1:], dtype=jnp.result_type(int))
+    indices = categorical_icdf(key, cdf, (n_max,) + shape)
+    return _count_categories(indices, n, n_max, cdf.shape[-1], shape)
+
+
+def multinomial_icdf(key, cdf, n, shape=(), total_count_max=None):
+    """
+    Draws multinomial samples by inverting the cumulative distribution function of
+    the categories, see :func:`categorical_icdf`.
+
+    :param jax.random.PRNGKey key: random key.
+    :param cdf: cumulative sums of the probabilities.
+    :param n: the total counts.
+    :param tuple shape: the shape of the samples, excluding the rightmost categories
+        dimension.
+    :param int total_count_max: the maximum of `n`, required if `n` is traced.
+    :return: the sampled counts.
+    """
+    n_max = _get_total_count_max(n, total_count_max)
+    return _multinomial_icdf(key, cdf, n, n_max, shape)
+
+
+@partial(jit, static_argnums=(3,))
+def _multinomial_binomial(key, p, n, shape):
+    p, n = _broadcast_total_count(p, n)
+    shape = shape or p.shape[:-1]
+    num_categories = p.shape[-1]
+    # probability of each category given that none of the previous ones was drawn
+    tail = jnp.flip(jnp.cumsum(jnp.flip(p, -1), -1), -1)
+    tiny = jnp.finfo(jnp.result_type(p, float)).tiny
+    cond_p = jnp.clip(p / jnp.clip(tail, tiny), 0, 1)
+    cond_p = jnp.moveaxis(cond_p[..., :-1], -1, 0)
+
+    def body_fn(remaining, args):
+        key, q = args
+        count = binomial(key, q, remaining, shape)
+        return remaining - count, count
+
+    n = jnp.broadcast_to(n, shape).astype(jnp.result_type(int))
+    keys = random.split(key, num_categories - 1)
+    remaining, counts = lax.scan(body_fn, n, (keys, cond_p))
+    counts = jnp.concatenate([counts, remaining[None]], axis=0)
+    return jnp.moveaxis(counts, 0, -1)
+
+
+def multinomial_binomial(key, p, n, shape=()):
+    """
+    Draws multinomial samples by sequential binomial splitting: the count of each
+    category is drawn from a binomial distribution given the counts of the previous
+    categories. The cost is linear in the number of categories and does not depend
+    on the total count `n`, which also does not need to be bounded statically.
+
+    :param jax.random.PRNGKey key: random key.
+    :param p: the probabilities, with the categories in the rightmost dimension.
+    :param n: the total counts.
+    :param tuple shape: the shape of the samples, excluding the rightmost categories
+        dimension.
+    :return: the sampled counts.
+    """
+    return _multinomial_binomial(key, p, n, shape)
+
+
+# Rates below this threshold are drawn by inversion, the others by PTRS.
+_poisson_ptrs_thresh = 10
+
+
+def _poisson_inversion(key, rate):
+    # Sequential search of the inverse cdf, which needs a single uniform
+    # variate per draw and about `rate` iterations.
+    u = random.uniform(key, rate.shape, rate.dtype)
+    pmf = jnp.exp(-rate)
+
+    def body_fn(val):
+        k, pmf, cdf = val
+        # stop once the pmf underflows, in case rounding keeps cdf below u
+        go = (u > cdf) & (pmf > 0)
+        pmf = jnp.where(go, pmf * rate / (k + 1), pmf)
+        return jnp.where(go, k + 1, k), pmf, jnp.where(go, cdf + pmf, cdf)
+
+    def cond_fn(val):
+        _, pmf, cdf = val
+        return jnp.any((u > cdf) & (pmf > 0))
+
+    return lax.while_loop(cond_fn, body_fn, (jnp.zeros_like(rate), pmf, pmf))[0]
+
+
+def _poisson_ptrs_params(rate):
+    # See Table 1 of the PTRS reference in `_poisson_ptrs`.
+    b = 0.931 + 2.53 * jnp.sqrt(rate)
+    a = -0.059 + 0.02483 * b
+    inv_alpha = 1.1239 + 1.1328 / (b - 3.4)
+    v_r = 0.9277 - 3.6224 / (b - 2)
+    return jnp.log(rate), a, b, inv_alpha, v_r
+
+
+def _poisson_ptrs_propose(key, rate, params):
+    log_rate, a, b, inv_alpha, v_r = params
+    u, v = random.uniform(key, (2,) + rate.shape, rate.dtype)
+    u = u - 0.5
+    us = 0.5 - jnp.abs(u)
+    k = jnp.floor((2 * a / us + b) * u + rate + 0.43)
+    early_accept = (us >= 0.07) & (v <= v_r)
+    early_reject = (k < 0) | ((us < 0.013) & (v > us))
+    log_f = -rate + k * log_rate - gammaln(k + 1)
+    accept = jnp.log(v * inv_alpha / (a / (us * us) + b)) <= log_f
+    return k, early_accept | (~early_reject & accept)
+
+
+def _poisson_ptrs_loop(key, rate, k, accepted):
+    params = _poisson_ptrs_params(rate)
+
+    def body_fn(val):
+        i, k, accepted = val
+        k_new, accept = _poisson_ptrs_propose(random.fold_in(key, i), rate, params)
+        return i + 1, jnp.where(accepted, k, k_new), accepted | accept
+
+    return lax.while_loop(lambda val: ~jnp.all(val[2]), body_fn, (0, k, accepted))[1]
+
+
+def _poisson_ptrs(key, rate):
+    """
+    Based on the transformed rejection with squeeze algorithm (PTRS) from the
+    following reference:
+
+    Hormann, "The transformed rejection method for generating Poisson random variables"
+    (https://research.wu.ac.at/files/18967493/document.pdf)
+
+    All draws are proposed at once and about 11% of them are rejected. Instead of
+    redrawing the whole batch until every draw is accepted, the rejected draws are
+    gathered into a buffer of a quarter of the batch size and only that buffer is
+    redrawn; the draws which do not fit into the buffer, which is very unlikely
+    for large batches, are redrawn with the whole batch.
+    """
+    key_first, key_buffer, key_rest = random.split(key, 3)
+    size = rate.shape[0]
+    k, accepted = _poisson_ptrs_propose(key_first, rate, _poisson_ptrs_params(rate))
+    buffer_size = max(size // 4, 1)
+    (idx,) = jnp.nonzero(~accepted, size=buffer_size, fill_value=size)
+    # out-of-bound indices are padding, which is accepted right away
+    k_buffer = _poisson_ptrs_loop(
+        key_buffer,
+        rate.at[idx].get(mode="fill", fill_value=1.0e5),
+        jnp.zeros(buffer_size, rate.dtype),
+        idx == size,
+    )
+    k = k.at[idx].set(k_buffer, mode="drop")
+    accepted = accepted.at[idx].set(True, mode="drop")
+    return _poisson_ptrs_loop(key_rest, rate, k, accepted)
+
+
+def _poisson_normal(key, rate):
+    z = random.normal(key, rate.shape, rate.dtype)
+    return jnp.clip(jnp.floor(rate + jnp.sqrt(rate) * z + 0.5), 0)
+
+
+def _poisson_flat(key, rate, normal_threshold):
+    key_inversion, key_ptrs, key_normal = random.split(key, 3)
+    # nan rates are taken by the inversion loop, which terminates right away for them
+    use_ptrs = rate >= _poisson_ptrs_thresh
+    use_inversion = ~use_ptrs
+    k = jnp.zeros_like(rate)
+    if normal_threshold is not None:
+        use_normal = rate >= normal_threshold
+        use_inversion = use_inversion & ~use_normal
+        use_ptrs = use_ptrs & ~use_normal
+        k = jnp.where(use_normal, _poisson_normal(key_normal, rate), k)
+
+    # Each method is skipped if no rate is taken by it. Otherwise, the rates of
+    # draws taken by another method are replaced by values for which its loop
+    # terminates right away.
+    def ptrs_fn(k):
+        k_ptrs = _poisson_ptrs(key_ptrs, jnp.where(use_ptrs, rate, 1.0e5))
+        return jnp.where(use_ptrs, k_ptrs, k)
+
+    def inversion_fn(k):
+        k_inv = _poisson_inversion(key_inversion, jnp.where(use_inversion, rate, 0.0))
+        return jnp.where(use_inversion, k_inv, k)
+
+    k = lax.cond(jnp.any(use_ptrs), ptrs_fn, lambda k: k, k)
+    k = lax.cond(jnp.any(use_inversion), inversion_fn, lambda k: k, k)
+    # nan rates give zero counts because nan is not allowed for integer types
+    return jnp.where(rate > 0, k, 0)
+
+
+@partial(jit, static_argnums=(2, 3))
+def _poisson(key, rate, shape, normal_threshold):
+    rate = jnp.asarray(rate, dtype=jnp.result_type(rate, float))
+    shape = shape or jnp.shape(rate)
+    rate = jnp.reshape(jnp.broadcast_to(rate, shape), -1)
+    k = _poisson_flat(key, rate, normal_threshold)
+    return jnp.reshape(k, shape).astype(jnp.result_type(int))
+
+
+def poisson(key, rate, shape=(), normal_threshold=None):
+    """
+    Draws Poisson samples. Rates smaller than 10 are drawn by inversion and the
+    other rates by transformed rejection (PTRS). Unlike :func:`jax.random.poisson`,
+    the rejection step only redraws the rejected samples, which is faster for
+    large batches.
+
+    :param jax.random.PRNGKey key: random key.
+    :param rate: the rates.
+    :param tuple shape: the shape of the samples.
+    :param float normal_threshold: if specified, the samples whose rate is at least
+        `normal_threshold` are drawn from a normal approximation, i.e. by rounding
+        a normal sample with the same mean and variance. The total variation
+        distance between this approximation and the Poisson distribution is about
+        `0.13 / sqrt(rate)`, so the threshold controls the accuracy.
+    :return: the sampled counts.
+    """
+    return _poisson(key, rate, shape, normal_threshold)
+
+
+def _gamma_marsaglia_tsang(key, concentration):
+    # Marsaglia and Tsang, "A simple method for generating gamma variables".
+    # Concentrations smaller than 1 are boosted by one and corrected with
+    # an uniform variate. All draws are redrawn until all are accepted, which
+    # is cheap as the acceptance rate is above 95%.
+    key_loop, key_boost = random.split(key)
+    boost = concentration < 1
+    d = jnp.where(boost, concentration + 1, concentration) - 1.0 / 3
+    c = 1.0 / jnp.sqrt(9 * d)
+
+    def body_fn(val):
+        i, g, accepted = val
+        key_x, key_u = random.split(random.fold_in(key_loop, i))
+        x = random.normal(key_x, d.shape, d.dtype)
+        u = random.uniform(key_u, d.shape, d.dtype)
+        v = (1 + c * x) ** 3
+        log_v = jnp.log(jnp.where(v > 0, v, 1))
+        accept = (v > 0) & (jnp.log(u) < 0.5 * x * x + d - d * v + d * log_v)
+        return i + 1, jnp.where(accepted, g, d * v), accepted | accept
+
+    g = lax.while_loop(
+        lambda val: ~jnp.all(val[2]),
+        body_fn,
+        (0, jnp.zeros_like(d), jnp.zeros(d.shape, dtype=bool)),
+    )[1]
+    u = random.uniform(key_boost, d.shape, d.dtype)
+    return jnp.where(boost, g * u ** (1 / concentration), g)
+
+
+@partial(jit, static_argnums=(3, 4))
+def _gamma_poisson(key, concentration, rate, shape, normal_threshold):
+    dtype = jnp.result_type(concentration, rate, float)
+    shape = shape or lax.broadcast_shapes(jnp.shape(concentration), jnp.shape(rate))
+    concentration = jnp.reshape(
+        jnp.broadcast_to(jnp.asarray(concentration, dtype), shape), -1
+    )
+    rate = jnp.reshape(jnp.broadcast_to(jnp.asarray(rate, dtype), shape), -1)
+    key_gamma, key_poisson = random.split(key)
+    poisson_rate = _gamma_marsaglia_tsang(key_gamma, concentration) / rate
+    k = _poisson_flat(key_poisson, poisson_rate, normal_threshold)
+    return jnp.reshape(k, shape).astype(jnp.result_type(int))
+
+
+def gamma_poisson(key, concentration, rate=1.0, shape=(), normal_threshold=None):
+    """
+    Draws gamma-Poisson (negative binomial) samples, by drawing the Poisson rates
+    from a gamma distribution and then the counts with :func:`poisson`. Both steps
+    are vectorized rejection samplers in a single compiled function.
+
+    :param jax.random.PRNGKey key: random key.
+    :param concentration: the concentrations of the gamma distribution.
+    :param rate: the rates of the gamma distribution.
+    :param tuple shape: the shape of the samples.
+    :param float normal_threshold: if specified, the Poisson draws whose rate is at
+        least `normal_threshold` use a normal approximation, see :func:`poisson`.
+    :return: the sampled counts.
+    """
+    return _gamma_poisson(key, concentration, rate, shape, normal_threshold)
+
+
 def cholesky_of_inverse(matrix):
     # This formulation only takes the inverse of a triangular matrix
     # which is more numerically stable.
@@ -291,6 +742,173 @@ def cholesky_of_inverse(matrix):
     return solve_triangular(tril_inv, identity, lower=True)
 
 
+class CholeskyFactor(namedtuple("CholeskyFactor", ["scale_tril", "whitening"])):
+    r"""
+    A reusable factorization :math:`\Sigma = L L^T` of a covariance matrix, to be
+    passed as the `factor` argument of
+    :class:`~numpyro.distributions.MultivariateNormal`.
+
+    Besides the Cholesky factor :math:`L`, the factorization stores its inverse
+    :math:`L^{-1}` so that the Mahalanobis distance is computed with a matrix
+    product instead of a triangular solve. When the covariance matrix does not
+    depend on the latent variables, e.g. in Gaussian process or observation models,
+    construct the factorization once outside of the model and pass it as a model
+    argument: it is a pytree, so it can also be shared across chains and devices.
+
+    **Example**
+
+    .. doctest::
+
+        >>> import jax.numpy as jnp
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.distributions.util import CholeskyFactor
+        >>> factor = CholeskyFactor.from_covariance(jnp.array([[2.0, 0.5], [0.5, 1.0]]))
+        >>> d = dist.MultivariateNormal(jnp.zeros(2), factor=factor)
+        >>> d.log_prob(jnp.ones(2)).shape
+        ()
+
+    :param numpy.ndarray scale_tril: the lower Cholesky factor :math:`L`.
+    :param numpy.ndarray whitening: the inverse :math:`L^{-1}` of `scale_tril`.
+    """
+
+    @classmethod
+    def from_covariance(cls, covariance_matrix):
+        """
+        Factorizes a (batch of) covariance matrices.
+        """
+        scale_tril = jnp.linalg.cholesky(covariance_matrix)
+        identity = jnp.broadcast_to(
+            jnp.identity(scale_tril.shape[-1]), scale_tril.shape
+        )
+        return cls(scale_tril, solve_triangular(scale_tril, identity, lower=True))
+
+    @classmethod
+    def from_precision(cls, precision_matrix):
+        """
+        Factorizes the covariance matrix given by a (batch of) precision matrices.
+        """
+        scale_tril = cholesky_of_inverse(precision_matrix)
+        identity = jnp.broadcast_to(
+            jnp.identity(scale_tril.shape[-1]), scale_tril.shape
+        )
+        return cls(scale_tril, solve_triangular(scale_tril, identity, lower=True))
+
+    @property
+    def scale(self):
+        return self.scale_tril
+
+    @property
+    def half_log_det(self):
+        return tri_logabsdet(self.scale_tril)
+
+
+class EighFactor(namedtuple("EighFactor", ["eigenvectors", "eigenvalues"])):
+    r"""
+    A reusable eigendecomposition :math:`\Sigma = Q \Lambda Q^T` of a covariance
+    matrix, to be passed as the `factor` argument of
+    :class:`~numpyro.distributions.MultivariateNormal`.
+
+    Unlike :class:`CholeskyFactor`, this factorization can be updated in
+    :math:`O(n)` when a multiple of the identity is added to the covariance matrix,
+    see :meth:`add_diag`. This is the common case of a fixed Gaussian process kernel
+    matrix :math:`K` with a latent observation noise :math:`\sigma^2`: the
+    :math:`O(n^3)` decomposition of :math:`K` is computed once, and each evaluation
+    of the density of :math:`\mathcal{N}(\mu, K + \sigma^2 I)` costs :math:`O(n^2)`.
+    For a diagonal noise with distinct entries, use
+    :class:`~numpyro.distributions.LowRankMultivariateNormal` with a
+    :class:`LowRankFactor` instead.
+
+    **Example**
+
+    .. doctest::
+
+        >>> import jax.numpy as jnp
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.distributions.util import EighFactor
+        >>> x = jnp.linspace(0, 1, 5)
+        >>> kernel = jnp.exp(-0.5 * (x[:, None] - x) ** 2)
+        >>> factor = EighFactor.from_covariance(kernel)
+        >>> noise = 0.1
+        >>> d = dist.MultivariateNormal(jnp.zeros(5), factor=factor.add_diag(noise))
+        >>> d.log_prob(jnp.ones(5)).shape
+        ()
+
+    :param numpy.ndarray eigenvectors: the orthogonal matrix :math:`Q` whose columns
+        are the eigenvectors of the covariance matrix.
+    :param numpy.ndarray eigenvalues: the positive eigenvalues :math:`\Lambda`.
+    """
+
+    @classmethod
+    def from_covariance(cls, covariance_matrix):
+        """
+        Factorizes a (batch of) covariance matrices.
+        """
+        eigenvalues, eigenvectors = jnp.linalg.eigh(covariance_matrix)
+        return cls(eigenvectors, eigenvalues)
+
+    def add_diag(self, value):
+        r"""
+        Returns the factorization of :math:`\Sigma + \text{value} \cdot I`.
+
+        :param value: a positive scalar, or an array of scalars broadcastable to the
+            batch shape of the factorization.
+        """
+        return type(self)(
+            self.eigenvectors, self.eigenvalues + jnp.expand_dims(value, -1)
+        )
+
+    @property
+    def scale(self):
+        return self.eigenvectors * jnp.expand_dims(jnp.sqrt(self.eigenvalues), -2)
+
+    @property
+    def whitening(self):
+        return jnp.swapaxes(self.eigenvectors, -1, -2) / jnp.expand_dims(
+            jnp.sqrt(self.eigenvalues), -1
+        )
+
+    @property
+    def half_log_det(self):
+        return 0.5 * jnp.log(self.eigenvalues).sum(-1)
+
+
+class LowRankFactor(
+    namedtuple("LowRankFactor", ["cov_factor", "cov_diag", "capacitance_tril"])
+):
+    r"""
+    A reusable factorization of a low-rank plus diagonal covariance matrix
+    :math:`W W^T + D`, to be passed as the `factor` argument of
+    :class:`~numpyro.distributions.LowRankMultivariateNormal`.
+
+    The factorization stores the Cholesky factor of the capacitance matrix
+    :math:`I + W^T D^{-1} W`, which is used together with the Woodbury matrix identity
+    and the matrix determinant lemma to evaluate the density. When only the diagonal
+    :math:`D` changes, :meth:`with_diag` updates the factorization in
+    :math:`O(n m^2 + m^3)`, where :math:`m` is the rank of :math:`W`.
+
+    :param numpy.ndarray cov_factor: the factor :math:`W` with shape `n x m`.
+    :param numpy.ndarray cov_diag: the diagonal :math:`D` with shape `n`.
+    :param numpy.ndarray capacitance_tril: the lower Cholesky factor of the
+        capacitance matrix.
+    """
+
+    @classmethod
+    def from_factors(cls, cov_factor, cov_diag):
+        """
+        Factorizes the covariance matrix `cov_factor @ cov_factor.T + diag(cov_diag)`.
+        """
+        return cls(cov_factor, cov_diag, None).with_diag(cov_diag)
+
+    def with_diag(self, cov_diag):
+        """
+        Returns the factorization of `cov_factor @ cov_factor.T + diag(cov_diag)`,
+        reusing `cov_factor`.
+        """
+        Wt_Dinv = jnp.swapaxes(self.cov_factor, -1, -2) / jnp.expand_dims(cov_diag, -2)
+        capacitance = add_diag(jnp.matmul(Wt_Dinv, self.cov_factor), 1)
+        return type(self)(self.cov_factor, cov_diag, jnp.linalg.cholesky(capacitance))
+
+
 # TODO: move upstream to jax.nn
 def binary_cross_entropy_with_logits(x, y):
     # compute -y * log(sigmoid(x)) - (1 - y) * log(1 - sigmoid(x))
@@ -489,6 +1107,210 @@ def logdiffexp(a: ArrayLike, b: ArrayLike) -> ArrayLike:
     )
 
 
+@jax.custom_jvp
+def log_ndtr_inv(log_p: ArrayLike) -> ArrayLike:
+    """
+    Inverse of :func:`jax.scipy.special.log_ndtr`, i.e. the quantile function of
+    the standard normal distribution evaluated at ``exp(log_p)``. Unlike
+    ``ndtri(exp(log_p))``, this is accurate in both tails, including when
+    ``exp(log_p)`` underflows or is rounded to one.
+
+    :param log_p: A number or array of numbers, which are not positive.
+    :return: The value ``x`` such that ``log_ndtr(x) == log_p``.
+    """
+    log_p = jnp.asarray(log_p, dtype=jnp.result_type(log_p, float))
+    log_tiny = math.log(jnp.finfo(log_p.dtype).tiny)
+    # ndtri is accurate in the lower tail, and in the upper tail given 1 - p
+    lower = log_p < -math.log(2)
+    x = jnp.where(
+        lower,
+        ndtri(jnp.exp(jnp.where(lower, log_p, -1.0))),
+        -ndtri(-jnp.expm1(jnp.where(lower, -1.0, log_p))),
+    )
+
+    def newton_fn(x):
+        # Start from the asymptotic expansion log_p ~ -x^2 / 2 - log(-x) - log(2 pi) / 2
+        # and refine with Newton steps on log_ndtr, whose derivative is pdf / cdf.
+        t = -2 * jnp.minimum(log_p, log_tiny)
+        x_tail = -jnp.sqrt(t - jnp.log(t) - math.log(2 * math.pi))
+        for _ in range(2):
+            log_pdf = -0.5 * x_tail**2 - 0.5 * math.log(2 * math.pi)
+            log_cdf = log_ndtr(x_tail)
+            x_tail = x_tail - (log_cdf - log_p) * jnp.exp(log_cdf - log_pdf)
+        return jnp.where(log_p < log_tiny, x_tail, x)
+
+    # the Newton steps are only needed if exp(log_p) underflows
+    x = lax.cond(jnp.any(log_p < log_tiny), newton_fn, lambda x: x, x)
+    return jnp.where(log_p == -jnp.inf, -jnp.inf, x)
+
+
+@log_ndtr_inv.defjvp
+def _log_ndtr_inv_jvp(primals, tangents):
+    (log_p,), (log_p_dot,) = primals, tangents
+    x = log_ndtr_inv(log_p)
+    log_pdf = -0.5 * x**2 - 0.5 * math.log(2 * math.pi)
+    return x, log_p_dot * jnp.exp(log_p - log_pdf)
+
+
+# The helpers below compute the exponentially scaled log I_v(x) - x, whose
+# differences across orders do not lose precision for large x.
+def _log_bessel_ive_series(v, x, max_terms=500):
+    # Power series evaluated in log space, summing terms until they are negligible.
+    eps = jnp.finfo(jnp.result_type(x)).eps
+    log_q = 2 * jnp.log(x / 2)
+
+    def cond_fn(state):
+        k, log_term, log_total = state
+        # the terms increase while k (v + k) < q
+        active = (log_term > log_total + jnp.log(eps)) | (2 * jnp.log(k + 1) < log_q)
+        return jnp.any(active) & (k < max_terms)
+
+    def body_fn(state):
+        k, log_term, log_total = state
+        k = k + 1
+        log_term = log_term + log_q - jnp.log(k) - jnp.log(v + k)
+        return k, log_term, jnp.logaddexp(log_total, log_term)
+
+    init = (jnp.zeros((), x.dtype), jnp.zeros_like(x), jnp.zeros_like(x))
+    _, _, log_total = lax.while_loop(cond_fn, body_fn, init)
+    return xlogy(v, x / 2) - gammaln(v + 1) + log_total - x
+
+
+def _log_bessel_ive_hankel(v, x, num_terms=10):
+    # Asymptotic expansion for large x relative to v**2.
+    mu = 4 * v**2
+    term = jnp.ones_like(x)
+    total = term
+    for k in range(1, num_terms):
+        term = -term * (mu - (2 * k - 1) ** 2) / (8 * k * x)
+        total = total + term
+    return -0.5 * jnp.log(2 * np.pi * x) + jnp.log(total)
+
+
+def _log_bessel_ive_debye(v, x):
+    # Uniform asymptotic expansion for large v, see DLMF 10.41.3.
+    z = x / v
+    s = jnp.sqrt(1 + z**2)
+    p = 1 / s
+    p2 = p**2
+    u1 = p * (3 - 5 * p2) / 24
+    u2 = p2 * (81 - 462 * p2 + 385 * p2**2) / 1152
+    u3 = p * p2 * (30375 - 369603 * p2 + 765765 * p2**2 - 425425 * p2**3) / 414720
+    u4 = (
+        p2**2
+        * (
+            4465125
+            - 94121676 * p2
+            + 349922430 * p2**2
+            - 446185740 * p2**3
+            + 185910725 * p2**4
+        )
+        / 39813120
+    )
+    # v * eta - x, where eta = s + log(z / (1 + s)) and v * s - x = v**2 / (v * s + x)
+    eta_minus_z = v / (v * s + x) + jnp.log(z / (1 + s))
+    correction = jnp.log1p(u1 / v + u2 / v**2 + u3 / v**3 + u4 / v**4)
+    return (
+        v * eta_minus_z - 0.5 * jnp.log(2 * np.pi * v) - 0.5 * jnp.log(s) + correction
+    )
+
+
+@jax.custom_jvp
+def _log_bessel_ive(v, x):
+    use_debye = v >= 15
+    use_hankel = ~use_debye & (x > jnp.maximum(30, v**2))
+    use_series = ~(use_debye | use_hankel)
+    # evaluate each expansion at a safe point outside of its domain
+    series = _log_bessel_ive_series(
+        jnp.where(use_series, v, 0), jnp.where(use_series, x, 1)
+    )
+    hankel = _log_bessel_ive_hankel(
+        jnp.where(use_hankel, v, 0), jnp.where(use_hankel, x, 30)
+    )
+    debye = _log_bessel_ive_debye(jnp.where(use_debye, v, 15), x)
+    return jnp.where(use_debye, debye, jnp.where(use_hankel, hankel, series))
+
+
+@_log_bessel_ive.defjvp
+def _log_bessel_ive_jvp(primals, tangents):
+    v, x = primals
+    _, x_dot = tangents
+    ans = _log_bessel_ive(v, x)
+    # I_v'(x) = I_{v+1}(x) + v / x * I_v(x)
+    ratio = jnp.exp(_log_bessel_ive(v + 1, x) - ans)
+    return ans, (ratio + jnp.where(v == 0, 0, v / x) - 1) * x_dot
+
+
+def log_bessel_iv(v: ArrayLike, x: ArrayLike) -> ArrayLike:
+    r"""
+    Numerically stable calculation of the logarithm of the modified Bessel function
+    of the first kind :math:`\log I_v(x)`.
+
+    Depending on the order and the argument, the function is evaluated by a power
+    series whose number of terms adapts to the argument, by the asymptotic expansion
+    for large arguments, or by the uniform asymptotic expansion for large orders
+    [1, 10.25.2, 10.40.1, 10.41.3]. Intermediate values have the same size as the
+    inputs. The orders `0` and `1` are dispatched to :func:`jax.scipy.special.i0e`
+    and :func:`jax.scipy.special.i1e`.
+
+    The gradient is only available with respect to `x`.
+
+    **References:**
+
+    1. *NIST Digital Library of Mathematical Functions*, https://dlmf.nist.gov/
+
+    :param v: A non-negative order or array of orders.
+    :param x: A non-negative number or array of numbers.
+    :return: The value of :math:`\log I_v(x)`.
+    """
+    x = jnp.asarray(x, dtype=jnp.result_type(x, float))
+    if isinstance(v, Number) and v in (0, 1):
+        return jnp.log((i0e if v == 0 else i1e)(x)) + x
+    v, x = jnp.broadcast_arrays(jnp.asarray(v, dtype=x.dtype), x)
+    return _log_bessel_ive(v, x) + x
+
+
+def log_bessel_iv_range(max_order: int, x: ArrayLike, num_extra_orders=20):
+    r"""
+    Computes :math:`\log I_v(x)` of the modified Bessel function of the first kind
+    for all integer orders :math:`v = 0, \dots,` `max_order`.
+
+    The ratios :math:`I_{v+1}(x) / I_v(x)` are computed by the backward recurrence
+    :math:`I_{v-1}(x) / I_v(x) = 2v / x + I_{v+1}(x) / I_v(x)`, which is stable,
+    started at order `max_order + num_extra_orders` from the approximation of [1].
+    They are accumulated from :math:`\log I_0(x)`, so the cost and memory are linear
+    in the number of orders.
+
+    **References:**
+
+    1. Amos, D. E. "Computation of Modified Bessel Functions and Their Ratios."
+       Mathematics of Computation 28.125 (1974): 239-251.
+
+    :param int max_order: The largest order.
+    :param x: A non-negative number or array of numbers.
+    :param int num_extra_orders: Number of recurrence steps above `max_order` used to
+        reduce the error of the starting ratio. Defaults to 20.
+    :return: An array with shape `(max_order + 1,) + jnp.shape(x)`.
+    """
+    x = jnp.asarray(x, dtype=jnp.result_type(x, float))
+    log_i0 = jnp.log(i0e(x)) + x
+    if max_order == 0:
+        return log_i0[None]
+    start = max_order + num_extra_orders
+    ratio = x / (start + 0.5 + jnp.sqrt((start + 1.5) ** 2 + x**2))
+
+    def body_fn(ratio, v):
+        ratio = x / (2 * v + x * ratio)
+        return ratio, ratio
+
+    # ratios[v] = I_{v+1}(x) / I_v(x) for v = 0, ..., start - 1
+    _, ratios = lax.scan(
+        body_fn, ratio, jnp.arange(1, start + 1, dtype=x.dtype), reverse=True
+    )
+    log_ivs = log_i0 + jnp.cumsum(jnp.log(ratios[:max_order]), axis=0)
+    return jnp.concatenate([log_i0[None], log_ivs])
+
+
 def clamp_probs(probs):
     finfo = jnp.finfo(jnp.result_type(probs, float))
     return jnp.clip(probs, finfo.tiny, 1.0 - finfo.eps)
@@ -98,12 +98,13 @@ import warnings
 
 import numpy as np
 
+import jax
 from jax import Array, random
 import jax.numpy as jnp
 from jax.typing import ArrayLike
 
 import numpyro
-from numpyro.distributions.distribution import COERCIONS
+from numpyro.distributions.distribution import COERCIONS, Distribution, Unit
 from numpyro.primitives import (
     _PYRO_STACK,
     CondIndepStackFrame,
@@ -113,15 +114,24 @@ from numpyro.primitives import (
     apply_stack,
     plate,
 )
-from numpyro.util import find_stack_level, is_prng_key, not_jax_tracer
+from numpyro.util import (
+    _axis_sizes,
+    _bucket_size,
+    _resize_batch,
+    find_stack_level,
+    is_prng_key,
+    not_jax_tracer,
+)
 
 __all__ = [
     "block",
+    "bucket",
     "collapse",
     "condition",
     "infer_config",
     "lift",
     "mask",
+    "mixed_precision",
     "reparam",
     "replay",
     "scale",
@@ -328,6 +338,124 @@ class block(Messenger):
             msg["kwargs"]["rng_key"] = numpyro.prng_key()
 
 
+class bucket(Messenger):
+    """
+    Pads the data points of a model to a bucket size and masks the observations of
+    the padded data points, so that the inference compiled for a bucket size is
+    reused for data of any size in the bucket, e.g. by
+    :class:`~numpyro.infer.mcmc.MCMC` or :class:`~numpyro.infer.svi.SVI` with
+    `jit_model_args=True`.
+
+    :meth:`pad` pads the arguments to the model along `in_axes` by repeating the last
+    data point, and adds a `bucket_mask` keyword argument which this handler removes
+    before calling `fn`. The observed sample sites in the plate `plate`, whose size
+    must be that of the padded arguments, are then masked by `bucket_mask`. The
+    local latent variables of the padded data points are drawn from their priors,
+    unless `mask_latent` is True. In SVI, the guide receives the same arguments and
+    should be wrapped by a `bucket` handler with the same plate.
+
+    :param callable fn: Python callable with NumPyro primitives.
+    :param str plate: the name of the plate of the data points.
+    :param in_axes: the axis of the data points in the arguments to the model, with
+        the same semantics as in :func:`jax.vmap`. This is a prefix of the tuple
+        `(args, kwargs)`, e.g. `0` (default) for the leading axis of all arguments, or
+        `((0, None), {"y": 0})` for the first positional argument and `y` only.
+    :param batch_sizes: the bucket sizes to which the data is padded. If None
+        (default), the data is padded to the next power of two.
+    :type batch_sizes: list of int
+    :param bool mask_latent: whether to also mask the latent sample sites in the plate,
+        e.g. the local latent variables of both the model and an amortized guide in
+        SVI, so that the padded data points do not contribute to the ELBO. This makes
+        the latent variables of the padded data points improper under the model, so
+        it should not be used with MCMC. Defaults to False.
+
+    **Example:**
+
+    .. doctest::
+
+       >>> import jax.numpy as jnp
+       >>> import numpyro
+       >>> from numpyro.handlers import bucket
+       >>> import numpyro.distributions as dist
+
+       >>> def model(x, y=None):
+       ...     w = numpyro.sample("w", dist.Normal(0., 1.))
+       ...     with numpyro.plate("N", x.shape[0]):
+       ...         numpyro.sample("y", dist.Normal(w * x, 1.), obs=y)
+
+       >>> bucketed_model = bucket(model, "N", batch_sizes=[8, 64])
+       >>> args, kwargs = bucketed_model.pad(jnp.ones(5), y=jnp.ones(5))
+       >>> args[0].shape, kwargs["y"].shape
+       ((8,), (8,))
+       >>> kwargs["bucket_mask"]
+       array([ True,  True,  True,  True,  True, False, False, False])
+
+    The padded arguments are then passed to the inference algorithm, e.g.::
+
+        mcmc = MCMC(NUTS(bucketed_model), jit_model_args=True, ...)
+        mcmc.run(rng_key, *args, **kwargs)
+    """
+
+    def __init__(
+        self,
+        fn: Optional[Callable] = None,
+        plate: Optional[str] = None,
+        in_axes=0,
+        batch_sizes: Optional[list[int]] = None,
+        mask_latent: bool = False,
+    ) -> None:
+        if plate is None:
+            raise ValueError("The name of the plate of the data points is required.")
+        self.plate = plate
+        self.in_axes = in_axes if isinstance(in_axes, tuple) else (in_axes, in_axes)
+        self.batch_sizes = None if batch_sizes is None else sorted(batch_sizes)
+        self.mask_latent = mask_latent
+        self._mask = None
+        super().__init__(fn)
+
+    def pad(self, *args, **kwargs) -> tuple[tuple, dict]:
+        """
+        Pads the arguments to the model to the bucket size of their data points.
+
+        :param args: arguments to the model.
+        :param kwargs: keyword arguments to the model.
+        :return: a tuple of the padded arguments and keyword arguments, including a
+            `bucket_mask` keyword argument.
+        """
+        sizes = _axis_sizes(self.in_axes, (args, kwargs))
+        if len(sizes) != 1:
+            raise ValueError(
+                "Expected a single number of data points along `in_axes`,"
+                " but got {}.".format(sizes or "none")
+            )
+        size = sizes.pop()
+        batch_size = _bucket_size(size, self.batch_sizes)
+        args, kwargs = _resize_batch(self.in_axes, (args, kwargs), batch_size)
+        kwargs["bucket_mask"] = np.arange(batch_size) < size
+        return args, kwargs
+
+    def __call__(self, *args, **kwargs):
+        if self.fn is None:
+            return super().__call__(*args, **kwargs)
+        self._mask = kwargs.pop("bucket_mask", None)
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            self._mask = None
+
+    def process_message(self, msg: Message) -> None:
+        if self._mask is None or msg["type"] != "sample":
+            return
+        if not (msg["is_observed"] or self.mask_latent):
+            return
+        for frame in msg["cond_indep_stack"]:
+            if frame.name == self.plate:
+                # align the mask with the dimension of the plate
+                mask = jnp.reshape(self._mask, (-1,) + (1,) * (-frame.dim - 1))
+                msg["fn"] = msg["fn"].mask(mask)
+                return
+
+
 class collapse(trace):
     """
     EXPERIMENTAL Collapses all sites in the context by lazily sampling and
@@ -598,6 +726,167 @@ class mask(Messenger):
         msg["fn"] = msg["fn"].mask(self.mask)
 
 
+def _cast_floating(x, dtype):
+    return jax.tree.map(
+        lambda v: (
+            jnp.asarray(v, dtype=dtype)
+            if jnp.issubdtype(jnp.result_type(v), jnp.floating)
+            else v
+        ),
+        x,
+    )
+
+
+class _MixedPrecisionDistribution(Distribution):
+    """
+    Wraps a distribution so that its :meth:`log_prob` is evaluated in
+    ``compute_dtype`` and returned in ``accum_dtype``.
+    """
+
+    arg_constraints = {}
+    pytree_data_fields = ("base_dist",)
+    pytree_aux_fields = ("compute_dtype", "accum_dtype")
+
+    def __init__(self, base_dist, compute_dtype, accum_dtype):
+        self.base_dist = base_dist
+        self.compute_dtype = compute_dtype
+        self.accum_dtype = accum_dtype
+        super().__init__(base_dist.batch_shape, base_dist.event_shape)
+
+    @property
+    def has_enumerate_support(self):
+        return self.base_dist.has_enumerate_support
+
+    @property
+    def has_rsample(self):
+        return self.base_dist.has_rsample
+
+    def rsample(self, key, sample_shape=()):
+        return self.base_dist.rsample(key, sample_shape=sample_shape)
+
+    @property
+    def support(self):
+        return self.base_dist.support
+
+    def sample(self, key, sample_shape=()):
+        return self.base_dist.sample(key, sample_shape=sample_shape)
+
+    def sample_with_intermediates(self, key, sample_shape=()):
+        return self.base_dist.sample_with_intermediates(key, sample_shape=sample_shape)
+
+    def log_prob(self, value, intermediates=None):
+        accum_dtype = (
+            jnp.result_type(float) if self.accum_dtype is None else self.accum_dtype
+        )
+        if intermediates is not None:
+            log_prob = self.base_dist.log_prob(value, intermediates)
+        elif isinstance(self.base_dist, Unit):
+            # the log factor is given rather than computed from the value
+            log_prob = self.base_dist.log_prob(value)
+        else:
+            base_dist = _cast_floating(self.base_dist, self.compute_dtype)
+            value = _cast_floating(value, self.compute_dtype)
+            log_prob = base_dist.log_prob(value)
+        return jnp.asarray(log_prob, dtype=accum_dtype)
+
+    def enumerate_support(self, expand=True):
+        return self.base_dist.enumerate_support(expand=expand)
+
+    @property
+    def mean(self):
+        return self.base_dist.mean
+
+    @property
+    def variance(self):
+        return self.base_dist.variance
+
+
+class mixed_precision(Messenger):
+    """
+    Runs the model in a lower precision ``compute_dtype`` and sums its log density
+    in a higher precision ``accum_dtype``.
+
+    Floating point values of ``sample`` and ``param`` sites are cast to
+    ``compute_dtype`` before they are returned to the model, so that computations
+    of the model that depend on them, e.g. the likelihood of a large dataset, run in
+    ``compute_dtype``. The log probability of each sample site is evaluated in
+    ``compute_dtype`` and cast to ``accum_dtype`` before it is summed. Values
+    recorded in the trace keep their precision, so that the parameters and the
+    state of inference algorithms, e.g. the optimizer state of
+    :class:`~numpyro.infer.svi.SVI`, or the momentum, energy and step size
+    adaptation of :class:`~numpyro.infer.hmc.HMC`, stay in the precision of the
+    inference algorithm. This handler is applied to the model passed to an
+    inference algorithm, so the policy can be set for each inference object.
+
+    .. note:: Observed values are cast to ``compute_dtype`` too, so they should be
+        representable in it, e.g. ``bfloat16`` represents integers exactly up to
+        256 only. Integer values are not cast.
+
+    **Example:**
+
+    .. doctest::
+
+       >>> import jax.numpy as jnp
+       >>> from jax import random
+       >>> import numpyro
+       >>> import numpyro.distributions as dist
+       >>> from numpyro.handlers import mixed_precision
+       >>> from numpyro.infer import MCMC, NUTS
+
+       >>> def model(x, y):
+       ...     coef = numpyro.sample("coef", dist.Normal(0, 1))
+       ...     with numpyro.plate("N", x.shape[0]):
+       ...         numpyro.sample("obs", dist.Normal(coef * x, 1), obs=y)
+
+       >>> x = random.normal(random.PRNGKey(0), (1000,))
+       >>> y = 2 * x + random.normal(random.PRNGKey(1), (1000,))
+       >>> kernel = NUTS(mixed_precision(model, compute_dtype=jnp.bfloat16))
+       >>> mcmc = MCMC(kernel, num_warmup=100, num_samples=100, progress_bar=False)
+       >>> mcmc.run(random.PRNGKey(2), x, y)
+       >>> mcmc.get_samples()["coef"].dtype
+       dtype('float32')
+
+    :param fn: Python callable with NumPyro primitives.
+    :param compute_dtype: the floating point dtype in which the model and the log
+        probabilities of its sample sites are evaluated. Defaults to ``bfloat16``.
+    :param accum_dtype: the floating point dtype of the log probabilities of sample
+        sites, in which they are summed. Defaults to the default floating point
+        dtype of JAX, i.e. ``float64`` if :func:`~numpyro.util.enable_x64` is set
+        and ``float32`` otherwise.
+    """
+
+    def __init__(
+        self,
+        fn: Optional[Callable] = None,
+        compute_dtype=jnp.bfloat16,
+        accum_dtype=None,
+    ) -> None:
+        for dtype in (compute_dtype, accum_dtype):
+            if dtype is not None and not jnp.issubdtype(dtype, jnp.floating):
+                raise ValueError(
+                    "Expected a floating point dtype but got {}.".format(dtype)
+                )
+        self.compute_dtype = jnp.dtype(compute_dtype)
+        self.accum_dtype = None if accum_dtype is None else jnp.dtype(accum_dtype)
+        super().__init__(fn)
+
+    def process_message(self, msg: Message) -> None:
+        if msg["type"] != "sample" or isinstance(
+            msg["fn"], _MixedPrecisionDistribution
+        ):
+            return
+
+        msg["fn"] = _MixedPrecisionDistribution(
+            msg["fn"], self.compute_dtype, self.accum_dtype
+        )
+
+    def postprocess_message(self, msg: Message) -> None:
+        # handlers above this one, e.g. `trace`, have already recorded the value
+        # in its original precision
+        if msg["type"] in ("sample", "param") and msg["value"] is not None:
+            msg["value"] = _cast_floating(msg["value"], self.compute_dtype)
+
+
 class reparam(Messenger):
     """
     Reparametrizes each affected sample site into one or more auxiliary sample
@@ -3,6 +3,7 @@
 
 
 from numpyro.infer.barker import BarkerMH
+from numpyro.infer.chees import ChEESHMC
 from numpyro.infer.elbo import (
     ELBO,
     RenyiELBO,
@@ -12,7 +13,7 @@ from numpyro.infer.elbo import (
     TraceMeanField_ELBO,
 )
 from numpyro.infer.ensemble import AIES, ESS
-from numpyro.infer.hmc import HMC, NUTS
+from numpyro.infer.hmc import HMC, NUTS, VectorizedNUTS
 from numpyro.infer.hmc_gibbs import HMCECS, DiscreteHMCGibbs, HMCGibbs
 from numpyro.infer.initialization import (
     init_to_feasible,
@@ -24,9 +25,10 @@ from numpyro.infer.initialization import (
 )
 from numpyro.infer.mcmc import MCMC
 from numpyro.infer.mixed_hmc import MixedHMC
+from numpyro.infer.pathfinder import Pathfinder
 from numpyro.infer.sa import SA
 from numpyro.infer.svi import SVI
-from numpyro.infer.util import Predictive, log_likelihood
+from numpyro.infer.util import CompiledPredictive, Predictive, log_likelihood
 
 from . import autoguide, reparam
 
@@ -42,6 +44,8 @@ __all__ = [
     "log_likelihood",
     "reparam",
     "BarkerMH",
+    "ChEESHMC",
+    "CompiledPredictive",
     "DiscreteHMCGibbs",
     "ELBO",
     "ESS",
@@ -51,6 +55,7 @@ __all__ = [
     "MCMC",
     "MixedHMC",
     "NUTS",
+    "Pathfinder",
     "Predictive",
     "RenyiELBO",
     "SA",
@@ -59,4 +64,5 @@ __all__ = [
     "TraceEnum_ELBO",
     "TraceGraph_ELBO",
     "TraceMeanField_ELBO",
+    "VectorizedNUTS",
 ]
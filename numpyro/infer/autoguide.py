@@ -25,9 +25,11 @@ from numpyro.distributions.flows import (
 )
 from numpyro.distributions.transforms import (
     AffineTransform,
+    BlockLowerCholeskyAffine,
     ComposeTransform,
     IndependentTransform,
     LowerCholeskyAffine,
+    LowRankUpdateAffine,
     PermuteTransform,
     ReshapeTransform,
     UnpackTransform,
@@ -222,6 +224,22 @@ class AutoGuide(ABC):
         """
         raise NotImplementedError
 
+    def natural_gradient(self, params, grads):
+        """
+        Preconditions the gradients of a loss w.r.t. the unconstrained parameters of
+        this guide by the inverse Fisher information matrix of the guide
+        distribution. This is used by :class:`~numpyro.optim.NaturalGradient`.
+
+        :param dict params: A dict containing unconstrained parameter values, e.g.
+            obtained using the ``get_params`` method of a NumPyro optimizer.
+        :param dict grads: A dict containing the gradients w.r.t. `params`.
+        :return: A dict with the same structure as `grads`, where the gradients of
+            the parameters of this guide are replaced by natural gradients and the
+            gradients of other parameters are unchanged.
+        :rtype: dict
+        """
+        raise NotImplementedError
+
 
 class AutoGuideList(AutoGuide):
     """
@@ -494,6 +512,38 @@ class AutoNormal(AutoGuide):
         }
         return self._constrain(latent)
 
+    def natural_gradient(self, params, grads):
+        """
+        Preconditions the gradients of a loss w.r.t. the unconstrained parameters of
+        this guide by the inverse Fisher information matrix of the guide
+        distribution, which is diagonal: the gradient of each `loc` is scaled by
+        `scale ** 2` and the gradient of each unconstrained `scale` by
+        `scale ** 2 / 2`, divided by the squared derivative of the transform to
+        :attr:`scale_constraint`.
+
+        :param dict params: A dict containing unconstrained parameter values, e.g.
+            obtained using the ``get_params`` method of a NumPyro optimizer.
+        :param dict grads: A dict containing the gradients w.r.t. `params`.
+        :return: A dict of gradients where the gradients of the parameters of this
+            guide are replaced by natural gradients.
+        :rtype: dict
+        """
+        grads = grads.copy()
+        transform = biject_to(self.scale_constraint)
+        for name in self._init_locs:
+            loc_name = "{}_{}_loc".format(name, self.prefix)
+            scale_name = "{}_{}_scale".format(name, self.prefix)
+            unconstrained_scale = params[scale_name]
+            scale, dscale = jax.jvp(
+                transform,
+                (unconstrained_scale,),
+                (jnp.ones_like(unconstrained_scale),),
+            )
+            variance = scale * scale
+            grads[loc_name] = variance * grads[loc_name]
+            grads[scale_name] = variance * grads[scale_name] / (2 * dscale * dscale)
+        return grads
+
 
 class AutoDelta(AutoGuide):
     """
@@ -1846,6 +1896,40 @@ class AutoMultivariateNormal(AutoContinuous):
         ).icdf(quantiles)
         return self._unpack_and_constrain(latent, params)
 
+    def natural_gradient(self, params, grads):
+        """
+        Preconditions the gradients of a loss w.r.t. the unconstrained parameters of
+        this guide by the inverse Fisher information matrix of the guide
+        distribution. The natural gradient of `loc` is `scale_tril @ scale_tril.T`
+        times its gradient. The natural gradient of `scale_tril` is computed
+        exactly in `O(latent_dim ** 3)` by writing a perturbation of `scale_tril`
+        as `scale_tril @ (I + A)` with `A` lower triangular, for which the Fisher
+        information matrix is diagonal.
+
+        :param dict params: A dict containing unconstrained parameter values, e.g.
+            obtained using the ``get_params`` method of a NumPyro optimizer.
+        :param dict grads: A dict containing the gradients w.r.t. `params`.
+        :return: A dict of gradients where the gradients of the parameters of this
+            guide are replaced by natural gradients.
+        :rtype: dict
+        """
+        grads = grads.copy()
+        loc_name = "{}_loc".format(self.prefix)
+        scale_tril_name = "{}_scale_tril".format(self.prefix)
+        transform = biject_to(self.scale_tril_constraint)
+        scale_tril = transform(params[scale_tril_name])
+        grads[loc_name] = scale_tril @ (scale_tril.T @ grads[loc_name])
+        # gradient w.r.t. scale_tril, then w.r.t. A
+        _, vjp_fn = jax.vjp(transform.inv, scale_tril)
+        (grad_scale_tril,) = vjp_fn(grads[scale_tril_name])
+        grad_a = jnp.tril(scale_tril.T @ grad_scale_tril)
+        # the Fisher information w.r.t. A is 2 on the diagonal and 1 elsewhere
+        nat_grad_a = grad_a / (1 + jnp.identity(self.latent_dim))
+        _, grads[scale_tril_name] = jax.jvp(
+            transform.inv, (scale_tril,), (scale_tril @ nat_grad_a,)
+        )
+        return grads
+
 
 class AutoBatchedMixin:
     """
@@ -2036,6 +2120,52 @@ class AutoLowRankMultivariateNormal(AutoContinuous):
         latent = dist.Normal(loc, scale).icdf(quantiles)
         return self._unpack_and_constrain(latent, params)
 
+    def natural_gradient(self, params, grads):
+        """
+        Preconditions the gradients of a loss w.r.t. the unconstrained parameters of
+        this guide by the inverse Fisher information matrix of the guide
+        distribution, in `O(latent_dim * rank ** 2)`. The natural gradient of `loc`
+        is the covariance matrix times its gradient. The gradient of `scale` is
+        preconditioned by the diagonal of the Fisher information matrix, which is
+        exact when `cov_factor` is zero. The gradient of `cov_factor` is unchanged.
+
+        :param dict params: A dict containing unconstrained parameter values, e.g.
+            obtained using the ``get_params`` method of a NumPyro optimizer.
+        :param dict grads: A dict containing the gradients w.r.t. `params`.
+        :return: A dict of gradients where the gradients of `loc` and `scale` are
+            replaced by natural gradients.
+        :rtype: dict
+        """
+        grads = grads.copy()
+        loc_name = "{}_loc".format(self.prefix)
+        scale_name = "{}_scale".format(self.prefix)
+        cov_factor = params["{}_cov_factor".format(self.prefix)]
+        unconstrained_scale = params[scale_name]
+        scale, dscale = jax.jvp(
+            biject_to(self.scale_constraint),
+            (unconstrained_scale,),
+            (jnp.ones_like(unconstrained_scale),),
+        )
+        # covariance = S @ M @ S, with S = diag(scale) and M = W @ W.T + I
+        grad_loc = grads[loc_name]
+        scaled_factor = cov_factor * scale[..., None]
+        grads[loc_name] = scale * scale * grad_loc + scaled_factor @ (
+            scaled_factor.T @ grad_loc
+        )
+        # the diagonal of the Fisher information w.r.t. scale is
+        # (1 + M_ii * inv(M)_ii) / scale_i ** 2, where by the Woodbury identity
+        # inv(M)_ii = 1 - W_i @ inv(I + W.T @ W) @ W_i
+        capacitance = jnp.identity(cov_factor.shape[-1]) + cov_factor.T @ cov_factor
+        capacitance_tril = jnp.linalg.cholesky(capacitance)
+        w = jax.scipy.linalg.solve_triangular(
+            capacitance_tril, cov_factor.T, lower=True
+        )
+        m_diag = 1 + jnp.square(cov_factor).sum(-1)
+        m_inv_diag = 1 - jnp.square(w).sum(0)
+        fisher_diag = (1 + m_diag * m_inv_diag) * jnp.square(dscale / scale)
+        grads[scale_name] = grads[scale_name] / fisher_diag
+        return grads
+
 
 class AutoBatchedLowRankMultivariateNormal(AutoBatchedMixin, AutoContinuous):
     """
@@ -2096,6 +2226,53 @@ class AutoBatchedLowRankMultivariateNormal(AutoBatchedMixin, AutoContinuous):
         return self._unpack_and_constrain(loc, params)
 
 
+def _lanczos(matvec, init_vector, num_steps):
+    """
+    Runs `num_steps` iterations of the Lanczos algorithm with full
+    reorthogonalization for the symmetric linear operator `matvec`.
+
+    :return: a tuple of the Lanczos vectors, stacked as the rows of a matrix, and
+        the diagonal and off-diagonal of the tridiagonal projection of `matvec`.
+    """
+    dim = init_vector.shape[0]
+    tol = jnp.sqrt(jnp.finfo(jnp.result_type(init_vector)).eps)
+
+    def body_fn(i, val):
+        vectors, diag, off_diag, v = val
+        vectors = vectors.at[i].set(v)
+        w = matvec(v)
+        diag = diag.at[i].set(jnp.dot(v, w))
+        w_norm = jnp.linalg.norm(w)
+        # orthogonalize twice against all previous vectors for numerical stability
+        w = w - vectors.T @ (vectors @ w)
+        w = w - vectors.T @ (vectors @ w)
+        beta = jnp.linalg.norm(w)
+        # the Krylov subspace is exhausted: the remaining vectors are set to zero,
+        # which gives zero Ritz values that do not contribute to the approximation
+        breakdown = beta <= tol * w_norm
+        off_diag = off_diag.at[i].set(jnp.where(breakdown, 0.0, beta))
+        v = jnp.where(breakdown, 0.0, w / jnp.where(breakdown, 1.0, beta))
+        return vectors, diag, off_diag, v
+
+    init_val = (
+        jnp.zeros((num_steps, dim)),
+        jnp.zeros(num_steps),
+        jnp.zeros(num_steps),
+        init_vector / jnp.linalg.norm(init_vector),
+    )
+    vectors, diag, off_diag, _ = lax.fori_loop(0, num_steps, body_fn, init_val)
+    return vectors, diag, off_diag[:-1]
+
+
+def _warn_singular_hessian():
+    warnings.warn(
+        "Hessian of log posterior at the MAP point is singular. Posterior"
+        " samples from AutoLaplaceApproxmiation will be constant (equal to"
+        " the MAP point). Please consider using an AutoNormal guide.",
+        stacklevel=find_stack_level(),
+    )
+
+
 class AutoLaplaceApproximation(AutoContinuous):
     r"""
     Laplace approximation (quadratic approximation) approximates the posterior
@@ -2105,11 +2282,31 @@ class AutoLaplaceApproximation(AutoContinuous):
     space. Its covariance is given by the inverse of the hessian of :math:`-\log p(x, z)`
     at the MAP point of `z`.
 
+    For high dimensional models, where the full hessian does not fit in memory, the
+    precision matrix can be approximated by either a block diagonal matrix with one
+    block per latent site (``covariance="block_diagonal"``) or a diagonal plus low
+    rank matrix (``covariance="low_rank"``). The latter is matrix-free: it only
+    requires hessian-vector products, which cost about as much as a gradient
+    evaluation. The diagonal :math:`D` of the hessian :math:`H` is estimated with
+    Hutchinson's estimator [1] and the precision is approximated by
+    :math:`D^{1/2} (I + U \Lambda U^T) D^{1/2}`, where :math:`U \Lambda U^T` is
+    a rank `rank` eigendecomposition of :math:`D^{-1/2} H D^{-1/2} - I` computed by
+    the Lanczos algorithm. The covariance and its square root are then available
+    in closed form, so posterior samples cost :math:`O(d \cdot rank)` time and
+    memory, see :class:`~numpyro.distributions.transforms.LowRankUpdateAffine`.
+
     Usage::
 
         guide = AutoLaplaceApproximation(model, ...)
         svi = SVI(model, guide, ...)
 
+    **References:**
+
+    1. *A stochastic estimator of the trace of the influence matrix for Laplacian
+       smoothing splines*, M. F. Hutchinson
+    2. *Computational methods for large-scale inverse problems: a survey on hybrid
+       projection methods*, T. Bui-Thanh, O. Ghattas, J. Martin, G. Stadler
+
     :param callable hessian_fn: EXPERIMENTAL a function that takes a function `f`
         and a vector `x`and returns the hessian of `f` at `x`. By default, we use
         ``lambda f, x: jax.hessian(f)(x)``. Other alternatives can be
@@ -2117,7 +2314,15 @@ class AutoLaplaceApproximation(AutoContinuous):
         ``lambda f, x: jax.hessian(f)(x) + 1e-3 * jnp.eye(x.shape[0])``. The later
         example is helpful when the hessian of `f` at `x` is not positive definite.
         Note that the output hessian is the precision matrix of the laplace
-        approximation.
+        approximation. This is not used when ``covariance="low_rank"``.
+    :param str covariance: the structure of the covariance matrix, one of "dense"
+        (default), "block_diagonal" or "low_rank". With "block_diagonal", the
+        correlations between different latent sites are ignored.
+    :param int rank: the number of Lanczos iterations, i.e. the rank of the low rank
+        part of the precision matrix when ``covariance="low_rank"``. Defaults to
+        the square root of the latent dimension.
+    :param int num_probes: the number of random probe vectors used to estimate the
+        diagonal of the hessian when ``covariance="low_rank"``. Defaults to 10.
     """
 
     def __init__(
@@ -2128,13 +2333,24 @@ class AutoLaplaceApproximation(AutoContinuous):
         init_loc_fn=init_to_uniform,
         create_plates=None,
         hessian_fn=None,
+        covariance="dense",
+        rank=None,
+        num_probes=10,
     ):
+        if covariance not in ("dense", "block_diagonal", "low_rank"):
+            raise ValueError(
+                "covariance should be one of 'dense', 'block_diagonal' or"
+                " 'low_rank', but got {}.".format(covariance)
+            )
         super().__init__(
             model, prefix=prefix, init_loc_fn=init_loc_fn, create_plates=create_plates
         )
         self._hessian_fn = (
             hessian_fn if hessian_fn is not None else (lambda f, x: hessian(f)(x))
         )
+        self.covariance = covariance
+        self.rank = rank
+        self.num_probes = num_probes
 
     def _setup_prototype(self, *args, **kwargs):
         super(AutoLaplaceApproximation, self)._setup_prototype(*args, **kwargs)
@@ -2155,6 +2371,64 @@ class AutoLaplaceApproximation(AutoContinuous):
     def get_base_dist(self):
         return dist.Normal(jnp.zeros(self.latent_dim), 1).to_event(1)
 
+    def _get_scale_tril(self, loss_fn, loc):
+        precision = self._hessian_fn(loss_fn, loc)
+        scale_tril = cholesky_of_inverse(precision)
+        if not_jax_tracer(scale_tril):
+            if np.any(np.isnan(scale_tril)):
+                _warn_singular_hessian()
+        return jnp.where(jnp.isnan(scale_tril), 0.0, scale_tril)
+
+    def _get_block_diagonal_transform(self, loss_fn, loc):
+        scale_trils = []
+        start = 0
+        # latent sites are raveled in the order of `self._init_locs`
+        for value in self._init_locs.values():
+            end = start + jnp.size(value)
+
+            def block_loss_fn(z, start=start, end=end):
+                return loss_fn(loc.at[start:end].set(z))
+
+            scale_trils.append(self._get_scale_tril(block_loss_fn, loc[start:end]))
+            start = end
+        return BlockLowerCholeskyAffine(loc, scale_trils)
+
+    def _get_low_rank_transform(self, loss_fn, loc):
+        rank = int(round(self.latent_dim**0.5)) if self.rank is None else self.rank
+        rank = min(rank, self.latent_dim)
+        grad_fn = grad(loss_fn)
+
+        def hvp(v):
+            return jax.jvp(grad_fn, (loc,), (v,))[1]
+
+        # Hutchinson's estimator of the hessian diagonal with Rademacher probes
+        probe_key, init_key = random.split(random.PRNGKey(0))
+        probes = random.rademacher(
+            probe_key, (self.num_probes, self.latent_dim), dtype=loc.dtype
+        )
+        diag = jnp.mean(probes * jax.vmap(hvp)(probes), axis=0)
+        # non-positive estimates are corrected by the low rank part below
+        diag = jnp.clip(diag, jnp.finfo(diag.dtype).eps * jnp.max(jnp.abs(diag)), None)
+        diag_sqrt = jnp.sqrt(diag)
+
+        def matvec(v):
+            return hvp(v / diag_sqrt) / diag_sqrt - v
+
+        init_vector = random.normal(init_key, (self.latent_dim,), dtype=loc.dtype)
+        vectors, alpha, beta = _lanczos(matvec, init_vector, rank)
+        tridiag = jnp.diag(alpha) + jnp.diag(beta, 1) + jnp.diag(beta, -1)
+        eigvals, eigvecs = jnp.linalg.eigh(tridiag)
+        basis = vectors.T @ eigvecs
+        # eigenvalues of the preconditioned precision matrix
+        precision_eigvals = 1 + eigvals
+        if not_jax_tracer(precision_eigvals):
+            if np.any(precision_eigvals <= 0):
+                _warn_singular_hessian()
+        basis_scale = jnp.where(
+            precision_eigvals > 0, lax.rsqrt(jnp.abs(precision_eigvals)), 0.0
+        )
+        return LowRankUpdateAffine(loc, 1 / diag_sqrt, basis, basis_scale)
+
     def get_transform(self, params):
         def loss_fn(z):
             params1 = params.copy()
@@ -2162,25 +2436,25 @@ class AutoLaplaceApproximation(AutoContinuous):
             return self._loss_fn(params1)
 
         loc = params["{}_loc".format(self.prefix)]
-        precision = self._hessian_fn(loss_fn, loc)
-        scale_tril = cholesky_of_inverse(precision)
-        if not_jax_tracer(scale_tril):
-            if np.any(np.isnan(scale_tril)):
-                warnings.warn(
-                    "Hessian of log posterior at the MAP point is singular. Posterior"
-                    " samples from AutoLaplaceApproxmiation will be constant (equal to"
-                    " the MAP point). Please consider using an AutoNormal guide.",
-                    stacklevel=find_stack_level(),
-                )
-        scale_tril = jnp.where(jnp.isnan(scale_tril), 0.0, scale_tril)
-        return LowerCholeskyAffine(loc, scale_tril)
+        if self.covariance == "block_diagonal":
+            return self._get_block_diagonal_transform(loss_fn, loc)
+        elif self.covariance == "low_rank":
+            return self._get_low_rank_transform(loss_fn, loc)
+        return LowerCholeskyAffine(loc, self._get_scale_tril(loss_fn, loc))
 
     def get_posterior(self, params):
         """
-        Returns a multivariate Normal posterior distribution.
+        Returns a multivariate Normal posterior distribution. If ``covariance`` is
+        not "dense", the distribution is a
+        :class:`~numpyro.distributions.TransformedDistribution` of a standard
+        Normal distribution, which avoids materializing the covariance matrix.
         """
         transform = self.get_transform(params)
-        return dist.MultivariateNormal(transform.loc, scale_tril=transform.scale_tril)
+        if self.covariance == "dense":
+            return dist.MultivariateNormal(
+                transform.loc, scale_tril=transform.scale_tril
+            )
+        return dist.TransformedDistribution(self.get_base_dist(), transform)
 
     def sample_posterior(self, rng_key, params, *args, sample_shape=(), **kwargs):
         latent_sample = self.get_posterior(params).sample(rng_key, sample_shape)
@@ -2192,10 +2466,20 @@ class AutoLaplaceApproximation(AutoContinuous):
 
     def quantiles(self, params, quantiles):
         transform = self.get_transform(params)
+        if self.covariance == "block_diagonal":
+            scale = jnp.concatenate(
+                [
+                    jnp.linalg.norm(scale_tril, axis=-1)
+                    for scale_tril in transform.scale_trils
+                ]
+            )
+        elif self.covariance == "low_rank":
+            basis_var = transform.basis**2 @ (transform.basis_scale**2 - 1)
+            scale = transform.scale * jnp.sqrt(jnp.clip(1 + basis_var, 0, None))
+        else:
+            scale = jnp.linalg.norm(transform.scale_tril, axis=-1)
         quantiles = jnp.array(quantiles)[..., None]
-        latent = dist.Normal(
-            transform.loc, jnp.linalg.norm(transform.scale_tril, axis=-1)
-        ).icdf(quantiles)
+        latent = dist.Normal(transform.loc, scale).icdf(quantiles)
         return self._unpack_and_constrain(latent, params)
 
 
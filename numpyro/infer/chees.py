@@ -0,0 +1,326 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import namedtuple
+import math
+
+from jax import random, vmap
+from jax.flatten_util import ravel_pytree
+import jax.numpy as jnp
+
+from numpyro.infer.hmc import HMC, HMCState, _hmc_kernels
+from numpyro.infer.hmc_util import _flat_inverse_mass_matrix, _mass_matrix_matvec
+from numpyro.infer.initialization import init_to_uniform
+from numpyro.util import cond, identity, is_prng_key
+
+__all__ = ["ChEESHMC"]
+
+ChEESAdaptState = namedtuple(
+    "ChEESAdaptState", ["log_trajectory_length", "avg_sq_grad", "rng_key"]
+)
+"""
+A :func:`~collections.namedtuple` consisting of the following fields, which are
+shared by all chains:
+
+ - **log_trajectory_length** - Logarithm of the (maximum) trajectory length.
+ - **avg_sq_grad** - Exponential moving average of the squared gradients of the
+   ChEES criterion w.r.t. ``log_trajectory_length``.
+ - **rng_key** - random number generator seed used to jitter trajectory lengths.
+"""
+
+ChEESHMCState = namedtuple(
+    "ChEESHMCState", HMCState._fields + ("trajectory_adapt_state",)
+)
+"""
+A :func:`~collections.namedtuple` used by :class:`ChEESHMC`. Its first fields are
+those of :data:`~numpyro.infer.hmc.HMCState`, where ``trajectory_length`` is the
+(jittered) trajectory length used in the current iteration. In addition, it consists
+of the field:
+
+ - **trajectory_adapt_state** - A :data:`ChEESAdaptState` of the adaptation of
+   the trajectory length, which is replicated across chains.
+"""
+
+
+def _chees_grad(z, z_new, r_new, inverse_mass_matrix, accept_prob, t):
+    # Computes the acceptance-weighted gradient estimate of the ChEES criterion
+    # w.r.t. the log trajectory length, given flat positions of a batch of chains.
+    z_centered = z - jnp.mean(z, 0)
+    z_new_centered = z_new - jnp.mean(z_new, 0)
+    velocity = vmap(lambda imm, r: _mass_matrix_matvec(imm)(r))(
+        inverse_mass_matrix, r_new
+    )
+    diff_sq = jnp.sum(z_new_centered**2, -1) - jnp.sum(z_centered**2, -1)
+    grads = t * diff_sq * jnp.sum(z_new_centered * velocity, -1)
+    # divergent transitions do not contribute to the estimate
+    valid = jnp.isfinite(grads)
+    weights = jnp.where(valid, accept_prob, 0.0)
+    grads = jnp.where(valid, grads, 0.0)
+    return jnp.sum(weights * grads) / jnp.clip(jnp.sum(weights), 1e-10)
+
+
+def _broadcast_chains(state, num_chains):
+    # replicates a namedtuple of arrays across chains
+    return type(state)(
+        *(jnp.broadcast_to(x, (num_chains,) + jnp.shape(x)) for x in state)
+    )
+
+
+class ChEESHMC(HMC):
+    """
+    Hamiltonian Monte Carlo inference for a batch of chains run with
+    ``chain_method="vectorized"``, where the trajectory length is adapted during
+    warmup by maximizing the Change in the Estimator of the Expected Square (ChEES)
+    criterion across chains [1].
+
+    At each iteration, all chains use the same trajectory length, which is jittered
+    uniformly between 0 and the adapted trajectory length, and rounded up to a
+    multiple of the step size of each chain. Hence every iteration costs (about) the
+    same number of leapfrog steps for all chains, so that the
+    kernel vectorizes well over a large number of chains. The trajectory length is
+    adapted using Adam on its logarithm. Step size and mass matrix are adapted
+    for each chain as in :class:`~numpyro.infer.hmc.HMC`.
+
+    **References:**
+
+    1. *An Adaptive MCMC Scheme for Setting Trajectory Lengths in Hamiltonian
+       Monte Carlo*, Matthew D. Hoffman, Alexey Radul, Pavel Sountsov
+
+    **Example**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import numpyro
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.infer import MCMC, ChEESHMC
+        >>> def model():
+        ...     numpyro.sample("x", dist.Normal(0.0, 10.0).expand([10]))
+        >>> mcmc = MCMC(
+        ...     ChEESHMC(model),
+        ...     num_warmup=500,
+        ...     num_samples=100,
+        ...     num_chains=32,
+        ...     chain_method="vectorized",
+        ...     progress_bar=False,
+        ... )
+        >>> mcmc.run(random.PRNGKey(0))
+        >>> samples = mcmc.get_samples()
+
+    :param model: Python callable containing Pyro :mod:`~numpyro.primitives`.
+        If model is provided, `potential_fn` will be inferred using the model.
+    :param potential_fn: Python callable that computes the potential energy
+        given input parameters. The input parameters to `potential_fn` can be
+        any python collection type, provided that `init_params` argument to
+        :meth:`init` has the same type.
+    :param float step_size: Determines the size of a single step taken by the
+        verlet integrator while computing the trajectory using Hamiltonian
+        dynamics. If not specified, it will be set to 1.
+    :param inverse_mass_matrix: Initial value for inverse mass matrix.
+        See :class:`~numpyro.infer.hmc.HMC` for more information.
+    :param bool adapt_step_size: A flag to decide if we want to adapt step_size
+        during warm-up phase using Dual Averaging scheme.
+    :param bool adapt_mass_matrix: A flag to decide if we want to adapt mass
+        matrix during warm-up phase using Welford scheme.
+    :param dense_mass: This flag controls whether mass matrix is dense (i.e.
+        full-rank) or diagonal. See :class:`~numpyro.infer.hmc.HMC` for the
+        specification of a structured mass matrix.
+    :type dense_mass: bool or list
+    :param float target_accept_prob: Target acceptance probability for step size
+        adaptation using Dual Averaging. Defaults to 0.651, which is optimal for
+        HMC with long trajectories.
+    :param float trajectory_length: Initial value of the trajectory length. If not
+        specified, it is set to ``step_size``.
+    :param bool adapt_trajectory_length: A flag to decide if we want to adapt the
+        trajectory length during warm-up phase. Defaults to True.
+    :param float learning_rate: Learning rate of Adam for the log trajectory length.
+        Defaults to 0.025.
+    :param int max_num_steps: Maximum number of leapfrog steps of a trajectory, which
+        is used to bound the adapted trajectory length. Defaults to 1000.
+    :param callable init_strategy: a per-site initialization function.
+        See :ref:`init_strategy` section for available functions.
+    :param bool find_heuristic_step_size: whether or not to use a heuristic function
+        to adjust the step size at the beginning of each adaptation window. Defaults
+        to False.
+    :param bool forward_mode_differentiation: whether to use forward-mode
+        differentiation or reverse-mode differentiation. Defaults to False.
+    :param bool regularize_mass_matrix: whether or not to regularize the estimated mass
+        matrix for numerical stability during warmup phase. Defaults to True.
+    :param str mass_matrix_estimator: either ``"draws"`` (default) or
+        ``"draws_and_grads"``. See :class:`~numpyro.infer.hmc.HMC`.
+    :param remat: the default `remat` argument of the
+        :func:`~numpyro.contrib.control_flow.scan` primitives of the model.
+        See :class:`~numpyro.infer.hmc.HMC`.
+    :type remat: bool or int
+    """
+
+    def __init__(
+        self,
+        model=None,
+        potential_fn=None,
+        step_size=1.0,
+        inverse_mass_matrix=None,
+        adapt_step_size=True,
+        adapt_mass_matrix=True,
+        dense_mass=False,
+        target_accept_prob=0.651,
+        trajectory_length=None,
+        adapt_trajectory_length=True,
+        learning_rate=0.025,
+        max_num_steps=1000,
+        init_strategy=init_to_uniform,
+        find_heuristic_step_size=False,
+        forward_mode_differentiation=False,
+        regularize_mass_matrix=True,
+        mass_matrix_estimator="draws",
+        remat=False,
+    ):
+        super().__init__(
+            model=model,
+            potential_fn=potential_fn,
+            step_size=step_size,
+            inverse_mass_matrix=inverse_mass_matrix,
+            adapt_step_size=adapt_step_size,
+            adapt_mass_matrix=adapt_mass_matrix,
+            dense_mass=dense_mass,
+            target_accept_prob=target_accept_prob,
+            trajectory_length=trajectory_length,
+            init_strategy=init_strategy,
+            find_heuristic_step_size=find_heuristic_step_size,
+            forward_mode_differentiation=forward_mode_differentiation,
+            regularize_mass_matrix=regularize_mass_matrix,
+            mass_matrix_estimator=mass_matrix_estimator,
+            remat=remat,
+        )
+        self._adapt_trajectory_length = adapt_trajectory_length
+        self._learning_rate = learning_rate
+        self._max_num_steps = max_num_steps
+        # Set on first call to init
+        self._num_warmup = None
+        self._sample_with_proposal_fn = None
+
+    def _init_state(self, rng_key, model_args, model_kwargs, init_params):
+        init_params = super()._init_state(
+            rng_key, model_args, model_kwargs, init_params
+        )
+        if self._sample_with_proposal_fn is None:
+            self._init_fn, self._sample_fn, _, self._sample_with_proposal_fn = (
+                _hmc_kernels(
+                    potential_fn=self._potential_fn,
+                    potential_fn_gen=self._potential_fn_gen,
+                    kinetic_fn=self._kinetic_fn,
+                    algo=self._algo,
+                )
+            )
+        return init_params
+
+    def init(
+        self, rng_key, num_warmup, init_params=None, model_args=(), model_kwargs={}
+    ):
+        if is_prng_key(rng_key):
+            raise ValueError(
+                "ChEESHMC requires a batch of chains, which are run with"
+                ' `chain_method="vectorized"`.'
+            )
+        self._num_warmup = num_warmup
+        rng_key, rng_key_adapt = jnp.swapaxes(vmap(random.split)(rng_key), 0, 1)
+        init_state = super().init(
+            rng_key,
+            num_warmup,
+            init_params=init_params,
+            model_args=model_args,
+            model_kwargs=model_kwargs,
+        )
+        num_chains = jnp.shape(init_state.i)[0]
+        trajectory_length = (
+            init_state.adapt_state.step_size[0]
+            if self._trajectory_length is None
+            else self._trajectory_length
+        )
+        adapt_state = ChEESAdaptState(
+            jnp.log(trajectory_length), jnp.zeros(()), rng_key_adapt[0]
+        )
+        adapt_state = _broadcast_chains(adapt_state, num_chains)
+        init_state = init_state._replace(
+            trajectory_length=jnp.broadcast_to(trajectory_length, num_chains)
+        )
+        return ChEESHMCState(*init_state, adapt_state)
+
+    def sample(self, state, model_args, model_kwargs):
+        """
+        Run HMC from the given :data:`~numpyro.infer.chees.ChEESHMCState` and return
+        the resulting :data:`~numpyro.infer.chees.ChEESHMCState`.
+
+        :param ChEESHMCState state: Represents the current state.
+        :param model_args: Arguments provided to the model.
+        :param model_kwargs: Keyword arguments provided to the model.
+        :return: Next `state` after running HMC.
+        """
+        hmc_state = HMCState(*state[: len(HMCState._fields)])
+        # the adaptation state is replicated across chains
+        adapt_state = ChEESAdaptState(*(x[0] for x in state.trajectory_adapt_state))
+        num_chains = jnp.shape(hmc_state.i)[0]
+
+        rng_key, rng_key_jitter = random.split(adapt_state.rng_key)
+        # NB: the jitter is in (0, 1] so that each trajectory has at least one step
+        jitter = 1 - random.uniform(rng_key_jitter)
+        t = jitter * jnp.exp(adapt_state.log_trajectory_length)
+        # Each chain takes ceil(t / step_size) steps of its own step size, so that
+        # the step size adaptation gets the feedback of the actual step size. The
+        # trajectory length is shrunk by a tiny fraction of a step to make sure
+        # that HMC does not round up the number of steps.
+        step_size = hmc_state.adapt_state.step_size
+        num_steps = jnp.ceil(t / step_size)
+        trajectory_length = (num_steps - 1e-3) * step_size
+        hmc_state = hmc_state._replace(trajectory_length=trajectory_length)
+        new_state, proposal = vmap(
+            self._sample_with_proposal_fn, in_axes=(0, None, None)
+        )(hmc_state, model_args, model_kwargs)
+
+        def update_trajectory_length(adapt_state):
+            log_trajectory_length, avg_sq_grad, _ = adapt_state
+            z = vmap(lambda z: ravel_pytree(z)[0])(hmc_state.z)
+            z_new = vmap(lambda z: ravel_pytree(z)[0])(proposal.z)
+            r_new = vmap(lambda r: ravel_pytree(r)[0])(proposal.r)
+            inverse_mass_matrix = vmap(_flat_inverse_mass_matrix)(
+                hmc_state.adapt_state.inverse_mass_matrix, proposal.z
+            )
+            g = _chees_grad(
+                z,
+                z_new,
+                r_new,
+                inverse_mass_matrix,
+                new_state.accept_prob,
+                trajectory_length,
+            )
+            # Adam with beta1 = 0, beta2 = 0.95, to maximize the criterion
+            beta2 = 0.95
+            avg_sq_grad = beta2 * avg_sq_grad + (1 - beta2) * g**2
+            bias_correction = 1 - beta2 ** (hmc_state.i[0] + 1)
+            log_trajectory_length = log_trajectory_length + self._learning_rate * g / (
+                jnp.sqrt(avg_sq_grad / bias_correction) + 1e-8
+            )
+            max_trajectory_length = self._max_num_steps * jnp.mean(
+                new_state.adapt_state.step_size
+            )
+            log_trajectory_length = jnp.clip(
+                log_trajectory_length,
+                math.log(1e-6),
+                jnp.log(max_trajectory_length),
+            )
+            return log_trajectory_length, avg_sq_grad
+
+        log_trajectory_length, avg_sq_grad = cond(
+            self._adapt_trajectory_length & (hmc_state.i[0] < self._num_warmup),
+            adapt_state,
+            update_trajectory_length,
+            (adapt_state.log_trajectory_length, adapt_state.avg_sq_grad),
+            identity,
+        )
+        adapt_state = ChEESAdaptState(log_trajectory_length, avg_sq_grad, rng_key)
+        return ChEESHMCState(*new_state, _broadcast_chains(adapt_state, num_chains))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_sample_with_proposal_fn"] = None
+        return state
@@ -7,12 +7,16 @@ import math
 import os
 import warnings
 
-from jax import lax, random, vmap
+from jax import lax, random, tree, vmap
 from jax.flatten_util import ravel_pytree
 import jax.numpy as jnp
 
 from numpyro.infer.hmc_util import (
     IntegratorState,
+    _flat_inverse_mass_matrix,
+    _fused_tree_info,
+    _fused_tree_init,
+    _fused_tree_step,
     build_tree,
     euclidean_kinetic_energy,
     find_reasonable_step_size,
@@ -22,11 +26,12 @@ from numpyro.infer.hmc_util import (
 from numpyro.infer.mcmc import MCMCKernel
 from numpyro.infer.util import (
     ParamInfo,
+    _default_scan_remat,
     find_stack_level,
     init_to_uniform,
     initialize_model,
 )
-from numpyro.util import cond, fori_loop, identity, is_prng_key
+from numpyro.util import cond, fori_loop, identity, is_prng_key, while_loop
 
 HMCState = namedtuple(
     "HMCState",
@@ -81,6 +86,24 @@ A :func:`~collections.namedtuple` consisting of the following fields:
  - **rng_key** - random number generator seed used for the iteration.
 """
 
+VectorizedNUTSState = namedtuple(
+    "VectorizedNUTSState",
+    HMCState._fields + ("latest_state", "tree_state", "has_next"),
+)
+"""
+A :func:`~collections.namedtuple` used by :class:`VectorizedNUTS` for a batch of
+chains. Its first fields are those of :data:`HMCState` and hold the current
+samples. In addition, it consists of the following fields:
+
+ - **latest_state** - A :data:`HMCState` of the latest completed transition of
+   each chain. This is one transition ahead of the current sample for the chains
+   which have completed a look-ahead trajectory.
+ - **tree_state** - The state of the trajectory of each chain which is being built
+   from ``latest_state``.
+ - **has_next** - A boolean array to indicate which chains have completed a
+   look-ahead trajectory, i.e. ``latest_state`` is the next sample.
+"""
+
 
 def _get_num_steps(step_size, trajectory_length):
     num_steps = jnp.ceil(trajectory_length / step_size)
@@ -178,6 +201,25 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
         >>> print(jnp.mean(samples['coefs'], axis=0))  # doctest: +SKIP
         [0.9153987 2.0754058 2.9621222]
     """
+    init_kernel, sample_kernel, *_ = _hmc_kernels(
+        potential_fn, potential_fn_gen, kinetic_fn, algo
+    )
+
+    # Make `init_kernel` and `sample_kernel` visible from the global scope once
+    # `hmc` is called for sphinx doc generation.
+    if "SPHINX_BUILD" in os.environ:
+        hmc.init_kernel = init_kernel
+        hmc.sample_kernel = sample_kernel
+
+    return init_kernel, sample_kernel
+
+
+def _hmc_kernels(
+    potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"
+):
+    # Implementation of :func:`hmc`, which additionally returns the functions to
+    # initialize, advance by one leapfrog step, and finalize a fused NUTS trajectory,
+    # and a variant of `sample_kernel` which also returns the proposal.
     if kinetic_fn is None:
         kinetic_fn = euclidean_kinetic_energy
     vv_update = None
@@ -187,6 +229,7 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
     forward_mode_ad = False
     max_delta_energy = 1000.0
     fixed_num_steps = None
+    fused_tree = False
     if algo not in {"HMC", "NUTS"}:
         raise ValueError("`algo` must be one of `HMC` or `NUTS`.")
 
@@ -206,6 +249,8 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
         find_heuristic_step_size=False,
         forward_mode_differentiation=False,
         regularize_mass_matrix=True,
+        fused_tree_building=False,
+        mass_matrix_estimator="draws",
         model_args=(),
         model_kwargs=None,
         rng_key=None,
@@ -275,6 +320,15 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
         :param bool regularize_mass_matrix: whether or not to regularize the estimated mass
             matrix for numerical stability during warmup phase. Defaults to True. This flag
             does not take effect if ``adapt_mass_matrix == False``.
+        :param bool fused_tree_building: whether to build NUTS trajectories with
+            :func:`~numpyro.infer.hmc_util.fused_build_tree`, which operates on the
+            flattened latent vector. This requires the euclidean kinetic energy and
+            does not take effect for HMC. Defaults to False.
+        :param str mass_matrix_estimator: either ``"draws"`` to adapt the mass matrix
+            from the covariance of samples, or ``"draws_and_grads"`` to adapt it from
+            the covariances of both samples and potential energy gradients, which
+            converges in fewer warmup steps. Defaults to ``"draws"``. See
+            :func:`~numpyro.infer.hmc_util.warmup_adapter` for more information.
         :param tuple model_args: Model arguments if `potential_fn_gen` is specified.
         :param dict model_kwargs: Model keyword arguments if `potential_fn_gen` is specified.
         :param jax.random.PRNGKey rng_key: random key to be used as the source of
@@ -293,8 +347,14 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             vv_update, \
             wa_steps, \
             forward_mode_ad, \
-            fixed_num_steps
+            fixed_num_steps, \
+            fused_tree
         forward_mode_ad = forward_mode_differentiation
+        if fused_tree_building and kinetic_fn is not euclidean_kinetic_energy:
+            raise ValueError(
+                "`fused_tree_building` only supports the euclidean kinetic energy."
+            )
+        fused_tree = fused_tree_building
         wa_steps = num_warmup
         max_treedepth = (
             max_tree_depth
@@ -330,6 +390,7 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             target_accept_prob=target_accept_prob,
             find_reasonable_step_size=find_reasonable_ss,
             regularize_mass_matrix=regularize_mass_matrix,
+            mass_matrix_estimator=mass_matrix_estimator,
         )
 
         rng_key_hmc, rng_key_wa, rng_key_momentum = random.split(rng_key, 3)
@@ -411,7 +472,7 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             (vv_state, energy_old),
             identity,
         )
-        return vv_state, energy, num_steps, accept_prob, diverging
+        return vv_state, energy, num_steps, accept_prob, diverging, vv_state_new
 
     def _nuts_next(
         step_size,
@@ -452,26 +513,12 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             num_steps,
             accept_prob,
             binary_tree.diverging,
+            vv_state,
         )
 
-    _next = _nuts_next if algo == "NUTS" else _hmc_next
-
-    def sample_kernel(hmc_state, model_args=(), model_kwargs=None):
-        """
-        Given an existing :data:`~numpyro.infer.mcmc.HMCState`, run HMC with fixed (possibly adapted)
-        step size and return a new :data:`~numpyro.infer.mcmc.HMCState`.
-
-        :param hmc_state: Current sample (and associated state).
-        :param tuple model_args: Model arguments if `potential_fn_gen` is specified.
-        :param dict model_kwargs: Model keyword arguments if `potential_fn_gen` is specified.
-        :return: new proposed :data:`~numpyro.infer.mcmc.HMCState` from simulating
-            Hamiltonian dynamics given existing state.
-
-        """
-        model_kwargs = {} if model_kwargs is None else model_kwargs
-        rng_key, rng_key_momentum, rng_key_transition = random.split(
-            hmc_state.rng_key, 3
-        )
+    def _fused_trajectory_init(hmc_state, model_args=(), model_kwargs=None):
+        # NB: random keys are split in the same way as in `sample_kernel`
+        _, rng_key_momentum, rng_key_transition = random.split(hmc_state.rng_key, 3)
         r = (
             momentum_generator(
                 hmc_state.z, hmc_state.adapt_state.mass_matrix_sqrt, rng_key_momentum
@@ -479,24 +526,66 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             if hmc_state.r is None
             else hmc_state.r
         )
-        vv_state = IntegratorState(
-            hmc_state.z, r, hmc_state.potential_energy, hmc_state.z_grad
+        max_treedepth_current = jnp.where(
+            hmc_state.i < wa_steps, max_treedepth[0], max_treedepth[1]
         )
-        if algo == "HMC":
-            hmc_length_args = (hmc_state.trajectory_length,)
+        return _fused_tree_init(
+            ravel_pytree(hmc_state.z)[0],
+            ravel_pytree(r)[0],
+            hmc_state.potential_energy,
+            ravel_pytree(hmc_state.z_grad)[0],
+            _flat_inverse_mass_matrix(
+                hmc_state.adapt_state.inverse_mass_matrix, hmc_state.z
+            ),
+            rng_key_transition,
+            (max_treedepth_current, max(max_treedepth)),
+        )
+
+    def _fused_trajectory_step_fn(hmc_state, model_args=(), model_kwargs=None):
+        # returns a function which takes one leapfrog step of the trajectory
+        # started at `hmc_state`, operating on the flattened latent vector
+        if potential_fn_gen:
+            kwargs = {} if model_kwargs is None else model_kwargs
+            pe_fn = potential_fn_gen(*model_args, **kwargs)
         else:
-            hmc_length_args = (
-                jnp.where(hmc_state.i < wa_steps, max_treedepth[0], max_treedepth[1]),
-            )
-        vv_state, energy, num_steps, accept_prob, diverging = _next(
+            pe_fn = potential_fn
+        _, unravel_fn = ravel_pytree(hmc_state.z)
+        return partial(
+            _fused_tree_step,
+            lambda z: pe_fn(unravel_fn(z)),
+            _flat_inverse_mass_matrix(
+                hmc_state.adapt_state.inverse_mass_matrix, hmc_state.z
+            ),
             hmc_state.adapt_state.step_size,
-            hmc_state.adapt_state.inverse_mass_matrix,
+            max_delta_energy=max_delta_energy,
+            forward_mode_differentiation=forward_mode_ad,
+        )
+
+    def _fused_trajectory_finalize(hmc_state, tree_state):
+        # unravel the proposal of a complete trajectory and update the adaptation
+        rng_key = random.split(hmc_state.rng_key, 3)[0]
+        _, unravel_fn = ravel_pytree(hmc_state.z)
+        binary_tree = _fused_tree_info(tree_state)
+        vv_state = IntegratorState(
+            z=unravel_fn(binary_tree.z_proposal),
+            r=hmc_state.r,
+            potential_energy=binary_tree.z_proposal_pe,
+            z_grad=unravel_fn(binary_tree.z_proposal_grad),
+        )
+        accept_prob = binary_tree.sum_accept_probs / binary_tree.num_proposals
+        return _next_state(
+            hmc_state,
+            rng_key,
             vv_state,
-            model_args,
-            model_kwargs,
-            rng_key_transition,
-            *hmc_length_args,
+            binary_tree.z_proposal_energy,
+            binary_tree.num_proposals,
+            accept_prob,
+            binary_tree.diverging,
         )
+
+    def _next_state(
+        hmc_state, rng_key, vv_state, energy, num_steps, accept_prob, diverging
+    ):
         # not update adapt_state after warmup phase
         adapt_state = cond(
             hmc_state.i < wa_steps,
@@ -529,13 +618,75 @@ def hmc(potential_fn=None, potential_fn_gen=None, kinetic_fn=None, algo="NUTS"):
             rng_key,
         )
 
-    # Make `init_kernel` and `sample_kernel` visible from the global scope once
-    # `hmc` is called for sphinx doc generation.
-    if "SPHINX_BUILD" in os.environ:
-        hmc.init_kernel = init_kernel
-        hmc.sample_kernel = sample_kernel
+    _next = _nuts_next if algo == "NUTS" else _hmc_next
 
-    return init_kernel, sample_kernel
+    def sample_kernel(hmc_state, model_args=(), model_kwargs=None):
+        """
+        Given an existing :data:`~numpyro.infer.mcmc.HMCState`, run HMC with fixed (possibly adapted)
+        step size and return a new :data:`~numpyro.infer.mcmc.HMCState`.
+
+        :param hmc_state: Current sample (and associated state).
+        :param tuple model_args: Model arguments if `potential_fn_gen` is specified.
+        :param dict model_kwargs: Model keyword arguments if `potential_fn_gen` is specified.
+        :return: new proposed :data:`~numpyro.infer.mcmc.HMCState` from simulating
+            Hamiltonian dynamics given existing state.
+
+        """
+        model_kwargs = {} if model_kwargs is None else model_kwargs
+        if algo == "NUTS" and fused_tree:
+            # run the whole trajectory on flat arrays and unravel the proposal only once
+            tree_state = while_loop(
+                lambda tree_state: ~tree_state.done,
+                _fused_trajectory_step_fn(hmc_state, model_args, model_kwargs),
+                _fused_trajectory_init(hmc_state, model_args, model_kwargs),
+            )
+            return _fused_trajectory_finalize(hmc_state, tree_state)
+        return _sample_with_proposal(hmc_state, model_args, model_kwargs)[0]
+
+    def _sample_with_proposal(hmc_state, model_args=(), model_kwargs=None):
+        # same as `sample_kernel` but also returns the integrator state of the
+        # proposal before the accept/reject step (for HMC) or the multinomial
+        # sample (for NUTS)
+        model_kwargs = {} if model_kwargs is None else model_kwargs
+        rng_key, rng_key_momentum, rng_key_transition = random.split(
+            hmc_state.rng_key, 3
+        )
+        r = (
+            momentum_generator(
+                hmc_state.z, hmc_state.adapt_state.mass_matrix_sqrt, rng_key_momentum
+            )
+            if hmc_state.r is None
+            else hmc_state.r
+        )
+        vv_state = IntegratorState(
+            hmc_state.z, r, hmc_state.potential_energy, hmc_state.z_grad
+        )
+        if algo == "HMC":
+            hmc_length_args = (hmc_state.trajectory_length,)
+        else:
+            hmc_length_args = (
+                jnp.where(hmc_state.i < wa_steps, max_treedepth[0], max_treedepth[1]),
+            )
+        vv_state, energy, num_steps, accept_prob, diverging, proposal = _next(
+            hmc_state.adapt_state.step_size,
+            hmc_state.adapt_state.inverse_mass_matrix,
+            vv_state,
+            model_args,
+            model_kwargs,
+            rng_key_transition,
+            *hmc_length_args,
+        )
+        hmc_state = _next_state(
+            hmc_state, rng_key, vv_state, energy, num_steps, accept_prob, diverging
+        )
+        return hmc_state, proposal
+
+    fused_trajectory_fns = (
+        _fused_trajectory_init,
+        _fused_trajectory_step_fn,
+        _fused_trajectory_finalize,
+    )
+    return init_kernel, sample_kernel, fused_trajectory_fns, _sample_with_proposal
 
 
 class HMC(MCMCKernel):
@@ -620,6 +771,18 @@ class HMC(MCMCKernel):
     :param bool regularize_mass_matrix: whether or not to regularize the estimated mass
         matrix for numerical stability during warmup phase. Defaults to True. This flag
         does not take effect if ``adapt_mass_matrix == False``.
+    :param str mass_matrix_estimator: either ``"draws"`` (default) to adapt the mass
+        matrix from the covariance of warmup samples, or ``"draws_and_grads"`` to
+        adapt it from the covariances of both samples and gradients of the potential
+        energy (as in nutpie), which typically gives a good preconditioner from much
+        fewer warmup samples. See
+        :func:`~numpyro.infer.hmc_util.welford_draw_grad_covariance`.
+    :param remat: the default `remat` argument of the
+        :func:`~numpyro.contrib.control_flow.scan` primitives of the model, which
+        rematerializes the intermediate values of long scans when computing the
+        gradient of the potential energy to save memory. Scans with an explicit
+        `remat` argument are not affected. Defaults to False.
+    :type remat: bool or int
     """
 
     def __init__(
@@ -639,6 +802,8 @@ class HMC(MCMCKernel):
         find_heuristic_step_size=False,
         forward_mode_differentiation=False,
         regularize_mass_matrix=True,
+        mass_matrix_estimator="draws",
+        remat=False,
     ):
         if not (model is None) ^ (potential_fn is None):
             raise ValueError("Only one of `model` or `potential_fn` must be specified.")
@@ -675,10 +840,13 @@ class HMC(MCMCKernel):
         )
         self._algo = "HMC"
         self._max_tree_depth = 10
+        self._fused_tree_building = False
         self._init_strategy = init_strategy
         self._find_heuristic_step_size = find_heuristic_step_size
         self._forward_mode_differentiation = forward_mode_differentiation
         self._regularize_mass_matrix = regularize_mass_matrix
+        self._mass_matrix_estimator = mass_matrix_estimator
+        self._remat = remat
         # Set on first call to init
         self._init_fn = None
         self._potential_fn_gen = None
@@ -694,7 +862,9 @@ class HMC(MCMCKernel):
                 model_trace,
             ) = initialize_model(
                 rng_key,
-                self._model,
+                _default_scan_remat(self._model, self._remat)
+                if self._remat
+                else self._model,
                 dynamic_args=True,
                 init_strategy=self._init_strategy,
                 model_args=model_args,
@@ -783,6 +953,8 @@ class HMC(MCMCKernel):
             find_heuristic_step_size=self._find_heuristic_step_size,
             forward_mode_differentiation=self._forward_mode_differentiation,
             regularize_mass_matrix=self._regularize_mass_matrix,
+            fused_tree_building=self._fused_tree_building,
+            mass_matrix_estimator=self._mass_matrix_estimator,
             model_args=model_args,
             model_kwargs=model_kwargs,
             rng_key=rng_key,
@@ -908,6 +1080,27 @@ class NUTS(HMC):
         only supports forward-mode differentiation. See
         `JAX's The Autodiff Cookbook <https://jax.readthedocs.io/en/latest/notebooks/autodiff_cookbook.html>`_
         for more information.
+    :param bool regularize_mass_matrix: whether or not to regularize the estimated mass
+        matrix for numerical stability during warmup phase. Defaults to True. This flag
+        does not take effect if ``adapt_mass_matrix == False``.
+    :param bool fused_tree_building: whether to build trajectories with
+        :func:`~numpyro.infer.hmc_util.fused_build_tree`, which runs a single loop
+        over leapfrog steps on the flattened latent vector. This reduces the
+        per-step overhead of tree building, which can be significant for small
+        and medium sized models. Requires the default euclidean kinetic energy.
+        Defaults to False.
+    :param str mass_matrix_estimator: either ``"draws"`` (default) to adapt the mass
+        matrix from the covariance of warmup samples, or ``"draws_and_grads"`` to
+        adapt it from the covariances of both samples and gradients of the potential
+        energy (as in nutpie), which typically gives a good preconditioner from much
+        fewer warmup samples. See
+        :func:`~numpyro.infer.hmc_util.welford_draw_grad_covariance`.
+    :param remat: the default `remat` argument of the
+        :func:`~numpyro.contrib.control_flow.scan` primitives of the model, which
+        rematerializes the intermediate values of long scans when computing the
+        gradient of the potential energy to save memory. Scans with an explicit
+        `remat` argument are not affected. Defaults to False.
+    :type remat: bool or int
     """
 
     def __init__(
@@ -927,6 +1120,9 @@ class NUTS(HMC):
         find_heuristic_step_size=False,
         forward_mode_differentiation=False,
         regularize_mass_matrix=True,
+        fused_tree_building=False,
+        mass_matrix_estimator="draws",
+        remat=False,
     ):
         super(NUTS, self).__init__(
             potential_fn=potential_fn,
@@ -943,6 +1139,190 @@ class NUTS(HMC):
             find_heuristic_step_size=find_heuristic_step_size,
             forward_mode_differentiation=forward_mode_differentiation,
             regularize_mass_matrix=regularize_mass_matrix,
+            mass_matrix_estimator=mass_matrix_estimator,
+            remat=remat,
         )
         self._max_tree_depth = max_tree_depth
+        self._fused_tree_building = fused_tree_building
         self._algo = "NUTS"
+
+
+class VectorizedNUTS(NUTS):
+    """
+    No U-Turn Sampler for a batch of chains run with ``chain_method="vectorized"``,
+    which avoids the lock-step waste of vectorizing NUTS trajectories.
+
+    When NUTS is vectorized over chains, each iteration runs until the longest
+    trajectory of the batch is complete, so that chains with shorter trajectories
+    wait idly. Here, the trajectories are built one leapfrog step at a time (as in
+    ``NUTS(fused_tree_building=True)``) and a chain which completes its trajectory
+    immediately starts the trajectory of its next iteration from the new state.
+    An iteration ends once every chain has completed a transition; chains which are
+    one transition ahead keep the result and wait for the next iteration. Each chain
+    hence generates exactly the same Markov chain as the
+    :class:`~numpyro.infer.hmc.NUTS` kernel with ``fused_tree_building=True``,
+    while the number of gradient evaluations per iteration of the batch is closer to
+    the average rather than the maximum trajectory length over chains.
+
+    For non-vectorized chains, this kernel is equivalent to
+    ``NUTS(fused_tree_building=True)``.
+
+    .. note:: The random key of the current sample in the state is not used to
+        generate the next transitions; the ``latest_state`` field carries the
+        randomness of the chains.
+
+    **Example**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import jax.numpy as jnp
+        >>> import numpyro
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.infer import MCMC, VectorizedNUTS
+        >>> def model():
+        ...     numpyro.sample("x", dist.StudentT(3.0).expand([5]))
+        >>> mcmc = MCMC(
+        ...     VectorizedNUTS(model),
+        ...     num_warmup=500,
+        ...     num_samples=500,
+        ...     num_chains=8,
+        ...     chain_method="vectorized",
+        ...     progress_bar=False,
+        ... )
+        >>> mcmc.run(random.PRNGKey(0))
+        >>> samples = mcmc.get_samples()
+
+    :param model: Python callable containing Pyro :mod:`~numpyro.primitives`.
+        If model is provided, `potential_fn` will be inferred using the model.
+    :param potential_fn: Python callable that computes the potential energy
+        given input parameters. The input parameters to `potential_fn` can be
+        any python collection type, provided that `init_params` argument to
+        `init_kernel` has the same type.
+    :param kwargs: other arguments of :class:`~numpyro.infer.hmc.NUTS`, except
+        ``kinetic_fn`` and ``fused_tree_building``.
+    """
+
+    def __init__(self, model=None, potential_fn=None, **kwargs):
+        for key in ("kinetic_fn", "fused_tree_building"):
+            if key in kwargs:
+                raise ValueError(f"`{key}` is not supported by VectorizedNUTS.")
+        super().__init__(
+            model=model, potential_fn=potential_fn, fused_tree_building=True, **kwargs
+        )
+        # Set on first call to init
+        self._fused_trajectory_fns = None
+
+    def _init_state(self, rng_key, model_args, model_kwargs, init_params):
+        init_params = super()._init_state(
+            rng_key, model_args, model_kwargs, init_params
+        )
+        if self._fused_trajectory_fns is None:
+            self._init_fn, self._sample_fn, self._fused_trajectory_fns, _ = (
+                _hmc_kernels(
+                    potential_fn=self._potential_fn,
+                    potential_fn_gen=self._potential_fn_gen,
+                    kinetic_fn=self._kinetic_fn,
+                    algo=self._algo,
+                )
+            )
+        return init_params
+
+    def init(
+        self, rng_key, num_warmup, init_params=None, model_args=(), model_kwargs={}
+    ):
+        init_state = super().init(
+            rng_key,
+            num_warmup,
+            init_params=init_params,
+            model_args=model_args,
+            model_kwargs=model_kwargs,
+        )
+        if is_prng_key(rng_key):
+            return init_state
+        trajectory_init, _, _ = self._fused_trajectory_fns
+        tree_state = vmap(trajectory_init, in_axes=(0, None, None))(
+            init_state, model_args, model_kwargs
+        )
+        has_next = jnp.zeros(jnp.shape(init_state.i), dtype=bool)
+        return VectorizedNUTSState(*init_state, init_state, tree_state, has_next)
+
+    def sample(self, state, model_args, model_kwargs):
+        """
+        Run NUTS from the given :data:`~numpyro.infer.hmc.VectorizedNUTSState`
+        and return the resulting :data:`~numpyro.infer.hmc.VectorizedNUTSState`.
+        For non-vectorized chains, the state is a :data:`~numpyro.infer.hmc.HMCState`.
+
+        :param state: Represents the current state.
+        :param model_args: Arguments provided to the model.
+        :param model_kwargs: Keyword arguments provided to the model.
+        :return: Next `state` after running NUTS.
+        """
+        if isinstance(state, HMCState):
+            return super().sample(state, model_args, model_kwargs)
+
+        trajectory_init, trajectory_step_fn, trajectory_finalize = (
+            self._fused_trajectory_fns
+        )
+
+        def select(pred, x, y):
+            return tree.map(
+                lambda a, b: jnp.where(
+                    jnp.reshape(pred, jnp.shape(pred) + (1,) * (jnp.ndim(a) - 1)), a, b
+                ),
+                x,
+                y,
+            )
+
+        def step_fn(hmc_state, tree_state):
+            return trajectory_step_fn(hmc_state, model_args, model_kwargs)(tree_state)
+
+        def finalize_fn(hmc_state, tree_state):
+            hmc_state = trajectory_finalize(hmc_state, tree_state)
+            return hmc_state, trajectory_init(hmc_state, model_args, model_kwargs)
+
+        def complete_transitions(val):
+            out, latest, tree_state, has_out, has_next, finished = val
+            new_latest, new_tree_state = vmap(finalize_fn)(latest, tree_state)
+            # chains without a sample of this iteration emit the new state,
+            # others keep it as a look-ahead sample
+            out = select(finished & ~has_out, new_latest, out)
+            latest = select(finished, new_latest, latest)
+            tree_state = select(finished, new_tree_state, tree_state)
+            has_next = has_next | (finished & has_out)
+            has_out = has_out | finished
+            return out, latest, tree_state, has_out, has_next
+
+        def body_fn(val):
+            out, latest, tree_state, has_out, has_next = val
+            # chains which are one transition ahead wait for the other chains
+            active = ~(has_out & has_next)
+            tree_state = select(
+                active & ~tree_state.done,
+                vmap(step_fn)(latest, tree_state),
+                tree_state,
+            )
+            finished = active & tree_state.done
+            return cond(
+                jnp.any(finished),
+                (out, latest, tree_state, has_out, has_next, finished),
+                complete_transitions,
+                (out, latest, tree_state, has_out, has_next),
+                identity,
+            )
+
+        # chains with a look-ahead sample emit it without extending trajectories
+        latest = state.latest_state
+        has_out = state.has_next
+        has_next = jnp.zeros_like(has_out)
+        out, latest, tree_state, _, has_next = while_loop(
+            lambda val: ~jnp.all(val[3]),
+            body_fn,
+            (latest, latest, state.tree_state, has_out, has_next),
+        )
+        return VectorizedNUTSState(*out, latest, tree_state, has_next)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_fused_trajectory_fns"] = None
+        return state
@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections import OrderedDict, namedtuple
+from functools import partial
+
+import numpy as np
 
 import jax
 from jax import grad, jacfwd, random, value_and_grad, vmap
@@ -224,17 +227,136 @@ def welford_covariance(diagonal=True):
                 cov = scaled_cov + shrinkage
             else:
                 cov = scaled_cov + shrinkage * jnp.identity(mean.shape[0])
-        if jnp.ndim(cov) == 2:
-            # copy the implementation of distributions.util.cholesky_of_inverse here
-            tril_inv = jnp.swapaxes(
-                jnp.linalg.cholesky(cov[..., ::-1, ::-1])[..., ::-1, ::-1], -2, -1
-            )
-            identity = jnp.identity(cov.shape[-1])
-            cov_inv_sqrt = solve_triangular(tril_inv, identity, lower=True)
+        return (cov,) + _cov_inv_sqrt_and_tril_inv(cov)
+
+    return init_fn, update_fn, final_fn
+
+
+def _cov_inv_sqrt_and_tril_inv(cov):
+    if jnp.ndim(cov) == 2:
+        # copy the implementation of distributions.util.cholesky_of_inverse here
+        tril_inv = jnp.swapaxes(
+            jnp.linalg.cholesky(cov[..., ::-1, ::-1])[..., ::-1, ::-1], -2, -1
+        )
+        identity = jnp.identity(cov.shape[-1])
+        cov_inv_sqrt = solve_triangular(tril_inv, identity, lower=True)
+    else:
+        tril_inv = jnp.sqrt(cov)
+        cov_inv_sqrt = jnp.reciprocal(tril_inv)
+    return cov_inv_sqrt, tril_inv
+
+
+def _sqrtm_and_inv_sqrtm(matrix):
+    # square root and inverse square root of a symmetric positive definite matrix
+    eigvals, eigvecs = jnp.linalg.eigh(matrix)
+    eigvals = jnp.clip(eigvals, jnp.finfo(eigvals.dtype).tiny)
+    sqrt = (eigvecs * jnp.sqrt(eigvals)) @ eigvecs.T
+    inv_sqrt = (eigvecs / jnp.sqrt(eigvals)) @ eigvecs.T
+    return sqrt, inv_sqrt
+
+
+def welford_draw_grad_covariance(diagonal=True):
+    """
+    Estimates an inverse mass matrix from the (co)variances of both samples and
+    gradients of the potential energy at those samples, which are computed using
+    Welford's online method. For a Gaussian target, the covariance of samples is
+    equal to the inverse of the covariance of gradients. Combining both estimates
+    gives an accurate preconditioner from much fewer samples than the covariance
+    of samples alone.
+
+    The estimated inverse mass matrix is ``sqrt(var(samples) / var(grads))`` for
+    a diagonal mass matrix, and the geometric mean of the covariance of samples
+    and the inverse of the covariance of gradients for a dense mass matrix. The
+    diagonal estimate minimizes the Fisher divergence between the target and an
+    affine transform of a standard normal distribution [1].
+
+    **References:**
+
+    1. *nutpie*, https://github.com/pymc-devs/nutpie
+
+    :param bool diagonal: If True, we estimate a diagonal inverse mass matrix.
+        Otherwise, we estimate a dense one. Defaults to True.
+    :return: a (`init_fn`, `update_fn`, `final_fn`) triple. Different from
+        :func:`welford_covariance`, `update_fn` takes both a sample and the
+        gradient of the potential energy at that sample.
+    """
+    wc_init, wc_update, _ = welford_covariance(diagonal=diagonal)
+
+    def init_fn(size):
+        """
+        :param int size: size of each sample. For a structured mass matrix,
+            this is a dict mapping from tuples of site names to the shape
+            of the mass matrix.
+        :return: initial state for the scheme.
+        """
+        if isinstance(size, dict):
+            return {
+                site_names: init_fn(size_block)
+                for site_names, size_block in size.items()
+            }
+        return wc_init(size), wc_init(size)
+
+    def update_fn(sample, grad, state):
+        """
+        :param sample: A new sample.
+        :param grad: Gradient of the potential energy at the new sample.
+        :param state: Current state of the scheme.
+        :return: new state for the scheme.
+        """
+        if isinstance(state, dict):
+            assert isinstance(sample, dict) and isinstance(grad, dict)
+            new_state = {}
+            for site_names, state_block in state.items():
+                sample_block = tuple(sample[k] for k in site_names)
+                grad_block = tuple(grad[k] for k in site_names)
+                new_state[site_names] = update_fn(sample_block, grad_block, state_block)
+            return new_state
+
+        sample_state, grad_state = state
+        return wc_update(sample, sample_state), wc_update(grad, grad_state)
+
+    def final_fn(state, regularize=False):
+        """
+        :param state: Current state of the scheme.
+        :param bool regularize: Whether to adjust diagonal for numerical stability.
+        :return: a triple of estimated inverse mass matrix, the square root of its
+            inverse, and the inverse of that square root.
+        """
+        if isinstance(state, dict):
+            cov, cov_inv_sqrt, tril_inv = {}, {}, {}
+            for site_names, state_block in state.items():
+                cov_block, cov_inv_sqrt_block, tril_inv_block = final_fn(
+                    state_block, regularize=regularize
+                )
+                cov[site_names] = cov_block
+                cov_inv_sqrt[site_names] = cov_inv_sqrt_block
+                tril_inv[site_names] = tril_inv_block
+            return cov, cov_inv_sqrt, tril_inv
+
+        (mean, sample_m2, n), (_, grad_m2, _) = state
+        sample_cov = sample_m2 / (n - 1)
+        grad_cov = grad_m2 / (n - 1)
+        if regularize:
+            # Regularization from Stan, applied to both estimates
+            shrinkage = 1e-3 * (5 / (n + 5))
+            if jnp.ndim(sample_cov) == 2:
+                shrinkage = shrinkage * jnp.identity(mean.shape[0])
+            sample_cov = (n / (n + 5)) * sample_cov + shrinkage
+            grad_cov = (n / (n + 5)) * grad_cov + shrinkage
+        if jnp.ndim(sample_cov) == 1:
+            tiny = jnp.finfo(jnp.result_type(sample_cov)).tiny
+            cov = jnp.sqrt(sample_cov / jnp.clip(grad_cov, tiny))
+            cov = jnp.clip(cov, 1e-20, 1e20)
         else:
-            tril_inv = jnp.sqrt(cov)
-            cov_inv_sqrt = jnp.reciprocal(tril_inv)
-        return cov, cov_inv_sqrt, tril_inv
+            # geometric mean of the sample covariance and the inverse of the
+            # gradient covariance: S^1/2 (S^1/2 G S^1/2)^-1/2 S^1/2
+            sample_cov_sqrt, _ = _sqrtm_and_inv_sqrtm(sample_cov)
+            _, middle = _sqrtm_and_inv_sqrtm(
+                sample_cov_sqrt @ grad_cov @ sample_cov_sqrt
+            )
+            cov = sample_cov_sqrt @ middle @ sample_cov_sqrt
+            cov = (cov + cov.T) / 2
+        return (cov,) + _cov_inv_sqrt_and_tril_inv(cov)
 
     return init_fn, update_fn, final_fn
 
@@ -523,6 +645,7 @@ def warmup_adapter(
     dense_mass=False,
     target_accept_prob=0.8,
     regularize_mass_matrix=True,
+    mass_matrix_estimator="draws",
 ):
     """
     A scheme to adapt tunable parameters, namely step size and mass matrix, during
@@ -540,12 +663,28 @@ def warmup_adapter(
     :param float target_accept_prob: Target acceptance probability for step size
         adaptation using Dual Averaging. Increasing this value will lead to a smaller
         step size, hence the sampling will be slower but more robust. Default to 0.8.
+    :param bool regularize_mass_matrix: whether or not to regularize the estimated
+        mass matrix for numerical stability (defaults to ``True``).
+    :param str mass_matrix_estimator: either ``"draws"`` (default) to estimate the
+        inverse mass matrix by the covariance of samples using
+        :func:`welford_covariance`, or ``"draws_and_grads"`` to estimate it from
+        the covariances of both samples and gradients of the potential energy using
+        :func:`welford_draw_grad_covariance`.
     :return: a pair of (`init_fn`, `update_fn`).
     """
     if find_reasonable_step_size is None:
         find_reasonable_step_size = identity
     ss_init, ss_update = dual_averaging()
-    mm_init, mm_update, mm_final = welford_covariance(diagonal=not dense_mass)
+    if mass_matrix_estimator == "draws":
+        mm_init, mm_update, mm_final = welford_covariance(diagonal=not dense_mass)
+    elif mass_matrix_estimator == "draws_and_grads":
+        mm_init, mm_update, mm_final = welford_draw_grad_covariance(
+            diagonal=not dense_mass
+        )
+    else:
+        raise ValueError(
+            "`mass_matrix_estimator` must be one of `draws` or `draws_and_grads`."
+        )
     adaptation_schedule = build_adaptation_schedule(num_adapt_steps)
     num_windows = len(adaptation_schedule)
 
@@ -675,9 +814,13 @@ def warmup_adapter(
         is_middle_window = (0 < window_idx) & (window_idx < (num_windows - 1))
         if adapt_mass_matrix:
             z = z_info[0]
+            if mass_matrix_estimator == "draws_and_grads":
+                mm_args = (z, z_info.z_grad, mm_state)
+            else:
+                mm_args = (z, mm_state)
             mm_state = cond(
                 is_middle_window,
-                (z, mm_state),
+                mm_args,
                 lambda args: mm_update(*args),
                 mm_state,
                 identity,
@@ -1180,6 +1323,312 @@ def build_tree(
     return tree
 
 
+def _flat_inverse_mass_matrix(inverse_mass_matrix, z):
+    # Converts a (possibly structured) inverse mass matrix to an array acting on
+    # the flattened latent vector `ravel_pytree(z)[0]`.
+    if not isinstance(inverse_mass_matrix, dict):
+        return inverse_mass_matrix
+    if len(inverse_mass_matrix) == 1:
+        ((site_names, inverse_mm),) = inverse_mass_matrix.items()
+        if list(site_names) == sorted(z):
+            return inverse_mm
+
+    offsets, offset = {}, 0
+    for k in sorted(z):
+        offsets[k] = np.arange(offset, offset + np.size(z[k]))
+        offset += np.size(z[k])
+    is_dense = any(jnp.ndim(v) == 2 for v in inverse_mass_matrix.values())
+    flat_imm = jnp.zeros((offset, offset) if is_dense else offset)
+    for site_names, inverse_mm in inverse_mass_matrix.items():
+        idx = np.concatenate([offsets[k] for k in site_names])
+        if is_dense:
+            if jnp.ndim(inverse_mm) == 1:
+                inverse_mm = jnp.diag(inverse_mm)
+            flat_imm = flat_imm.at[np.ix_(idx, idx)].set(inverse_mm)
+        else:
+            flat_imm = flat_imm.at[idx].set(inverse_mm)
+    return flat_imm
+
+
+_FusedTreeState = namedtuple(
+    "_FusedTreeState",
+    [
+        "rng_key",
+        "depth",
+        "leaf_idx",
+        "going_right",
+        "frontier",
+        "left",
+        "right",
+        "trajectory",
+        "subtree",
+        "r_ckpts",
+        "r_sum_ckpts",
+        "sum_accept_probs",
+        "num_proposals",
+        "turning",
+        "diverging",
+        "done",
+        "energy_current",
+        "max_tree_depth",
+    ],
+)
+
+
+def _mass_matrix_matvec(inverse_mass_matrix):
+    if inverse_mass_matrix.ndim == 2:
+        # NB: the inverse mass matrix is symmetric and `r` may be batched
+        return partial(jnp.matmul, b=inverse_mass_matrix)
+    elif inverse_mass_matrix.ndim == 1:
+        return partial(jnp.multiply, inverse_mass_matrix)
+    else:
+        raise ValueError("inverse_mass_matrix should have 1 or 2 dimensions.")
+
+
+def _fused_tree_init(
+    z, r, potential_energy, z_grad, inverse_mass_matrix, rng_key, max_tree_depth=10
+):
+    # Initial state of a trajectory which is built by `_fused_tree_step`, one
+    # leapfrog step at a time. This allows to resume the trajectory later.
+    if isinstance(max_tree_depth, tuple):
+        max_tree_depth_current, max_tree_depth = max_tree_depth
+    else:
+        max_tree_depth_current = max_tree_depth
+    mm_matvec = _mass_matrix_matvec(inverse_mass_matrix)
+    energy_current = potential_energy + 0.5 * jnp.dot(mm_matvec(r), r)
+    zeros_ckpts = jnp.zeros((max_tree_depth, jnp.size(r)))
+    zero_int = jnp.array(0, dtype=jnp.result_type(int))
+    false = jnp.array(False)
+    proposal = (z, potential_energy, z_grad, energy_current)
+    return _FusedTreeState(
+        rng_key,
+        zero_int,
+        zero_int,
+        false,
+        (z, r, z_grad),
+        (z, r, z_grad),
+        (z, r, z_grad),
+        (jnp.zeros(()), r, proposal),
+        (jnp.array(-jnp.inf), jnp.zeros_like(r), proposal),
+        zeros_ckpts,
+        zeros_ckpts,
+        jnp.zeros(()),
+        zero_int,
+        false,
+        false,
+        jnp.array(max_tree_depth_current <= 0),
+        energy_current,
+        jnp.array(max_tree_depth_current, dtype=jnp.result_type(int)),
+    )
+
+
+def _fused_tree_step(
+    potential_fn,
+    inverse_mass_matrix,
+    step_size,
+    state,
+    max_delta_energy=1000.0,
+    forward_mode_differentiation=False,
+):
+    # Takes one leapfrog step of the trajectory stored in `state`.
+    mm_matvec = _mass_matrix_matvec(inverse_mass_matrix)
+    max_tree_depth = state.r_ckpts.shape[0]
+    ckpt_idxs = jnp.arange(max_tree_depth)
+
+    def is_turning(r_left, r_right, r_sum):
+        # r_sum can have a leading batch dimension of checkpoints
+        r_sum = r_sum - (r_left + r_right) / 2
+        left_angle = jnp.sum(mm_matvec(r_left) * r_sum, -1)
+        right_angle = jnp.sum(mm_matvec(r_right) * r_sum, -1)
+        return (left_angle <= 0) | (right_angle <= 0)
+
+    def select(pred, x, y):
+        return jax.tree.map(lambda a, b: jnp.where(pred, a, b), x, y)
+
+    depth, leaf_idx, going_right, frontier = state[1:5]
+    left, right, traj, subtree = state[5:9]
+    r_ckpts, r_sum_ckpts = state.r_ckpts, state.r_sum_ckpts
+    # draw all random numbers needed by this step at once
+    rng_key, step_key = random.split(state.rng_key)
+    u_direction, u_leaf, u_subtree = random.uniform(step_key, (3,))
+
+    # start a new subtree from the end of the trajectory in a random direction
+    new_subtree = leaf_idx == 0
+    going_right = jnp.where(new_subtree, u_direction < 0.5, going_right)
+    frontier = select(new_subtree, select(going_right, right, left), frontier)
+
+    # leapfrog step
+    z, r, z_grad = frontier
+    eps = jnp.where(going_right, step_size, -step_size)
+    r = r - 0.5 * eps * z_grad
+    z = z + eps * mm_matvec(r)
+    pe, z_grad = _value_and_grad(potential_fn, z, forward_mode_differentiation)
+    r = r - 0.5 * eps * z_grad
+    frontier = (z, r, z_grad)
+
+    energy = pe + 0.5 * jnp.dot(mm_matvec(r), r)
+    delta_energy = energy - state.energy_current
+    delta_energy = jnp.where(jnp.isnan(delta_energy), jnp.inf, delta_energy)
+    diverging = delta_energy > max_delta_energy
+    accept_prob = jnp.clip(jnp.exp(-delta_energy), None, 1.0)
+
+    # multinomial sampling of the subtree proposal
+    sub_weight, sub_r_sum, sub_proposal = subtree
+    sub_weight = jnp.where(new_subtree, -jnp.inf, sub_weight)
+    sub_r_sum = jnp.where(new_subtree, 0.0, sub_r_sum) + r
+    new_sub_weight = jnp.logaddexp(sub_weight, -delta_energy)
+    transition = u_leaf < jnp.exp(-delta_energy - new_sub_weight)
+    sub_proposal = select(transition, (z, pe, z_grad, energy), sub_proposal)
+    subtree = (new_sub_weight, sub_r_sum, sub_proposal)
+
+    # U-turn checks of all sub-subtrees whose right-most leaf is the new leaf
+    ckpt_idx_min, ckpt_idx_max = _leaf_idx_to_ckpt_idxs(leaf_idx)
+    update_ckpt = (leaf_idx % 2 == 0) & (ckpt_idxs == ckpt_idx_max)
+    r_ckpts = jnp.where(update_ckpt[:, None], r, r_ckpts)
+    r_sum_ckpts = jnp.where(update_ckpt[:, None], sub_r_sum, r_sum_ckpts)
+    in_range = (ckpt_idxs >= ckpt_idx_min) & (ckpt_idxs <= ckpt_idx_max)
+    subtree_turning = jnp.any(
+        in_range & is_turning(r_ckpts, r, sub_r_sum - r_sum_ckpts + r_ckpts)
+    )
+
+    sum_accept_probs = state.sum_accept_probs + accept_prob
+    num_proposals = state.num_proposals + 1
+    subtree_done = (
+        (leaf_idx + 1 == jnp.left_shift(1, depth)) | subtree_turning | diverging
+    )
+
+    # merge a complete subtree into the trajectory using biased transition
+    merge = subtree_done & ~subtree_turning & ~diverging
+    traj_weight, traj_r_sum, traj_proposal = traj
+    transition = merge & (u_subtree < jnp.exp(new_sub_weight - traj_weight))
+    traj_proposal = select(transition, sub_proposal, traj_proposal)
+    traj_weight = jnp.where(
+        subtree_done, jnp.logaddexp(traj_weight, new_sub_weight), traj_weight
+    )
+    traj_r_sum = jnp.where(merge, traj_r_sum + sub_r_sum, traj_r_sum)
+    left = select(merge & ~going_right, (z, r, z_grad), left)
+    right = select(merge & going_right, (z, r, z_grad), right)
+    traj_turning = merge & is_turning(left[1], right[1], traj_r_sum)
+    traj = (traj_weight, traj_r_sum, traj_proposal)
+    depth = jnp.where(subtree_done, depth + 1, depth)
+    leaf_idx = jnp.where(subtree_done, 0, leaf_idx + 1)
+
+    turning = subtree_turning | traj_turning
+    done = subtree_done & (turning | diverging | (depth >= state.max_tree_depth))
+    return _FusedTreeState(
+        rng_key,
+        depth,
+        leaf_idx,
+        going_right,
+        frontier,
+        left,
+        right,
+        traj,
+        subtree,
+        r_ckpts,
+        r_sum_ckpts,
+        sum_accept_probs,
+        num_proposals,
+        turning,
+        diverging,
+        done,
+        state.energy_current,
+        state.max_tree_depth,
+    )
+
+
+def _fused_tree_info(state):
+    left, right = state.left, state.right
+    weight, r_sum, (z_proposal, pe_proposal, grad_proposal, energy_proposal) = (
+        state.trajectory
+    )
+    return TreeInfo(
+        left[0],
+        left[1],
+        left[2],
+        right[0],
+        right[1],
+        right[2],
+        z_proposal,
+        pe_proposal,
+        grad_proposal,
+        energy_proposal,
+        state.depth,
+        weight,
+        r_sum,
+        state.turning,
+        state.diverging,
+        state.sum_accept_probs,
+        state.num_proposals,
+    )
+
+
+def fused_build_tree(
+    potential_fn,
+    z,
+    r,
+    potential_energy,
+    z_grad,
+    inverse_mass_matrix,
+    step_size,
+    rng_key,
+    max_delta_energy=1000.0,
+    max_tree_depth=10,
+    forward_mode_differentiation=False,
+):
+    """
+    Builds a NUTS trajectory on flat arrays. This is a drop-in alternative of
+    :func:`build_tree` for the Euclidean kinetic energy, which generates the same
+    distribution of trajectories.
+
+    Instead of nesting a loop to build subtrees inside a loop to double the tree,
+    each iteration of a single :func:`~jax.lax.while_loop` takes one leapfrog step,
+    accumulates the multinomial proposal of the current subtree, checks the U-turn
+    conditions of all sub-subtrees ending at the new leaf at once, and merges the
+    subtree into the trajectory when it is complete. All computations operate on
+    the raveled latent vector so that no pytree is flattened or unflattened in the
+    loop body.
+
+    :param potential_fn: A callable to compute the potential energy of a flat
+        latent vector.
+    :param z: Flat position of the initial state.
+    :param r: Flat momentum of the initial state.
+    :param float potential_energy: Potential energy at ``z``.
+    :param z_grad: Gradient of the potential energy at ``z``.
+    :param inverse_mass_matrix: Inverse of the mass matrix, either a vector for a
+        diagonal mass matrix or a dense matrix.
+    :param float step_size: Step size for the current trajectory.
+    :param jax.random.PRNGKey rng_key: random key to be used as the source of
+        randomness.
+    :param float max_delta_energy: A threshold to decide if the new state diverges
+        (based on the energy difference) too much from the initial integrator state.
+    :param int max_tree_depth: Max depth of the binary tree created during the doubling
+        scheme of NUTS sampler. Defaults to 10. This argument also accepts a tuple of
+        integers `(d1, d2)`, where `d1` is the max tree depth at the current MCMC
+        step and `d2` is the global max tree depth for all MCMC steps.
+    :param bool forward_mode_differentiation: whether to use forward-mode
+        differentiation to compute the gradient of ``potential_fn``.
+    :return: information of the tree, whose latent values are flat arrays.
+    :rtype: :data:`TreeInfo`
+    """
+    state = _fused_tree_init(
+        z, r, potential_energy, z_grad, inverse_mass_matrix, rng_key, max_tree_depth
+    )
+    state = while_loop(
+        lambda state: ~state.done,
+        partial(
+            _fused_tree_step,
+            potential_fn,
+            inverse_mass_matrix,
+            step_size,
+            max_delta_energy=max_delta_energy,
+            forward_mode_differentiation=forward_mode_differentiation,
+        ),
+        state,
+    )
+    return _fused_tree_info(state)
+
+
 def euclidean_kinetic_energy(inverse_mass_matrix, r):
     if isinstance(inverse_mass_matrix, dict):
         ke = jnp.zeros(())
@@ -15,6 +15,7 @@ import jax.numpy as jnp
 
 from numpyro.diagnostics import print_summary
 from numpyro.util import (
+    _run_checkpointed,
     cached_by,
     find_stack_level,
     fori_collect,
@@ -472,9 +473,11 @@ class MCMC(object):
             init_state = new_init_state if init_state is None else init_state
         sample_fn, postprocess_fn = self._get_cached_fns()
         diagnostics = (  # noqa: E731
-            lambda x: self.sampler.get_diagnostics_str(x[0])
-            if is_prng_key(rng_key) or self.sampler.is_ensemble_kernel
-            else ""
+            lambda x: (
+                self.sampler.get_diagnostics_str(x[0])
+                if is_prng_key(rng_key) or self.sampler.is_ensemble_kernel
+                else ""
+            )
         )
         init_val = (init_state, args, kwargs) if self._jit_model_args else (init_state,)
         lower_idx = self._collection_params["lower"]
@@ -512,6 +515,123 @@ class MCMC(object):
         states = dict(zip(collect_fields, states))
         return states, last_state
 
+    def _init_chain(self, init, args, kwargs):
+        rng_key, init_state, init_params = init
+        if init_state is None or (getattr(self.sampler, "_sample_fn", None) is None):
+            new_init_state = self.sampler.init(
+                rng_key,
+                self.num_warmup,
+                init_params,
+                model_args=args,
+                model_kwargs=kwargs,
+            )
+            init_state = new_init_state if init_state is None else init_state
+        return init_state
+
+    def _single_chain_segment(
+        self, state, args, kwargs, collect_fields, remove_sites, length
+    ):
+        sample_fn, postprocess_fn = self._get_cached_fns()
+        transform = _collect_and_postprocess(
+            postprocess_fn, collect_fields, remove_sites
+        )
+
+        def body_fn(val, _):
+            val = sample_fn(val)
+            return val, transform(val)
+
+        init_val = (state, args, kwargs) if self._jit_model_args else (state,)
+        last_val, states = lax.scan(body_fn, init_val, None, length=length)
+        if len(collect_fields) == 1:
+            states = (states,)
+        states = dict(zip(collect_fields, states))
+        return states, last_val[0]
+
+    def _map_chains(self, map_fn, map_args):
+        if self.num_chains == 1 or self.chain_method == "vectorized":
+            return map_fn(map_args)
+        elif self.chain_method == "sequential":
+            return _laxmap(map_fn, map_args)
+        elif self.chain_method == "parallel":
+            return pmap(map_fn)(map_args)
+        else:
+            assert callable(self.chain_method)
+            return self.chain_method(map_fn)(map_args)
+
+    def _group_by_chain(self, states):
+        if self.num_chains == 1:
+            return jax.tree.map(lambda x: x[jnp.newaxis, ...], states)
+        elif self.chain_method == "vectorized":
+            # swap num_samples x num_chains to num_chains x num_samples
+            return jax.tree.map(lambda x: jnp.swapaxes(x, 0, 1), states)
+        return states
+
+    def _run_checkpointed(
+        self, map_args, args, kwargs, collect_fields, remove_sites, checkpoint, resume
+    ):
+        lower = self._collection_params["lower"]
+        upper = self._collection_params["upper"]
+        phase = self._collection_params["phase"]
+        # the same samples are kept as in `fori_collect`
+        start_idx = lower + (upper - lower) % self.thinning
+        segment_fns = {}
+
+        def segment_fn(state, start, length):
+            if length not in segment_fns:
+                segment_fns[length] = jit(
+                    partial(
+                        self._single_chain_segment,
+                        args=args,
+                        kwargs=kwargs,
+                        collect_fields=collect_fields,
+                        remove_sites=remove_sites,
+                        length=length,
+                    )
+                )
+            states, state = self._map_chains(segment_fns[length], state)
+            idx = np.arange(start, start + length)
+            keep = (idx >= start_idx) & (
+                (idx - start_idx) % self.thinning == self.thinning - 1
+            )
+            # select the kept samples on host and move the chain axis first
+            states = device_get(states)
+            if self.num_chains == 1:
+                states = jax.tree.map(lambda x: x[keep][np.newaxis, ...], states)
+            elif self.chain_method == "vectorized":
+                states = jax.tree.map(lambda x: np.swapaxes(x[keep], 0, 1), states)
+            else:
+                states = jax.tree.map(lambda x: x[:, keep], states)
+            return state, states
+
+        state = self._map_chains(
+            partial(self._init_chain, args=args, kwargs=kwargs), map_args
+        )
+        state, chunks = _run_checkpointed(
+            segment_fn,
+            state,
+            upper,
+            checkpoint,
+            resume=resume,
+            meta={
+                "lower": lower,
+                "upper": upper,
+                "thinning": self.thinning,
+                "num_chains": self.num_chains,
+                "fields": collect_fields + tuple("~" + site for site in remove_sites),
+            },
+            progbar=self.progress_bar,
+            progbar_desc=partial(_get_progbar_desc_str, lower, phase),
+            diagnostics_fn=lambda state, _: (
+                self.sampler.get_diagnostics_str(state)
+                if self.num_chains == 1 or self.sampler.is_ensemble_kernel
+                else ""
+            ),
+        )
+        states = jax.tree.map(
+            lambda *xs: jnp.asarray(np.concatenate(xs, axis=1)), *chunks
+        )
+        return states, jax.tree.map(jnp.asarray, state)
+
     def _set_collection_params(
         self, lower=None, upper=None, collection_size=None, phase=None
     ):
@@ -623,7 +743,16 @@ class MCMC(object):
         )
         self._warmup_state = self._last_state
 
-    def run(self, rng_key, *args, extra_fields=(), init_params=None, **kwargs):
+    def run(
+        self,
+        rng_key,
+        *args,
+        extra_fields=(),
+        init_params=None,
+        checkpoint=None,
+        resume=False,
+        **kwargs,
+    ):
         """
         Run the MCMC samplers and collect samples.
 
@@ -644,6 +773,19 @@ class MCMC(object):
             with the input type to `potential_fn` provided to the kernel. If the kernel is
             instantiated by a numpyro model, the initial parameters here correspond to latent
             values in unconstrained space.
+        :param ~numpyro.util.Checkpoint checkpoint: if not None, run the chains in
+            segments of `checkpoint.every` steps and write a snapshot of the states of
+            the chains (including the adaptation state and the random keys) and of the
+            samples collected in each segment to `checkpoint.directory`. Usage::
+
+                mcmc.run(random.PRNGKey(0), data, checkpoint=Checkpoint("ckpt", 500))
+                # after an interruption, continue exactly where the run stopped
+                mcmc.run(random.PRNGKey(0), data, checkpoint=Checkpoint("ckpt", 500),
+                         resume=True)
+
+        :param bool resume: whether to continue from the snapshot in
+            `checkpoint.directory`, if any. The random key and initial parameters of
+            the resumed chains are those of the snapshot. Defaults to False.
         :param kwargs: Keyword arguments to be provided to the :meth:`numpyro.infer.mcmc.MCMCKernel.init`
             method. These are typically the keyword arguments needed by the `model`.
 
@@ -690,29 +832,21 @@ class MCMC(object):
         collect_fields = tuple(collect_fields.keys())
         remove_sites = tuple(remove_sites.keys())
 
-        partial_map_fn = partial(
-            self._single_chain_mcmc,
-            args=args,
-            kwargs=kwargs,
-            collect_fields=collect_fields,
-            remove_sites=remove_sites,
-        )
         map_args = (rng_key, init_state, init_params)
-        if self.num_chains == 1:
-            states_flat, last_state = partial_map_fn(map_args)
-            states = jax.tree.map(lambda x: x[jnp.newaxis, ...], states_flat)
+        if checkpoint is not None:
+            states, last_state = self._run_checkpointed(
+                map_args, args, kwargs, collect_fields, remove_sites, checkpoint, resume
+            )
         else:
-            if self.chain_method == "sequential":
-                states, last_state = _laxmap(partial_map_fn, map_args)
-            elif self.chain_method == "parallel":
-                states, last_state = pmap(partial_map_fn)(map_args)
-            elif callable(self.chain_method):
-                states, last_state = self.chain_method(partial_map_fn)(map_args)
-            else:
-                assert self.chain_method == "vectorized"
-                states, last_state = partial_map_fn(map_args)
-                # swap num_samples x num_chains to num_chains x num_samples
-                states = jax.tree.map(lambda x: jnp.swapaxes(x, 0, 1), states)
+            partial_map_fn = partial(
+                self._single_chain_mcmc,
+                args=args,
+                kwargs=kwargs,
+                collect_fields=collect_fields,
+                remove_sites=remove_sites,
+            )
+            states, last_state = self._map_chains(partial_map_fn, map_args)
+            states = self._group_by_chain(states)
 
         self._last_state = last_state
         self._states = states
@@ -0,0 +1,469 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import namedtuple
+import math
+
+import jax
+from jax import lax, random, value_and_grad, vmap
+from jax.flatten_util import ravel_pytree
+import jax.numpy as jnp
+from jax.scipy.linalg import solve_triangular
+
+from numpyro.infer.initialization import init_to_uniform, init_to_value
+from numpyro.infer.util import initialize_model
+from numpyro.util import while_loop
+
+__all__ = ["Pathfinder", "pathfinder"]
+
+PathfinderState = namedtuple(
+    "PathfinderState",
+    [
+        "samples",
+        "potential_energy",
+        "log_weights",
+        "elbo",
+        "inverse_mass_matrix",
+    ],
+)
+"""
+A :func:`~collections.namedtuple` consisting of the following fields:
+
+ - **samples** - approximate posterior draws (in the same pytree structure as the
+   initial parameters) obtained by importance resampling of the draws from all paths.
+ - **potential_energy** - potential energy evaluated at ``samples``.
+ - **log_weights** - log importance weights of ``samples`` w.r.t. the Gaussian
+   approximation that generated them (before resampling).
+ - **elbo** - the best ELBO found along each path, with shape ``(num_paths,)``.
+ - **inverse_mass_matrix** - the inverse Hessian estimate at the best point of the
+   best path. This is a flat vector for ``dense_mass=False`` and a dense matrix
+   otherwise; it can be used as the initial ``inverse_mass_matrix`` of
+   :class:`~numpyro.infer.hmc.HMC` or :class:`~numpyro.infer.hmc.NUTS`.
+"""
+
+# Inverse Hessian approximation at an L-BFGS iterate, stored in the factored form
+# `H = diag(alpha) + beta @ gamma @ beta.T` of reference [2] in :func:`pathfinder`.
+_LBFGSApprox = namedtuple("_LBFGSApprox", ["alpha", "beta", "gamma"])
+
+
+def _update_alpha(alpha, s, y):
+    # Diagonal BFGS update of the initial inverse Hessian with Oren-Luenberger
+    # scaling, see Algorithm 3 of reference [1] in :func:`pathfinder`.
+    a = jnp.dot(alpha * y, y)
+    b = jnp.dot(y, s)
+    c = jnp.dot(s / alpha, s)
+    return 1 / (a / (b * alpha) + y**2 / b - a * (s / alpha) ** 2 / (b * c))
+
+
+def _lbfgs_approx(alpha, S, Y, mask):
+    # S, Y have shape (history_size, d) and are ordered from the oldest to the
+    # newest update; rows with mask == False are unused and filled with zeros.
+    SY = S @ Y.T
+    R = jnp.triu(SY) + jnp.diag(jnp.where(mask, 0.0, 1.0))
+    D = jnp.diag(jnp.diagonal(SY))
+    R_inv = solve_triangular(R, jnp.identity(R.shape[0]), lower=False)
+    YaY = (Y * alpha) @ Y.T
+    zeros = jnp.zeros_like(R)
+    gamma = jnp.block(
+        [[zeros, -R_inv], [-R_inv.T, R_inv.T @ (D + YaY) @ R_inv]],
+    )
+    beta = jnp.concatenate([(Y * alpha).T, S.T], axis=-1)
+    return _LBFGSApprox(alpha, beta, gamma)
+
+
+def _hvp(approx, v):
+    return approx.alpha * v + approx.beta @ (approx.gamma @ (approx.beta.T @ v))
+
+
+def _approx_diagonal(approx):
+    return approx.alpha + jnp.einsum(
+        "ij,jk,ik->i", approx.beta, approx.gamma, approx.beta
+    )
+
+
+def _approx_dense(approx):
+    return jnp.diag(approx.alpha) + approx.beta @ approx.gamma @ approx.beta.T
+
+
+def _sample_approx(rng_key, approx, mean, num_samples):
+    # Draw from N(mean, H) with H in factored form without materializing a dense
+    # d x d matrix, see Algorithm 4 of reference [1] in :func:`pathfinder`.
+    alpha, beta, gamma = approx
+    sqrt_alpha = jnp.sqrt(alpha)
+    Q, R = jnp.linalg.qr(beta / sqrt_alpha[:, None])
+    L = jnp.linalg.cholesky(jnp.identity(R.shape[0]) + R @ gamma @ R.T)
+    log_det = jnp.sum(jnp.log(alpha)) + 2 * jnp.sum(jnp.log(jnp.diagonal(L)))
+    u = random.normal(rng_key, (num_samples,) + mean.shape)
+    u_proj = u @ Q
+    draws = mean + sqrt_alpha * (u_proj @ L.T @ Q.T + u - u_proj @ Q.T)
+    log_q = -0.5 * (
+        log_det + jnp.sum(u**2, -1) + mean.shape[-1] * math.log(2 * math.pi)
+    )
+    return draws, log_q
+
+
+def _single_path(
+    rng_key,
+    potential_fn,
+    x0,
+    *,
+    max_iters,
+    history_size,
+    num_elbo_draws,
+    num_draws,
+    max_line_search_steps,
+):
+    pe_and_grad = value_and_grad(potential_fn)
+    d = x0.shape[-1]
+    dtype = x0.dtype
+    U0, g0 = pe_and_grad(x0)
+
+    def elbo_fn(rng_key, approx, x, g):
+        mean = x - _hvp(approx, g)
+        draws, log_q = _sample_approx(rng_key, approx, mean, num_elbo_draws)
+        pe = vmap(potential_fn)(draws)
+        log_w = -pe - log_q
+        # non-finite potential energies make the approximation unusable
+        log_w = jnp.where(jnp.isfinite(log_w), log_w, -jnp.inf)
+        return jnp.mean(log_w)
+
+    def line_search(x, U, g, direction):
+        # backtracking line search with the Armijo sufficient decrease condition
+        slope = jnp.dot(g, direction)
+
+        def eval_fn(step):
+            x_new = x + step * direction
+            U_new, g_new = pe_and_grad(x_new)
+            U_new = jnp.where(jnp.isnan(U_new), jnp.inf, U_new)
+            return x_new, U_new, g_new, U_new <= U + 1e-4 * step * slope
+
+        def cond_fn(state):
+            i, _, _, _, _, armijo = state
+            return (i < max_line_search_steps) & ~armijo
+
+        def body_fn(state):
+            i, step, *_ = state
+            step = 0.5 * step
+            return (i + 1, step) + eval_fn(step)
+
+        step = jnp.array(1.0, dtype=dtype)
+        init_state = (jnp.array(0), step) + eval_fn(step)
+        _, _, x_new, U_new, g_new, armijo = while_loop(cond_fn, body_fn, init_state)
+        success = armijo & jnp.isfinite(U_new) & jnp.all(jnp.isfinite(g_new))
+        return success, x_new, U_new, g_new
+
+    def body_fn(carry, rng_key):
+        x, U, g, alpha, S, Y, mask, best = carry
+        approx = _lbfgs_approx(alpha, S, Y, mask)
+        direction = -_hvp(approx, g)
+        # fall back to steepest descent if the direction is not a descent direction
+        direction = jnp.where(jnp.dot(direction, g) < 0, direction, -g)
+        success, x_new, U_new, g_new = line_search(x, U, g, direction)
+        s, y = x_new - x, g_new - g
+        # only accept updates which satisfy the curvature condition
+        accept = success & (jnp.dot(s, y) > 1e-10 * jnp.dot(y, y))
+        x, U, g = jax.tree.map(
+            lambda a, b: jnp.where(accept, a, b), (x_new, U_new, g_new), (x, U, g)
+        )
+        alpha = jnp.where(accept, _update_alpha(alpha, s, y), alpha)
+        S, Y, mask = jax.tree.map(
+            lambda a, b: jnp.where(accept, jnp.concatenate([a[1:], b[None]]), a),
+            (S, Y, mask),
+            (s, y, jnp.array(True)),
+        )
+        approx = _lbfgs_approx(alpha, S, Y, mask)
+        elbo = jnp.where(accept, elbo_fn(rng_key, approx, x, g), -jnp.inf)
+        best = jax.tree.map(
+            lambda a, b: jnp.where(elbo > best[0], a, b),
+            (elbo, x, g, alpha, S, Y, mask),
+            best,
+        )
+        return (x, U, g, alpha, S, Y, mask, best), None
+
+    alpha = jnp.ones(d, dtype=dtype)
+    S = Y = jnp.zeros((history_size, d), dtype=dtype)
+    mask = jnp.zeros(history_size, dtype=bool)
+    best = (jnp.array(-jnp.inf, dtype=dtype), x0, g0, alpha, S, Y, mask)
+    rng_key, rng_key_iters = random.split(rng_key)
+    init_carry = (x0, U0, g0, alpha, S, Y, mask, best)
+    (_, _, _, _, _, _, _, best), _ = lax.scan(
+        body_fn, init_carry, random.split(rng_key_iters, max_iters)
+    )
+
+    elbo, x, g, alpha, S, Y, mask = best
+    approx = _lbfgs_approx(alpha, S, Y, mask)
+    draws, log_q = _sample_approx(rng_key, approx, x - _hvp(approx, g), num_draws)
+    pe = vmap(potential_fn)(draws)
+    return draws, pe, log_q, elbo, approx
+
+
+def pathfinder(
+    rng_key,
+    potential_fn,
+    init_params,
+    *,
+    num_draws=1000,
+    max_iters=100,
+    history_size=6,
+    num_elbo_draws=10,
+    max_line_search_steps=20,
+    dense_mass=False,
+):
+    r"""
+    (EXPERIMENTAL INTERFACE) Multi-path Pathfinder variational inference [1].
+
+    Each path runs L-BFGS from one of the initial points. At every iterate, the
+    L-BFGS inverse Hessian estimate, represented as a diagonal plus low-rank matrix,
+    defines a Gaussian approximation of the posterior whose ELBO is estimated with
+    ``num_elbo_draws`` Monte Carlo draws. The approximation with the highest ELBO
+    along each path is used to generate ``num_draws`` draws, and draws from all paths
+    are pooled and importance resampled. All paths are run in parallel with
+    :func:`jax.vmap`.
+
+    The returned draws can be used to initialize MCMC chains, while the inverse
+    Hessian estimate can be used as the initial inverse mass matrix of HMC or NUTS,
+    which typically allows to substantially reduce the number of warmup steps.
+
+    **References:**
+
+    1. *Pathfinder: Parallel quasi-Newton variational inference*,
+       Lu Zhang, Bob Carpenter, Andrew Gelman, Aki Vehtari
+    2. *Representations of quasi-Newton matrices and their use in limited memory methods*,
+       Richard H. Byrd, Jorge Nocedal, Robert B. Schnabel
+
+    :param jax.random.PRNGKey rng_key: random key to be used as the source of randomness.
+    :param callable potential_fn: Python callable that computes the potential energy
+        given input parameters.
+    :param init_params: initial parameters for each path. This is a pytree whose
+        leaves have a leading dimension of size ``num_paths``.
+    :param int num_draws: number of approximate posterior draws returned.
+        Defaults to 1000.
+    :param int max_iters: number of L-BFGS iterations of each path. Defaults to 100.
+    :param int history_size: number of recent updates used in the L-BFGS inverse
+        Hessian estimate. Defaults to 6.
+    :param int num_elbo_draws: number of draws used to estimate the ELBO at each
+        iterate. Defaults to 10.
+    :param int max_line_search_steps: maximum number of step halvings in the
+        backtracking line search. Defaults to 20.
+    :param bool dense_mass: whether to return a dense or a diagonal inverse mass
+        matrix estimate. Defaults to False.
+    :return: a :data:`PathfinderState` namedtuple.
+
+    **Example**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import jax.numpy as jnp
+        >>> from numpyro.infer.pathfinder import pathfinder
+
+        >>> def potential_fn(x):
+        ...     return 0.5 * jnp.sum((x["a"] - 1.0) ** 2 / jnp.array([1.0, 4.0]))
+        >>> init_params = {"a": random.normal(random.PRNGKey(0), (4, 2))}
+        >>> state = pathfinder(random.PRNGKey(1), potential_fn, init_params)
+        >>> print(state.inverse_mass_matrix)  # doctest: +SKIP
+        [1. 4.]
+    """
+    init_flat = vmap(lambda p: ravel_pytree(p)[0])(init_params)
+    unravel_fn = ravel_pytree(jax.tree.map(lambda x: x[0], init_params))[1]
+    num_paths = init_flat.shape[0]
+
+    def flat_potential_fn(x):
+        return potential_fn(unravel_fn(x))
+
+    rng_key, rng_key_resample = random.split(rng_key)
+    run_path = lambda key, x0: _single_path(  # noqa: E731
+        key,
+        flat_potential_fn,
+        x0,
+        max_iters=max_iters,
+        history_size=history_size,
+        num_elbo_draws=num_elbo_draws,
+        num_draws=num_draws,
+        max_line_search_steps=max_line_search_steps,
+    )
+    draws, pe, log_q, elbo, approx = vmap(run_path)(
+        random.split(rng_key, num_paths), init_flat
+    )
+
+    # pool the draws from all paths and resample them using importance weights
+    draws = draws.reshape((-1, draws.shape[-1]))
+    pe = pe.reshape(-1)
+    log_weights = -pe - log_q.reshape(-1)
+    log_weights = jnp.where(jnp.isfinite(log_weights), log_weights, -jnp.inf)
+    idx = random.categorical(rng_key_resample, log_weights, shape=(num_draws,))
+    samples = vmap(unravel_fn)(draws[idx])
+
+    best_path = jnp.argmax(elbo)
+    approx = jax.tree.map(lambda x: x[best_path], approx)
+    inverse_mass_matrix = (
+        _approx_dense(approx) if dense_mass else _approx_diagonal(approx)
+    )
+    return PathfinderState(
+        samples, pe[idx], log_weights[idx], elbo, inverse_mass_matrix
+    )
+
+
+class Pathfinder:
+    """
+    (EXPERIMENTAL) Multi-path Pathfinder variational inference for NumPyro models.
+    See :func:`pathfinder` for details of the algorithm.
+
+    The approximate posterior draws and the inverse Hessian estimate can be used to
+    initialize :class:`~numpyro.infer.hmc.NUTS` or :class:`~numpyro.infer.hmc.HMC`,
+    which shortens the transient phase of the warmup.
+
+    :param callable model: a callable containing NumPyro primitives.
+    :param int num_paths: number of L-BFGS paths to run in parallel. Defaults to 4.
+    :param int num_draws: number of approximate posterior draws. Defaults to 1000.
+    :param int max_iters: number of L-BFGS iterations of each path. Defaults to 100.
+    :param int history_size: number of recent updates used in the L-BFGS inverse
+        Hessian estimate. Defaults to 6.
+    :param int num_elbo_draws: number of draws used to estimate the ELBO at each
+        iterate. Defaults to 10.
+    :param bool dense_mass: whether to estimate a dense or a diagonal inverse mass
+        matrix. Defaults to False.
+    :param callable init_strategy: a per-site initialization function used to
+        initialize the paths. See :ref:`init_strategy` section for available functions.
+
+    **Example**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import numpyro
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.infer import MCMC, NUTS
+        >>> from numpyro.infer.pathfinder import Pathfinder
+
+        >>> def model():
+        ...     numpyro.sample("x", dist.Normal(0, 1).expand([10]))
+        >>>
+        >>> pf = Pathfinder(model)
+        >>> pf.run(random.PRNGKey(0))
+        >>> kernel = NUTS(
+        ...     model,
+        ...     init_strategy=pf.get_init_strategy(),
+        ...     inverse_mass_matrix=pf.inverse_mass_matrix,
+        ... )
+        >>> mcmc = MCMC(
+        ...     kernel,
+        ...     num_warmup=100,
+        ...     num_samples=100,
+        ...     num_chains=2,
+        ...     chain_method="vectorized",
+        ...     progress_bar=False,
+        ... )
+        >>> mcmc.run(random.PRNGKey(1), init_params=pf.get_init_params(2))
+    """
+
+    def __init__(
+        self,
+        model,
+        *,
+        num_paths=4,
+        num_draws=1000,
+        max_iters=100,
+        history_size=6,
+        num_elbo_draws=10,
+        dense_mass=False,
+        init_strategy=init_to_uniform,
+    ):
+        self.model = model
+        self.num_paths = num_paths
+        self.num_draws = num_draws
+        self.max_iters = max_iters
+        self.history_size = history_size
+        self.num_elbo_draws = num_elbo_draws
+        self.dense_mass = dense_mass
+        self.init_strategy = init_strategy
+        self._postprocess_fn = None
+        self._state = None
+
+    def run(self, rng_key, *args, **kwargs):
+        """
+        Run Pathfinder on the model.
+
+        :param jax.random.PRNGKey rng_key: random key to be used as the source of randomness.
+        :param args: arguments to the model.
+        :param kwargs: keyword arguments to the model.
+        """
+        rng_key_init, rng_key_pf = random.split(rng_key)
+        model_info = initialize_model(
+            random.split(rng_key_init, self.num_paths),
+            self.model,
+            init_strategy=self.init_strategy,
+            model_args=args,
+            model_kwargs=kwargs,
+        )
+        self._postprocess_fn = model_info.postprocess_fn
+        self._state = pathfinder(
+            rng_key_pf,
+            model_info.potential_fn,
+            model_info.param_info.z,
+            num_draws=self.num_draws,
+            max_iters=self.max_iters,
+            history_size=self.history_size,
+            num_elbo_draws=self.num_elbo_draws,
+            dense_mass=self.dense_mass,
+        )
+
+    def _check_run(self):
+        if self._state is None:
+            raise RuntimeError(
+                "Pathfinder.run(...) method should be called first to obtain results."
+            )
+
+    @property
+    def state(self):
+        """
+        The :data:`PathfinderState` of the last run.
+        """
+        self._check_run()
+        return self._state
+
+    @property
+    def inverse_mass_matrix(self):
+        """
+        Inverse Hessian estimate in the unconstrained space, in the layout of
+        ``inverse_mass_matrix`` argument of :class:`~numpyro.infer.hmc.HMC`
+        (latent sites sorted by name).
+        """
+        self._check_run()
+        return self._state.inverse_mass_matrix
+
+    def get_samples(self):
+        """
+        Get approximate posterior draws in the constrained space, including values
+        of deterministic sites.
+
+        :return: a dict of posterior draws keyed by site names.
+        """
+        self._check_run()
+        return vmap(self._postprocess_fn)(self._state.samples)
+
+    def get_init_params(self, num_chains=1):
+        """
+        Get approximate posterior draws in the unconstrained space, which can be
+        used as ``init_params`` of :meth:`~numpyro.infer.mcmc.MCMC.run`.
+
+        :param int num_chains: number of chains to initialize.
+        :return: a dict of unconstrained initial values. If ``num_chains > 1``, the
+            values have a leading dimension of size ``num_chains``.
+        """
+        self._check_run()
+        if num_chains > self.num_draws:
+            raise ValueError("`num_chains` must not be larger than `num_draws`.")
+        if num_chains == 1:
+            return jax.tree.map(lambda x: x[0], self._state.samples)
+        return jax.tree.map(lambda x: x[:num_chains], self._state.samples)
+
+    def get_init_strategy(self):
+        """
+        Get an initialization strategy which initializes latent sites to an
+        approximate posterior draw.
+
+        :return: an :func:`~numpyro.infer.initialization.init_to_value` strategy.
+        """
+        samples = self.get_samples()
+        return init_to_value(values={k: v[0] for k, v in samples.items()})
@@ -2,22 +2,38 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections import namedtuple
+from contextlib import ExitStack
 from functools import partial
 import warnings
 
+import numpy as np
 import tqdm
 
 import jax
 from jax import jit, lax, random
 from jax.example_libraries import optimizers
 import jax.numpy as jnp
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
 
+import numpyro
+import numpyro.distributions as dist
 from numpyro.distributions import constraints
 from numpyro.distributions.transforms import biject_to
-from numpyro.handlers import replay, seed, substitute, trace
-from numpyro.infer.util import helpful_support_errors, transform_fn
+from numpyro.handlers import block, replay, seed, substitute, trace
+from numpyro.infer.util import (
+    _default_scan_remat,
+    helpful_support_errors,
+    log_density,
+    transform_fn,
+)
 from numpyro.optim import _NumPyroOptim, optax_to_numpyro
-from numpyro.util import find_stack_level
+from numpyro.primitives import mutable as numpyro_mutable
+from numpyro.util import (
+    _axis_sizes,
+    _run_checkpointed,
+    find_stack_level,
+    is_prng_key,
+)
 
 SVIState = namedtuple("SVIState", ["optim_state", "mutable_state", "rng_key"])
 """
@@ -28,12 +44,45 @@ A :func:`~collections.namedtuple` consisting of the following fields:
 """
 
 
-SVIRunResult = namedtuple("SVIRunResult", ["params", "state", "losses"])
+SVIRunResult = namedtuple(
+    "SVIRunResult",
+    ["params", "state", "losses", "converged", "num_steps"],
+    defaults=(None, None),
+)
 """
 A :func:`~collections.namedtuple` consisting of the following fields:
  - **params** - the optimized parameters.
  - **state** - the last :data:`SVIState`
  - **losses** - the losses collected at every step.
+ - **converged** - whether the run has met its :data:`EarlyStopping` criterion,
+   or None if no criterion is used.
+ - **num_steps** - the number of steps actually taken, or None if no
+   :data:`EarlyStopping` criterion is used.
+"""
+
+
+EarlyStopping = namedtuple(
+    "EarlyStopping",
+    ["window", "rtol", "grad_norm", "param_change"],
+    defaults=(100, 1e-4, None, None),
+)
+"""
+A :func:`~collections.namedtuple` describing when an SVI run has converged. The
+steps are split into consecutive windows and the criteria are checked at the end of
+each window; the run has converged once any of them is met. It consists of the
+following fields:
+ - **window** - the number of steps in a window, defaults to 100.
+ - **rtol** - converged once the mean loss over a window improves on the mean loss
+   over the previous window by less than `rtol` times its absolute value. Defaults
+   to 1e-4; None disables this criterion.
+ - **grad_norm** - converged once the norm of the gradient of the loss with respect
+   to the unconstrained parameters, evaluated at the end of a window, is less than
+   `grad_norm`. Note that the gradient is stochastic for most ELBO objectives, and
+   is evaluated on the first minibatch when :meth:`SVI.run` accumulates updates over
+   minibatches. Defaults to None, i.e. disabled.
+ - **param_change** - converged once the largest absolute change of the
+   unconstrained parameters over a window is less than `param_change`. Defaults to
+   None, i.e. disabled.
 """
 
 
@@ -67,6 +116,171 @@ def _make_loss_fn(
     return loss_fn
 
 
+def _take(in_axes, tree, index):
+    """
+    Takes the element `index` along the axes `in_axes` of the leaves of `tree`, where
+    `in_axes` is a prefix of `tree` as in :func:`jax.vmap`.
+    """
+
+    def take(axis, subtree):
+        if axis is None:
+            return subtree
+        return jax.tree.map(lambda x: jnp.take(x, index, axis), subtree)
+
+    return jax.tree.map(take, in_axes, tree, is_leaf=lambda x: x is None)
+
+
+def _is_converged(early_stopping, loss, prev_loss, params, prev_params, grad_norm_fn):
+    converged = jnp.array(False)
+    if early_stopping.rtol is not None:
+        # NB: this is False for the first window, where prev_loss is NaN
+        converged = converged | (
+            prev_loss - loss < early_stopping.rtol * jnp.abs(prev_loss)
+        )
+    if early_stopping.param_change is not None:
+        change = jnp.array(0.0)
+        for x, prev_x in zip(jax.tree.leaves(params), jax.tree.leaves(prev_params)):
+            change = jnp.maximum(change, jnp.max(jnp.abs(x - prev_x), initial=0.0))
+        converged = converged | (change < early_stopping.param_change)
+    if early_stopping.grad_norm is not None:
+        converged = converged | (grad_norm_fn() < early_stopping.grad_norm)
+    return converged
+
+
+# conjugate families of priors, which are also the families of their variational
+# distributions, and the number of event dimensions of a single variable
+_CONJUGATE_FAMILIES = {dist.Normal: 0, dist.Gamma: 0, dist.Dirichlet: 1}
+
+
+def _conjugate_family(fn):
+    while isinstance(fn, (dist.ExpandedDistribution, dist.Independent)):
+        fn = fn.base_dist
+    for family in _CONJUGATE_FAMILIES:
+        if isinstance(fn, family):
+            return family, fn
+    return None, fn
+
+
+def _conjugate_natural_params(family, params):
+    if family is dist.Normal:
+        precision = params["scale"] ** -2
+        return params["loc"] * precision, -0.5 * precision
+    elif family is dist.Gamma:
+        return params["concentration"] - 1, -params["rate"]
+    return (params["concentration"] - 1,)
+
+
+def _conjugate_params(family, natural_params):
+    if family is dist.Normal:
+        precision = -2 * natural_params[1]
+        return {"loc": natural_params[0] / precision, "scale": precision**-0.5}
+    elif family is dist.Gamma:
+        return {"concentration": natural_params[0] + 1, "rate": -natural_params[1]}
+    return {"concentration": natural_params[0] + 1}
+
+
+def _conjugate_target(family, log_joint, shape):
+    """
+    Returns the natural parameters of the variational distribution of a conjugate
+    site which maximizes the ELBO, given a log joint density of the site value that
+    is linear in its sufficient statistics `T(z)`, i.e. `eta @ T(z) + const`. The
+    coefficients `eta` are solved from the derivatives of the log joint density at
+    two points: `T(z) = (z, z ** 2)` for Normal, `(log(z), z)` for Gamma and
+    `log(z)` for Dirichlet distributions.
+    """
+    grad_fn = jax.grad(log_joint)
+    if family is dist.Normal:
+        grad_0 = grad_fn(jnp.zeros(shape))
+        grad_1 = grad_fn(jnp.ones(shape))
+        return grad_0, 0.5 * (grad_1 - grad_0)
+    elif family is dist.Gamma:
+        grad_1 = grad_fn(jnp.ones(shape))
+        grad_2 = grad_fn(jnp.full(shape, 2.0))
+        eta_log = 2 * (grad_1 - grad_2)
+        return eta_log, grad_1 - eta_log
+    value = jnp.full(shape, 1 / shape[-1])
+    return (value * grad_fn(value),)
+
+
+class _ConjugateGuide(object):
+    """
+    Runs `guide` and samples the conjugate sites of `model` from variational
+    distributions in the same family as their priors. The parameters of these
+    distributions are stored in `"{name}_conjugate"` mutable sites, and are
+    initialized to the parameters of the priors.
+    """
+
+    def __init__(self, model, guide, sites):
+        self.model = model
+        self.guide = guide
+        self.sites = sites
+        self.prototypes = None
+
+    def _setup_prototype(self, *args, **kwargs):
+        rng_key = numpyro.prng_key()
+        with block():
+            model_trace = trace(seed(self.model, rng_key)).get_trace(*args, **kwargs)
+        self.prototypes = {}
+        for name in self.sites:
+            site = model_trace.get(name)
+            if site is None or site["type"] != "sample" or site["is_observed"]:
+                raise ValueError(
+                    "Conjugate site '{}' is not a latent sample site of the "
+                    "model.".format(name)
+                )
+            family, prior = _conjugate_family(site["fn"])
+            if family is None:
+                raise ValueError(
+                    "Conjugate site '{}' has a {} prior, but only {} priors are "
+                    "supported.".format(
+                        name,
+                        type(prior).__name__,
+                        ", ".join(f.__name__ for f in _CONJUGATE_FAMILIES),
+                    )
+                )
+            for frame in site["cond_indep_stack"]:
+                if frame.size != model_trace[frame.name]["args"][0]:
+                    raise NotImplementedError(
+                        "Conjugate site '{}' in subsampled plate '{}' is not "
+                        "supported.".format(name, frame.name)
+                    )
+            shape = jnp.shape(site["value"])
+            if family is dist.Normal:
+                init_params = {"loc": prior.loc, "scale": prior.scale}
+            elif family is dist.Gamma:
+                init_params = {
+                    "concentration": prior.concentration,
+                    "rate": prior.rate,
+                }
+            else:
+                init_params = {"concentration": prior.concentration}
+            init_params = {
+                k: jnp.broadcast_to(v, shape).astype(jnp.result_type(float))
+                for k, v in init_params.items()
+            }
+            self.prototypes[name] = (
+                family,
+                site["fn"].event_dim - _CONJUGATE_FAMILIES[family],
+                site["cond_indep_stack"],
+                init_params,
+            )
+
+    def __call__(self, *args, **kwargs):
+        if self.prototypes is None:
+            self._setup_prototype(*args, **kwargs)
+
+        result = None if self.guide is None else self.guide(*args, **kwargs)
+        for name, (family, event_dim, frames, init_params) in self.prototypes.items():
+            params = numpyro_mutable("{}_conjugate".format(name), init_params)
+            with ExitStack() as stack:
+                for frame in frames:
+                    stack.enter_context(
+                        numpyro.plate(frame.name, frame.size, dim=frame.dim)
+                    )
+                numpyro.sample(name, family(**params).to_event(event_dim))
+        return result
+
+
 class SVI(object):
     """
     Stochastic Variational Inference given an ELBO loss objective.
@@ -126,17 +340,69 @@ class SVI(object):
             >>> svi = SVI(model, guide, chain(clip(10.0), adam(1e-3)), loss=Trace_ELBO())
 
     :param loss: ELBO loss, i.e. negative Evidence Lower Bound, to minimize.
+    :param list conjugate_sites: an optional list of names of latent sites of the
+        model with a Normal, Gamma or Dirichlet prior which is conjugate to the rest
+        of the model, i.e. the log joint density is linear in the sufficient
+        statistics of the site, e.g. the location of Normal observations with
+        known scale, the rate of Poisson observations, or the probabilities of
+        Categorical observations. These sites must not appear in `guide`, which may
+        be None if all the latent sites are conjugate. Instead, they are sampled
+        from variational distributions in the same family as their priors, whose
+        parameters are stored in `"{name}_conjugate"` entries of
+        :attr:`SVIState.mutable_state`. After each gradient step, these parameters
+        take a closed-form natural gradient step, i.e. a coordinate ascent step
+        when `conjugate_step_size` is 1, given a sample of the other sites from the
+        guide.
+    :param conjugate_step_size: the step size, or a schedule of the step index
+        returning the step size, of the natural gradient steps of the conjugate
+        sites, in `(0, 1]`. Defaults to 1. Smaller step sizes average out the noise
+        of the sampled values of the other sites, or of subsampled data.
+    :param remat: the default `remat` argument of the
+        :func:`~numpyro.contrib.control_flow.scan` primitives of the model, which
+        rematerializes the intermediate values of long scans when computing the
+        gradient of the loss to save memory. Scans with an explicit `remat`
+        argument, and scans in the guide, are not affected. Defaults to False.
+        See also the `remat` argument of :meth:`accumulated_update`, which
+        rematerializes the loss of each minibatch.
+    :type remat: bool or int
+    :param bool jit_model_args: whether the arguments to the model / guide are
+        arguments of the compiled loop of :meth:`run`, instead of constants. The
+        loop is then compiled once for all the arguments of the same shapes, e.g. for
+        new data padded to the same :class:`~numpyro.handlers.bucket` size, which
+        the runs of the same :class:`SVI` instance reuse. Not used with
+        `early_stopping` or `checkpoint`. Defaults to False.
     :param static_kwargs: static arguments for the model / guide, i.e. arguments
         that remain constant during fitting.
     :return: tuple of `(init_fn, update_fn, evaluate)`.
     """
 
-    def __init__(self, model, guide, optim, loss, **static_kwargs):
+    def __init__(
+        self,
+        model,
+        guide,
+        optim,
+        loss,
+        *,
+        conjugate_sites=None,
+        conjugate_step_size=1.0,
+        remat=False,
+        jit_model_args=False,
+        **static_kwargs,
+    ):
+        if remat:
+            model = _default_scan_remat(model, remat)
         self.model = model
         self.guide = guide
         self.loss = loss
         self.static_kwargs = static_kwargs
+        self.jit_model_args = jit_model_args
+        # compiled steps and loops of :meth:`run`, keyed by their options
+        self._cache = {}
         self.constrain_fn = None
+        self.conjugate_sites = conjugate_sites
+        if conjugate_sites:
+            self.guide = _ConjugateGuide(model, guide, conjugate_sites)
+            self.conjugate_step_size = optimizers.make_schedule(conjugate_step_size)
 
         if isinstance(optim, _NumPyroOptim):
             self.optim = optim
@@ -286,6 +552,10 @@ class SVI(object):
             svi_state.optim_state,
             forward_mode_differentiation=forward_mode_differentiation,
         )
+        if self.conjugate_sites:
+            mutable_state = self._conjugate_update(
+                svi_state, optim_state, mutable_state, rng_key_step, args, kwargs
+            )
         return SVIState(optim_state, mutable_state, rng_key), loss_val
 
     def stable_update(
@@ -321,8 +591,226 @@ class SVI(object):
             svi_state.optim_state,
             forward_mode_differentiation=forward_mode_differentiation,
         )
+        if self.conjugate_sites:
+            new_mutable_state = self._conjugate_update(
+                svi_state, optim_state, mutable_state, rng_key_step, args, kwargs
+            )
+            is_finite = jnp.isfinite(loss_val)
+            for x in jax.tree.leaves(new_mutable_state):
+                is_finite = is_finite & jnp.isfinite(x).all()
+            mutable_state = jax.tree.map(
+                lambda x, y: jnp.where(is_finite, x, y),
+                new_mutable_state,
+                svi_state.mutable_state,
+            )
         return SVIState(optim_state, mutable_state, rng_key), loss_val
 
+    def _conjugate_update(
+        self, svi_state, optim_state, mutable_state, rng_key, args, kwargs
+    ):
+        """
+        Takes a natural gradient step for the variational distributions of the
+        conjugate sites, given the parameters in `optim_state` and a sample of the
+        other latent sites from the guide.
+        """
+        kwargs = {**kwargs, **self.static_kwargs}
+        # NB: Trace_ELBO drops the mutable state when num_particles > 1
+        mutable_state = {**svi_state.mutable_state, **(mutable_state or {})}
+        guide_key, model_key = random.split(random.fold_in(rng_key, 1))
+        params = self.constrain_fn(self.optim.get_params(optim_state))
+        params.update(mutable_state)
+        guide_trace = trace(
+            substitute(seed(self.guide, guide_key), data=params)
+        ).get_trace(*args, **kwargs)
+        latents = {
+            name: site["value"]
+            for name, site in guide_trace.items()
+            if site["type"] == "sample" and not site["is_observed"]
+        }
+        model = seed(self.model, model_key)
+        step_size = self.conjugate_step_size(svi_state.optim_state[0])
+        for name, (family, *_) in self.guide.prototypes.items():
+
+            def log_joint(value):
+                data = {**params, **latents, name: value}
+                return log_density(model, args, kwargs, data)[0]
+
+            state_name = "{}_conjugate".format(name)
+            natural_params = _conjugate_natural_params(
+                family, mutable_state[state_name]
+            )
+            target = _conjugate_target(family, log_joint, jnp.shape(latents[name]))
+            natural_params = [
+                (1 - step_size) * x + step_size * y
+                for x, y in zip(natural_params, target)
+            ]
+            mutable_state[state_name] = _conjugate_params(family, natural_params)
+        return mutable_state
+
+    def accumulated_update(
+        self,
+        svi_state,
+        *args,
+        minibatch_axes=0,
+        stable_update=False,
+        forward_mode_differentiation=False,
+        remat=False,
+        **kwargs,
+    ):
+        """
+        Take a single step of SVI on a stack of `K` minibatches, using the optimizer.
+        The loss and its gradient are averaged over the minibatches, so the step uses
+        an effective batch `K` times larger than a minibatch. They are accumulated in
+        a :func:`jax.lax.scan` over the minibatches, so that the memory used by the
+        gradient computation is that of a single minibatch.
+
+        .. note:: The mutable state is updated from the state at the beginning of the
+            step for each minibatch, and the one of the last minibatch is kept.
+
+        :param svi_state: current state of SVI.
+        :param args: arguments to the model / guide, stacked along `minibatch_axes`.
+        :param minibatch_axes: the axis of the minibatches in the arguments to the
+            model / guide, with the same semantics as `in_axes` in :meth:`run_batched`.
+            Defaults to 0, i.e. the leading axis of all arguments.
+        :param bool stable_update: whether to keep the current state if the loss or
+            the new state contains invalid values, as in :meth:`stable_update`.
+            Defaults to False.
+        :param forward_mode_differentiation: boolean flag indicating whether to use forward mode differentiation.
+            Defaults to False.
+        :param bool remat: whether to rematerialize the intermediate values of the
+            model and guide in the backward pass with :func:`jax.checkpoint`, which
+            reduces the memory used for a minibatch at the cost of running them twice.
+            Defaults to False.
+        :param kwargs: keyword arguments to the model / guide, stacked along
+            `minibatch_axes`.
+        :return: tuple of `(svi_state, loss)`.
+        """
+        if self.conjugate_sites:
+            raise NotImplementedError(
+                "Accumulated updates are not supported with conjugate sites."
+            )
+        if not isinstance(minibatch_axes, tuple):
+            minibatch_axes = (minibatch_axes, minibatch_axes)
+        num_batches = _axis_sizes(minibatch_axes, (args, kwargs))
+        if len(num_batches) != 1:
+            raise ValueError(
+                "The arguments must have a unique number of minibatches along"
+                f" minibatch_axes, but got {num_batches}."
+            )
+        rng_key, rng_key_step = random.split(svi_state.rng_key)
+        (num_batches,) = num_batches
+
+        def loss_fn(params, batch):
+            rng_key, index = batch
+            batch_args, batch_kwargs = _take(minibatch_axes, (args, kwargs), index)
+            return _make_loss_fn(
+                self.loss,
+                rng_key,
+                self.constrain_fn,
+                self.model,
+                self.guide,
+                batch_args,
+                batch_kwargs,
+                self.static_kwargs,
+                mutable_state=svi_state.mutable_state,
+            )(params)
+
+        batches = (random.split(rng_key_step, num_batches), jnp.arange(num_batches))
+        (loss_val, mutable_state), optim_state = self.optim.eval_and_accumulated_update(
+            loss_fn,
+            batches,
+            svi_state.optim_state,
+            forward_mode_differentiation=forward_mode_differentiation,
+            remat=remat,
+            stable_update=stable_update,
+        )
+        return SVIState(optim_state, mutable_state, rng_key), loss_val
+
+    def _grad_norm(self, svi_state, args, kwargs, forward_mode_differentiation):
+        # we split to have the same seed as `update_fn` given an svi_state
+        _, rng_key_eval = random.split(svi_state.rng_key)
+        loss_fn = _make_loss_fn(
+            self.loss,
+            rng_key_eval,
+            self.constrain_fn,
+            self.model,
+            self.guide,
+            args,
+            kwargs,
+            self.static_kwargs,
+            mutable_state=svi_state.mutable_state,
+        )
+        grad_fn = jax.jacfwd if forward_mode_differentiation else jax.grad
+        grads = grad_fn(lambda params: loss_fn(params)[0])(
+            self.optim.get_params(svi_state.optim_state)
+        )
+        return jnp.sqrt(sum(jnp.sum(g**2) for g in jax.tree.leaves(grads)))
+
+    def _run_windows(self, body_fn, svi_state, num_steps, early_stopping, grad_norm_fn):
+        """
+        Runs `num_steps` steps of `body_fn` in a while loop over scans of
+        `early_stopping.window` steps, which stops once the convergence criterion is
+        met. The losses of the steps which are not taken are NaN.
+        """
+        window = early_stopping.window
+        num_windows, remainder = divmod(num_steps, window)
+        loss_dtype = jax.eval_shape(body_fn, svi_state, None)[1].dtype
+
+        def window_fn(i, svi_state, prev_loss, prev_params, losses, length):
+            svi_state, window_losses = lax.scan(body_fn, svi_state, None, length=length)
+            losses = lax.dynamic_update_slice_in_dim(
+                losses, window_losses, i * window, 0
+            )
+            # NB: losses can be NaN with stable_update
+            loss = jnp.nanmean(window_losses)
+            params = self.optim.get_params(svi_state.optim_state)
+            converged = _is_converged(
+                early_stopping,
+                loss,
+                prev_loss,
+                params,
+                prev_params,
+                lambda: grad_norm_fn(svi_state),
+            )
+            return svi_state, loss, params, losses, converged
+
+        def cond_fn(carry):
+            i, *_, converged = carry
+            return (i < num_windows) & ~converged
+
+        def loop_fn(carry):
+            i, svi_state, prev_loss, prev_params, losses, _ = carry
+            return (i + 1,) + window_fn(
+                i, svi_state, prev_loss, prev_params, losses, window
+            )
+
+        carry = (
+            jnp.array(0),
+            svi_state,
+            jnp.array(jnp.nan, dtype=loss_dtype),
+            self.optim.get_params(svi_state.optim_state),
+            jnp.full(num_steps, jnp.nan, dtype=loss_dtype),
+            jnp.array(False),
+        )
+        if num_windows > 0:
+            carry = lax.while_loop(cond_fn, loop_fn, carry)
+        i, svi_state, loss, params, losses, converged = carry
+        num_steps = i * window
+        if remainder:
+
+            def remainder_fn():
+                state, _, _, new_losses, new_converged = window_fn(
+                    i, svi_state, loss, params, losses, remainder
+                )
+                return state, new_losses, new_converged, num_steps + remainder
+
+            svi_state, losses, converged, num_steps = lax.cond(
+                converged,
+                lambda: (svi_state, losses, converged, num_steps),
+                remainder_fn,
+            )
+        return svi_state, losses, converged, num_steps
+
     def run(
         self,
         rng_key,
@@ -333,6 +821,11 @@ class SVI(object):
         forward_mode_differentiation=False,
         init_state=None,
         init_params=None,
+        early_stopping=None,
+        minibatch_axes=None,
+        remat=False,
+        checkpoint=None,
+        resume=False,
         **kwargs,
     ):
         """
@@ -340,10 +833,10 @@ class SVI(object):
         the optimized parameters and the stacked losses at every step. If `num_steps`
         is large, setting `progress_bar=False` can make the run faster.
 
-        .. note:: For a complex training process (e.g. the one requires early stopping,
-            epoch training, varying args/kwargs,...), we recommend to use the more
-            flexible methods :meth:`init`, :meth:`update`, :meth:`evaluate` to
-            customize your training procedure.
+        .. note:: For a complex training process (e.g. epoch training, varying
+            args/kwargs,...), we recommend to use the more flexible methods
+            :meth:`init`, :meth:`update`, :meth:`evaluate` to customize your training
+            procedure. Early stopping is supported with the `early_stopping` argument.
 
         :param jax.random.PRNGKey rng_key: random number generator seed.
         :param int num_steps: the number of optimization steps.
@@ -370,18 +863,61 @@ class SVI(object):
 
         :param dict init_params: if not None, initialize :class:`numpyro.param` sites with values from
             this dictionary instead of using ``init_value`` in :class:`numpyro.param` primitives.
+        :param EarlyStopping early_stopping: if not None, stop the run once this
+            convergence criterion is met, checked every `early_stopping.window` steps.
+            Without progress bar, the windows are run in a :func:`jax.lax.while_loop`
+            of :func:`jax.lax.scan`, so the run stays on device. Usage::
+
+                svi_result = svi.run(
+                    random.PRNGKey(0), 100_000, data, progress_bar=False,
+                    early_stopping=EarlyStopping(window=500, rtol=1e-4),
+                )
+                losses = svi_result.losses[:svi_result.num_steps]
+
+        :param minibatch_axes: if not None, the arguments to the model / guide are
+            stacks of minibatches along these axes, and each step is an
+            :meth:`accumulated_update` over all the minibatches. This gives a large
+            effective batch while the gradient computation only holds one minibatch
+            in memory. The semantics are those of `in_axes` in :meth:`run_batched`.
+            The SVI state is initialized with the first minibatch.
+        :param bool remat: whether to rematerialize the intermediate values of the
+            model and guide in the backward pass, see :meth:`accumulated_update`.
+            Only used with `minibatch_axes`.
+        :param ~numpyro.util.Checkpoint checkpoint: if not None, run the steps in
+            compiled segments of `checkpoint.every` steps and write a snapshot of the
+            SVI state (including the optimizer state and the random key) and of the
+            losses of each segment to `checkpoint.directory`. Not supported with
+            `early_stopping`.
+        :param bool resume: whether to continue from the snapshot in
+            `checkpoint.directory`, if any, instead of `init_state`. The resumed run
+            takes the same steps as an uninterrupted run. Defaults to False.
         :param kwargs: keyword arguments to the model / guide
         :return: a namedtuple with fields `params` and `losses` where `params`
             holds the optimized values at :class:`numpyro.param` sites,
-            and `losses` is the collected loss during the process.
+            and `losses` is the collected loss during the process. With
+            `early_stopping`, the fields `converged` and `num_steps` hold whether
+            the criterion is met and the number of steps taken, and the losses of
+            the steps which are not taken are NaN.
         :rtype: :data:`SVIRunResult`
         """
 
         if num_steps < 1:
             raise ValueError("num_steps must be a positive integer.")
+        if checkpoint is not None and early_stopping is not None:
+            raise ValueError("`checkpoint` is not supported with `early_stopping`.")
 
-        def body_fn(svi_state, _):
-            if stable_update:
+        def step_fn(svi_state, args, kwargs):
+            if minibatch_axes is not None:
+                svi_state, loss = self.accumulated_update(
+                    svi_state,
+                    *args,
+                    minibatch_axes=minibatch_axes,
+                    stable_update=stable_update,
+                    forward_mode_differentiation=forward_mode_differentiation,
+                    remat=remat,
+                    **kwargs,
+                )
+            elif stable_update:
                 svi_state, loss = self.stable_update(
                     svi_state,
                     *args,
@@ -397,16 +933,95 @@ class SVI(object):
                 )
             return svi_state, loss
 
+        def body_fn(svi_state, _):
+            return step_fn(svi_state, args, kwargs)
+
+        def cached_jit(fn, *options):
+            if not self.jit_model_args:
+                return jit(partial(fn, args=args, kwargs=kwargs))
+            # `fn` takes the arguments to the model / guide, so its compiled versions
+            # are reused by the runs with the same options
+            key = (fn.__name__, minibatch_axes, stable_update)
+            key += (forward_mode_differentiation, remat) + options
+            try:
+                fn = self._cache.setdefault(key, jit(fn))
+            # If unhashable `minibatch_axes` are provided, proceed without caching
+            except TypeError:
+                fn = jit(fn)
+            return partial(fn, args=args, kwargs=kwargs)
+
+        if minibatch_axes is None:
+            init_args, init_kwargs = args, kwargs
+        else:
+            if not isinstance(minibatch_axes, tuple):
+                minibatch_axes = (minibatch_axes, minibatch_axes)
+            init_args, init_kwargs = _take(minibatch_axes, (args, kwargs), 0)
         if init_state is None:
-            svi_state = self.init(rng_key, *args, init_params=init_params, **kwargs)
+            svi_state = self.init(
+                rng_key, *init_args, init_params=init_params, **init_kwargs
+            )
         else:
             svi_state = init_state
-        if progress_bar:
+
+        def grad_norm_fn(svi_state):
+            # NB: with minibatches, the gradient norm is that of the first minibatch
+            return self._grad_norm(
+                svi_state, init_args, init_kwargs, forward_mode_differentiation
+            )
+
+        converged = taken_steps = None
+        if checkpoint is not None:
+            segment_fns = {}
+
+            def segment_fn(svi_state, start, length):
+                if length not in segment_fns:
+                    segment_fns[length] = jit(
+                        lambda svi_state: lax.scan(
+                            body_fn, svi_state, None, length=length
+                        )
+                    )
+                svi_state, losses = segment_fns[length](svi_state)
+                return svi_state, jax.device_get(losses)
+
+            svi_state, losses = _run_checkpointed(
+                segment_fn,
+                svi_state,
+                num_steps,
+                checkpoint,
+                resume=resume,
+                meta={"num_steps": num_steps},
+                progbar=progress_bar,
+                diagnostics_fn=lambda _, losses: "avg. loss: {:.4f}".format(
+                    np.nanmean(losses)
+                ),
+            )
+            svi_state = jax.tree.map(jnp.asarray, svi_state)
+            losses = jnp.asarray(np.concatenate(losses))
+        elif progress_bar:
             losses = []
+            if early_stopping is not None:
+                window = early_stopping.window
+                prev_loss = float("nan")
+                prev_params = self.optim.get_params(svi_state.optim_state)
+
+                @jit
+                def converged_fn(svi_state, loss, prev_loss, prev_params):
+                    params = self.optim.get_params(svi_state.optim_state)
+                    converged = _is_converged(
+                        early_stopping,
+                        loss,
+                        prev_loss,
+                        params,
+                        prev_params,
+                        lambda: grad_norm_fn(svi_state),
+                    )
+                    return converged, params
+
+            step = cached_jit(step_fn)
             with tqdm.trange(1, num_steps + 1) as t:
                 batch = max(num_steps // 20, 1)
                 for i in t:
-                    svi_state, loss = jit(body_fn)(svi_state, None)
+                    svi_state, loss = step(svi_state)
                     losses.append(jax.device_get(loss))
                     if i % batch == 0:
                         if stable_update:
@@ -424,13 +1039,228 @@ class SVI(object):
                             ),
                             refresh=False,
                         )
+                    if early_stopping is not None and (
+                        i % window == 0 or i == num_steps
+                    ):
+                        window_losses = jnp.stack(losses[(i - 1) // window * window :])
+                        loss = jnp.nanmean(window_losses)
+                        converged, prev_params = converged_fn(
+                            svi_state, loss, prev_loss, prev_params
+                        )
+                        prev_loss = loss
+                        if converged:
+                            break
+            if early_stopping is not None:
+                taken_steps = len(losses)
+                losses.extend([float("nan")] * (num_steps - taken_steps))
             losses = jnp.stack(losses)
+        elif early_stopping is not None:
+            svi_state, losses, converged, taken_steps = self._run_windows(
+                body_fn, svi_state, num_steps, early_stopping, grad_norm_fn
+            )
+        elif self.jit_model_args:
+
+            def scan_fn(svi_state, args, kwargs):
+                return lax.scan(
+                    lambda svi_state, _: step_fn(svi_state, args, kwargs),
+                    svi_state,
+                    None,
+                    length=num_steps,
+                )
+
+            svi_state, losses = cached_jit(scan_fn, num_steps)(svi_state)
         else:
             svi_state, losses = lax.scan(body_fn, svi_state, None, length=num_steps)
 
         # XXX: we also return the last svi_state for further inspection of both
         # optimizer's state and mutable state.
-        return SVIRunResult(self.get_params(svi_state), svi_state, losses)
+        return SVIRunResult(
+            self.get_params(svi_state), svi_state, losses, converged, taken_steps
+        )
+
+    def run_batched(
+        self,
+        rng_key,
+        num_steps,
+        *args,
+        num_runs=None,
+        in_axes=None,
+        early_stopping=None,
+        devices=None,
+        stable_update=False,
+        forward_mode_differentiation=False,
+        init_state=None,
+        init_params=None,
+        **kwargs,
+    ):
+        """
+        (EXPERIMENTAL INTERFACE) Run a batch of independent SVI fits with `num_steps`
+        iterations each, in a single compiled program. The members of the batch can
+        differ by their data, their random number generator seeds (e.g. random
+        restarts) or their initial parameters. This is the vectorized counterpart of
+        calling :meth:`run` in a loop.
+
+        **Example:**
+
+        .. doctest::
+
+            >>> from jax import random
+            >>> import jax.numpy as jnp
+            >>> import numpyro
+            >>> import numpyro.distributions as dist
+            >>> from numpyro.infer import SVI, Trace_ELBO
+            >>> from numpyro.infer.autoguide import AutoNormal
+
+            >>> def model(y):
+            ...     loc = numpyro.sample("loc", dist.Normal(0, 10))
+            ...     with numpyro.plate("N", y.shape[-1]):
+            ...         numpyro.sample("obs", dist.Normal(loc, 1), obs=y)
+
+            >>> # fit 8 independent series with 50 observations each
+            >>> y = 3 * jnp.arange(8.0)[:, None] + random.normal(random.PRNGKey(0), (8, 50))
+            >>> svi = SVI(model, AutoNormal(model), numpyro.optim.Adam(0.1), Trace_ELBO())
+            >>> svi_result = svi.run_batched(random.PRNGKey(1), 2000, y, in_axes=0)
+            >>> svi_result.params["loc_auto_loc"].shape
+            (8,)
+            >>> svi_result.losses.shape
+            (8, 2000)
+
+        .. note:: The guide is set up with the arguments of the first member, so
+            the initial values of an autoguide are the same for all members unless
+            `init_params` is specified.
+
+        :param jax.random.PRNGKey rng_key: random number generator seed, which is
+            split into one seed per member, or an array of `num_runs` seeds.
+        :param int num_steps: the number of optimization steps.
+        :param args: arguments to the model / guide, batched according to `in_axes`.
+        :param int num_runs: the number of members of the batch. It only needs to be
+            specified if it cannot be inferred from `rng_key`, `init_state`,
+            `init_params` or the batched arguments, e.g. for random restarts.
+        :param in_axes: the axis of the batch in the arguments to the model / guide,
+            with the same semantics as in :func:`jax.vmap`. This is a prefix of the
+            tuple `(args, kwargs)`, e.g. `0` for a batch of datasets in all arguments,
+            `((0, None), {})` for a batch in the first positional argument only, or
+            `None` (default) for the same arguments in all members.
+        :param EarlyStopping early_stopping: if not None, the convergence criterion of
+            each member. Once a member has converged, its state is frozen and its
+            losses are NaN for the remaining steps. The run stops once all members
+            have converged; until then, the steps of the converged members are still
+            computed and discarded.
+        :param devices: sequence of devices, e.g. :func:`jax.local_devices`, over which
+            the batch is sharded. The number of members must be divisible by the
+            number of devices. Default is `None`, meaning no sharding.
+        :param bool stable_update: whether to use :meth:`stable_update` to update
+            the state. Defaults to False.
+        :param bool forward_mode_differentiation: whether to use forward-mode
+            differentiation, see :meth:`run`.
+        :param SVIState init_state: if not None, the stacked final states of a
+            previous batched run to continue from.
+        :param dict init_params: if not None, initialize :class:`numpyro.param` sites
+            with values from this dictionary, whose values have a leading batch
+            dimension, instead of using ``init_value`` in :class:`numpyro.param`
+            primitives.
+        :param kwargs: keyword arguments to the model / guide, batched according to
+            `in_axes`.
+        :return: a namedtuple whose fields have a leading batch dimension, as
+            returned by :meth:`run`; `losses` has shape `(num_runs, num_steps)`.
+        :rtype: :data:`SVIRunResult`
+        """
+        if num_steps < 1:
+            raise ValueError("num_steps must be a positive integer.")
+
+        if not isinstance(in_axes, tuple):
+            in_axes = (in_axes, in_axes)
+        batch_sizes = _axis_sizes(in_axes, (args, kwargs))
+        if not is_prng_key(rng_key):
+            batch_sizes.add(len(rng_key))
+        batch_sizes |= _axis_sizes(0, (init_state, init_params))
+        if num_runs is not None:
+            batch_sizes.add(num_runs)
+        if not batch_sizes:
+            raise ValueError(
+                "num_runs must be specified when neither rng_key, init_state,"
+                " init_params nor the arguments are batched."
+            )
+        if len(batch_sizes) != 1:
+            raise ValueError(
+                "Cannot infer a unique number of runs from num_runs, rng_key,"
+                f" init_state, init_params and the batched arguments: {batch_sizes}."
+            )
+        (num_runs,) = batch_sizes
+        if is_prng_key(rng_key):
+            rng_key = random.split(rng_key, num_runs)
+
+        if devices is not None:
+            if num_runs % len(devices) != 0:
+                raise ValueError(
+                    f"The number of runs ({num_runs}) must be divisible by the"
+                    f" number of devices ({len(devices)})."
+                )
+            mesh = Mesh(np.asarray(devices), ("runs",))
+
+            def shard(axis, tree):
+                spec = (
+                    PartitionSpec()
+                    if axis is None
+                    else PartitionSpec(*([None] * axis), "runs")
+                )
+                return jax.device_put(tree, NamedSharding(mesh, spec))
+
+            rng_key, init_state, init_params = shard(
+                0, (rng_key, init_state, init_params)
+            )
+            args, kwargs = jax.tree.map(
+                shard, in_axes, (args, kwargs), is_leaf=lambda x: x is None
+            )
+
+        # Initialize eagerly with the first member, so that the side effects of
+        # init, e.g. `self.constrain_fn` or the prototype trace of an autoguide,
+        # do not hold batched tracers.
+        first_args, first_kwargs = _take(in_axes, (args, kwargs), 0)
+        self.init(
+            rng_key[0],
+            *first_args,
+            init_params=_take(0, init_params, 0),
+            **first_kwargs,
+        )
+
+        update_fn = self.stable_update if stable_update else self.update
+
+        def run_fn(rng_key, init_state, init_params, args, kwargs):
+            if init_state is None:
+                svi_state = self.init(rng_key, *args, init_params=init_params, **kwargs)
+            else:
+                svi_state = init_state
+
+            def body_fn(svi_state, _):
+                return update_fn(
+                    svi_state,
+                    *args,
+                    forward_mode_differentiation=forward_mode_differentiation,
+                    **kwargs,
+                )
+
+            def grad_norm_fn(svi_state):
+                return self._grad_norm(
+                    svi_state, args, kwargs, forward_mode_differentiation
+                )
+
+            if early_stopping is None:
+                svi_state, losses = lax.scan(body_fn, svi_state, None, length=num_steps)
+                converged = taken_steps = None
+            else:
+                svi_state, losses, converged, taken_steps = self._run_windows(
+                    body_fn, svi_state, num_steps, early_stopping, grad_norm_fn
+                )
+            return SVIRunResult(
+                self.get_params(svi_state), svi_state, losses, converged, taken_steps
+            )
+
+        state_axis = None if init_state is None else 0
+        params_axis = None if init_params is None else 0
+        return jit(jax.vmap(run_fn, in_axes=(0, state_axis, params_axis, *in_axes)))(
+            rng_key, init_state, init_params, args, kwargs
+        )
 
     def evaluate(self, svi_state, *args, **kwargs):
         """
@@ -455,3 +1285,8 @@ class SVI(object):
             **kwargs,
             **self.static_kwargs,
         )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
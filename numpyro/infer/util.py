@@ -4,6 +4,7 @@
 from collections import namedtuple
 from collections.abc import Sequence
 from contextlib import contextmanager
+import copy
 from functools import partial
 from typing import Callable, Optional
 import warnings
@@ -25,6 +26,9 @@ from numpyro.handlers import condition, replay, seed, substitute, trace
 from numpyro.infer.initialization import init_to_uniform, init_to_value
 from numpyro.primitives import Messenger
 from numpyro.util import (
+    _axis_sizes,
+    _bucket_size,
+    _resize_batch,
     _validate_model,
     find_stack_level,
     is_prng_key,
@@ -40,6 +44,7 @@ __all__ = [
     "log_likelihood",
     "potential_energy",
     "initialize_model",
+    "CompiledPredictive",
     "Predictive",
 ]
 
@@ -55,6 +60,21 @@ class _substitute_default_key(Messenger):
             msg["value"] = random.PRNGKey(0)
 
 
+class _default_scan_remat(Messenger):
+    """
+    Sets the `remat` argument of :func:`~numpyro.contrib.control_flow.scan`
+    primitives which do not specify it.
+    """
+
+    def __init__(self, fn=None, remat=False):
+        self.remat = remat
+        super().__init__(fn)
+
+    def process_message(self, msg):
+        if msg["type"] == "control_flow" and msg["kwargs"].get("remat", False) is None:
+            msg["kwargs"]["remat"] = self.remat
+
+
 def compute_log_probs(
     model,
     model_args: tuple,
@@ -1091,6 +1111,182 @@ class Predictive(object):
             raise NotImplementedError
 
 
+def _predict(predictive, rng_key, params, posterior_samples, args, kwargs):
+    predictive = copy.copy(predictive)
+    predictive.params = params
+    predictive.posterior_samples = posterior_samples
+    return Predictive.__call__(predictive, rng_key, *args, **kwargs)
+
+
+class CompiledPredictive(Predictive):
+    """
+    A :class:`Predictive` compiled for repeated predictions on new batches of data,
+    e.g. to score requests online with a trained model and (amortized) guide.
+
+    The `params` and `posterior_samples` are moved to the device once and passed as
+    arguments to a compiled function of the model, guide and predictive sampling.
+    The batch of data points along `in_axes` of the arguments is padded to a bucket
+    size, by repeating its last data point, and the outputs are sliced back to the
+    size of the batch on host. Hence the function is compiled once per bucket size,
+    and batches of any size in a bucket reuse the compiled function.
+
+    The data points of a batch must be independent given the other arguments and the
+    global latent variables, e.g. the guide must not pool over the data points,
+    otherwise the padded data points change the predictions of the batch.
+
+    :param model: Python callable containing Pyro primitives.
+    :param dict posterior_samples: dictionary of samples from the posterior.
+    :param in_axes: the axis of the batch in the arguments to the model / guide,
+        with the same semantics as in :func:`jax.vmap`. This is a prefix of the tuple
+        `(args, kwargs)`, e.g. `0` (default) for a batch along the leading axis of all
+        arguments, or `((0, None), {})` for a batch in the first positional argument
+        only. Non-array arguments are static and compiled into the function.
+    :param batch_sizes: the sizes of the buckets, i.e. the sizes to which batches
+        are padded. Batches larger than the largest size are rejected. If None
+        (default), batches are padded to the next power of two.
+    :type batch_sizes: list of int
+    :param kwargs: other keyword arguments of :class:`Predictive`, e.g. `guide`,
+        `params`, `num_samples` or `return_sites`.
+
+    :return: dict of samples from the predictive distribution, as NumPy arrays.
+
+    **Example:**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import jax.numpy as jnp
+        >>> import numpyro
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.infer.util import CompiledPredictive
+
+        >>> def model(x, y=None):
+        ...     w = numpyro.sample("w", dist.Normal(0, 1))
+        ...     with numpyro.plate("N", x.shape[0]):
+        ...         numpyro.sample("y", dist.Normal(w * x, 1), obs=y)
+
+        >>> def guide(x, y=None):
+        ...     loc = numpyro.param("loc", 0.0)
+        ...     numpyro.sample("w", dist.Normal(loc, 0.1))
+
+        >>> predictive = CompiledPredictive(
+        ...     model, guide=guide, params={"loc": 1.0}, num_samples=100,
+        ...     batch_sizes=[8, 64],
+        ... )
+        >>> # both batches reuse the function compiled for batches of 8
+        >>> predictive(random.PRNGKey(0), jnp.ones(3))["y"].shape
+        (100, 3)
+        >>> predictive(random.PRNGKey(1), jnp.ones(5))["y"].shape
+        (100, 5)
+    """
+
+    def __init__(
+        self,
+        model: Callable,
+        posterior_samples: Optional[dict] = None,
+        *,
+        in_axes=0,
+        batch_sizes: Optional[Sequence[int]] = None,
+        **kwargs,
+    ):
+        super().__init__(model, posterior_samples, **kwargs)
+        if batch_sizes is not None:
+            batch_sizes = sorted(batch_sizes)
+            if batch_sizes[0] < 1:
+                raise ValueError("Batch sizes must be positive integers.")
+        self.in_axes = in_axes if isinstance(in_axes, tuple) else (in_axes, in_axes)
+        self.batch_sizes = batch_sizes
+        self.params = jax.device_put(self.params)
+        self.posterior_samples = jax.device_put(self.posterior_samples)
+        # compiled functions and batch axes of the outputs, keyed by static arguments
+        self._compiled = {}
+
+    def _get_compiled(self, rng_key, args, kwargs, batch_size):
+        leaves, treedef = jax.tree.flatten((args, kwargs))
+        is_array = [isinstance(x, (np.ndarray, jax.Array)) for x in leaves]
+        static = tuple(None if a else x for a, x in zip(is_array, leaves))
+        key = (treedef, tuple(is_array), static)
+        if key not in self._compiled:
+
+            def predict(rng_key, params, posterior_samples, arrays):
+                arrays = iter(arrays)
+                leaves = [next(arrays) if a else x for a, x in zip(is_array, static)]
+                args, kwargs = jax.tree.unflatten(treedef, leaves)
+                return _predict(self, rng_key, params, posterior_samples, args, kwargs)
+
+            predict = jax.jit(predict)
+
+            def output_shapes(size):
+                args_, kwargs_ = _resize_batch(self.in_axes, (args, kwargs), size)
+                leaves_ = jax.tree.leaves((args_, kwargs_))
+                arrays = [x for a, x in zip(is_array, leaves_) if a]
+                return jax.eval_shape(
+                    predict, rng_key, self.params, self.posterior_samples, arrays
+                )
+
+            # the batch axes of the outputs are those which change with the batch size
+            shapes, next_shapes = (
+                output_shapes(batch_size),
+                output_shapes(batch_size + 1),
+            )
+            batch_axes = jax.tree.map(
+                lambda x, y: tuple(
+                    i for i, (m, n) in enumerate(zip(x.shape, y.shape)) if m != n
+                ),
+                shapes,
+                next_shapes,
+            )
+            self._compiled[key] = predict, batch_axes, is_array
+        return self._compiled[key]
+
+    def __call__(self, rng_key, *args, **kwargs):
+        """
+        Returns dict of samples from the predictive distribution for a batch of data.
+
+        :param jax.random.PRNGKey rng_key: random key to draw samples.
+        :param args: model arguments, batched along `in_axes`.
+        :param kwargs: model kwargs, batched along `in_axes`.
+        """
+        sizes = _axis_sizes(self.in_axes, (args, kwargs))
+        if len(sizes) != 1:
+            raise ValueError(
+                "Expected a single batch size along `in_axes`, but got {}.".format(
+                    sizes or "none"
+                )
+            )
+        size = sizes.pop()
+        batch_size = _bucket_size(size, self.batch_sizes)
+        predict, batch_axes, is_array = self._get_compiled(
+            rng_key, args, kwargs, batch_size
+        )
+        args, kwargs = _resize_batch(self.in_axes, (args, kwargs), batch_size)
+        leaves = jax.tree.leaves((args, kwargs))
+        arrays = [x for a, x in zip(is_array, leaves) if a]
+        samples = device_get(
+            predict(rng_key, self.params, self.posterior_samples, arrays)
+        )
+        return jax.tree.map(
+            lambda x, axes: x[
+                tuple(slice(size) if i in axes else slice(None) for i in range(x.ndim))
+            ],
+            samples,
+            batch_axes,
+        )
+
+    def warmup(self, rng_key, *args, **kwargs):
+        """
+        Compiles the function for each of `batch_sizes`, or for the bucket size of
+        the batch if `batch_sizes` is None, so that no compilation happens when
+        serving. The arguments are those of :meth:`__call__`; the batch is resized to
+        each bucket size.
+        """
+        (size,) = _axis_sizes(self.in_axes, (args, kwargs))
+        batch_sizes = self.batch_sizes or [_bucket_size(size)]
+        for batch_size in batch_sizes:
+            args_, kwargs_ = _resize_batch(self.in_axes, (args, kwargs), batch_size)
+            self(rng_key, *args_, **kwargs_)
+
+
 def log_likelihood(
     model, posterior_samples, *args, parallel=False, batch_ndims=1, **kwargs
 ):
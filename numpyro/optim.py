@@ -9,7 +9,7 @@ suited for working with NumPyro inference algorithms.
 
 from collections import namedtuple
 from collections.abc import Callable
-from typing import Any, Optional, Protocol
+from typing import Any, Optional, Protocol, Union
 
 import jax
 from jax import jacfwd, lax, value_and_grad
@@ -24,8 +24,10 @@ __all__ = [
     "Adam",
     "Adagrad",
     "ClippedAdam",
+    "LBFGS",
     "Minimize",
     "Momentum",
+    "NaturalGradient",
     "RMSProp",
     "RMSPropMomentum",
     "SGD",
@@ -50,6 +52,40 @@ def _value_and_grad(f, x, forward_mode_differentiation=False) -> tuple:
         return value_and_grad(f, has_aux=True)(x)
 
 
+def _accumulate_value_and_grad(
+    f, x, batches, forward_mode_differentiation=False, remat=False
+) -> tuple:
+    """
+    Computes the mean over a stack of minibatches of the values and gradients of
+    `f(x, batch)`. They are accumulated in a scan, so that only one minibatch is
+    differentiated at a time. The auxiliary output of the last minibatch is returned.
+    """
+    if remat:
+        f = jax.checkpoint(f)
+    first_batch = jax.tree.map(lambda b: b[0], batches)
+    out_shape = jax.eval_shape(lambda x: f(x, first_batch)[0], x)
+
+    def body_fn(carry, batch):
+        out_sum, grads_sum = carry
+        (out, aux), grads = _value_and_grad(
+            lambda x: f(x, batch),
+            x,
+            forward_mode_differentiation=forward_mode_differentiation,
+        )
+        grads_sum = jax.tree.map(jnp.add, grads_sum, grads)
+        return (out_sum + out, grads_sum), aux
+
+    carry = (
+        jnp.zeros(out_shape.shape, out_shape.dtype),
+        jax.tree.map(jnp.zeros_like, x),
+    )
+    (out, grads), aux = lax.scan(body_fn, carry, batches)
+    num_batches = jax.tree.leaves(batches)[0].shape[0]
+    out = out / num_batches
+    grads = jax.tree.map(lambda g: g / num_batches, grads)
+    return (out, jax.tree.map(lambda a: a[-1], aux)), grads
+
+
 class UpdateExtraArgsFn(Protocol):
     """An update function accepting additional keyword arguments."""
 
@@ -157,6 +193,57 @@ class _NumPyroOptim(object):
         )
         return (out, aux), state
 
+    def eval_and_accumulated_update(
+        self,
+        fn: Callable[[Any, Any], tuple],
+        batches: Any,
+        state: _IterOptState,
+        forward_mode_differentiation: bool = False,
+        remat: bool = False,
+        stable_update: bool = False,
+    ) -> tuple[tuple[Any, Any], _IterOptState]:
+        """
+        Performs a single optimization step for the mean of the objective function
+        `fn` over a stack of minibatches. The values and gradients of `fn` are
+        accumulated in a :func:`jax.lax.scan` over the minibatches, so that the
+        memory used by the gradient computation is that of a single minibatch.
+
+        :param fn: an objective function of the parameters and a minibatch, returning
+            a pair where the first item is a scalar loss function to be differentiated
+            and the second item is an auxiliary output.
+        :param batches: a pytree whose leaves have a leading dimension of size `K`,
+            the number of minibatches.
+        :param state: current optimizer state.
+        :param forward_mode_differentiation: boolean flag indicating whether to use forward mode differentiation.
+        :param remat: boolean flag indicating whether to rematerialize the
+            intermediate values of `fn` in the backward pass with
+            :func:`jax.checkpoint`, which saves memory at the cost of computing `fn`
+            twice.
+        :param stable_update: boolean flag indicating whether to keep the input
+            `state` when the mean value or gradients are not finite, as in
+            :meth:`eval_and_stable_update`.
+        :return: a pair of the mean output of the objective function, with the
+            auxiliary output of the last minibatch, and the new optimizer state.
+        """
+        params: _Params = self.get_params(state)
+        (out, aux), grads = _accumulate_value_and_grad(
+            fn,
+            params,
+            batches,
+            forward_mode_differentiation=forward_mode_differentiation,
+            remat=remat,
+        )
+        if stable_update:
+            out, state = lax.cond(
+                jnp.isfinite(out) & jnp.isfinite(ravel_pytree(grads)[0]).all(),
+                lambda _: (out, self.update(grads, state, value=out)),
+                lambda _: (jnp.nan, state),
+                None,
+            )
+        else:
+            state = self.update(grads, state, value=out)
+        return (out, aux), state
+
     def get_params(self, state: _IterOptState) -> _Params:
         """
         Get current parameter values.
@@ -249,6 +336,243 @@ class SM3(_NumPyroOptim):
         super(SM3, self).__init__(optimizers.sm3, *args, **kwargs)
 
 
+class _LBFGSState(
+    namedtuple(
+        "_LBFGSState",
+        ["flat_params", "prev_params", "prev_grad", "s", "y", "rho", "unravel_fn"],
+    )
+):
+    flat_params: ArrayLike
+    prev_params: ArrayLike
+    prev_grad: ArrayLike
+    s: ArrayLike
+    y: ArrayLike
+    rho: ArrayLike
+    unravel_fn: Callable[[ArrayLike], _Params]
+
+
+register_pytree_node(
+    _LBFGSState,
+    lambda state: (tuple(state[:-1]), (state.unravel_fn,)),
+    lambda data, xs: _LBFGSState(*xs, data[0]),
+)
+
+
+def _lbfgs_direction(grad, s, y, rho):
+    """
+    Computes the L-BFGS approximation of `-H^{-1} @ grad` with the two-loop recursion,
+    where the curvature pairs `(s, y)` are ordered from the newest to the oldest and
+    empty slots have `rho = 0`.
+    """
+
+    def first_loop(q, pair):
+        s_i, y_i, rho_i = pair
+        alpha = rho_i * jnp.dot(s_i, q)
+        return q - alpha * y_i, alpha
+
+    def second_loop(r, pair):
+        s_i, y_i, rho_i, alpha = pair
+        beta = rho_i * jnp.dot(y_i, r)
+        return r + (alpha - beta) * s_i, None
+
+    q, alpha = lax.scan(first_loop, grad, (s, y, rho))
+    # scale the initial Hessian approximation by the newest curvature pair, or take
+    # a step of unit norm when there is no curvature pair yet
+    yy = jnp.dot(y[0], y[0])
+    grad_norm = jnp.linalg.norm(grad)
+    gamma = jnp.where(
+        rho[0] > 0,
+        jnp.dot(s[0], y[0]) / jnp.where(yy > 0, yy, 1),
+        1 / jnp.where(grad_norm > 0, grad_norm, 1),
+    )
+    r, _ = lax.scan(second_loop, gamma * q, (s, y, rho, alpha), reverse=True)
+    return -r
+
+
+def _lbfgs(
+    step_size: Union[float, Callable[[ArrayLike], ArrayLike]],
+    history_size: int,
+    curvature_eps: float,
+    max_step_norm: Optional[float],
+) -> tuple[
+    Callable[[_Params], _LBFGSState],
+    Callable[[ArrayLike, _Params, _LBFGSState], _LBFGSState],
+    Callable[[_LBFGSState], _Params],
+]:
+    step_size = optimizers.make_schedule(step_size)
+
+    def init_fn(params: _Params) -> _LBFGSState:
+        flat_params, unravel_fn = ravel_pytree(params)
+        history = jnp.zeros((history_size,) + flat_params.shape, flat_params.dtype)
+        return _LBFGSState(
+            flat_params,
+            flat_params,
+            jnp.zeros_like(flat_params),
+            history,
+            history,
+            jnp.zeros(history_size, flat_params.dtype),
+            unravel_fn,
+        )
+
+    def update_fn(
+        i: ArrayLike, grad_tree: _Params, opt_state: _LBFGSState
+    ) -> _LBFGSState:
+        x, prev_x, prev_g, s, y, rho, unravel_fn = opt_state
+        g = ravel_pytree(grad_tree)[0]
+
+        # Only keep the new curvature pair if it satisfies the curvature condition
+        # with a margin: with stochastic gradients, `s @ y` can be small or negative
+        # and the pair would make the inverse Hessian approximation indefinite.
+        s_new, y_new = x - prev_x, g - prev_g
+        sy = jnp.dot(s_new, y_new)
+        accept = (i > 0) & (
+            sy > curvature_eps * jnp.linalg.norm(s_new) * jnp.linalg.norm(y_new)
+        )
+        s = jnp.where(accept, jnp.concatenate([s_new[None], s[:-1]]), s)
+        y = jnp.where(accept, jnp.concatenate([y_new[None], y[:-1]]), y)
+        rho_new = 1 / jnp.where(accept, sy, 1)
+        rho = jnp.where(accept, jnp.concatenate([rho_new[None], rho[:-1]]), rho)
+
+        direction = _lbfgs_direction(g, s, y, rho)
+        # fall back to the steepest descent direction if the approximation is not
+        # a descent direction
+        is_descent = (jnp.dot(direction, g) < 0) & jnp.isfinite(direction).all()
+        direction = jnp.where(is_descent, direction, -g)
+        step = step_size(i) * direction
+        if max_step_norm is not None:
+            step_norm = jnp.linalg.norm(step)
+            step = step * jnp.minimum(
+                1, max_step_norm / jnp.where(step_norm > 0, step_norm, 1)
+            )
+        return _LBFGSState(x + step, x, g, s, y, rho, unravel_fn)
+
+    def get_params(opt_state: _LBFGSState) -> _Params:
+        return opt_state.unravel_fn(opt_state.flat_params)
+
+    return init_fn, update_fn, get_params
+
+
+class LBFGS(_NumPyroOptim):
+    """
+    Limited-memory BFGS optimizer which performs a single quasi-Newton step per
+    update, so that it can be used as any other optimizer in
+    :meth:`~numpyro.infer.svi.SVI.update` or in the compiled loop of
+    :meth:`~numpyro.infer.svi.SVI.run`.
+
+    The inverse Hessian is approximated from the last `history_size` pairs of
+    parameter and gradient differences between consecutive steps. No line search
+    is performed, instead the step is scaled by `step_size`, and the first step,
+    taken before any curvature pair is available, has unit norm. To be robust to
+    stochastic gradients, e.g. of the ELBO, a new pair is discarded when it does not
+    satisfy the curvature condition `s @ y > curvature_eps * |s| * |y|`, the
+    steepest descent direction is used when the quasi-Newton direction is not a
+    descent direction, and the norm of each step can be clipped by `max_step_norm`.
+
+    .. note:: Unlike :class:`Minimize`, this optimizer only requires gradients, which
+        makes it usable with stochastic objectives. With deterministic objectives
+        such as MAP estimation with :class:`~numpyro.infer.autoguide.AutoDelta`,
+        it usually converges in much fewer steps than first order optimizers.
+
+    :param step_size: a positive scalar or a schedule of the step index returning
+        the step size. Defaults to 1.
+    :param int history_size: number of curvature pairs kept to approximate the
+        inverse Hessian. Defaults to 10.
+    :param float curvature_eps: the curvature pairs whose cosine between `s` and
+        `y` is not larger than this value are discarded. Defaults to 1e-8.
+    :param float max_step_norm: if not None, the maximum Euclidean norm of a step.
+
+    **Reference:**
+
+    1. *Updating Quasi-Newton Matrices with Limited Storage*, Jorge Nocedal
+    2. *A Stochastic Quasi-Newton Method for Online Convex Optimization*,
+       Nicol N. Schraudolph, Jin Yu, Simon Günter
+    """
+
+    def __init__(
+        self,
+        step_size: Union[float, Callable[[ArrayLike], ArrayLike]] = 1.0,
+        history_size: int = 10,
+        curvature_eps: float = 1e-8,
+        max_step_norm: Optional[float] = None,
+    ) -> None:
+        super().__init__(_lbfgs, step_size, history_size, curvature_eps, max_step_norm)
+
+
+class NaturalGradient(_NumPyroOptim):
+    """
+    Wraps an optimizer so that the gradients of the guide parameters are
+    preconditioned by the inverse Fisher information matrix of the guide
+    distribution before being passed to the wrapped optimizer. The natural gradients
+    are computed by the ``natural_gradient`` method of the guide, e.g.
+    :meth:`~numpyro.infer.autoguide.AutoNormal.natural_gradient`,
+    :meth:`~numpyro.infer.autoguide.AutoMultivariateNormal.natural_gradient`, or
+    :meth:`~numpyro.infer.autoguide.AutoLowRankMultivariateNormal.natural_gradient`.
+    The gradients of the other parameters, e.g. of the model, are not changed.
+
+    .. note:: Natural gradients are scaled by the covariance of the guide, so that
+        steps along the directions where the posterior is narrower than the guide
+        can be large, in particular with Monte Carlo estimates of the gradients.
+        Small step sizes or a gradient clipping transformation such as
+        ``optax.clip_by_global_norm`` in the wrapped optimizer help to keep the
+        updates stable.
+
+    **Example:**
+
+    .. doctest::
+
+        >>> from jax import random
+        >>> import numpyro
+        >>> import numpyro.distributions as dist
+        >>> from numpyro.infer import SVI, Trace_ELBO
+        >>> from numpyro.infer.autoguide import AutoMultivariateNormal
+        >>> from numpyro.optim import NaturalGradient, SGD
+
+        >>> def model():
+        ...     numpyro.sample("x", dist.Normal(0, 1).expand([3]).to_event())
+
+        >>> guide = AutoMultivariateNormal(model)
+        >>> optim = NaturalGradient(guide, SGD(0.1))
+        >>> svi = SVI(model, guide, optim, Trace_ELBO())
+        >>> svi_result = svi.run(random.PRNGKey(0), 1000, progress_bar=False)
+
+    :param guide: a guide implementing the ``natural_gradient`` method.
+    :param optim: the optimizer applied to the natural gradients, either an instance
+        of :class:`~numpyro.optim._NumPyroOptim` or an Optax
+        ``GradientTransformation``.
+
+    **Reference:**
+
+    1. *Natural Gradient Works Efficiently in Learning*, Shun-ichi Amari
+    2. *Fast and Simple Natural-Gradient Variational Inference with Mixture of
+       Exponential-family Approximations*, Wu Lin, Mohammad Emtiyaz Khan,
+       Mark Schmidt
+    """
+
+    def __init__(self, guide, optim) -> None:
+        if not isinstance(optim, _NumPyroOptim):
+            optim = optax_to_numpyro(optim)
+        if isinstance(optim, Minimize):
+            raise ValueError("NaturalGradient does not support the Minimize optimizer.")
+        self.guide = guide
+        self.optim = optim
+        super().__init__(
+            lambda: (optim.init_fn, optim.update_fn, optim.get_params_fn),
+            update_with_value=optim.update_with_value,
+        )
+
+    def init(self, params: _Params) -> _IterOptState:
+        return self.optim.init(params)
+
+    def update(
+        self, g: _Params, state: _IterOptState, value: Optional[ArrayLike] = None
+    ) -> _IterOptState:
+        g = self.guide.natural_gradient(self.get_params(state), g)
+        return self.optim.update(g, state, value=value)
+
+    def get_params(self, state: _IterOptState) -> _Params:
+        return self.optim.get_params(state)
+
+
 # TODO: currently, jax.scipy.optimize.minimize only supports 1D input,
 # so we need to add the following mechanism to transform params to flat_params
 # and pass `unravel_fn` around.
@@ -357,6 +681,11 @@ class Minimize(_NumPyroOptim):
         state = (i + 1, _MinimizeState(flat_params, unravel_fn))
         return (out, None), state
 
+    def eval_and_accumulated_update(self, *args, **kwargs):
+        raise NotImplementedError(
+            "Minimize does not support updates accumulated over minibatches."
+        )
+
 
 def optax_to_numpyro(transformation) -> _NumPyroOptim:
     """
@@ -4,6 +4,7 @@
 from collections import namedtuple
 from contextlib import ExitStack, contextmanager
 import functools
+import threading
 from types import TracebackType
 from typing import Any, Callable, Generator, Optional, Union, cast
 import warnings
@@ -20,7 +21,40 @@ from numpyro.util import find_stack_level, identity
 # Type aliases
 Message = dict[str, Any]
 
-_PYRO_STACK: list = []
+
+class _HandlerStack(threading.local):
+    """
+    A list of active effect handlers which is local to each thread, so that models
+    can be traced concurrently from different threads, e.g. when running inference
+    for several models in a thread pool.
+    """
+
+    def __init__(self) -> None:
+        self.handlers: list = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.handlers, name)
+
+    def __len__(self) -> int:
+        return len(self.handlers)
+
+    def __bool__(self) -> bool:
+        return bool(self.handlers)
+
+    def __iter__(self):
+        return iter(self.handlers)
+
+    def __reversed__(self):
+        return reversed(self.handlers)
+
+    def __getitem__(self, index):
+        return self.handlers[index]
+
+    def __contains__(self, handler: Any) -> bool:
+        return handler in self.handlers
+
+
+_PYRO_STACK: _HandlerStack = _HandlerStack()
 
 
 CondIndepStackFrame = namedtuple("CondIndepStackFrame", ["name", "dim", "size"])
@@ -1,14 +1,16 @@
 # Copyright Contributors to the Pyro project.
 # SPDX-License-Identifier: Apache-2.0
 
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 from functools import partial
 import inspect
 from itertools import zip_longest
 import os
+import pickle
 import random
 import re
+import tempfile
 from threading import Lock
 from typing import Any, Callable, Generator, Optional
 import warnings
@@ -357,8 +359,10 @@ def fori_collect(
     collection = jax.tree.map(map_fn, init_val_transformed)
 
     if not progbar:
-
-        def loop_fn(collection):
+        # the loop is cached, with `init_val` as an argument, so that it is compiled
+        # once for all the initial values of the same shape
+        @cached_by(fori_collect, body_fun, transform, upper, start_idx, thinning)
+        def loop_fn(collection, init_val):
             return fori_loop(
                 0,
                 upper,
@@ -366,7 +370,9 @@ def fori_collect(
                 (init_val, collection, start_idx, thinning),
             )
 
-        last_val, collection, _, _ = maybe_jit(loop_fn, donate_argnums=0)(collection)
+        last_val, collection, _, _ = maybe_jit(loop_fn, donate_argnums=0)(
+            collection, init_val
+        )
 
     elif num_chains > 1:
         progress_bar_fori_loop = progress_bar_factory(upper, num_chains)
@@ -407,6 +413,156 @@ def fori_collect(
     return (collection, last_val) if return_last_val else collection
 
 
+Checkpoint = namedtuple("Checkpoint", ["directory", "every"], defaults=(1000,))
+"""
+A :func:`~collections.namedtuple` describing the periodic snapshots written by
+:meth:`MCMC.run <numpyro.infer.mcmc.MCMC.run>` and
+:meth:`SVI.run <numpyro.infer.svi.SVI.run>`. Steps are run in segments of `every`
+steps; after each segment, the values collected in the segment are written to a new
+file and the state of the run (sampler or optimizer state, including the random
+key, and the number of steps and segments done) is written to a single file, both
+with atomic replaces so that a run interrupted at any point can be resumed with
+`resume=True`. It consists of the following fields:
+ - **directory** - the local directory of the snapshots, created if needed.
+ - **every** - the number of steps between two snapshots, defaults to 1000. Each
+   segment is compiled once, so a run compiles at most twice: once for the segments
+   of `every` steps and once for the last, shorter segment.
+"""
+
+
+def _save_checkpoint(directory, name, value):
+    # write to a temporary file first so that a crash never leaves a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(directory, name))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_checkpoint(directory, name):
+    with open(os.path.join(directory, name), "rb") as f:
+        return pickle.load(f)
+
+
+def _run_checkpointed(
+    segment_fn,
+    init_val,
+    num_steps,
+    checkpoint,
+    resume=False,
+    meta=None,
+    progbar=True,
+    progbar_desc=lambda i: "",
+    diagnostics_fn=None,
+):
+    """
+    Runs `num_steps` steps of `segment_fn` in segments of `checkpoint.every` steps,
+    saving a snapshot after each segment. `segment_fn(val, start, length)` runs the
+    steps `start, ..., start + length - 1` from `val` and returns the new value and
+    the (host) values collected in the segment.
+
+    :return: the last value and the list of collected values of all segments.
+    """
+    if checkpoint.every < 1:
+        raise ValueError("`checkpoint.every` must be a positive integer.")
+    os.makedirs(checkpoint.directory, exist_ok=True)
+    start, chunks = 0, []
+    # host values have the same abstract values when starting and resuming a run
+    val = jax.device_get(init_val)
+    if resume and os.path.exists(os.path.join(checkpoint.directory, "state.pkl")):
+        snapshot = _load_checkpoint(checkpoint.directory, "state.pkl")
+        if snapshot["meta"] != meta:
+            raise ValueError(
+                "The snapshot in {} was written by a different run: expected {}"
+                " but got {}.".format(checkpoint.directory, meta, snapshot["meta"])
+            )
+        start, val = snapshot["step"], snapshot["val"]
+        for k in range(snapshot["num_chunks"]):
+            chunks.append(_load_checkpoint(checkpoint.directory, f"chunk_{k:06d}.pkl"))
+
+    with tqdm.tqdm(total=num_steps, initial=start, disable=not progbar) as t:
+        while start < num_steps:
+            length = min(checkpoint.every, num_steps - start)
+            val, chunk = segment_fn(val, start, length)
+            name = f"chunk_{len(chunks):06d}.pkl"
+            _save_checkpoint(checkpoint.directory, name, chunk)
+            chunks.append(chunk)
+            start += length
+            snapshot = {
+                "meta": meta,
+                "step": start,
+                "num_chunks": len(chunks),
+                "val": jax.device_get(val),
+            }
+            _save_checkpoint(checkpoint.directory, "state.pkl", snapshot)
+            t.set_description(progbar_desc(start - 1), refresh=False)
+            if diagnostics_fn:
+                t.set_postfix_str(diagnostics_fn(val, chunk), refresh=False)
+            t.update(length)
+    return val, chunks
+
+
+def _axis_sizes(in_axes, tree):
+    """
+    Returns the set of sizes of the axes `in_axes` of the leaves of `tree`, where
+    `in_axes` is a prefix of `tree` as in :func:`jax.vmap`.
+    """
+    sizes = set()
+
+    def collect_sizes(axis, subtree):
+        if axis is not None:
+            for x in jax.tree.leaves(subtree):
+                sizes.add(jnp.shape(x)[axis])
+
+    jax.tree.map(collect_sizes, in_axes, tree, is_leaf=lambda x: x is None)
+    return sizes
+
+
+def _resize_batch(in_axes, tree, size):
+    """
+    Resizes the axes `in_axes` of the leaves of `tree` to `size` on host, by repeating
+    the last element or dropping the trailing elements, where `in_axes` is a prefix
+    of `tree` as in :func:`jax.vmap`.
+    """
+
+    def resize(axis, subtree):
+        if axis is None:
+            return subtree
+
+        def resize_leaf(x):
+            x = np.asarray(x)
+            index = np.minimum(np.arange(size), x.shape[axis] - 1)
+            return np.take(x, index, axis)
+
+        return jax.tree.map(resize_leaf, subtree)
+
+    return jax.tree.map(resize, in_axes, tree, is_leaf=lambda x: x is None)
+
+
+def _bucket_size(size, batch_sizes=None):
+    """
+    Returns the smallest of `batch_sizes` which is not less than `size`, or the
+    smallest power of two which is not less than `size` if `batch_sizes` is None.
+    """
+    if size < 1:
+        raise ValueError("Expected a non-empty batch.")
+    if batch_sizes is None:
+        return 1 << (size - 1).bit_length()
+    for batch_size in batch_sizes:
+        if batch_size >= size:
+            return batch_size
+    raise ValueError(
+        "The batch of size {} is larger than the largest batch size {}.".format(
+            size, batch_sizes[-1]
+        )
+    )
+
+
 def soft_vmap(
     fn: Callable, xs: Any, batch_ndims: int = 1, chunk_size: Optional[int] = None
 ) -> Any:
@@ -8,7 +8,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 
-from jax import numpy as jnp, random
+from jax import numpy as jnp, random, vmap
 
 from numpyro import sample
 from numpyro.contrib.einstein import SteinVI
@@ -212,3 +212,50 @@ def test_apply_kernel(name, kernel, particle_info, loss_fn, mode, kval):
     if mode == "matrix":
         kval_[mode] = np.dot(kval_[mode], v)
     assert_allclose(value, kval_[mode], atol=0.5)
+
+
+@pytest.mark.parametrize(
+    "kernel, mode",
+    [
+        (RBFKernel, "norm"),
+        (RBFKernel, "vector"),
+        (RBFKernel, "matrix"),
+        (IMQKernel, "norm"),
+        (IMQKernel, "vector"),
+        (
+            lambda mode: MixtureKernel([0.3, 0.7], [RBFKernel(mode), IMQKernel(mode)]),
+            "norm",
+        ),
+    ],
+)
+def test_kernel_grad(kernel, mode):
+    particles = random.normal(random.PRNGKey(0), (10, 3))
+    kernel = kernel(mode=mode)
+    kernel.init(random.PRNGKey(1), particles.shape)
+    kernel_fn = kernel.compute(random.PRNGKey(2), particles, {}, None)
+    kernel_grad = kernel.compute_grad(random.PRNGKey(2), particles, {}, None)
+    stein = SteinVI(id, id, Adam(1.0), kernel)
+    for x in particles:
+        assert_allclose(
+            kernel_grad(x, particles[0]),
+            stein._kernel_grad(kernel_fn, x, particles[0]),
+            rtol=1e-5,
+            atol=1e-6,
+        )
+
+
+@pytest.mark.parametrize("kernel", [RBFKernel, IMQKernel])
+@pytest.mark.parametrize(
+    "approximation, num_features, atol",
+    [("random_features", 5000, 0.05), ("nystrom", 50, 1e-3)],
+)
+def test_kernel_approximation(kernel, approximation, num_features, atol):
+    particles = random.normal(random.PRNGKey(0), (50, 2))
+    exact_fn = kernel().compute(random.PRNGKey(1), particles, {}, None)
+    kernel = kernel(approximation=approximation, num_features=num_features)
+    features = kernel.compute_features(random.PRNGKey(1), particles, {}, None)
+    approx_fn = kernel.compute(random.PRNGKey(1), particles, {}, None)
+    assert features(particles[0]).shape[-1] <= num_features
+    exact = vmap(lambda x: vmap(lambda y: exact_fn(x, y))(particles))(particles)
+    approx = vmap(lambda x: vmap(lambda y: approx_fn(x, y))(particles))(particles)
+    assert_allclose(approx, exact, atol=atol)
@@ -10,6 +10,7 @@ import numpy.random as nrandom
 from numpy.testing import assert_allclose
 import pytest
 
+import jax
 from jax import numpy as jnp, random
 
 import numpyro
@@ -140,6 +141,88 @@ def test_run_smoke(kernel, problem, method):
     stein.run(random.PRNGKey(0), 1, *data)
 
 
+@pytest.mark.parametrize(
+    "kernel, num_force_particles, chunk_size",
+    [
+        (RBFKernel(), 3, None),
+        (RBFKernel(), None, 2),
+        (IMQKernel(), 3, 2),
+        (RBFKernel(approximation="random_features", num_features=20), None, None),
+        (RBFKernel(approximation="nystrom", num_features=4), 3, 2),
+        (IMQKernel(approximation="random_features", num_features=20), None, 2),
+    ],
+)
+def test_run_sampled_forces(kernel, num_force_particles, chunk_size):
+    _, data, model = regression()
+    stein = SVGD(
+        model,
+        Adam(1e-1),
+        kernel,
+        num_stein_particles=5,
+        num_force_particles=num_force_particles,
+        chunk_size=chunk_size,
+    )
+    result = stein.run(random.PRNGKey(0), 10, *data, progress_bar=False)
+    assert np.all(np.isfinite(result.losses))
+    for value in result.params.values():
+        assert np.all(np.isfinite(value))
+
+
+@pytest.mark.parametrize("kernel", [RBFKernel(), IMQKernel()])
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_chunked_forces(kernel, chunk_size):
+    _, data, model = regression()
+
+    def run(num_force_particles, chunk_size):
+        stein = SVGD(
+            model,
+            Adam(1e-1),
+            kernel,
+            num_stein_particles=5,
+            num_force_particles=num_force_particles,
+            chunk_size=chunk_size,
+        )
+        return stein.run(random.PRNGKey(0), 3, *data, progress_bar=False).params
+
+    expected = run(5, None)
+    actual = run(5, chunk_size)
+    for name in expected:
+        assert_allclose(actual[name], expected[name], rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("num_force_particles", [None, 2])
+def test_sharded_particles(num_force_particles):
+    _, data, model = regression()
+
+    def run(devices):
+        stein = SVGD(
+            model,
+            Adam(1e-1),
+            RBFKernel(),
+            num_stein_particles=4,
+            num_force_particles=num_force_particles,
+            devices=devices,
+        )
+        return stein.run(random.PRNGKey(0), 3, *data, progress_bar=False).params
+
+    expected = run(None)
+    actual = run(jax.local_devices())
+    for name in expected:
+        assert_allclose(actual[name], expected[name], rtol=1e-5, atol=1e-6)
+
+
+def test_sharded_particles_invalid():
+    _, _, model = regression()
+    with pytest.raises(ValueError, match="divisible"):
+        SVGD(
+            model,
+            Adam(1e-1),
+            RBFKernel(),
+            num_stein_particles=2 * len(jax.local_devices()) + 1,
+            devices=jax.local_devices() * 2,
+        )
+
+
 ########################################
 # Stein Interior
 ########################################
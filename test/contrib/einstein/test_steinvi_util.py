@@ -10,7 +10,12 @@ import scipy
 
 from jax import numpy as jnp, tree
 
-from numpyro.contrib.einstein.stein_util import batch_ravel_pytree, posdef, sqrth
+from numpyro.contrib.einstein.stein_util import (
+    batch_ravel_pytree,
+    chunked_vmap,
+    posdef,
+    sqrth,
+)
 
 pd_matrices = [
     np.array(
@@ -89,3 +94,12 @@ def test_ravel_pytree_batched(pytree, nbatch_dims):
             )
         )[0]
     )
+
+
+@pytest.mark.parametrize("num_inputs", [1, 7, 12])
+@pytest.mark.parametrize("chunk_size", [None, 1, 5, 20])
+def test_chunked_vmap(num_inputs, chunk_size):
+    xs = np.arange(2.0 * num_inputs).reshape(num_inputs, 2)
+    actual = chunked_vmap(lambda x: (x.sum(), 2 * x), xs, chunk_size)
+    assert_allclose(actual[0], xs.sum(-1))
+    assert_allclose(actual[1], 2 * xs)
@@ -204,3 +204,32 @@ def test_weight_convergence():
         or np.allclose(analytic_weights, slp_weights[::-1], rtol=1e-5, atol=1e-5)
     )
     assert close_weights
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_num_workers(vectorized):
+    def model(y):
+        z = numpyro.sample("z", dist.Normal(0.0, 1.0))
+        model1 = numpyro.sample(
+            "model1", dist.Categorical(jnp.ones(3) / 3), infer={"branching": True}
+        )
+        if vectorized:
+            # the branching value is only used as an index: SLPs are discovered
+            # by tracing the model under vmap
+            sigma = jnp.array([0.5, 1.0, 2.0])[model1]
+        else:
+            sigma = [0.5, 1.0, 2.0][model1]
+        with numpyro.plate("data", y.shape[0]):
+            numpyro.sample("obs", dist.Normal(z, sigma), obs=y)
+
+    y_train = dist.Normal(0, 1).sample(random.PRNGKey(0), (200,))
+    mcmc_kwargs = dict(num_warmup=50, num_samples=50, progress_bar=False)
+
+    expected = DCC(model, mcmc_kwargs=mcmc_kwargs).run(random.PRNGKey(1), y_train)
+    actual = DCC(model, mcmc_kwargs=mcmc_kwargs, num_workers=3).run(
+        random.PRNGKey(1), y_train
+    )
+    assert set(actual.samples) == {"0", "1", "2"}
+    for slp in expected.samples:
+        assert_allclose(actual.samples[slp]["z"], expected.samples[slp]["z"])
+        assert_allclose(actual.slp_weights[slp], expected.slp_weights[slp])
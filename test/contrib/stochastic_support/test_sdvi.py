@@ -1,6 +1,7 @@
 # Copyright Contributors to the Pyro project.
 # SPDX-License-Identifier: Apache-2.0
 
+from numpy.testing import assert_allclose
 import pytest
 
 from jax import random
@@ -172,3 +173,25 @@ def test_progress_bar():
     )
     rng_key, subkey = random.split(rng_key)
     sdvi.run(subkey, y)
+
+
+def test_num_workers():
+    def model(y):
+        z = numpyro.sample("z", dist.Normal(0.0, 1.0))
+        model1 = numpyro.sample(
+            "model1", dist.Bernoulli(0.5), infer={"branching": True}
+        )
+        sigma = 1.0 if model1 == 0 else 2.0
+        with numpyro.plate("data", y.shape[0]):
+            numpyro.sample("obs", dist.Normal(z, sigma), obs=y)
+
+    y_train = dist.Normal(0, 1).sample(random.PRNGKey(0), (200,))
+    optimizer = numpyro.optim.Adam(step_size=0.01)
+    expected = SDVI(model, optimizer, svi_num_steps=10).run(random.PRNGKey(1), y_train)
+    actual = SDVI(model, optimizer, svi_num_steps=10, num_workers=2).run(
+        random.PRNGKey(1), y_train
+    )
+    assert set(actual.guides) == {"0", "1"}
+    for slp, (_, params) in expected.guides.items():
+        assert_allclose(actual.guides[slp][1]["z_auto_loc"], params["z_auto_loc"])
+        assert_allclose(actual.slp_weights[slp], expected.slp_weights[slp])
@@ -4,6 +4,7 @@
 from numpy.testing import assert_allclose
 import pytest
 
+import jax
 from jax import random
 import jax.numpy as jnp
 
@@ -13,7 +14,7 @@ import numpyro.distributions as dist
 from numpyro.handlers import mask, seed, substitute, trace
 from numpyro.infer import MCMC, NUTS, SVI, Predictive, Trace_ELBO
 from numpyro.infer.autoguide import AutoNormal
-from numpyro.infer.util import log_density, potential_energy
+from numpyro.infer.util import _default_scan_remat, log_density, potential_energy
 from numpyro.optim import Adam
 
 
@@ -116,6 +117,71 @@ def test_scan_constrain_reparam_compatible():
     assert_allclose(actual_log_joint, expected_log_joint, rtol=1e-6)
 
 
+def _scan_remat_model(T=10, remat=None, reverse=False):
+    def transition(x_prev, t):
+        x = numpyro.sample("x", dist.Normal(jnp.sin(x_prev) + t, 1))
+        return x, x * t
+
+    x0 = numpyro.sample("x_0", dist.Normal(0, 1))
+    _, ys = scan(transition, x0, jnp.arange(T), remat=remat, reverse=reverse)
+    return ys
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("remat", [True, 3, 5, 20])
+def test_scan_remat(remat, reverse):
+    params = {"x_0": 0.5, "x": jnp.linspace(-1, 1, 10)}
+
+    def potential_fn(params, remat):
+        return potential_energy(
+            _scan_remat_model, (), {"remat": remat, "reverse": reverse}, params
+        )
+
+    actual, actual_grad = jax.value_and_grad(potential_fn)(params, remat)
+    expected, expected_grad = jax.value_and_grad(potential_fn)(params, None)
+    assert_allclose(actual, expected, rtol=1e-6)
+    for name in params:
+        assert_allclose(actual_grad[name], expected_grad[name], rtol=1e-6)
+
+    with seed(rng_seed=0):
+        actual_ys = _scan_remat_model(remat=remat, reverse=reverse)
+    with seed(rng_seed=0):
+        expected_ys = _scan_remat_model(reverse=reverse)
+    assert_allclose(actual_ys, expected_ys)
+
+
+@pytest.mark.parametrize("remat", [None, False])
+def test_scan_remat_default(remat):
+    model = _default_scan_remat(lambda: _scan_remat_model(remat=remat), 5)
+    params = {"x_0": 0.0, "x": jnp.zeros(10)}
+    jaxpr = str(jax.make_jaxpr(lambda p: potential_energy(model, (), {}, p))(params))
+    # only scans which do not specify `remat` are rematerialized
+    assert ("remat" in jaxpr or "checkpoint" in jaxpr) == (remat is None)
+
+
+def test_scan_remat_inference():
+    losses = []
+    for remat in [False, 3]:
+        svi = SVI(
+            _scan_remat_model,
+            AutoNormal(_scan_remat_model),
+            Adam(0.1),
+            Trace_ELBO(),
+            remat=remat,
+        )
+        losses.append(svi.run(random.PRNGKey(0), 10, progress_bar=False).losses)
+    assert_allclose(losses[0], losses[1], rtol=1e-5)
+
+    mcmc = MCMC(
+        NUTS(_scan_remat_model, remat=3),
+        num_warmup=10,
+        num_samples=10,
+        progress_bar=False,
+    )
+    mcmc.run(random.PRNGKey(0))
+    assert mcmc.get_samples()["x"].shape == (10, 10)
+
+
 def test_scan_without_stack():
     def multiply_and_add_repeatedly(K, c_in):
         def iteration(c_prev, c_in):
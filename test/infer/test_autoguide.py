@@ -8,8 +8,9 @@ from numpy.testing import assert_allclose
 import pytest
 
 import jax
-from jax import jacobian, jit, lax, random, vmap
+from jax import hessian, jacobian, jit, lax, random, vmap
 from jax.example_libraries.stax import Dense
+from jax.flatten_util import ravel_pytree
 import jax.numpy as jnp
 import optax
 from optax import piecewise_constant_schedule
@@ -436,6 +437,51 @@ def test_laplace_approximation_custom_hessian():
     guide.get_transform(svi_result.params)
 
 
+@pytest.mark.parametrize("covariance", ["block_diagonal", "low_rank"])
+def test_laplace_approximation_covariance(covariance):
+    def model(x, group, y):
+        a = numpyro.sample("a", dist.Normal(0, 1).expand([3]).to_event())
+        b = numpyro.sample("b", dist.Normal(0, 1).expand([2]).to_event())
+        logits = a[group] + b[0] + b[1] * x
+        with numpyro.plate("N", len(x)):
+            numpyro.sample("y", dist.Bernoulli(logits=logits), obs=y)
+
+    x = random.normal(random.PRNGKey(0), (100,))
+    group = random.randint(random.PRNGKey(1), (100,), 0, 3)
+    y = dist.Bernoulli(logits=x + group).sample(random.PRNGKey(2))
+    guide = AutoLaplaceApproximation(model)
+    svi = SVI(model, guide, optim.Adam(0.1), Trace_ELBO(), x=x, group=group, y=y)
+    params = svi.run(random.PRNGKey(3), 2000, progress_bar=False).params
+    expected_cov = guide.get_posterior(params).covariance_matrix
+    if covariance == "block_diagonal":
+        # correlations between the sites `a` and `b` are ignored
+        precision = jnp.linalg.inv(expected_cov)
+        expected_cov = jax.scipy.linalg.block_diag(
+            jnp.linalg.inv(precision[:3, :3]), jnp.linalg.inv(precision[3:, 3:])
+        )
+
+    # the low rank approximation is exact if its rank is the latent dimension
+    approx_guide = AutoLaplaceApproximation(model, covariance=covariance, rank=5)
+    handlers.seed(approx_guide, 0)(x, group, y)
+    transform = approx_guide.get_transform(params)
+    scale = jacobian(transform)(jnp.zeros(5))
+    assert_allclose(scale @ scale.T, expected_cov, rtol=1e-4, atol=1e-5)
+
+    posterior = approx_guide.get_posterior(params)
+    samples = posterior.sample(random.PRNGKey(4), (10,))
+    expected_posterior = dist.MultivariateNormal(params["auto_loc"], expected_cov)
+    assert_allclose(
+        posterior.log_prob(samples), expected_posterior.log_prob(samples), rtol=1e-4
+    )
+
+    quantiles = approx_guide.quantiles(params, [0.1, 0.9])
+    expected_latent = dist.Normal(
+        params["auto_loc"], jnp.sqrt(jnp.diag(expected_cov))
+    ).icdf(jnp.array([0.1, 0.9])[:, None])
+    assert_allclose(quantiles["a"], expected_latent[:, :3], rtol=1e-4, atol=1e-5)
+    assert_allclose(quantiles["b"], expected_latent[:, 3:], rtol=1e-4, atol=1e-5)
+
+
 def test_improper():
     y = random.normal(random.PRNGKey(0), (100,))
 
@@ -1380,3 +1426,81 @@ def test_subsample(guide_cls) -> None:
     )
     state = svi.init(jax.random.key(2), x=x)
     svi.update(state, x=subset)
+
+
+@pytest.mark.parametrize(
+    "guide_class",
+    [
+        AutoNormal,
+        AutoMultivariateNormal,
+        partial(AutoLowRankMultivariateNormal, rank=1),
+    ],
+)
+def test_natural_gradient(guide_class) -> None:
+    def model():
+        numpyro.sample("x", dist.Normal(0, 1).expand([3]).to_event())
+        numpyro.sample("y", dist.Normal(0, 1))
+
+    guide = guide_class(model)
+    svi = SVI(model, guide, optim.Adam(0.1), Trace_ELBO())
+    svi_state = svi.init(random.PRNGKey(0))
+    params = svi.optim.get_params(svi_state.optim_state)
+    params = jax.tree.map(
+        lambda x: x + 0.3 * random.normal(random.PRNGKey(1), jnp.shape(x)), params
+    )
+    flat_params, unravel_fn = ravel_pytree(params)
+
+    def get_posterior(flat_params):
+        params = svi.constrain_fn(unravel_fn(flat_params))
+        if isinstance(guide, AutoNormal):
+            locs = jnp.concatenate([params["x_auto_loc"], params["y_auto_loc"][None]])
+            scales = jnp.concatenate(
+                [params["x_auto_scale"], params["y_auto_scale"][None]]
+            )
+            return dist.Normal(locs, scales).to_event(1)
+        posterior = guide.get_posterior(params)
+        return dist.MultivariateNormal(
+            posterior.mean, covariance_matrix=posterior.covariance_matrix
+        )
+
+    # the Fisher information matrix is the Hessian of the KL divergence
+    fisher = hessian(
+        lambda x: dist.kl_divergence(get_posterior(flat_params), get_posterior(x))
+    )(flat_params)
+    grads = unravel_fn(random.normal(random.PRNGKey(2), flat_params.shape))
+    actual = guide.natural_gradient(params, grads)
+    if isinstance(guide, AutoLowRankMultivariateNormal):
+        # the gradient of `scale` is preconditioned by the diagonal of the Fisher
+        # information matrix and the gradient of `cov_factor` is unchanged
+        covariance = get_posterior(flat_params).covariance_matrix
+        fisher_diag = unravel_fn(jnp.diag(fisher))
+        assert_allclose(
+            actual["auto_loc"], covariance @ grads["auto_loc"], rtol=1e-4, atol=1e-6
+        )
+        assert_allclose(
+            actual["auto_scale"],
+            grads["auto_scale"] / fisher_diag["auto_scale"],
+            rtol=1e-4,
+        )
+        assert_allclose(actual["auto_cov_factor"], grads["auto_cov_factor"])
+    else:
+        expected = unravel_fn(jnp.linalg.solve(fisher, ravel_pytree(grads)[0]))
+        for name in expected:
+            assert_allclose(actual[name], expected[name], rtol=1e-3, atol=1e-5)
+
+
+@pytest.mark.parametrize("auto_class", [AutoNormal, AutoMultivariateNormal])
+def test_natural_gradient_svi(auto_class) -> None:
+    cov = jnp.array([[1.0, 0.9], [0.9, 1.0]])
+
+    def model():
+        numpyro.sample("x", dist.MultivariateNormal(jnp.array([1.0, -1.0]), cov))
+
+    guide = auto_class(model)
+    svi = SVI(
+        model, guide, optim.NaturalGradient(guide, optim.Adam(0.05)), Trace_ELBO(10)
+    )
+    svi_result = svi.run(random.PRNGKey(0), 2000, progress_bar=False)
+    assert_allclose(
+        guide.median(svi_result.params)["x"], jnp.array([1.0, -1.0]), atol=0.1
+    )
@@ -22,11 +22,14 @@ from numpyro.infer.hmc_util import (
     build_tree,
     consensus,
     dual_averaging,
+    euclidean_kinetic_energy,
     find_reasonable_step_size,
+    fused_build_tree,
     parametric_draws,
     velocity_verlet,
     warmup_adapter,
     welford_covariance,
+    welford_draw_grad_covariance,
 )
 from numpyro.util import control_flow_prims_disabled, fori_loop, optional
 
@@ -89,6 +92,40 @@ def test_welford_covariance(jitted, diagonal, regularize):
             )
 
 
+@pytest.mark.parametrize("diagonal", [True, False])
+def test_welford_draw_grad_covariance(diagonal):
+    np.random.seed(0)
+    loc = np.random.randn(3)
+    if diagonal:
+        target_cov = np.diag(np.exp(np.random.randn(3)))
+    else:
+        a = np.random.randn(3, 3)
+        target_cov = np.matmul(a, a.T) + np.identity(3)
+    # for a Gaussian target, the estimate is exact after a few samples
+    x = np.random.multivariate_normal(loc, target_cov, size=(10,))
+    grads = (x - loc) @ np.linalg.inv(target_cov)
+
+    @jit
+    def get_cov(x, grads):
+        wc_init, wc_update, wc_final = welford_draw_grad_covariance(diagonal=diagonal)
+        wc_state = wc_init(3)
+        wc_state = fori_loop(
+            0, 10, lambda i, val: wc_update(x[i], grads[i], val), wc_state
+        )
+        cov, cov_inv_sqrt, _ = wc_final(wc_state)
+        return cov, cov_inv_sqrt
+
+    cov, cov_inv_sqrt = get_cov(x, grads)
+    if diagonal:
+        assert_allclose(cov, np.diagonal(target_cov), rtol=1e-4)
+        assert_allclose(cov_inv_sqrt, 1 / np.sqrt(np.diagonal(target_cov)), rtol=1e-4)
+    else:
+        assert_allclose(cov, target_cov, rtol=1e-3, atol=1e-4)
+        assert_allclose(
+            cov_inv_sqrt, np.linalg.cholesky(np.linalg.inv(target_cov)), rtol=1e-3
+        )
+
+
 ########################################
 # verlocity_verlet Test
 ########################################
@@ -442,6 +479,59 @@ def test_build_tree(step_size):
         assert tree.num_proposals > 10
 
 
+@pytest.mark.parametrize("step_size", [0.1, 0.9, 100.0])
+@pytest.mark.parametrize("dense_mass", [False, True])
+def test_fused_build_tree(step_size, dense_mass):
+    cov = jnp.array([[1.0, 0.8], [0.8, 1.0]])
+    precision = jnp.linalg.inv(cov)
+
+    def potential_fn(q):
+        return 0.5 * q @ precision @ q
+
+    vv_init, vv_update = velocity_verlet(potential_fn, euclidean_kinetic_energy)
+    vv_state = vv_init(jnp.array([1.0, -0.5]), jnp.array([0.3, 1.2]))
+    inverse_mass_matrix = jnp.identity(2) if dense_mass else jnp.ones(2)
+    rng_keys = random.split(random.PRNGKey(0), 10000)
+
+    expected_trees = jax.vmap(
+        lambda key: build_tree(
+            vv_update,
+            euclidean_kinetic_energy,
+            vv_state,
+            inverse_mass_matrix,
+            step_size,
+            key,
+        )
+    )(rng_keys)
+    actual_trees = jax.vmap(
+        lambda key: fused_build_tree(
+            potential_fn,
+            vv_state.z,
+            vv_state.r,
+            vv_state.potential_energy,
+            vv_state.z_grad,
+            inverse_mass_matrix,
+            step_size,
+            key,
+        )
+    )(rng_keys)
+
+    # both implementations generate the same distribution of trajectories
+    for field in ["num_proposals", "depth", "sum_accept_probs"]:
+        expected = getattr(expected_trees, field).astype(jnp.float32)
+        actual = getattr(actual_trees, field).astype(jnp.float32)
+        assert_allclose(actual.mean(), expected.mean(), rtol=0.03)
+    assert_allclose(
+        actual_trees.z_proposal.mean(0), expected_trees.z_proposal.mean(0), atol=0.03
+    )
+    assert_allclose(
+        actual_trees.z_proposal.std(0), expected_trees.z_proposal.std(0), rtol=0.03
+    )
+    assert_allclose(actual_trees.diverging.mean(), expected_trees.diverging.mean())
+    if step_size > 10:
+        assert jnp.all(actual_trees.num_proposals == 1)
+
+
 @pytest.mark.parametrize("method", [consensus, parametric_draws])
 @pytest.mark.parametrize("diagonal", [True, False])
 def test_gaussian_subposterior(method, diagonal):
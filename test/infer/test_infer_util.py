@@ -26,6 +26,7 @@ from numpyro.infer.initialization import (
 )
 from numpyro.infer.reparam import TransformReparam
 from numpyro.infer.util import (
+    CompiledPredictive,
     Predictive,
     compute_log_probs,
     constrain_fn,
@@ -247,6 +248,54 @@ def test_prior_predictive(batch_ndims):
     assert predictive_samples["obs"].shape == batch_shape + data.shape
 
 
+def test_compiled_predictive():
+    num_traces = []
+
+    def model(x, scale, y=None):
+        num_traces.append(1)
+        w = numpyro.sample("w", dist.Normal(0, 1).expand([2]).to_event(1))
+        with numpyro.plate("N", x.shape[0]):
+            z = numpyro.sample("z", dist.Normal(0, scale))
+            numpyro.deterministic("mean", x @ w + z)
+            numpyro.sample("y", dist.Normal(x @ w + z, 1), obs=y)
+
+    def guide(x, scale, y=None):
+        w_loc = numpyro.param("w_loc", jnp.zeros(2))
+        numpyro.sample("w", dist.Normal(w_loc, 0.1).to_event(1))
+        # an amortized guide of the local latent variables
+        z_weight = numpyro.param("z_weight", jnp.zeros(2))
+        with numpyro.plate("N", x.shape[0]):
+            numpyro.sample("z", dist.Delta(x @ z_weight))
+
+    params = {"w_loc": jnp.array([1.0, -1.0]), "z_weight": jnp.array([0.5, 0.5])}
+    kwargs = dict(
+        guide=guide, params=params, num_samples=10, return_sites=["z", "mean", "y"]
+    )
+    predictive = CompiledPredictive(
+        model, in_axes=((0, None), {}), batch_sizes=[4, 16], **kwargs
+    )
+    predictive.warmup(random.PRNGKey(0), jnp.ones((3, 2)), 1.0)
+    num_compiled_traces = len(num_traces)
+
+    x = random.normal(random.PRNGKey(1), (16, 2))
+    for size in [1, 3, 4, 5, 16]:
+        samples = predictive(random.PRNGKey(2), x[:size], 1.0)
+        expected = Predictive(model, **kwargs)(random.PRNGKey(2), x[:size], 1.0)
+        assert samples.keys() == expected.keys() == {"z", "mean", "y"}
+        assert samples["y"].shape == (10, size)
+        assert_allclose(samples["z"], expected["z"], rtol=1e-6)
+        assert_allclose(samples["mean"], expected["mean"], rtol=1e-6)
+    # each size reuses the function compiled for its bucket
+    assert len(num_traces) == num_compiled_traces + 5
+
+    with pytest.raises(ValueError, match="larger than the largest batch size"):
+        predictive(random.PRNGKey(2), jnp.ones((17, 2)), 1.0)
+    with pytest.raises(ValueError, match="single batch size"):
+        CompiledPredictive(model, **kwargs)(
+            random.PRNGKey(2), jnp.ones((3, 2)), jnp.ones(4)
+        )
+
+
 @pytest.mark.parametrize("batch_shape", [(), (100,), (2, 50)])
 def test_log_likelihood(batch_shape):
     model, data, _ = beta_bernoulli()
@@ -17,12 +17,23 @@ from jax.scipy.special import logit
 import numpyro
 import numpyro.distributions as dist
 from numpyro.distributions.transforms import AffineTransform
-from numpyro.infer import AIES, ESS, HMC, MCMC, NUTS, SA, BarkerMH, init_to_value
+from numpyro.infer import (
+    AIES,
+    ESS,
+    HMC,
+    MCMC,
+    NUTS,
+    SA,
+    BarkerMH,
+    ChEESHMC,
+    VectorizedNUTS,
+    init_to_value,
+)
 from numpyro.infer.hmc import hmc
 from numpyro.infer.reparam import TransformReparam
 from numpyro.infer.sa import _get_proposal_loc_and_scale, _numpy_delete
 from numpyro.infer.util import initialize_model
-from numpyro.util import fori_collect, is_prng_key
+from numpyro.util import Checkpoint, fori_collect, is_prng_key
 
 
 @pytest.mark.parametrize("kernel_cls", [HMC, NUTS, SA, BarkerMH, AIES, ESS])
@@ -345,6 +356,177 @@ def test_dense_mass(kernel_cls, rho):
     assert_allclose(jnp.var(samples, axis=0), jnp.array([10.0, 0.1]), rtol=0.20)
 
 
+@pytest.mark.parametrize("dense_mass", [False, True, [("x",)]])
+def test_nuts_fused_tree_building(dense_mass):
+    true_cov = jnp.array([[2.0, 0.6, 0.0], [0.6, 1.0, 0.3], [0.0, 0.3, 0.5]])
+
+    def model():
+        numpyro.sample("x", dist.MultivariateNormal(jnp.arange(3.0), true_cov))
+        numpyro.sample("y", dist.LogNormal(0.0, 0.5))
+
+    kernel = NUTS(model, dense_mass=dense_mass, fused_tree_building=True)
+    mcmc = MCMC(kernel, num_warmup=1000, num_samples=5000, progress_bar=False)
+    mcmc.run(random.PRNGKey(0))
+    samples = mcmc.get_samples()
+    assert_allclose(jnp.mean(samples["x"], 0), jnp.arange(3.0), atol=0.1)
+    assert_allclose(jnp.cov(samples["x"].T), true_cov, atol=0.2)
+    assert_allclose(jnp.mean(jnp.log(samples["y"])), 0.0, atol=0.05)
+
+
+def test_nuts_fused_tree_building_invalid_kinetic_fn():
+    def model():
+        numpyro.sample("x", dist.Normal(0, 1))
+
+    def kinetic_fn(inverse_mass_matrix, r):
+        return 0.5 * jnp.sum(inverse_mass_matrix * r["x"] ** 2)
+
+    kernel = NUTS(model, kinetic_fn=kinetic_fn, fused_tree_building=True)
+    mcmc = MCMC(kernel, num_warmup=10, num_samples=10, progress_bar=False)
+    with pytest.raises(ValueError, match="euclidean kinetic energy"):
+        mcmc.run(random.PRNGKey(0))
+
+
+@pytest.mark.parametrize("dense_mass", [False, True])
+def test_vectorized_nuts(dense_mass):
+    def model():
+        numpyro.sample("x", dist.StudentT(3.0, jnp.arange(3.0)))
+        numpyro.sample("y", dist.LogNormal(0.0, jnp.array([0.1, 1.0])))
+
+    samples, num_steps = {}, {}
+    for kernel_class in [NUTS, VectorizedNUTS]:
+        kwargs = {"fused_tree_building": True} if kernel_class is NUTS else {}
+        kernel = kernel_class(model, dense_mass=dense_mass, **kwargs)
+        mcmc = MCMC(
+            kernel,
+            num_warmup=500,
+            num_samples=2000,
+            num_chains=4,
+            chain_method="vectorized",
+            progress_bar=False,
+        )
+        mcmc.run(random.PRNGKey(0), extra_fields=("num_steps",))
+        samples[kernel_class] = mcmc.get_samples()
+        num_steps[kernel_class] = mcmc.get_extra_fields()["num_steps"]
+
+    # each chain follows the same Markov chain as the fused NUTS kernel
+    assert_allclose(samples[VectorizedNUTS]["x"], samples[NUTS]["x"], rtol=1e-5)
+    assert_allclose(num_steps[VectorizedNUTS], num_steps[NUTS])
+    assert_allclose(
+        jnp.median(samples[VectorizedNUTS]["x"], 0), jnp.arange(3.0), atol=0.1
+    )
+    assert_allclose(
+        jnp.std(jnp.log(samples[VectorizedNUTS]["y"]), 0),
+        jnp.array([0.1, 1.0]),
+        rtol=0.1,
+    )
+
+
+def test_vectorized_nuts_post_warmup_state():
+    def model():
+        numpyro.sample("x", dist.Normal(0, 1).expand([2]))
+
+    mcmc = MCMC(
+        VectorizedNUTS(model),
+        num_warmup=100,
+        num_samples=100,
+        num_chains=3,
+        chain_method="vectorized",
+        progress_bar=False,
+    )
+    mcmc.warmup(random.PRNGKey(0))
+    assert mcmc.post_warmup_state.latest_state.z["x"].shape == (3, 2)
+    mcmc.run(random.PRNGKey(1))
+    assert mcmc.get_samples(group_by_chain=True)["x"].shape == (3, 100, 2)
+    # single chain runs are equivalent to the fused NUTS kernel
+    mcmc = MCMC(
+        VectorizedNUTS(model), num_warmup=100, num_samples=100, progress_bar=False
+    )
+    mcmc.run(random.PRNGKey(0))
+    assert mcmc.get_samples()["x"].shape == (100, 2)
+    with pytest.raises(ValueError, match="not supported"):
+        VectorizedNUTS(model, fused_tree_building=False)
+
+
+@pytest.mark.parametrize("dense_mass", [False, True])
+def test_chees_hmc(dense_mass):
+    true_std = jnp.array([0.1, 1.0, 10.0])
+
+    def model():
+        numpyro.sample("x", dist.Normal(jnp.arange(3.0), true_std))
+
+    kernel = ChEESHMC(model, dense_mass=dense_mass)
+    mcmc = MCMC(
+        kernel,
+        num_warmup=500,
+        num_samples=500,
+        num_chains=32,
+        chain_method="vectorized",
+        progress_bar=False,
+    )
+    mcmc.run(
+        random.PRNGKey(0),
+        extra_fields=("num_steps", "trajectory_adapt_state.log_trajectory_length"),
+    )
+    samples = mcmc.get_samples()
+    assert_allclose(jnp.mean(samples["x"], 0), jnp.arange(3.0), atol=0.2)
+    assert_allclose(jnp.std(samples["x"], 0), true_std, rtol=0.05)
+    extra_fields = mcmc.get_extra_fields()
+    # the trajectory length is shared by all chains and fixed after warmup
+    log_trajectory_length = extra_fields["trajectory_adapt_state.log_trajectory_length"]
+    assert_allclose(log_trajectory_length, log_trajectory_length[0])
+    assert jnp.exp(log_trajectory_length[0]) > 1.0
+
+
+def test_chees_hmc_requires_vectorized_chains():
+    def model():
+        numpyro.sample("x", dist.Normal(0, 1))
+
+    mcmc = MCMC(ChEESHMC(model), num_warmup=10, num_samples=10, progress_bar=False)
+    with pytest.raises(ValueError, match="vectorized"):
+        mcmc.run(random.PRNGKey(0))
+
+
+@pytest.mark.parametrize("dense_mass", [False, True, [("x",)]])
+def test_mass_matrix_estimator_draws_and_grads(dense_mass):
+    true_cov = jnp.array([[4.0, 1.0], [1.0, 1.0]])
+
+    def model():
+        numpyro.sample("x", dist.MultivariateNormal(jnp.zeros(2), true_cov))
+        numpyro.sample("y", dist.Normal(0.0, 0.1))
+
+    kernel = NUTS(model, dense_mass=dense_mass, mass_matrix_estimator="draws_and_grads")
+    mcmc = MCMC(kernel, num_warmup=200, num_samples=2000, progress_bar=False)
+    mcmc.run(random.PRNGKey(0))
+    samples = mcmc.get_samples()
+    assert_allclose(jnp.cov(samples["x"].T), true_cov, rtol=0.15, atol=0.1)
+    # the estimate is accurate despite the short warmup
+    inverse_mass_matrix = mcmc.last_state.adapt_state.inverse_mass_matrix
+    if dense_mass is True:
+        expected = jnp.zeros((3, 3)).at[:2, :2].set(true_cov).at[2, 2].set(0.01)
+        assert_allclose(inverse_mass_matrix[("x", "y")], expected, rtol=0.1, atol=1e-3)
+    elif dense_mass is False:
+        # sqrt(var(x) / var(grad)) is the geometric mean of the marginal variance
+        # and the conditional variance given the other coordinates
+        expected = jnp.sqrt(jnp.array([4.0 * 3.0, 1.0 * 0.75, 0.01**2]))
+        assert_allclose(inverse_mass_matrix[("x", "y")], expected, rtol=0.1)
+    else:
+        assert_allclose(inverse_mass_matrix[("x",)], true_cov, rtol=0.1)
+
+
+def test_mass_matrix_estimator_invalid():
+    def model():
+        numpyro.sample("x", dist.Normal(0, 1))
+
+    mcmc = MCMC(
+        NUTS(model, mass_matrix_estimator="foo"),
+        num_warmup=10,
+        num_samples=10,
+        progress_bar=False,
+    )
+    with pytest.raises(ValueError, match="mass_matrix_estimator"):
+        mcmc.run(random.PRNGKey(0))
+
+
 def test_change_point_x64():
     # Ref: https://forum.pyro.ai/t/i-dont-understand-why-nuts-code-is-not-working-bayesian-hackers-mail/696
     if sys.version_info.minor == 9:
@@ -1255,3 +1437,81 @@ def test_empty_summary():
     mcmc.run(random.PRNGKey(0))
 
     mcmc.print_summary()
+
+
+@pytest.mark.parametrize(
+    "num_chains, chain_method",
+    [(1, "sequential"), (2, "sequential"), (2, "parallel"), (2, "vectorized")],
+)
+def test_checkpoint_resume(tmp_path, monkeypatch, num_chains, chain_method):
+    if chain_method == "parallel" and jax.device_count() == 1:
+        pytest.skip("parallel method requires device_count greater than 1.")
+
+    def model(y):
+        mu = numpyro.sample("mu", dist.Normal(0, 5))
+        numpyro.sample("y", dist.Normal(mu, 1), obs=y)
+
+    y = jnp.arange(5.0)
+    kwargs = dict(
+        num_warmup=20,
+        num_samples=30,
+        num_chains=num_chains,
+        thinning=3,
+        chain_method=chain_method,
+        progress_bar=False,
+    )
+    mcmc = MCMC(NUTS(model), **kwargs)
+    mcmc.run(random.PRNGKey(0), y, extra_fields=("num_steps",))
+    expected = mcmc.get_samples(group_by_chain=True)
+
+    # interrupt the run in the warmup phase, after 2 snapshots of 7 steps
+    checkpoint = Checkpoint(str(tmp_path), every=7)
+    save_checkpoint = numpyro.util._save_checkpoint
+    saves = []
+
+    def interrupted_save(*args):
+        if len(saves) == 5:
+            raise KeyboardInterrupt
+        saves.append(args[1])
+        save_checkpoint(*args)
+
+    monkeypatch.setattr(numpyro.util, "_save_checkpoint", interrupted_save)
+    mcmc = MCMC(NUTS(model), **kwargs)
+    with pytest.raises(KeyboardInterrupt):
+        mcmc.run(
+            random.PRNGKey(0), y, extra_fields=("num_steps",), checkpoint=checkpoint
+        )
+    assert saves == [
+        "chunk_000000.pkl",
+        "state.pkl",
+        "chunk_000001.pkl",
+        "state.pkl",
+        "chunk_000002.pkl",
+    ]
+    monkeypatch.undo()
+
+    mcmc = MCMC(NUTS(model), **kwargs)
+    mcmc.run(
+        random.PRNGKey(1),
+        y,
+        extra_fields=("num_steps",),
+        checkpoint=checkpoint,
+        resume=True,
+    )
+    assert_allclose(mcmc.get_samples(group_by_chain=True)["mu"], expected["mu"])
+    assert mcmc.get_extra_fields()["num_steps"].shape == (num_chains * 10,)
+    assert_allclose(mcmc.last_state.i, 50)
+
+    # the snapshot of a run with other samples or fields is not resumed
+    mcmc = MCMC(NUTS(model), **dict(kwargs, thinning=1))
+    with pytest.raises(ValueError, match="different run"):
+        mcmc.run(
+            random.PRNGKey(0),
+            y,
+            extra_fields=("num_steps",),
+            checkpoint=checkpoint,
+            resume=True,
+        )
+    mcmc = MCMC(NUTS(model), **kwargs)
+    with pytest.raises(ValueError, match="different run"):
+        mcmc.run(random.PRNGKey(0), y, checkpoint=checkpoint, resume=True)
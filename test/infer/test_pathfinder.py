@@ -0,0 +1,96 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from jax import random
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro.infer import MCMC, NUTS
+from numpyro.infer.pathfinder import (
+    Pathfinder,
+    _approx_dense,
+    _lbfgs_approx,
+    _sample_approx,
+    pathfinder,
+)
+
+
+def test_lbfgs_approx_sample():
+    d, m = 6, 3
+    S = random.normal(random.PRNGKey(0), (m, d))
+    # make sure that the curvature condition holds
+    Y = S + 0.1 * random.normal(random.PRNGKey(1), (m, d))
+    mask = jnp.array([False, True, True])
+    S, Y = S.at[0].set(0.0), Y.at[0].set(0.0)
+    alpha = jnp.exp(random.normal(random.PRNGKey(2), (d,)))
+    approx = _lbfgs_approx(alpha, S, Y, mask)
+    cov = _approx_dense(approx)
+    mean = jnp.arange(d, dtype=jnp.float32)
+    draws, log_q = _sample_approx(random.PRNGKey(3), approx, mean, 100000)
+    expected_log_q = dist.MultivariateNormal(mean, cov).log_prob(draws)
+    assert_allclose(log_q, expected_log_q, rtol=1e-4, atol=1e-3)
+    assert_allclose(jnp.cov(draws.T), cov, atol=0.05)
+
+
+@pytest.mark.parametrize("dense_mass", [False, True])
+def test_pathfinder_gaussian(dense_mass):
+    A = random.normal(random.PRNGKey(0), (4, 4))
+    cov = A @ A.T + jnp.identity(4)
+    precision = jnp.linalg.inv(cov)
+    loc = jnp.arange(4.0)
+
+    def potential_fn(params):
+        diff = params["x"] - loc
+        return 0.5 * diff @ precision @ diff
+
+    init_params = {"x": random.normal(random.PRNGKey(1), (3, 4))}
+    state = pathfinder(
+        random.PRNGKey(2),
+        potential_fn,
+        init_params,
+        num_draws=10000,
+        dense_mass=dense_mass,
+    )
+    assert state.elbo.shape == (3,)
+    assert state.samples["x"].shape == (10000, 4)
+    assert_allclose(jnp.mean(state.samples["x"], 0), loc, atol=0.1)
+    expected_imm = cov if dense_mass else jnp.diag(cov)
+    assert_allclose(state.inverse_mass_matrix, expected_imm, rtol=0.2, atol=0.5)
+
+
+def test_pathfinder_init_nuts():
+    def model():
+        numpyro.sample("x", dist.Normal(jnp.arange(3.0), jnp.array([1.0, 2.0, 3.0])))
+        numpyro.sample("s", dist.LogNormal(0.0, 0.5))
+
+    pf = Pathfinder(model, num_paths=2, num_draws=2000)
+    with pytest.raises(RuntimeError, match="should be called first"):
+        pf.get_samples()
+    pf.run(random.PRNGKey(0))
+    samples = pf.get_samples()
+    assert_allclose(jnp.mean(samples["x"], 0), jnp.arange(3.0), atol=0.3)
+    assert_allclose(jnp.std(samples["x"], 0), jnp.array([1.0, 2.0, 3.0]), rtol=0.2)
+    # sites are sorted by name in the inverse mass matrix layout
+    assert_allclose(pf.inverse_mass_matrix, jnp.array([0.25, 1.0, 4.0, 9.0]), rtol=0.6)
+
+    kernel = NUTS(
+        model,
+        init_strategy=pf.get_init_strategy(),
+        inverse_mass_matrix=pf.inverse_mass_matrix,
+    )
+    mcmc = MCMC(
+        kernel,
+        num_warmup=100,
+        num_samples=500,
+        num_chains=2,
+        chain_method="sequential",
+        progress_bar=False,
+    )
+    mcmc.run(random.PRNGKey(1), init_params=pf.get_init_params(2))
+    samples = mcmc.get_samples()
+    assert_allclose(np.mean(samples["x"], 0), np.arange(3.0), atol=0.5)
@@ -26,8 +26,9 @@ from numpyro.infer import (
     TraceMeanField_ELBO,
 )
 from numpyro.infer.elbo import _apply_vmap
+from numpyro.infer.svi import EarlyStopping
 from numpyro.primitives import mutable as numpyro_mutable
-from numpyro.util import fori_loop
+from numpyro.util import Checkpoint, fori_loop
 
 
 def assert_equal(a, b, prec=0):
@@ -454,6 +455,353 @@ def test_stable_run(stable_run):
     assert jnp.isfinite(svi_result.params["loc"]) == stable_run
 
 
+def _batched_model(y):
+    loc = numpyro.sample("loc", dist.Normal(0, 10))
+    with numpyro.plate("N", y.shape[-1]):
+        numpyro.sample("obs", dist.Normal(loc, 1), obs=y)
+
+
+def _batched_guide(y):
+    loc = numpyro.param("loc_q", lambda key: random.normal(key))
+    scale = numpyro.param("scale_q", 1.0, constraint=constraints.positive)
+    numpyro.sample("loc", dist.Normal(loc, scale))
+
+
+@pytest.mark.parametrize("stable_update", [False, True])
+def test_run_batched_datasets(stable_update):
+    y = jnp.arange(4.0)[:, None] + random.normal(random.PRNGKey(0), (4, 20))
+    rng_keys = random.split(random.PRNGKey(1), 4)
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(0.1), Trace_ELBO())
+    svi_result = svi.run_batched(
+        rng_keys, 100, y, in_axes=0, stable_update=stable_update
+    )
+    assert svi_result.losses.shape == (4, 100)
+    assert svi_result.converged is None
+    for i in range(4):
+        expected = svi.run(
+            rng_keys[i], 100, y[i], progress_bar=False, stable_update=stable_update
+        )
+        assert_allclose(svi_result.losses[i], expected.losses, rtol=1e-5)
+        assert_equal(
+            jax.tree.map(lambda x: x[i], svi_result.params), expected.params, 1e-5
+        )
+
+
+def test_run_batched_restarts():
+    y = random.normal(random.PRNGKey(0), (20,))
+    init_params = {"loc_q": jnp.array([-5.0, 0.0, 5.0]), "scale_q": jnp.ones(3)}
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(0.1), Trace_ELBO())
+    svi_result = svi.run_batched(
+        random.PRNGKey(1), 10, y, init_params=init_params, devices=jax.devices()[:1]
+    )
+    assert svi_result.losses.shape == (3, 10)
+    # the first step moves each member from its own initial value
+    assert_allclose(svi_result.params["loc_q"], init_params["loc_q"], atol=1.0)
+
+    # continue from the final states of the previous run
+    svi_result = svi.run_batched(random.PRNGKey(2), 10, y, init_state=svi_result.state)
+    assert svi_result.losses.shape == (3, 10)
+
+    with pytest.raises(ValueError, match="num_runs"):
+        svi.run_batched(random.PRNGKey(1), 10, y)
+
+
+@pytest.mark.parametrize("num_steps", [2000, 2050])
+def test_run_batched_early_stopping(num_steps):
+    y = 10 * jnp.arange(4.0)[:, None] + random.normal(random.PRNGKey(0), (4, 20))
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(0.1), Trace_ELBO())
+    svi_result = svi.run_batched(
+        random.PRNGKey(1),
+        num_steps,
+        y,
+        in_axes=0,
+        early_stopping=EarlyStopping(window=100, rtol=1e-3),
+    )
+    assert svi_result.losses.shape == (4, num_steps)
+    assert svi_result.converged.all()
+    num_finite = jnp.isfinite(svi_result.losses).sum(-1)
+    # members stop at the end of a window, and the ones far from the initial value
+    # take longer to converge
+    assert (num_finite % 100 == 0).all()
+    assert (num_finite < num_steps).all()
+    assert_allclose(svi_result.num_steps, num_finite)
+    assert num_finite[0] < num_finite[-1]
+    assert_allclose(svi_result.params["loc_q"], y.mean(-1), atol=0.2)
+
+
+@pytest.mark.parametrize(
+    "early_stopping",
+    [
+        EarlyStopping(window=100, rtol=1e-3),
+        EarlyStopping(window=100, rtol=None, grad_norm=1e-2),
+        EarlyStopping(window=100, rtol=None, param_change=1e-3),
+    ],
+)
+@pytest.mark.parametrize("progress_bar", [False, True])
+def test_run_early_stopping(early_stopping, progress_bar):
+    def guide(y):
+        numpyro.sample("loc", dist.Delta(numpyro.param("loc_q", 0.0)))
+
+    y = 5 + random.normal(random.PRNGKey(0), (20,))
+    svi = SVI(_batched_model, guide, optim.Adam(0.05), Trace_ELBO())
+    svi_result = svi.run(
+        random.PRNGKey(1),
+        5050,
+        y,
+        progress_bar=progress_bar,
+        early_stopping=early_stopping,
+    )
+    assert svi_result.converged
+    assert svi_result.num_steps < 5050
+    assert svi_result.num_steps % 100 == 0
+    assert svi_result.losses.shape == (5050,)
+    assert jnp.isfinite(svi_result.losses[: svi_result.num_steps]).all()
+    assert jnp.isnan(svi_result.losses[svi_result.num_steps :]).all()
+    assert_allclose(svi_result.params["loc_q"], y.sum() / (y.size + 0.01), atol=0.01)
+
+    # the same steps are taken without early stopping
+    expected = svi.run(
+        random.PRNGKey(1), int(svi_result.num_steps), y, progress_bar=False
+    )
+    assert_allclose(
+        svi_result.losses[: svi_result.num_steps], expected.losses, rtol=1e-6
+    )
+
+
+@pytest.mark.parametrize("num_steps", [50, 250])
+def test_run_early_stopping_not_converged(num_steps):
+    y = random.normal(random.PRNGKey(0), (20,))
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(1e-3), Trace_ELBO())
+    svi_result = svi.run(
+        random.PRNGKey(1),
+        num_steps,
+        y,
+        progress_bar=False,
+        early_stopping=EarlyStopping(window=100, rtol=1e-6),
+    )
+    assert not svi_result.converged
+    assert svi_result.num_steps == num_steps
+    assert jnp.isfinite(svi_result.losses).all()
+
+
+@pytest.mark.parametrize("remat", [False, True])
+@pytest.mark.parametrize("stable_update", [False, True])
+@pytest.mark.parametrize("forward_mode_differentiation", [False, True])
+def test_accumulated_update(remat, stable_update, forward_mode_differentiation):
+    def guide(y):
+        numpyro.sample("loc", dist.Delta(numpyro.param("loc_q", 0.0)))
+
+    y = 5 + random.normal(random.PRNGKey(0), (4, 10))
+    svi = SVI(_batched_model, guide, optim.SGD(0.01), Trace_ELBO())
+    svi_state = svi.init(random.PRNGKey(1), y[0])
+    new_state, loss = svi.accumulated_update(
+        svi_state,
+        y,
+        remat=remat,
+        stable_update=stable_update,
+        forward_mode_differentiation=forward_mode_differentiation,
+    )
+
+    def expected_loss_fn(params):
+        return jnp.mean(
+            jnp.stack(
+                [
+                    Trace_ELBO().loss(
+                        random.PRNGKey(0), params, _batched_model, guide, y_k
+                    )
+                    for y_k in y
+                ]
+            )
+        )
+
+    params = svi.get_params(svi_state)
+    expected_loss, grads = value_and_grad(expected_loss_fn)(params)
+    assert_allclose(loss, expected_loss, rtol=1e-6)
+    assert_allclose(
+        svi.get_params(new_state)["loc_q"],
+        params["loc_q"] - 0.01 * grads["loc_q"],
+        rtol=1e-6,
+    )
+
+
+def test_run_minibatches():
+    def model(y):
+        loc = numpyro.sample("loc", dist.Normal(0, 10))
+        # the likelihood of a minibatch is scaled to the full dataset
+        with numpyro.plate("N", 40, subsample_size=y.shape[-1]):
+            numpyro.sample("obs", dist.Normal(loc, 1), obs=y)
+
+    def guide(y):
+        numpyro.sample("loc", dist.Delta(numpyro.param("loc_q", 0.0)))
+
+    y = 5 + random.normal(random.PRNGKey(0), (40,))
+    svi = SVI(model, guide, optim.Adam(0.1), Trace_ELBO())
+    expected = svi.run(random.PRNGKey(1), 100, y, progress_bar=False)
+    # a stack of 4 minibatches of 10 data points along the last axis
+    svi_result = svi.run(
+        random.PRNGKey(1),
+        100,
+        y.reshape((4, 10)).T,
+        progress_bar=False,
+        minibatch_axes=1,
+        remat=True,
+    )
+    assert_allclose(svi_result.losses, expected.losses, rtol=1e-5)
+    assert_allclose(svi_result.params["loc_q"], expected.params["loc_q"], rtol=1e-5)
+
+
+def _interrupt_after(monkeypatch, num_saves):
+    save_checkpoint = numpyro.util._save_checkpoint
+    saves = []
+
+    def interrupted_save(*args):
+        if len(saves) == num_saves:
+            raise KeyboardInterrupt
+        saves.append(args[1])
+        save_checkpoint(*args)
+
+    monkeypatch.setattr(numpyro.util, "_save_checkpoint", interrupted_save)
+    return saves
+
+
+@pytest.mark.parametrize("progress_bar", [True, False])
+def test_run_checkpoint_resume(tmp_path, monkeypatch, progress_bar):
+    y = random.normal(random.PRNGKey(0), (20,))
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(0.05), Trace_ELBO())
+    expected = svi.run(random.PRNGKey(1), 100, y, progress_bar=False)
+
+    checkpoint = Checkpoint(str(tmp_path), every=30)
+    saves = _interrupt_after(monkeypatch, 5)
+    with pytest.raises(KeyboardInterrupt):
+        svi.run(random.PRNGKey(1), 100, y, progress_bar=False, checkpoint=checkpoint)
+    # the chunk of losses is saved before the state of each segment
+    assert saves == [
+        "chunk_000000.pkl",
+        "state.pkl",
+        "chunk_000001.pkl",
+        "state.pkl",
+        "chunk_000002.pkl",
+    ]
+    monkeypatch.undo()
+
+    svi = SVI(_batched_model, _batched_guide, optim.Adam(0.05), Trace_ELBO())
+    svi_result = svi.run(
+        random.PRNGKey(2),
+        100,
+        y,
+        progress_bar=progress_bar,
+        checkpoint=checkpoint,
+        resume=True,
+    )
+    assert_allclose(svi_result.losses, expected.losses)
+    assert_allclose(svi_result.params["loc_q"], expected.params["loc_q"])
+
+    with pytest.raises(ValueError, match="different run"):
+        svi.run(random.PRNGKey(1), 50, y, checkpoint=checkpoint, resume=True)
+    with pytest.raises(ValueError, match="early_stopping"):
+        svi.run(
+            random.PRNGKey(1),
+            100,
+            y,
+            checkpoint=checkpoint,
+            early_stopping=EarlyStopping(),
+        )
+
+
+def _gamma_poisson(x):
+    rate = numpyro.sample("z", dist.Gamma(2.0, 1.0).expand([3]).to_event(1))
+    with numpyro.plate("N", x.shape[0]):
+        numpyro.sample("obs", dist.Poisson(rate).to_event(1), obs=x)
+
+
+def _normal_normal(x):
+    with numpyro.plate("D", 3):
+        loc = numpyro.sample("z", dist.Normal(1.0, 2.0))
+        with numpyro.plate("N", x.shape[0], dim=-2):
+            numpyro.sample("obs", dist.Normal(loc, 0.5), obs=x)
+
+
+def _dirichlet_categorical(x):
+    probs = numpyro.sample("z", dist.Dirichlet(jnp.ones(3)))
+    with numpyro.plate("N", x.shape[0]):
+        numpyro.sample("obs", dist.Categorical(probs), obs=x)
+
+
+@pytest.mark.parametrize(
+    "model, x, expected",
+    [
+        (
+            _gamma_poisson,
+            np.array([[1.0, 0.0, 5.0], [3.0, 1.0, 4.0]]),
+            {
+                "concentration": np.array([6.0, 3.0, 11.0]),
+                "rate": np.array([3.0, 3.0, 3.0]),
+            },
+        ),
+        (
+            _normal_normal,
+            np.array([[1.0, 2.0, 3.0], [2.0, 2.0, 0.0]]),
+            {
+                "loc": (1.0 / 4 + np.array([3.0, 4.0, 3.0]) * 4) / (1 / 4 + 8),
+                "scale": np.full(3, (1 / 4 + 8) ** -0.5),
+            },
+        ),
+        (
+            _dirichlet_categorical,
+            np.array([0, 2, 2, 1, 2]),
+            {"concentration": np.array([2.0, 2.0, 4.0])},
+        ),
+    ],
+)
+def test_conjugate_sites(model, x, expected):
+    svi = SVI(model, None, optim.Adam(0.1), Trace_ELBO(), conjugate_sites=["z"])
+    svi_state = svi.init(random.PRNGKey(0), jnp.asarray(x))
+    svi_state, _ = svi.update(svi_state, jnp.asarray(x))
+    # a unit natural gradient step recovers the exact posterior
+    for name, value in expected.items():
+        assert_allclose(svi_state.mutable_state["z_conjugate"][name], value, rtol=1e-5)
+
+
+@pytest.mark.parametrize("stable_update", [False, True])
+def test_conjugate_sites_hybrid(stable_update):
+    def model(y):
+        loc = numpyro.sample("loc", dist.Normal(0, 10))
+        scale = numpyro.sample("scale", dist.HalfNormal(2))
+        with numpyro.plate("N", y.shape[0]):
+            numpyro.sample("obs", dist.Normal(loc, scale), obs=y)
+
+    def guide(y):
+        scale_q = numpyro.param("scale_q", 1.0, constraint=constraints.positive)
+        numpyro.sample("scale", dist.Delta(scale_q))
+
+    y = 5 + 0.5 * random.normal(random.PRNGKey(0), (100,))
+    svi = SVI(
+        model,
+        guide,
+        optim.Adam(0.05),
+        Trace_ELBO(),
+        conjugate_sites=["loc"],
+        conjugate_step_size=0.5,
+    )
+    svi_result = svi.run(
+        random.PRNGKey(1), 1000, y, progress_bar=False, stable_update=stable_update
+    )
+    posterior = svi_result.state.mutable_state["loc_conjugate"]
+    scale = svi_result.params["scale_q"]
+    assert_allclose(scale, 0.5, rtol=0.1)
+    assert_allclose(posterior["loc"], jnp.mean(y), rtol=1e-2)
+    assert_allclose(posterior["scale"], scale / 10, rtol=1e-3)
+
+
+def test_conjugate_sites_invalid():
+    def model():
+        numpyro.sample("x", dist.LogNormal(0, 1))
+
+    svi = SVI(model, None, optim.Adam(0.1), Trace_ELBO(), conjugate_sites=["x"])
+    with pytest.raises(ValueError, match="LogNormal prior"):
+        svi.init(random.PRNGKey(0))
+
+
 def test_svi_discrete_latent():
     cont_inf_only_cls = [RenyiELBO(), Trace_ELBO(), TraceMeanField_ELBO()]
     mixed_inf_cls = [TraceGraph_ELBO()]
@@ -759,21 +1107,26 @@ def test_tracegraph_gaussian_chain(num_latents, num_steps, step_size, atol, diff
         for k in reversed(range(1, N + 1)):
             loc_q = numpyro.param(
                 f"loc_q_{k}",
-                lambda key: target_mus[k]
-                + difficulty * (0.1 * random.normal(key) - 0.53),
+                lambda key: (
+                    target_mus[k] + difficulty * (0.1 * random.normal(key) - 0.53)
+                ),
             )
             log_sig_q = numpyro.param(
                 f"log_sig_q_{k}",
-                lambda key: -0.5 * jnp.log(lambda_posts[k])
-                + difficulty * (0.1 * random.normal(key) - 0.53),
+                lambda key: (
+                    -0.5 * jnp.log(lambda_posts[k])
+                    + difficulty * (0.1 * random.normal(key) - 0.53)
+                ),
             )
             sig_q = jnp.exp(log_sig_q)
             kappa_q = None
             if k != N:
                 kappa_q = numpyro.param(
                     "kappa_q_%d" % k,
-                    lambda key: target_kappas[k]
-                    + difficulty * (0.1 * random.normal(key) - 0.53),
+                    lambda key: (
+                        target_kappas[k]
+                        + difficulty * (0.1 * random.normal(key) - 0.53)
+                    ),
                 )
             mean_function = loc_q if k == N else kappa_q * previous_sample + loc_q
             node_flagged = True if which_nodes_reparam[k - 1] == 1.0 else False
@@ -44,6 +44,9 @@ from numpyro.distributions.transforms import (
     biject_to,
 )
 from numpyro.distributions.util import (
+    CholeskyFactor,
+    EighFactor,
+    LowRankFactor,
     matrix_to_tril_vec,
     multinomial,
     signed_stick_breaking_tril,
@@ -143,6 +146,27 @@ def _circulant_to_scipy(loc, covariance_row, covariance_rfft):
     return osp.multivariate_normal(mean=jax_dist.mean, cov=jax_dist.covariance_matrix)
 
 
+def _structured_mvn_to_scipy(jax_dist):
+    def to_scipy(*params):
+        d = jax_dist(*params)
+        return osp.multivariate_normal(mean=d.mean, cov=d.covariance_matrix)
+
+    return to_scipy
+
+
+def _kronecker_mvn_to_scipy(loc, left_cov, right_cov, left_scale, right_scale):
+    # build the reference covariance in float64 to avoid a loss of precision
+    def cov(cov, scale):
+        if cov is None:
+            scale = np.asarray(scale, dtype=np.float64)
+            return scale @ np.swapaxes(scale, -2, -1)
+        return np.asarray(cov, dtype=np.float64)
+
+    cov = np.kron(cov(left_cov, left_scale), cov(right_cov, right_scale))
+    loc = np.broadcast_to(loc, cov.shape[-1:])
+    return osp.multivariate_normal(mean=loc, cov=cov)
+
+
 def _TruncatedNormal(loc, scale, low, high):
     return dist.TruncatedNormal(loc=loc, scale=scale, low=low, high=high)
 
@@ -419,6 +443,9 @@ _DIST_MAP = {
     ),
     dist.Cauchy: lambda loc, scale: osp.cauchy(loc=loc, scale=scale),
     dist.Chi2: lambda df: osp.chi2(df),
+    dist.BlockDiagonalMultivariateNormal: _structured_mvn_to_scipy(
+        dist.BlockDiagonalMultivariateNormal
+    ),
     dist.CirculantNormal: _circulant_to_scipy,
     dist.Dirichlet: lambda conc: osp.dirichlet(conc),
     dist.DiscreteUniform: lambda low, high: osp.randint(low, high + 1),
@@ -444,6 +471,10 @@ _DIST_MAP = {
     dist.MultivariateNormal: _mvn_to_scipy,
     dist.MultivariateStudentT: _multivariate_t_to_scipy,
     dist.LowRankMultivariateNormal: _lowrank_mvn_to_scipy,
+    dist.KroneckerMultivariateNormal: _kronecker_mvn_to_scipy,
+    dist.ToeplitzMultivariateNormal: _structured_mvn_to_scipy(
+        dist.ToeplitzMultivariateNormal
+    ),
     dist.Normal: lambda loc, scale: osp.norm(loc=loc, scale=scale),
     dist.Pareto: lambda scale, alpha: osp.pareto(alpha, scale=scale),
     dist.Poisson: lambda rate: osp.poisson(rate),
@@ -663,6 +694,40 @@ CONTINUOUS = [
         np.broadcast_to(np.identity(3), (2, 3, 3)),
         None,
     ),
+    T(
+        dist.KroneckerMultivariateNormal,
+        np.arange(6.0),
+        np.array([[1.0, 0.5], [0.5, 1.0]]),
+        np.array([[2.0, 0.3, 0.1], [0.3, 1.0, 0.2], [0.1, 0.2, 1.5]]),
+        None,
+        None,
+    ),
+    T(
+        dist.KroneckerMultivariateNormal,
+        0.0,
+        None,
+        None,
+        np.array([[[1.0, 0.0], [0.5, 1.0]], [[2.0, 0.0], [0.3, 0.5]]]),
+        np.array([[1.0, 0.0], [-0.4, 0.8]]),
+    ),
+    T(dist.ToeplitzMultivariateNormal, np.zeros(4), np.array([1.0, 0.5, 0.2, 0.1])),
+    T(
+        dist.ToeplitzMultivariateNormal,
+        np.arange(3.0),
+        np.array([[1.0, 0.5, 0.2], [2.0, -0.3, 0.1]]),
+    ),
+    T(
+        dist.BlockDiagonalMultivariateNormal,
+        np.arange(4.0),
+        np.broadcast_to(np.array([[1.0, 0.5], [0.5, 1.0]]), (2, 2, 2)),
+        None,
+    ),
+    T(
+        dist.BlockDiagonalMultivariateNormal,
+        0.0,
+        None,
+        np.array([[[[1.0, 0.0], [0.5, 1.0]]], [[[2.0, 0.0], [-0.5, 1.0]]]]),
+    ),
     T(
         dist.CAR,
         1.2,
@@ -1169,6 +1234,10 @@ def gen_values_within_bounds(constraint, size, key=None):
         return x
     elif constraint is constraints.positive_definite_circulant_vector:
         return jnp.fft.irfft(random.gamma(key, 10, size) / 10, n=size[-1])
+    elif constraint is constraints.positive_definite_toeplitz_vector:
+        # the covariance of an Ornstein-Uhlenbeck process
+        length_scale = random.gamma(key, 10, size[:-1] + (1,))
+        return jnp.exp(-jnp.arange(size[-1]) / length_scale)
     else:
         raise NotImplementedError("{} not implemented.".format(constraint))
 
@@ -1243,6 +1312,8 @@ def gen_values_outside_bounds(constraint, size, key=None):
         return x
     elif constraint is constraints.positive_definite_circulant_vector:
         return random.normal(key, size)
+    elif constraint is constraints.positive_definite_toeplitz_vector:
+        return random.normal(key, size).at[..., 0].set(-1.0)
     else:
         raise NotImplementedError("{} not implemented.".format(constraint))
 
@@ -2154,6 +2225,11 @@ def test_distribution_constraints(jax_dist, sp_dist, params, prepend_shape):
             # we need to ensure this is defined, so force df >= 1
             valid_params[0] += 1
 
+        if jax_dist is dist.KroneckerMultivariateNormal and dist_args[i] != "loc":
+            # the condition number of a Kronecker product is the product of
+            # the condition numbers, so keep random factors well-conditioned
+            valid_params[i] += jnp.identity(jnp.shape(params[i])[-1])
+
         if jax_dist is dist.LogUniform:
             # scipy.stats.loguniform take parameter a and b
             # which is a > 0 and b > a.
@@ -3157,6 +3233,64 @@ def test_kl_multivariate_normal_nondiagonal_covariance():
     assert_allclose(actual, expected, atol=2e-5)
 
 
+def _random_covariance(key, shape):
+    A = random.normal(key, shape)
+    return A @ jnp.swapaxes(A, -1, -2) + jnp.eye(shape[-1])
+
+
+@pytest.mark.parametrize(
+    "make_dist",
+    [
+        lambda key: dist.KroneckerMultivariateNormal(
+            random.normal(key, (6,)),
+            _random_covariance(random.fold_in(key, 1), (3, 2, 2)),
+            _random_covariance(random.fold_in(key, 2), (3, 3)),
+        ),
+        lambda key: dist.ToeplitzMultivariateNormal(
+            random.normal(key, (5,)),
+            jnp.exp(-jnp.arange(5.0) / random.uniform(key, (3, 1), minval=0.5)),
+        ),
+        lambda key: dist.BlockDiagonalMultivariateNormal(
+            random.normal(key, (6,)),
+            _random_covariance(random.fold_in(key, 1), (3, 2, 3, 3)),
+        ),
+    ],
+    ids=["kronecker", "toeplitz", "block_diagonal"],
+)
+def test_kl_structured_multivariate_normal(make_dist):
+    p = make_dist(random.PRNGKey(0))
+    q = make_dist(random.PRNGKey(1))
+    actual = kl_divergence(p, q)
+    expected = kl_divergence(
+        dist.MultivariateNormal(p.mean, p.covariance_matrix),
+        dist.MultivariateNormal(q.mean, q.covariance_matrix),
+    )
+    assert actual.shape == (3,)
+    assert_allclose(actual, expected, rtol=1e-4)
+
+
+def test_toeplitz_mvn_log_prob_grad():
+    covariance_row = np.exp(-np.arange(6.0) / 2)
+    value = random.normal(random.PRNGKey(0), (6,))
+
+    def log_prob(covariance_row):
+        d = dist.ToeplitzMultivariateNormal(0.0, covariance_row)
+        return d.log_prob(value)
+
+    def expected_log_prob(covariance_row):
+        d = dist.ToeplitzMultivariateNormal(0.0, covariance_row)
+        return dist.MultivariateNormal(0.0, d.covariance_matrix).log_prob(value)
+
+    assert_allclose(
+        log_prob(covariance_row), expected_log_prob(covariance_row), rtol=1e-5
+    )
+    assert_allclose(
+        jax.grad(log_prob)(covariance_row),
+        jax.grad(expected_log_prob)(covariance_row),
+        rtol=1e-4,
+    )
+
+
 @pytest.mark.parametrize("shape", [(), (4,), (2, 3)], ids=str)
 @pytest.mark.parametrize(
     "p_dist, q_dist",
@@ -3416,6 +3550,61 @@ def test_multinomial_abstract_total_count():
     assert_allclose(x, y, rtol=1e-6)
 
 
+@pytest.mark.parametrize("sampler", [None, "alias", "icdf", "binomial"])
+def test_multinomial_sampler(sampler):
+    probs = jnp.array([[0.2, 0.5, 0.3], [0.6, 0.0, 0.4]])
+    key = random.PRNGKey(0)
+
+    def f(total_count):
+        return dist.Multinomial(
+            total_count, probs=probs, total_count_max=1000, sampler=sampler
+        ).sample(key, (500,))
+
+    total_count = jnp.array([10, 1000])
+    x = jax.jit(f)(total_count)
+    assert x.shape == (500, 2, 3)
+    assert_allclose(x.sum(-1), jnp.broadcast_to(total_count, (500, 2)))
+    assert_allclose(x.mean(0) / total_count[:, None], probs, atol=0.02)
+    if sampler != "binomial":
+        d = dist.Categorical(probs, sampler=sampler)
+        x = jax.jit(lambda d: d.sample(key, (10000,)))(d)
+        freqs = jnp.stack([jnp.bincount(x[:, i], length=3) for i in range(2)])
+        assert_allclose(freqs / 10000, probs, atol=0.02)
+
+
+def test_invalid_sampler():
+    with pytest.raises(ValueError, match="Unknown sampler"):
+        dist.Categorical(jnp.ones(3) / 3, sampler="binomial")
+    with pytest.raises(ValueError, match="Unknown sampler"):
+        dist.Multinomial(10, jnp.ones(3) / 3, sampler="foo")
+    with pytest.raises(ValueError, match="only supported with `probs`"):
+        dist.Multinomial(10, logits=jnp.zeros(3), sampler="alias")
+
+
+@pytest.mark.parametrize("sampler", [None, "ptrs", "normal"])
+def test_poisson_sampler(sampler):
+    rate = jnp.array([0.5, 20.0, 2000.0])
+    key = random.PRNGKey(0)
+    d = dist.Poisson(rate, sampler=sampler)
+    x = jax.jit(lambda d: d.sample(key, (20000,)))(d)
+    assert x.shape == (20000, 3)
+    assert_allclose(x.mean(0), rate, rtol=0.03)
+    assert_allclose(x.var(0), rate, rtol=0.05)
+
+    d = dist.NegativeBinomial2(rate, 3.0, sampler=sampler)
+    x = jax.jit(lambda d: d.sample(key, (20000,)))(d)
+    assert x.shape == (20000, 3)
+    assert_allclose(x.mean(0), rate, rtol=0.05)
+    assert_allclose(x.var(0), rate + rate**2 / 3, rtol=0.1)
+
+
+def test_invalid_poisson_sampler():
+    with pytest.raises(ValueError, match="Unknown sampler"):
+        dist.Poisson(1.0, sampler="alias")
+    with pytest.raises(ValueError, match="Unknown sampler"):
+        dist.NegativeBinomialProbs(10, 0.5, sampler="foo")
+
+
 def test_normal_log_cdf():
     # test if log_cdf method agrees with jax.scipy.stats.norm.logcdf
     # and if exp(log_cdf) agrees with cdf
@@ -3459,6 +3648,108 @@ def test_sample_truncated_normal_in_tail():
     assert ~jnp.isinf(samples).any()
 
 
+@pytest.mark.parametrize(
+    "low, high",
+    [(40.0, None), (None, -40.0), (38.0, 38.5), (-45.0, -44.0), (-1.0, 1.0)],
+)
+def test_truncated_normal_far_tail(low, high):
+    d = dist.TruncatedNormal(0.0, 1.0, low=low, high=high)
+    samples = d.sample(random.PRNGKey(0), sample_shape=(10_000,))
+    assert jnp.isfinite(samples).all()
+    low = -np.inf if low is None else low
+    high = np.inf if high is None else high
+    assert ((samples >= low) & (samples <= high)).all()
+    expected = osp.truncnorm(low, high)
+    assert_allclose(samples.mean(), expected.mean(), atol=0.01)
+    value = expected.ppf(np.array([0.1, 0.5, 0.9]))
+    assert_allclose(d.log_prob(value), expected.logpdf(value), rtol=1e-4)
+
+
+def test_power_law_large_exponent():
+    alpha, low, high = 60.0, 2.0, 10.0
+    d = dist.DoublyTruncatedPowerLaw(alpha, low, high)
+    samples = d.sample(random.PRNGKey(0), sample_shape=(10_000,))
+    assert ((samples >= low) & (samples <= high)).all()
+    # the mass concentrates near high, with mean (alpha + 1) / (alpha + 2) * high
+    assert_allclose(samples.mean(), (alpha + 1) / (alpha + 2) * high, rtol=1e-3)
+    value = np.array([5.0, 9.0, 10.0])
+    expected = alpha * np.log(value) + np.log(alpha + 1) - (alpha + 1) * np.log(high)
+    expected -= np.log1p(-((low / high) ** (alpha + 1)))
+    assert_allclose(d.log_prob(value), expected, rtol=1e-5)
+    assert_allclose(
+        d.cdf(value), np.exp(expected + np.log(value) - np.log(alpha + 1)), rtol=1e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "make_factor",
+    [
+        lambda cov: CholeskyFactor.from_covariance(cov),
+        lambda cov: CholeskyFactor.from_precision(jnp.linalg.inv(cov)),
+        lambda cov: EighFactor.from_covariance(cov),
+    ],
+    ids=["cholesky", "precision", "eigh"],
+)
+@pytest.mark.parametrize("batch_shape", [(), (3,)])
+def test_mvn_factor(make_factor, batch_shape):
+    A = random.normal(random.PRNGKey(0), batch_shape + (4, 4))
+    cov = A @ jnp.swapaxes(A, -1, -2) + jnp.eye(4)
+    loc = np.arange(4.0)
+    expected = dist.MultivariateNormal(loc, cov)
+    actual = dist.MultivariateNormal(loc, factor=make_factor(cov))
+    assert actual.batch_shape == expected.batch_shape
+    assert actual.event_shape == expected.event_shape
+    value = random.normal(random.PRNGKey(1), (2,) + batch_shape + (4,))
+    assert_allclose(actual.log_prob(value), expected.log_prob(value), rtol=1e-4)
+    assert_allclose(actual.entropy(), expected.entropy(), rtol=1e-5)
+    assert_allclose(actual.variance, expected.variance, rtol=1e-4)
+    assert_allclose(actual.scale_tril, expected.scale_tril, rtol=1e-4, atol=1e-5)
+    samples = actual.sample(random.PRNGKey(2), (10000,))
+    assert samples.shape == (10000,) + batch_shape + (4,)
+    assert_allclose(samples.mean(0), expected.mean, atol=0.1)
+
+    # the factorization is a pytree which can be passed to jitted functions
+    log_prob = jax.jit(lambda d, x: d.log_prob(x))(actual, value)
+    assert_allclose(log_prob, expected.log_prob(value), rtol=1e-4)
+
+
+def test_mvn_eigh_factor_add_diag():
+    x = np.linspace(0, 1, 6)
+    kernel = np.exp(-0.5 * (x[:, None] - x) ** 2 / 0.3**2)
+    factor = EighFactor.from_covariance(kernel)
+    value = random.normal(random.PRNGKey(0), (6,))
+
+    def log_prob(noise):
+        d = dist.MultivariateNormal(0.0, factor=factor.add_diag(noise))
+        return d.log_prob(value)
+
+    def expected_log_prob(noise):
+        return dist.MultivariateNormal(0.0, kernel + noise * jnp.eye(6)).log_prob(value)
+
+    assert_allclose(log_prob(0.5), expected_log_prob(0.5), rtol=1e-5)
+    assert_allclose(
+        jax.grad(log_prob)(0.5), jax.grad(expected_log_prob)(0.5), rtol=1e-4
+    )
+    # batched noise
+    noise = np.array([0.1, 0.5, 1.0])
+    assert_allclose(
+        jax.vmap(log_prob)(noise), jax.vmap(expected_log_prob)(noise), rtol=1e-4
+    )
+
+
+def test_lowrank_mvn_factor():
+    cov_factor = random.normal(random.PRNGKey(0), (3, 5, 2))
+    cov_diag = np.ones(5)
+    factor = LowRankFactor.from_factors(cov_factor, cov_diag).with_diag(2 * cov_diag)
+    actual = dist.LowRankMultivariateNormal(np.zeros(5), factor=factor)
+    expected = dist.LowRankMultivariateNormal(np.zeros(5), cov_factor, 2 * cov_diag)
+    value = random.normal(random.PRNGKey(1), (2, 3, 5))
+    assert_allclose(actual.log_prob(value), expected.log_prob(value), rtol=1e-5)
+    assert_allclose(actual.covariance_matrix, expected.covariance_matrix, rtol=1e-6)
+    with pytest.raises(ValueError, match="cannot be specified"):
+        dist.LowRankMultivariateNormal(np.zeros(5), cov_factor, factor=factor)
+
+
 @jax.enable_custom_prng()
 def test_jax_custom_prng():
     samples = dist.Normal(0, 5).sample(random.PRNGKey(0), sample_shape=(1000,))
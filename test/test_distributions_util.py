@@ -17,13 +17,24 @@ from jax.test_util import check_grads
 import numpyro.distributions as dist
 from numpyro.distributions.util import (
     add_diag,
+    alias_table,
     binary_cross_entropy_with_logits,
     binomial,
     categorical,
+    categorical_alias,
+    categorical_icdf,
     cholesky_update,
+    gamma_poisson,
     log1mexp,
+    log_bessel_iv,
+    log_bessel_iv_range,
+    log_ndtr_inv,
     logdiffexp,
     multinomial,
+    multinomial_alias,
+    multinomial_binomial,
+    multinomial_icdf,
+    poisson,
     safe_normalize,
     vec_to_tril_matrix,
     von_mises_centered,
@@ -81,6 +92,66 @@ def test_categorical_stats(p):
     assert_allclose(counts / float(n), p, atol=0.01)
 
 
+@pytest.mark.parametrize(
+    "p",
+    [
+        np.array([0.2, 0.3, 0.5]),
+        np.array([0.0, 0.7, 0.0, 0.3]),
+        np.array([[0.25, 0.25, 0.25, 0.25], [0.97, 0.01, 0.01, 0.01]]),
+    ],
+)
+def test_alias_table(p):
+    prob, alias = alias_table(p)
+    assert prob.shape == alias.shape == p.shape
+    # the probability of each category implied by the table
+    num_categories = p.shape[-1]
+    implied = np.zeros(p.shape)
+    for idx in np.ndindex(p.shape[:-1]):
+        for i in range(num_categories):
+            implied[idx + (i,)] += prob[idx + (i,)] / num_categories
+            implied[idx + (int(alias[idx + (i,)]),)] += (
+                1 - prob[idx + (i,)]
+            ) / num_categories
+    assert_allclose(implied, p, atol=1e-6)
+
+
+@pytest.mark.parametrize("sampler", ["alias", "icdf"])
+@pytest.mark.parametrize(
+    "p, shape",
+    [
+        (np.array([0.2, 0.3, 0.5]), (10000,)),
+        (np.array([[0.8, 0.1, 0.1], [0.0, 0.5, 0.5]]), (10000, 2)),
+    ],
+)
+def test_categorical_samplers(sampler, p, shape):
+    rng_key = random.PRNGKey(0)
+    if sampler == "alias":
+        z = categorical_alias(rng_key, *alias_table(p), shape)
+    else:
+        z = categorical_icdf(rng_key, jnp.cumsum(p, -1), shape)
+    assert z.shape == shape
+    z = z.reshape(shape[:1] + (-1,))
+    freqs = np.stack([np.bincount(z[:, i], minlength=3) for i in range(z.shape[1])])
+    assert_allclose(freqs / shape[0], p.reshape((-1, 3)), atol=0.01)
+
+
+def test_log_ndtr_inv():
+    log_p = np.array([-1e4, -500.0, -100.0, -20.0, -1.0, -0.1, -1e-5, -1e-20, 0.0])
+    x = log_ndtr_inv(log_p)
+    assert x[-1] == np.inf
+    # compare to scipy where exp(log_p) does not underflow, otherwise check that
+    # log_ndtr is inverted
+    expected = -scipy.stats.norm.ppf(-np.expm1(log_p))
+    finite = np.isfinite(expected)
+    assert_allclose(x[finite], expected[finite], rtol=1e-5)
+    assert_allclose(jax.scipy.special.log_ndtr(x[:3]), log_p[:3], rtol=1e-5)
+    # the derivative of log_ndtr(x) is pdf(x) / cdf(x)
+    actual_grad = vmap(grad(log_ndtr_inv))(log_p[:-1])
+    x = x[:-1]
+    expected_grad = np.exp(log_p[:-1] - scipy.stats.norm.logpdf(np.asarray(x)))
+    assert_allclose(actual_grad, expected_grad, rtol=1e-3)
+
+
 @pytest.mark.parametrize("x", [-80.5632, -0.32523, -0.5, -20.53, -8.032])
 def test_log1mexp_grads(x):
     check_grads(log1mexp, (x,), order=3)
@@ -236,6 +307,34 @@ def test_logdiffexp_stable(a, b):
         assert result == -jnp.inf
 
 
+def _log_bessel_iv_grad(v, x):
+    # d/dx log I_v(x) = I_{v+1}(x) / I_v(x) + v / x
+    return scipy.special.ive(v + 1, x) / scipy.special.ive(v, x) + v / x
+
+
+@pytest.mark.parametrize("v", [0, 1, 0.5, 2.5, 7.0, 14.9, 15.0, 30.0, 49.0])
+def test_log_bessel_iv(v):
+    x = np.array([1e-3, 0.1, 1.0, 5.0, 10.0, 30.0, 50.0, 100.0, 225.0, 1e3, 1e4])
+    expected = np.log(scipy.special.ive(v, x)) + x
+    assert_allclose(log_bessel_iv(v, x), expected, rtol=1e-5, atol=1e-5)
+    assert_allclose(log_bessel_iv(v, 0.0), 0.0 if v == 0 else -np.inf, atol=1e-6)
+    actual_grad = vmap(grad(lambda x: log_bessel_iv(v, x)))(x)
+    assert_allclose(actual_grad, _log_bessel_iv_grad(v, x), rtol=1e-4)
+
+
+@pytest.mark.parametrize("shape", [(), (3,), (2, 3)])
+def test_log_bessel_iv_range(shape):
+    x = random.uniform(random.PRNGKey(0), shape, minval=0.01, maxval=300.0)
+    actual = log_bessel_iv_range(49, x)
+    assert actual.shape == (50,) + shape
+    orders = np.arange(50).reshape((-1,) + (1,) * len(shape))
+    expected = np.log(scipy.special.ive(orders, x)) + x
+    assert_allclose(actual, expected, rtol=1e-5, atol=1e-5)
+    actual_grad = jax.jacfwd(lambda x: log_bessel_iv_range(49, x))(37.3)
+    expected_grad = _log_bessel_iv_grad(np.arange(50), 37.3)
+    assert_allclose(actual_grad, expected_grad, rtol=1e-3)
+
+
 @pytest.mark.parametrize(
     "p, shape",
     [
@@ -274,6 +373,58 @@ def test_multinomial_stats(p, n):
     assert_allclose(z / n, p, atol=0.01)
 
 
+@pytest.mark.parametrize("sampler", ["alias", "icdf", "binomial"])
+@pytest.mark.parametrize("n", [0, 10000, np.array([0, 10000, 20000])])
+@pytest.mark.parametrize("shape", [(), (3,), (2, 3)])
+def test_multinomial_samplers(sampler, n, shape):
+    rng_key = random.PRNGKey(0)
+    p = np.array([0.2, 0.0, 0.3, 0.5])
+    if sampler == "alias":
+        z = multinomial_alias(rng_key, *alias_table(p), n, shape)
+    elif sampler == "icdf":
+        z = multinomial_icdf(rng_key, jnp.cumsum(p), n, shape)
+    else:
+        z = multinomial_binomial(rng_key, p, n, shape)
+    expected_shape = lax.broadcast_shapes(jnp.shape(n), shape) + p.shape
+    assert z.shape == expected_shape
+    assert_allclose(z.sum(-1), jnp.broadcast_to(n, expected_shape[:-1]))
+    n = jnp.expand_dims(jnp.asarray(n), -1)
+    p = jnp.broadcast_to(p, z.shape)
+    assert_allclose(jnp.where(n > 0, z / jnp.maximum(n, 1), p), p, atol=0.02)
+
+
+@pytest.mark.parametrize(
+    "rate", [0.0, 0.5, 5.0, 10.0, 50.0, 5000.0, np.array([0.0, 3.0, 30.0, 3000.0])]
+)
+@pytest.mark.parametrize("normal_threshold", [None, 1000.0])
+def test_poisson(rate, normal_threshold):
+    rng_key = random.PRNGKey(0)
+    z = poisson(rng_key, rate, (100000,) + jnp.shape(rate), normal_threshold)
+    assert z.shape == (100000,) + jnp.shape(rate)
+    assert jnp.issubdtype(z.dtype, jnp.integer)
+    assert_allclose(z.mean(0), rate, rtol=0.02, atol=0.02)
+    assert_allclose(z.var(0), rate, rtol=0.05, atol=0.02)
+
+
+def test_poisson_nan():
+    z = poisson(random.PRNGKey(0), jnp.array([jnp.nan, 20.0]), (10, 2))
+    assert_array_equal(z[:, 0], 0)
+
+
+@pytest.mark.parametrize(
+    "concentration, rate", [(0.3, 0.1), (2.0, 0.02), (np.array([0.5, 50.0]), 2.0)]
+)
+@pytest.mark.parametrize("normal_threshold", [None, 100.0])
+def test_gamma_poisson(concentration, rate, normal_threshold):
+    rng_key = random.PRNGKey(0)
+    shape = (200000,) + jnp.shape(concentration)
+    z = gamma_poisson(rng_key, concentration, rate, shape, normal_threshold)
+    assert z.shape == shape
+    mean = jnp.broadcast_to(concentration / rate, shape[1:])
+    assert_allclose(z.mean(0), mean, rtol=0.03)
+    assert_allclose(z.var(0), mean * (1 + rate) / rate, rtol=0.1)
+
+
 @pytest.mark.parametrize("shape", [(6,), (5, 10), (3, 4, 3)])
 @pytest.mark.parametrize("diagonal", [0, -1, -2])
 def test_vec_to_tril_matrix(shape, diagonal):
@@ -156,6 +156,181 @@ def test_scale(use_context_manager):
     assert_allclose(log_joint, expected)
 
 
+@pytest.mark.parametrize("compute_dtype", ["float16", "bfloat16"])
+def test_mixed_precision(compute_dtype):
+    dtypes = []
+
+    def model(data, mask):
+        loc = numpyro.sample("loc", dist.Normal(0, 1))
+        scale = numpyro.sample("scale", dist.HalfNormal(1))
+        dtypes.extend([loc.dtype, scale.dtype])
+        numpyro.factor("factor", -(loc**2))
+        with numpyro.plate("N", data.shape[0]), handlers.mask(mask=mask):
+            numpyro.sample("obs", dist.Normal(loc, scale), obs=data)
+
+    data = random.normal(random.PRNGKey(0), (1000,))
+    mask = np.arange(1000) < 900
+    params = {"loc": jnp.array(0.3), "scale": jnp.array(1.2)}
+
+    def potential_fn(params, model):
+        log_joint, model_trace = log_density(model, (data, mask), {}, params)
+        return -log_joint, model_trace
+
+    (expected, _), expected_grad = value_and_grad(potential_fn, has_aux=True)(
+        params, model
+    )
+    mixed_model = handlers.mixed_precision(model, compute_dtype=compute_dtype)
+    dtypes.clear()
+    (actual, model_trace), actual_grad = value_and_grad(potential_fn, has_aux=True)(
+        params, mixed_model
+    )
+    assert dtypes == [compute_dtype] * 2
+    assert actual.dtype == jnp.float32
+    assert model_trace["loc"]["value"].dtype == jnp.float32
+    assert all(g.dtype == jnp.float32 for g in jax.tree.leaves(actual_grad))
+    assert_allclose(actual, expected, rtol=0.01)
+    assert_allclose(actual_grad["scale"], expected_grad["scale"], rtol=0.05)
+
+
+def test_mixed_precision_svi():
+    def model(data):
+        loc = numpyro.sample("loc", dist.Normal(0, 10))
+        with numpyro.plate("N", data.shape[0]):
+            numpyro.sample("obs", dist.Normal(loc, 1), obs=data)
+
+    def guide(data):
+        loc_loc = numpyro.param("loc_loc", 0.0)
+        loc_scale = numpyro.param("loc_scale", 1.0, constraint=constraints.positive)
+        numpyro.sample("loc", dist.Normal(loc_loc, loc_scale))
+
+    data = 3 + random.normal(random.PRNGKey(0), (1000,))
+    svi = SVI(handlers.mixed_precision(model), guide, optim.Adam(0.05), Trace_ELBO())
+    result = svi.run(random.PRNGKey(1), 1000, data, progress_bar=False)
+    assert result.params["loc_loc"].dtype == jnp.float32
+    assert_allclose(result.params["loc_loc"], data.mean(), atol=0.05)
+
+
+def test_mixed_precision_invalid_dtype():
+    with pytest.raises(ValueError, match="floating point"):
+        handlers.mixed_precision(compute_dtype=jnp.int32)
+
+
+def _bucket_model(x, y=None):
+    w = numpyro.sample("w", dist.Normal(0, 1))
+    with numpyro.plate("N", x.shape[0]):
+        z = numpyro.sample("z", dist.Normal(0, 1))
+        numpyro.sample("y", dist.Normal(w * x + z, 1), obs=y)
+
+
+@pytest.mark.parametrize("mask_latent", [False, True])
+def test_bucket(mask_latent):
+    x, y = random.normal(random.PRNGKey(0), (2, 5))
+    bucketed = handlers.bucket(
+        _bucket_model, "N", batch_sizes=[4, 8, 16], mask_latent=mask_latent
+    )
+    args, kwargs = bucketed.pad(x, y=y)
+    assert args[0].shape == (8,) and kwargs["y"].shape == (8,)
+    assert_allclose(kwargs["bucket_mask"], np.arange(8) < 5)
+    assert_allclose(args[0][5:], x[-1])
+
+    params = {"w": 0.3, "z": jnp.linspace(-1, 1, 8)}
+    actual, _ = log_density(bucketed, args, kwargs, params)
+    expected, _ = log_density(
+        _bucket_model, (x,), {"y": y}, {"w": 0.3, "z": params["z"][:5]}
+    )
+    if not mask_latent:
+        # the latent variables of the padded data points are not masked
+        expected = expected + dist.Normal(0, 1).log_prob(params["z"][5:]).sum()
+    assert_allclose(actual, expected, rtol=1e-6)
+    # without a mask, the handler does nothing
+    assert_allclose(
+        log_density(bucketed, args, {"y": kwargs["y"]}, params)[0],
+        log_density(_bucket_model, args, {"y": kwargs["y"]}, params)[0],
+    )
+
+
+def test_bucket_invalid():
+    with pytest.raises(ValueError, match="name of the plate"):
+        handlers.bucket(_bucket_model)
+    bucketed = handlers.bucket(_bucket_model, "N", batch_sizes=[4])
+    with pytest.raises(ValueError, match="larger than the largest"):
+        bucketed.pad(jnp.ones(5))
+    with pytest.raises(ValueError, match="single number"):
+        bucketed.pad(jnp.ones(3), y=jnp.ones(2))
+
+
+def test_bucket_svi_reuses_compilation():
+    num_traces = 0
+
+    def model(x, y=None):
+        nonlocal num_traces
+        if not not_jax_tracer(x):
+            num_traces += 1
+        loc = numpyro.sample("loc", dist.Normal(0, 10))
+        with numpyro.plate("N", x.shape[0]):
+            numpyro.sample("obs", dist.Normal(loc + x, 1), obs=y)
+
+    def guide(x, y=None):
+        loc_loc = numpyro.param("loc_loc", 0.0)
+        numpyro.sample("loc", dist.Normal(loc_loc, 0.1))
+
+    bucketed = handlers.bucket(model, "N", batch_sizes=[16])
+    bucketed_guide = handlers.bucket(guide, "N", batch_sizes=[16])
+    svi = SVI(
+        bucketed, bucketed_guide, optim.Adam(0.05), Trace_ELBO(), jit_model_args=True
+    )
+    num_traces_by_size = []
+    for size in [10, 12, 16]:
+        x = jnp.zeros(size)
+        y = 3 + random.normal(random.PRNGKey(size), (size,))
+        args, kwargs = bucketed.pad(x, y=y)
+        result = svi.run(random.PRNGKey(1), 100, *args, progress_bar=False, **kwargs)
+        num_traces_by_size.append(num_traces)
+
+        expected = SVI(model, guide, optim.Adam(0.05), Trace_ELBO()).run(
+            random.PRNGKey(1), 100, x, y=y, progress_bar=False
+        )
+        assert_allclose(result.losses, expected.losses, rtol=1e-5)
+        num_traces = num_traces_by_size[-1]
+    # the model is only compiled for the first size
+    assert num_traces_by_size[0] > 0
+    assert num_traces_by_size[1] == num_traces_by_size[2] == num_traces_by_size[0]
+
+
+def test_bucket_mcmc():
+    num_traces = 0
+
+    def model(x, y=None):
+        nonlocal num_traces
+        if not not_jax_tracer(x):
+            num_traces += 1
+        loc = numpyro.sample("loc", dist.Normal(0, 10))
+        with numpyro.plate("N", x.shape[0]):
+            numpyro.sample("obs", dist.Normal(loc + x, 1), obs=y)
+
+    bucketed = handlers.bucket(model, "N")
+    mcmc = MCMC(
+        NUTS(bucketed),
+        num_warmup=200,
+        num_samples=200,
+        jit_model_args=True,
+        progress_bar=False,
+    )
+    for size in [10, 13]:
+        x = jnp.zeros(size)
+        y = 3 + random.normal(random.PRNGKey(size), (size,))
+        args, kwargs = bucketed.pad(x, y=y)
+        mcmc.run(random.PRNGKey(1), *args, **kwargs)
+        if size == 10:
+            num_traces_first_run = num_traces
+        samples = mcmc.get_samples()["loc"]
+        # the posterior of `loc` given the observations
+        assert_allclose(samples.mean(), y.sum() / (size + 0.01), atol=0.15)
+        assert_allclose(samples.std(), (size + 0.01) ** -0.5, rtol=0.25)
+    # the model is not compiled again for the second size
+    assert num_traces == num_traces_first_run
+
+
 def test_substitute():
     def model():
         x = numpyro.param("x", None)
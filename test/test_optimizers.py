@@ -5,7 +5,7 @@ from functools import partial
 
 import pytest
 
-from jax import grad, jit
+from jax import grad, jit, lax, random, vmap
 import jax.numpy as jnp
 
 from numpyro import optim
@@ -68,6 +68,7 @@ def step(opt_state, optim):
         (optim.RMSProp, (1e-2, 0.95), {}, False),
         (optim.RMSPropMomentum, (1e-4,), {}, False),
         (optim.SGD, (1e-2,), {}, False),
+        (optim.LBFGS, (), {}, False),
     ]
     + optax_optimizers,
 )
@@ -96,6 +97,7 @@ def test_optim_multi_params(optim_class, args, kwargs, uses_value_arg):
         (optim.RMSProp, (1e-2, 0.95), {}, False),
         (optim.RMSPropMomentum, (1e-4,), {}, False),
         (optim.SGD, (1e-2,), {}, False),
+        (optim.LBFGS, (), {}, False),
     ]
     + optax_optimizers,
 )
@@ -128,3 +130,77 @@ def test_numpyrooptim_no_double_jit(optim_class, args, kwargs, uses_value_arg):
         assert my_fn_calls == 2
     else:
         assert my_fn_calls == 1
+
+
+@pytest.mark.parametrize(
+    "optim_class, args, kwargs, uses_value_arg",
+    [
+        (optim.Adam, (1e-2,), {}, False),
+        (optim.SGD, (1e-2,), {}, False),
+    ]
+    + optax_optimizers[:1],
+)
+@pytest.mark.parametrize("remat", [False, True])
+def test_eval_and_accumulated_update(optim_class, args, kwargs, uses_value_arg, remat):
+    opt = optim_class(*args, **kwargs)
+    if not isinstance(opt, optim._NumPyroOptim):
+        opt = optim.optax_to_numpyro(opt)
+    state = opt.init({"x": jnp.array([1.0, 2.0, 3.0])})
+    batches = jnp.arange(12.0).reshape((4, 3))
+
+    def fn(params, batch):
+        return jnp.sum((params["x"] - batch) ** 2), batch
+
+    (out, aux), new_state = opt.eval_and_accumulated_update(
+        fn, batches, state, remat=remat
+    )
+    (expected_out, _), expected_state = opt.eval_and_update(
+        lambda params: (jnp.mean(vmap(fn, (None, 0))(params, batches)[0]), None),
+        state,
+    )
+    assert jnp.allclose(out, expected_out)
+    assert jnp.allclose(aux, batches[-1])
+    assert jnp.allclose(
+        opt.get_params(new_state)["x"], opt.get_params(expected_state)["x"]
+    )
+
+
+@pytest.mark.parametrize("history_size", [3, 10])
+def test_lbfgs_in_scan(history_size):
+    scales = jnp.array([100.0, 10.0, 1.0, 0.1])
+    target = jnp.array([1.0, -2.0, 3.0, -4.0])
+
+    def fn(params):
+        return 0.5 * jnp.sum(scales * (params["x"] - target) ** 2), None
+
+    opt = optim.LBFGS(history_size=history_size)
+
+    def body_fn(state, _):
+        (out, _), state = opt.eval_and_update(fn, state)
+        return state, out
+
+    state, losses = jit(lambda state: lax.scan(body_fn, state, None, 50))(
+        opt.init({"x": jnp.zeros(4)})
+    )
+    assert jnp.allclose(opt.get_params(state)["x"], target, atol=1e-4)
+    assert losses[-1] < 1e-8
+
+
+def test_lbfgs_noisy_gradients():
+    target = jnp.array([1.0, -2.0, 3.0])
+
+    def fn(params, rng_key):
+        noise = 0.1 * random.normal(rng_key, (3,))
+        return 0.5 * jnp.sum((params["x"] - target - noise) ** 2), None
+
+    opt = optim.LBFGS(step_size=0.5, max_step_norm=1.0)
+
+    def body_fn(state, rng_key):
+        (out, _), state = opt.eval_and_update(partial(fn, rng_key=rng_key), state)
+        return state, out
+
+    rng_keys = random.split(random.PRNGKey(0), 200)
+    state, _ = lax.scan(body_fn, opt.init({"x": jnp.zeros(3)}), rng_keys)
+    params = opt.get_params(state)["x"]
+    assert jnp.isfinite(params).all()
+    assert jnp.allclose(params, target, atol=0.2)
@@ -20,6 +20,7 @@ from numpyro.distributions.flows import (
 from numpyro.distributions.transforms import (
     AbsTransform,
     AffineTransform,
+    BlockLowerCholeskyAffine,
     CholeskyTransform,
     ComplexTransform,
     ComposeTransform,
@@ -31,6 +32,7 @@ from numpyro.distributions.transforms import (
     L1BallTransform,
     LowerCholeskyAffine,
     LowerCholeskyTransform,
+    LowRankUpdateAffine,
     OrderedTransform,
     PackRealFastFourierCoefficientsTransform,
     PermuteTransform,
@@ -82,6 +84,16 @@ TRANSFORMS = {
     "lower_cholesky_affine": T(
         LowerCholeskyAffine, (np.array([1.0, 2.0]), np.eye(2)), dict()
     ),
+    "block_lower_cholesky_affine": T(
+        BlockLowerCholeskyAffine,
+        (np.array([1.0, 2.0, 3.0]), (np.eye(1), np.array([[1.0, 0.0], [0.5, 2.0]]))),
+        dict(),
+    ),
+    "low_rank_update_affine": T(
+        LowRankUpdateAffine,
+        (np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.eye(2)[:, :1], np.array([0.5])),
+        dict(),
+    ),
     "pack_rfft_odd": T(
         PackRealFastFourierCoefficientsTransform, (), dict(transform_shape=(7,))
     ),
@@ -288,6 +300,21 @@ def test_real_fast_fourier_transform(input_shape, shape, ndims):
         (IndependentTransform(ExpTransform(), 2), (3, 4)),
         (L1BallTransform(), (9,)),
         (LowerCholeskyAffine(np.ones(3), np.eye(3)), (3,)),
+        (
+            BlockLowerCholeskyAffine(
+                np.ones(3), (np.array([[2.0]]), np.array([[1.0, 0.0], [0.5, 2.0]]))
+            ),
+            (3,),
+        ),
+        (
+            LowRankUpdateAffine(
+                np.ones(4),
+                np.array([1.0, 2.0, 3.0, 4.0]),
+                np.linalg.qr(np.random.default_rng(0).normal(size=(4, 2)))[0],
+                np.array([0.5, 3.0]),
+            ),
+            (4,),
+        ),
         (LowerCholeskyTransform(), (10,)),
         (OrderedTransform(), (5,)),
         (PermuteTransform(np.roll(np.arange(7), 2)), (7,)),